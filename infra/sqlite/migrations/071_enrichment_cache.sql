@@ -0,0 +1,16 @@
+-- Persistent TTL cache for company-enrichment artifacts (search API results,
+-- Wikipedia lookups, fetched page text). Keyed by a hash of namespace +
+-- normalized query/URL. Rows are a pure performance cache — dropping the
+-- table is safe; the worker recreates it lazily and refetches on miss.
+
+CREATE TABLE IF NOT EXISTS enrichment_cache (
+    key_hash     TEXT PRIMARY KEY,
+    namespace    TEXT NOT NULL,
+    cache_key    TEXT NOT NULL,
+    payload_json TEXT,
+    created_at   TEXT NOT NULL,
+    expires_at   TEXT NOT NULL
+);
+
+CREATE INDEX IF NOT EXISTS idx_enrichment_cache_expires
+  ON enrichment_cache(expires_at);
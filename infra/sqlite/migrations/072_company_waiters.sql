@@ -0,0 +1,12 @@
+-- Jobs parked on an in-flight COMPANY enrichment task.
+-- A row exists while the job waits; the company task's terminal status update
+-- deletes the rows and wakes the jobs exactly once (replaces requeue polling).
+CREATE TABLE IF NOT EXISTS company_waiters (
+  queue_item_id TEXT PRIMARY KEY,
+  company_id TEXT,
+  company_name TEXT,
+  parked_at TEXT NOT NULL
+);
+
+CREATE INDEX IF NOT EXISTS idx_company_waiters_company
+  ON company_waiters(company_id, company_name);
@@ -0,0 +1,17 @@
+-- Prompt-level LLM response cache. Keyed by a hash of the normalized request
+-- (model, system prompt, prompt, temperature, max_tokens, response_format).
+-- Pure performance cache: the worker recreates the table lazily, enforces
+-- expires_at and a row cap, and dropping the table is safe.
+
+CREATE TABLE IF NOT EXISTS llm_response_cache (
+    key_hash       TEXT PRIMARY KEY,
+    task_type      TEXT NOT NULL,
+    model          TEXT NOT NULL,
+    response_text  TEXT NOT NULL,
+    response_model TEXT,
+    created_at     TEXT NOT NULL,
+    expires_at     TEXT NOT NULL
+);
+
+CREATE INDEX IF NOT EXISTS idx_llm_response_cache_created
+  ON llm_response_cache(created_at);
@@ -0,0 +1,31 @@
+-- Change counter for job_sources. The worker keeps an in-memory index of
+-- sources (board tokens, base URLs, normalized names) and rebuilds it when
+-- this version moves, so writes from the API or ad-hoc SQL are picked up.
+-- Only columns the index reads bump the version. The worker recreates the
+-- table and triggers lazily; dropping them is safe.
+
+CREATE TABLE IF NOT EXISTS table_versions (
+    table_name TEXT PRIMARY KEY,
+    version    INTEGER NOT NULL DEFAULT 0
+);
+
+INSERT OR IGNORE INTO table_versions (table_name, version) VALUES ('job_sources', 0);
+
+CREATE TRIGGER IF NOT EXISTS trg_job_sources_version_insert
+AFTER INSERT ON job_sources
+BEGIN
+    UPDATE table_versions SET version = version + 1 WHERE table_name = 'job_sources';
+END;
+
+CREATE TRIGGER IF NOT EXISTS trg_job_sources_version_delete
+AFTER DELETE ON job_sources
+BEGIN
+    UPDATE table_versions SET version = version + 1 WHERE table_name = 'job_sources';
+END;
+
+CREATE TRIGGER IF NOT EXISTS trg_job_sources_version_update
+AFTER UPDATE OF name, config_json ON job_sources
+WHEN OLD.name IS NOT NEW.name OR OLD.config_json IS NOT NEW.config_json
+BEGIN
+    UPDATE table_versions SET version = version + 1 WHERE table_name = 'job_sources';
+END;
@@ -0,0 +1,27 @@
+-- Background rescore runs. The worker fingerprints its scoring inputs
+-- (match-policy, personal-info, prefilter-policy, skill_taxonomy,
+-- content_items); when the fingerprint changes it rescores job_matches from
+-- stored extraction snapshots during idle poll windows and checkpoints
+-- progress here (last_rowid) so restarts resume. The worker recreates the
+-- table lazily.
+
+CREATE TABLE IF NOT EXISTS rescore_runs (
+    id              TEXT PRIMARY KEY,
+    config_hash     TEXT NOT NULL,
+    components_json TEXT NOT NULL,
+    changed_json    TEXT NOT NULL DEFAULT '[]',
+    status          TEXT NOT NULL,  -- running | completed | superseded
+    last_rowid      INTEGER NOT NULL DEFAULT 0,
+    max_rowid       INTEGER NOT NULL DEFAULT 0,
+    total           INTEGER NOT NULL DEFAULT 0,
+    processed       INTEGER NOT NULL DEFAULT 0,
+    changed         INTEGER NOT NULL DEFAULT 0,
+    flipped         INTEGER NOT NULL DEFAULT 0,
+    last_error      TEXT,
+    created_at      TEXT NOT NULL,
+    updated_at      TEXT NOT NULL,
+    completed_at    TEXT
+);
+
+CREATE INDEX IF NOT EXISTS idx_rescore_runs_created
+  ON rescore_runs(created_at);
@@ -0,0 +1,21 @@
+-- Sampled per-queue-item span traces. Each traced processing attempt stores
+-- its span tree (stages, LLM calls, HTTP fetches, SQLite totals) as compact
+-- JSON, served by the worker at /trace/<item_id>. Rows older than the
+-- retention window are pruned by the worker, which also recreates the table
+-- lazily.
+
+CREATE TABLE IF NOT EXISTS queue_item_traces (
+    id            INTEGER PRIMARY KEY AUTOINCREMENT,
+    queue_item_id TEXT NOT NULL,
+    item_type     TEXT NOT NULL,
+    duration_ms   REAL NOT NULL,
+    span_count    INTEGER NOT NULL,
+    trace_json    TEXT NOT NULL,
+    created_at    TEXT NOT NULL
+);
+
+CREATE INDEX IF NOT EXISTS idx_queue_item_traces_item
+  ON queue_item_traces(queue_item_id);
+
+CREATE INDEX IF NOT EXISTS idx_queue_item_traces_created
+  ON queue_item_traces(created_at);
@@ -0,0 +1,33 @@
+-- Change counter for claimable queue work. The idle worker polls this row
+-- (every 250ms, only while idle) instead of sleeping the full poll interval,
+-- so items submitted by the API are picked up within a fraction of a second.
+-- It moves on a pending insert, a transition back to pending (retry,
+-- unblock, recovery) and when a parked item's company waiter is released.
+-- The worker recreates the row and triggers lazily; dropping them is safe.
+
+CREATE TABLE IF NOT EXISTS table_versions (
+    table_name TEXT PRIMARY KEY,
+    version    INTEGER NOT NULL DEFAULT 0
+);
+
+INSERT OR IGNORE INTO table_versions (table_name, version) VALUES ('job_queue_pending', 0);
+
+CREATE TRIGGER IF NOT EXISTS trg_job_queue_pending_insert
+AFTER INSERT ON job_queue
+WHEN NEW.status = 'pending'
+BEGIN
+    UPDATE table_versions SET version = version + 1 WHERE table_name = 'job_queue_pending';
+END;
+
+CREATE TRIGGER IF NOT EXISTS trg_job_queue_pending_update
+AFTER UPDATE OF status ON job_queue
+WHEN NEW.status = 'pending' AND OLD.status IS NOT 'pending'
+BEGIN
+    UPDATE table_versions SET version = version + 1 WHERE table_name = 'job_queue_pending';
+END;
+
+CREATE TRIGGER IF NOT EXISTS trg_company_waiters_release
+AFTER DELETE ON company_waiters
+BEGIN
+    UPDATE table_versions SET version = version + 1 WHERE table_name = 'job_queue_pending';
+END;
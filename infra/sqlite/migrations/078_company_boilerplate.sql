@@ -0,0 +1,25 @@
+-- Per-company boilerplate shingle fingerprints. The worker splits each
+-- paragraph that could be boilerplate (outside requirement / responsibility /
+-- location / salary sections, no salary figure, not a bullet) into 5-word
+-- shingles and counts, per company, how many distinct postings contain each
+-- shingle (one row per shingle fingerprint). A paragraph is dropped from LLM
+-- prompts when at least 80% of its shingles were seen in 3+ of the company's
+-- postings, so repeated "about us" / culture / benefits blurbs are caught even
+-- when a templated token (title, team, city) differs per posting. Shingles
+-- seen in fewer than 3 postings are pruned after 90 days. The worker
+-- recreates both tables lazily; dropping them only resets what was learned.
+
+CREATE TABLE IF NOT EXISTS company_boilerplate (
+    company_key  TEXT NOT NULL,
+    fingerprint  TEXT NOT NULL,
+    postings     INTEGER NOT NULL DEFAULT 0,
+    last_seen_at TEXT NOT NULL,
+    PRIMARY KEY (company_key, fingerprint)
+);
+
+CREATE TABLE IF NOT EXISTS company_boilerplate_postings (
+    company_key  TEXT NOT NULL,
+    posting_hash TEXT NOT NULL,
+    seen_at      TEXT NOT NULL,
+    PRIMARY KEY (company_key, posting_hash)
+);
@@ -0,0 +1,24 @@
+-- Finished job extractions keyed by job content: content fingerprint (title,
+-- company, description prefix, plus normalized location), extraction prompt
+-- version and model. Requeued, reposted and mirrored jobs reuse the stored
+-- result instead of calling the LLM again. Pure performance cache: the worker
+-- recreates the table lazily, evicts least recently used rows beyond a row
+-- cap, and dropping the table is safe.
+
+CREATE TABLE IF NOT EXISTS job_extraction_cache (
+    fingerprint     TEXT NOT NULL,
+    prompt_version  TEXT NOT NULL,
+    model           TEXT NOT NULL,
+    extraction_json TEXT NOT NULL,
+    response_model  TEXT,
+    hit_count       INTEGER NOT NULL DEFAULT 0,
+    created_at      TEXT NOT NULL,
+    last_used_at    TEXT NOT NULL,
+    PRIMARY KEY (fingerprint, prompt_version, model)
+);
+
+CREATE INDEX IF NOT EXISTS idx_job_extraction_cache_last_used
+  ON job_extraction_cache(last_used_at);
+
+CREATE INDEX IF NOT EXISTS idx_job_extraction_cache_version
+  ON job_extraction_cache(prompt_version);
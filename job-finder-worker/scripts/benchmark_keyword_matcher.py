@@ -0,0 +1,108 @@
+#!/usr/bin/env python3
+"""Benchmark KeywordMatcher against per-keyword word-boundary regexes.
+
+Generates a 200-keyword list (real title/tech terms plus synthetic words,
+multi-word phrases and non-word edges like "c++") and 50k titles plus 50k
+descriptions, then times:
+
+- baseline: ``for kw in keywords: re.search(rf"\\b{kw}\\b", text)`` (what
+  TitleFilter/PreFilter/ScoringEngine did before)
+- matcher: ``KeywordMatcher.first`` / ``contains_any``
+
+Both must agree on every input; the script exits non-zero otherwise.
+
+Usage:
+    python scripts/benchmark_keyword_matcher.py
+    python scripts/benchmark_keyword_matcher.py --keywords 200 --texts 50000
+"""
+
+import argparse
+import random
+import re
+import string
+import sys
+import time
+from typing import Callable, List, Optional
+
+# Add src to path for imports
+sys.path.insert(0, "src")
+
+from job_finder.utils.keyword_matcher import KeywordMatcher  # noqa: E402
+
+_REAL_TERMS = [
+    "senior", "staff", "principal", "lead", "engineer", "software", "backend",
+    "frontend", "full stack", "manager", "director", "vp of sales", "sales",
+    "intern", "recruiter", "account executive", "data", "data engineer",
+    "machine learning", "ml", "ai", "llm", "devops", "sre", "platform",
+    "architect", "designer", "product", "c++", ".net", "node.js", "python",
+]  # fmt: skip
+
+
+def build_corpus(n_keywords: int, n_texts: int, seed: int):
+    rng = random.Random(seed)
+    letters = string.ascii_lowercase
+    words = ["".join(rng.choice(letters) for _ in range(rng.randint(3, 9))) for _ in range(5000)]
+    # Synthetic keywords come from their own pool so hit rates stay realistic.
+    synthetic = rng.sample(words[:1000], n_keywords)
+    keywords = list(dict.fromkeys(_REAL_TERMS + synthetic))[:n_keywords]
+    vocab = words + _REAL_TERMS
+    titles = [
+        " ".join(rng.choice(vocab) for _ in range(rng.randint(2, 7))).title()
+        for _ in range(n_texts)
+    ]
+    filler = words[1000:]
+    descriptions = []
+    for _ in range(n_texts):
+        body = [rng.choice(filler) for _ in range(rng.randint(150, 400))]
+        for _ in range(rng.randint(0, 3)):
+            body.insert(rng.randrange(len(body)), rng.choice(keywords))
+        descriptions.append(" ".join(body))
+    return keywords, titles, descriptions
+
+
+def _time(label: str, fn: Callable[[str], Optional[str]], texts: List[str]):
+    started = time.perf_counter()
+    results = [fn(t) for t in texts]
+    elapsed = time.perf_counter() - started
+    hits = sum(1 for r in results if r)
+    print(f"  {label:<10} {elapsed * 1000:>9.1f} ms  ({hits} hits)")
+    return results, elapsed
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--keywords", type=int, default=200)
+    parser.add_argument("--texts", type=int, default=50000)
+    parser.add_argument("--seed", type=int, default=42)
+    args = parser.parse_args()
+
+    keywords, titles, descriptions = build_corpus(args.keywords, args.texts, args.seed)
+    patterns = [re.compile(rf"\b{re.escape(kw)}\b", re.IGNORECASE) for kw in keywords]
+
+    def baseline_first(text: str) -> Optional[str]:
+        lowered = text.lower()
+        for kw, pattern in zip(keywords, patterns):
+            if pattern.search(lowered):
+                return kw
+        return None
+
+    compile_started = time.perf_counter()
+    matcher = KeywordMatcher(keywords)
+    compile_ms = (time.perf_counter() - compile_started) * 1000
+
+    print(f"{len(keywords)} keywords, compiled in {compile_ms:.1f} ms")
+    ok = True
+    for name, texts in (("titles", titles), ("descriptions", descriptions)):
+        print(f"{len(texts)} {name}:")
+        expected, base_s = _time("baseline", baseline_first, texts)
+        actual, fast_s = _time("matcher", lambda t: matcher.first(t.lower()), texts)
+        print(f"  speedup    {base_s / fast_s:>9.1f}x")
+        if expected != actual:
+            mismatches = sum(1 for a, b in zip(expected, actual) if a != b)
+            print(f"  MISMATCH on {mismatches} {name}")
+            ok = False
+    return 0 if ok else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,112 @@
+#!/usr/bin/env python3
+"""Benchmark offline timezone resolution over distinct location strings.
+
+Builds N distinct location strings in the shapes job feeds actually use
+("Austin, TX", "Toronto, ON, Canada", "Greater Seattle Area",
+"Remote - Poland", "Berlin (Hybrid)", postcode suffixes, unknown towns in
+known states, ...) and resolves each once with a cold in-process cache and
+the geocoder fallback disabled. Reports throughput, latency percentiles and
+how many strings would still have needed a (~1 req/s) Nominatim call.
+
+Usage:
+    python scripts/benchmark_timezone_resolution.py
+    python scripts/benchmark_timezone_resolution.py --count 10000 --seed 7
+"""
+
+import argparse
+import os
+import random
+import statistics
+import sys
+import time
+from collections import Counter
+from typing import List
+
+# Add src to path for imports
+sys.path.insert(0, "src")
+
+os.environ["TIMEZONE_GEOCODER_FALLBACK"] = "false"
+
+from job_finder.utils import timezone_gazetteer  # noqa: E402
+from job_finder.utils.timezone_utils import clear_cache, get_timezone_for_city  # noqa: E402
+
+_UNKNOWN_TOWNS = ["Springdale", "Oakridge", "Fairview", "Lakeside", "Riverton", "Milltown"]
+
+
+def build_locations(count: int, seed: int) -> List[str]:
+    """Return *count* distinct location strings built from the gazetteer."""
+    rng = random.Random(seed)
+    cities = [row for row in timezone_gazetteer._rows(timezone_gazetteer._CITY_DATA)]
+    regions = [row for row in timezone_gazetteer._rows(timezone_gazetteer._ADMIN_DATA)]
+    countries = [
+        row for row in timezone_gazetteer._rows(timezone_gazetteer._COUNTRY_DATA) if row[1]
+    ]
+    country_names = {cc: names.split(";")[0] for cc, _, names in countries}
+
+    def variants():
+        names, admin, cc, _ = rng.choice(cities)
+        name = rng.choice(names.split(";"))
+        country = country_names.get(cc, cc)
+        yield name
+        yield f"{name}, {admin or cc}"
+        yield f"{name}, {country}"
+        yield f"{name}, {admin}, {country}" if admin else f"{name} {country}"
+        yield f"Greater {name} Area"
+        yield f"{name} (Hybrid)"
+        yield f"{name.upper()}, {cc}"
+        yield f"{name}, {admin or cc} {rng.randint(10000, 99999)}"
+        _, code, region_names, _ = rng.choice(regions)
+        town = f"{rng.choice(_UNKNOWN_TOWNS)} {rng.randint(1, 999)}"
+        yield f"{town}, {rng.choice([code, region_names.split(';')[0]])}"
+        yield f"Remote - {rng.choice(countries)[2].split(';')[0]}"
+
+    seen = set()
+    locations: List[str] = []
+    while len(locations) < count:
+        for location in variants():
+            if location not in seen:
+                seen.add(location)
+                locations.append(location)
+                if len(locations) == count:
+                    break
+    return locations
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--count", type=int, default=10000)
+    parser.add_argument("--seed", type=int, default=42)
+    args = parser.parse_args()
+
+    locations = build_locations(args.count, args.seed)
+    clear_cache()
+
+    latencies = []
+    outcomes: Counter = Counter()
+    started = time.perf_counter()
+    for location in locations:
+        t0 = time.perf_counter()
+        result = get_timezone_for_city(location)
+        latencies.append(time.perf_counter() - t0)
+        outcomes["resolved" if result.timezone_name else result.error or "unresolved"] += 1
+    elapsed = time.perf_counter() - started
+
+    warm_started = time.perf_counter()
+    for location in locations:
+        get_timezone_for_city(location)
+    warm_elapsed = time.perf_counter() - warm_started
+
+    latencies_us = sorted(x * 1e6 for x in latencies)
+    p99 = latencies_us[int(len(latencies_us) * 0.99) - 1]
+    print(f"Distinct locations:   {len(locations)}")
+    print(f"Cold total:           {elapsed * 1000:.1f} ms ({len(locations) / elapsed:,.0f}/s)")
+    print(f"Cold p50 / p99:       {statistics.median(latencies_us):.1f} / {p99:.1f} us")
+    print(f"Warm total (LRU):     {warm_elapsed * 1000:.1f} ms")
+    for outcome, n in outcomes.most_common():
+        print(f"  {outcome:<20} {n:>6} ({n / len(locations):.1%})")
+    needs_geocoder = outcomes.get("City not found", 0)
+    print(f"Geocoder calls needed: {needs_geocoder} (~{needs_geocoder}s at Nominatim's 1 req/s)")
+
+
+if __name__ == "__main__":
+    main()
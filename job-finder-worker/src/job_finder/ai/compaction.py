@@ -0,0 +1,514 @@
+"""Token-budgeted compaction of job descriptions before LLM prompts.
+
+Prompts used to carry ``description[:8000]``: a character cut that keeps
+whatever comes first (often "About us", benefits and EEO text) and can drop
+the requirements at the end. ``DescriptionCompactor`` instead:
+
+1. segments the description into sections by heading (``segment_sections``)
+   and classifies each one (requirements, responsibilities, location,
+   salary, overview, benefits, about, legal)
+2. drops paragraphs the company's ``BoilerplateStore`` has seen across
+   several of its postings (the repeated "about us" / culture blurbs), plus
+   legal boilerplate (EEO statements, accommodation notices, cookie banners).
+   Paragraphs are compared by word shingles (``paragraph_shingles``): one
+   counts as seen when ``BOILERPLATE_SIMILARITY`` of its shingles were, so
+   a blurb that differs per posting by a templated token (job title, team,
+   city) is still recognised
+3. if the rest is still over ``budget_tokens``, keeps sections in priority
+   order (requirements / responsibilities / location / salary first,
+   benefits and company blurbs last), trimming the first section that no
+   longer fits at a line boundary, and reassembles the kept text in its
+   original order
+
+HTML descriptions are converted to text first. Paragraphs with a salary
+figure, bullet items and paragraphs under requirements / responsibilities /
+location / salary headings are never treated as company boilerplate; salary
+figures are kept even under a legal heading (pay transparency notices carry
+the range). Tokens are counted with tiktoken (``cl100k_base``) when its
+encoding is available and estimated at ~4 characters per token otherwise, so
+the worker never needs network access to load an encoding.
+
+Post-extraction guards still run against the full description.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import logging
+import re
+import threading
+from dataclasses import dataclass, field
+from typing import TYPE_CHECKING, Callable, Dict, List, Optional, Sequence, Set, Tuple
+
+if TYPE_CHECKING:  # pragma: no cover
+    from job_finder.storage.boilerplate_storage import BoilerplateStore
+
+logger = logging.getLogger(__name__)
+
+# ~8000 characters of English job text, the previous hard cut
+DEFAULT_DESCRIPTION_TOKEN_BUDGET = 2000
+
+_CHARS_PER_TOKEN = 4
+_TIKTOKEN_ENCODING = "cl100k_base"
+
+# Lower is kept first when the budget is tight
+SECTION_PRIORITY: Dict[str, int] = {
+    "requirements": 0,
+    "responsibilities": 0,
+    "location": 0,
+    "salary": 0,
+    "overview": 1,
+    "benefits": 2,
+    "about": 3,
+    "legal": 4,
+}
+# Sections at or below this priority are trimmed to fit rather than dropped
+_TRIMMABLE_PRIORITY = 1
+
+_HEADING_KINDS = (
+    (
+        "legal",
+        re.compile(
+            r"equal (employment )?opportunit|\beeo\b|accommodation|privacy|cookie|"
+            r"e-verify|disclaimer|pay transparency|fraud|recruitment scam|applicant notice",
+            re.I,
+        ),
+    ),
+    (
+        "salary",
+        re.compile(r"salary|compensation|\bpay\b|pay range|base pay|\bwage|\bote\b", re.I),
+    ),
+    (
+        "requirements",
+        re.compile(
+            r"requirement|qualification|what you('ll| will)? (bring|need|have)|"
+            r"you (have|bring|are)|must have|nice to have|preferred|skills|experience|"
+            r"who you are|about you|looking for",
+            re.I,
+        ),
+    ),
+    (
+        "responsibilities",
+        re.compile(
+            r"responsibilit|what you('ll| will) do|the role|your role|duties|day[- ]to[- ]day|"
+            r"you will|in this role|the job|the position|what you'll work on|impact",
+            re.I,
+        ),
+    ),
+    ("location", re.compile(r"location|remote|hybrid|on-?site|where|office|travel", re.I)),
+    ("benefits", re.compile(r"benefit|perks|what we offer|why (join|work)|we offer", re.I)),
+    (
+        "about",
+        re.compile(r"about (us|the company|the team|[A-Z])|who we are|our (mission|story)", re.I),
+    ),
+)
+
+# Body-text signals for paragraphs outside any heading
+_LEGAL_TEXT_RE = re.compile(
+    r"equal opportunity employer|without regard to (race|sex|age)|reasonable accommodation|"
+    r"e-verify|we use cookies|accept (all )?cookies|protected veteran|"
+    r"do not accept unsolicited|recruitment (agencies|fraud)",
+    re.I,
+)
+_SALARY_TEXT_RE = re.compile(
+    r"[$£€]\s?\d|\b\d{2,3}[,.]?\d{3}\s*(usd|eur|gbp)\b|\b\d{2,3}k\b|"
+    r"per (hour|year|annum)|salary|base pay|pay range|compensation",
+    re.I,
+)
+_SALARY_FIGURE_RE = re.compile(r"[$£€]\s?\d|\b\d{2,3}[,.]?\d{3}\b|\b\d{2,3}k\b", re.I)
+_BULLET_RE = re.compile(r"\s*([*\-•]|\d+[.)])\s")
+_HTML_BLOCK_RE = re.compile(r"<(p|li|ul|div|br|h[1-6])\b", re.I)
+_HEADING_MAX_CHARS = 80
+_MARKDOWN_DECOR_RE = re.compile(r"^[#*_\s]+|[#*_:\s]+$")
+_PARAGRAPH_SPLIT_RE = re.compile(r"\n\s*\n")
+_FINGERPRINT_STRIP_RE = re.compile(r"[^a-z0-9]+")
+
+# Paragraphs shorter than this are never fingerprinted (headings, one-liners)
+MIN_BOILERPLATE_CHARS = 80
+# Words per shingle, and the share of a paragraph's shingles that must be
+# company boilerplate for the paragraph to be dropped. One changed word
+# spoils at most SHINGLE_WORDS shingles of a paragraph.
+SHINGLE_WORDS = 5
+BOILERPLATE_SIMILARITY = 0.8
+
+
+# ---------------------------------------------------------------------- #
+# Token counting
+# ---------------------------------------------------------------------- #
+
+_encoder = None
+_encoder_loaded = False
+_encoder_lock = threading.Lock()
+
+
+def _get_encoder():
+    global _encoder, _encoder_loaded
+    if _encoder_loaded:
+        return _encoder
+    with _encoder_lock:
+        if not _encoder_loaded:
+            try:
+                import tiktoken
+
+                _encoder = tiktoken.get_encoding(_TIKTOKEN_ENCODING)
+            except Exception as exc:  # not installed, or encoding not cached offline
+                logger.info("tiktoken unavailable (%s); estimating tokens from length", exc)
+                _encoder = None
+            _encoder_loaded = True
+    return _encoder
+
+
+def count_tokens(text: str) -> int:
+    """Token count of *text* (tiktoken when available, else a length estimate)."""
+    if not text:
+        return 0
+    encoder = _get_encoder()
+    if encoder is not None:
+        return len(encoder.encode(text, disallowed_special=()))
+    return (len(text) + _CHARS_PER_TOKEN - 1) // _CHARS_PER_TOKEN
+
+
+# ---------------------------------------------------------------------- #
+# Segmentation
+# ---------------------------------------------------------------------- #
+
+
+@dataclass
+class Section:
+    """A heading (possibly empty) and the paragraphs under it."""
+
+    kind: str
+    heading: str = ""
+    paragraphs: List[str] = field(default_factory=list)
+    index: int = 0
+
+    @property
+    def priority(self) -> int:
+        return SECTION_PRIORITY.get(self.kind, SECTION_PRIORITY["overview"])
+
+    def text(self) -> str:
+        parts = ([self.heading] if self.heading else []) + self.paragraphs
+        return "\n\n".join(parts)
+
+
+def _heading_text(line: str) -> Optional[str]:
+    """The heading in *line* if it looks like one, else None."""
+    stripped = line.strip()
+    if not stripped or len(stripped) > _HEADING_MAX_CHARS or "\n" in stripped:
+        return None
+    bare = _MARKDOWN_DECOR_RE.sub("", stripped)
+    if not bare or bare[-1] in ".!?,;":
+        return None
+    decorated = stripped.startswith(("#", "**")) or stripped.endswith(":")
+    if decorated or (bare.isupper() and len(bare) > 3) or len(bare.split()) <= 6:
+        return bare
+    return None
+
+
+def classify_heading(heading: str) -> str:
+    """Section kind for a heading (``overview`` when nothing matches)."""
+    for kind, pattern in _HEADING_KINDS:
+        if pattern.search(heading):
+            return kind
+    return "overview"
+
+
+def segment_sections(text: str) -> List[Section]:
+    """Split *text* into headed sections of paragraphs, in document order."""
+    sections: List[Section] = []
+    current = Section(kind="overview")
+    for block in _PARAGRAPH_SPLIT_RE.split(text or ""):
+        block = block.strip()
+        if not block:
+            continue
+        first_line, _, rest = block.partition("\n")
+        heading = _heading_text(first_line)
+        kind = classify_heading(heading) if heading is not None else None
+        # Any heading ends a legal section, so later content is not dropped with it
+        if kind is not None and (kind != "overview" or current.kind == "legal"):
+            if current.heading or current.paragraphs:
+                sections.append(current)
+            current = Section(kind=kind, heading=first_line.strip())
+            if rest.strip():
+                current.paragraphs.append(rest.strip())
+            continue
+        # EEO / cookie text often trails the last headed section: split it off
+        is_legal = bool(_LEGAL_TEXT_RE.search(block))
+        if current.kind != "legal" and is_legal:
+            if current.heading or current.paragraphs:
+                sections.append(current)
+            current = Section(kind="legal")
+        elif current.kind == "legal" and not current.heading and not is_legal:
+            sections.append(current)
+            current = Section(kind="overview")
+        current.paragraphs.append(block)
+    if current.heading or current.paragraphs:
+        sections.append(current)
+
+    # Promote unheaded paragraphs whose text is plainly legal or salary
+    result: List[Section] = []
+    for section in sections:
+        if section.heading or section.kind != "overview":
+            result.append(section)
+            continue
+        for paragraph in section.paragraphs:
+            kind = "overview"
+            if _LEGAL_TEXT_RE.search(paragraph):
+                kind = "legal"
+            elif _SALARY_TEXT_RE.search(paragraph):
+                kind = "salary"
+            if result and not result[-1].heading and result[-1].kind == kind:
+                result[-1].paragraphs.append(paragraph)
+            else:
+                result.append(Section(kind=kind, paragraphs=[paragraph]))
+    for index, section in enumerate(result):
+        section.index = index
+    return result
+
+
+# ---------------------------------------------------------------------- #
+# Boilerplate fingerprints
+# ---------------------------------------------------------------------- #
+
+
+def paragraph_shingles(paragraph: str) -> Set[str]:
+    """Fingerprints of a paragraph's ``SHINGLE_WORDS``-word shingles (empty for short ones)."""
+    if len(paragraph) < MIN_BOILERPLATE_CHARS:
+        return set()
+    words = _FINGERPRINT_STRIP_RE.sub(" ", paragraph.lower()).split()
+    spans = range(max(1, len(words) - SHINGLE_WORDS + 1))
+    return {
+        hashlib.sha1(" ".join(words[i : i + SHINGLE_WORDS]).encode("utf-8")).hexdigest()[:16]
+        for i in spans
+    }
+
+
+def _may_be_boilerplate(paragraph: str) -> bool:
+    """Salary figures and bullet items are never company boilerplate."""
+    return not _SALARY_TEXT_RE.search(paragraph) and not _BULLET_RE.match(paragraph)
+
+
+def company_key(company: Optional[str]) -> str:
+    """Normalized company name used to key boilerplate fingerprints."""
+    return _FINGERPRINT_STRIP_RE.sub(" ", (company or "").lower()).strip()
+
+
+# ---------------------------------------------------------------------- #
+# Budget allocation
+# ---------------------------------------------------------------------- #
+
+
+@dataclass
+class CompactionResult:
+    """Compacted description plus what it cost and saved."""
+
+    text: str
+    original_tokens: int
+    tokens: int
+    dropped_sections: List[str] = field(default_factory=list)
+    boilerplate_paragraphs: int = 0
+
+    @property
+    def saved_tokens(self) -> int:
+        return max(0, self.original_tokens - self.tokens)
+
+
+def _trim_to_tokens(text: str, budget: int) -> str:
+    """Longest prefix of *text*'s lines that fits *budget* tokens."""
+    kept: List[str] = []
+    used = 0
+    for line in text.split("\n"):
+        cost = count_tokens(line) + 1
+        if used + cost > budget:
+            break
+        kept.append(line)
+        used += cost
+    return "\n".join(kept).rstrip()
+
+
+def allocate_budget(
+    sections: Sequence[Section], budget_tokens: int
+) -> Tuple[List[Section], List[str]]:
+    """Pick (and trim) sections by priority to fit *budget_tokens*.
+
+    Returns the kept sections in document order and the kinds dropped.
+    """
+    kept: Dict[int, Section] = {}
+    dropped: List[str] = []
+    remaining = budget_tokens
+    for section in sorted(sections, key=lambda s: (s.priority, s.index)):
+        text = section.text()
+        cost = count_tokens(text) + 2
+        if cost <= remaining:
+            kept[section.index] = section
+            remaining -= cost
+        elif section.priority <= _TRIMMABLE_PRIORITY and remaining > 16:
+            trimmed = _trim_to_tokens(text, remaining - 2)
+            if trimmed:
+                kept[section.index] = Section(
+                    kind=section.kind, paragraphs=[trimmed], index=section.index
+                )
+                remaining -= count_tokens(trimmed) + 2
+            if trimmed != text:
+                dropped.append(f"{section.kind}(trimmed)")
+        else:
+            dropped.append(section.kind)
+    return [kept[i] for i in sorted(kept)], dropped
+
+
+# ---------------------------------------------------------------------- #
+# Compactor
+# ---------------------------------------------------------------------- #
+
+_stats: Dict[str, int] = {
+    "descriptions": 0,
+    "compacted": 0,
+    "tokens_in": 0,
+    "tokens_out": 0,
+    "boilerplate_paragraphs": 0,
+}
+_stats_lock = threading.Lock()
+
+
+def _record_stats(result: CompactionResult) -> None:
+    with _stats_lock:
+        _stats["descriptions"] += 1
+        _stats["compacted"] += int(result.tokens < result.original_tokens)
+        _stats["tokens_in"] += result.original_tokens
+        _stats["tokens_out"] += result.tokens
+        _stats["boilerplate_paragraphs"] += result.boilerplate_paragraphs
+
+
+def get_compaction_stats() -> Dict[str, int]:
+    """Process-wide description compaction counters (exposed in ``/status``)."""
+    with _stats_lock:
+        return dict(_stats)
+
+
+def reset_compaction_stats() -> None:
+    with _stats_lock:
+        for key in _stats:
+            _stats[key] = 0
+
+
+class DescriptionCompactor:
+    """Drops boilerplate and fits descriptions to a token budget."""
+
+    def __init__(
+        self,
+        store: Optional["BoilerplateStore"] = None,
+        budget_tokens: int = DEFAULT_DESCRIPTION_TOKEN_BUDGET,
+    ):
+        """
+        Args:
+            store: Per-company boilerplate fingerprints (None: legal text and
+                the budget only)
+            budget_tokens: Target size of the compacted description
+        """
+        self.store = store
+        self.budget_tokens = budget_tokens
+
+    def _boilerplate_for(self, company: Optional[str]) -> Callable[[str], bool]:
+        if self.store is None or not company_key(company):
+            return lambda paragraph: False
+        try:
+            fingerprints = self.store.get_boilerplate(company_key(company))
+        except Exception as exc:
+            logger.debug("Boilerplate lookup failed for %s: %s", company, exc)
+            return lambda paragraph: False
+        if not fingerprints:
+            return lambda paragraph: False
+
+        def is_boilerplate(paragraph: str) -> bool:
+            shingles = paragraph_shingles(paragraph)
+            if not shingles or not _may_be_boilerplate(paragraph):
+                return False
+            return len(shingles & fingerprints) >= BOILERPLATE_SIMILARITY * len(shingles)
+
+        return is_boilerplate
+
+    def compact(
+        self, description: str, company: Optional[str] = None, observe: bool = False
+    ) -> CompactionResult:
+        """Compact *description*; with *observe*, also learn its paragraphs for *company*."""
+        description = description or ""
+        original_tokens = count_tokens(description)
+        if _HTML_BLOCK_RE.search(description):
+            # Raw ATS HTML: segment (and prompt with) the readable text instead
+            from job_finder.scrapers.text_sanitizer import sanitize_html_description
+
+            description = sanitize_html_description(description)
+        sections = segment_sections(description)
+        if observe and self.store is not None and company_key(company):
+            # Only text that could be dropped as boilerplate is worth counting
+            paragraphs = [
+                p
+                for s in sections
+                if s.priority > 0 and s.kind != "legal"
+                for p in s.paragraphs
+                if _may_be_boilerplate(p)
+            ]
+            try:
+                self.store.observe(company_key(company), description, paragraphs)
+            except Exception as exc:
+                logger.debug("Boilerplate observe failed for %s: %s", company, exc)
+
+        is_boilerplate = self._boilerplate_for(company)
+        filtered: List[Section] = []
+        dropped: List[str] = []
+        boilerplate_paragraphs = 0
+        for section in sections:
+            if section.kind == "legal":
+                # Pay-transparency notices carry the salary range
+                salary = [p for p in section.paragraphs if _SALARY_FIGURE_RE.search(p)]
+                if not salary:
+                    dropped.append("legal")
+                    continue
+                section = Section("salary", section.heading, salary, index=section.index)
+            # Repeated requirement / location text is still about the role
+            paragraphs = [
+                p for p in section.paragraphs if section.priority == 0 or not is_boilerplate(p)
+            ]
+            boilerplate_paragraphs += len(section.paragraphs) - len(paragraphs)
+            if not paragraphs:
+                if section.paragraphs:
+                    dropped.append(f"{section.kind}(boilerplate)")
+                continue
+            filtered.append(Section(section.kind, section.heading, paragraphs, index=section.index))
+
+        text = "\n\n".join(s.text() for s in filtered)
+        tokens = count_tokens(text)
+        if tokens > self.budget_tokens:
+            kept, budget_dropped = allocate_budget(filtered, self.budget_tokens)
+            dropped.extend(budget_dropped)
+            text = "\n\n".join(s.text() for s in kept)
+            tokens = count_tokens(text)
+        if not text.strip():
+            # Never hand the model an empty description
+            text = _trim_to_tokens(description, self.budget_tokens)
+            tokens = count_tokens(text)
+
+        result = CompactionResult(
+            text=text,
+            original_tokens=original_tokens,
+            tokens=tokens,
+            dropped_sections=dropped,
+            boilerplate_paragraphs=boilerplate_paragraphs,
+        )
+        _record_stats(result)
+        return result
+
+
+_default_compactor = DescriptionCompactor()
+
+
+def fit_description(description: str, budget_tokens: int = DEFAULT_DESCRIPTION_TOKEN_BUDGET) -> str:
+    """Store-less compaction used by prompt builders as the last-resort size cap."""
+    if count_tokens(description or "") <= budget_tokens:
+        return description or ""
+    compactor = (
+        _default_compactor
+        if budget_tokens == _default_compactor.budget_tokens
+        else DescriptionCompactor(budget_tokens=budget_tokens)
+    )
+    return compactor.compact(description).text
@@ -0,0 +1,209 @@
+"""Adaptive per-model concurrency control for LLM calls.
+
+LiteLLM (and the Ollama model behind ``local-extract``) can serve several
+requests at once, but how many depends on the backend and on load. Rather
+than hard-coding a number, each model gets an in-flight limit that adapts
+AIMD-style:
+
+- additive increase: every call that completes with normal latency grows the
+  limit by ``1 / limit`` (≈ +1 per full window of calls)
+- multiplicative decrease: a rate limit (429), provider outage, timeout, or a
+  latency spike (``latency > latency_tolerance * recent minimum``) multiplies
+  the limit by ``backoff``
+
+Callers wrap each request in ``limiter.slot(model)``; the slot blocks until a
+permit is free and reports the outcome on exit. One process-wide limiter is
+shared by all InferenceClient instances (see ``get_default_limiter``).
+"""
+
+from __future__ import annotations
+
+import logging
+import math
+import os
+import threading
+import time
+from collections import deque
+from contextlib import contextmanager
+from typing import Callable, Deque, Dict, Iterator, Optional
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_INITIAL_LIMIT = 2.0
+DEFAULT_MIN_LIMIT = 1.0
+DEFAULT_MAX_LIMIT = 8.0
+DEFAULT_LATENCY_TOLERANCE = 3.0
+DEFAULT_BACKOFF = 0.5
+
+# Samples kept per model for the latency baseline (recent minimum).
+_LATENCY_WINDOW = 50
+
+
+class _ModelState:
+    """Limit, in-flight count and latency history for one model."""
+
+    def __init__(self, initial_limit: float):
+        self.limit = initial_limit
+        self.in_flight = 0
+        self.latencies: Deque[float] = deque(maxlen=_LATENCY_WINDOW)
+        self.successes = 0
+        self.overloads = 0
+
+
+class ConcurrencySlot:
+    """Handle for one in-flight call. Mark overload before the slot exits."""
+
+    def __init__(self) -> None:
+        self.overloaded = False
+        self.failed = False
+
+    def mark_overloaded(self) -> None:
+        """Report a congestion signal (429, provider outage, timeout)."""
+        self.overloaded = True
+
+    def mark_failed(self) -> None:
+        """Report a non-congestion failure (does not move the limit)."""
+        self.failed = True
+
+
+class AdaptiveConcurrencyLimiter:
+    """Per-model AIMD in-flight limiter (thread-safe)."""
+
+    def __init__(
+        self,
+        initial_limit: float = DEFAULT_INITIAL_LIMIT,
+        min_limit: float = DEFAULT_MIN_LIMIT,
+        max_limit: float = DEFAULT_MAX_LIMIT,
+        latency_tolerance: float = DEFAULT_LATENCY_TOLERANCE,
+        backoff: float = DEFAULT_BACKOFF,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        if min_limit < 1:
+            raise ValueError("min_limit must be >= 1")
+        if max_limit < min_limit:
+            raise ValueError("max_limit must be >= min_limit")
+        self.initial_limit = min(max(initial_limit, min_limit), max_limit)
+        self.min_limit = min_limit
+        self.max_limit = max_limit
+        self.latency_tolerance = latency_tolerance
+        self.backoff = backoff
+        self._clock = clock
+        self._models: Dict[str, _ModelState] = {}
+        self._cond = threading.Condition()
+
+    def _state(self, model: str) -> _ModelState:
+        state = self._models.get(model)
+        if state is None:
+            state = _ModelState(self.initial_limit)
+            self._models[model] = state
+        return state
+
+    def acquire(self, model: str, timeout: Optional[float] = None) -> bool:
+        """Block until *model* has a free permit. Returns False on timeout."""
+        deadline = None if timeout is None else self._clock() + timeout
+        with self._cond:
+            state = self._state(model)
+            while state.in_flight >= math.floor(state.limit):
+                remaining = None if deadline is None else deadline - self._clock()
+                if remaining is not None and remaining <= 0:
+                    return False
+                self._cond.wait(remaining)
+            state.in_flight += 1
+            return True
+
+    def release(
+        self,
+        model: str,
+        latency: Optional[float] = None,
+        overloaded: bool = False,
+        failed: bool = False,
+    ) -> None:
+        """Return a permit and adapt the limit from the call's outcome."""
+        with self._cond:
+            state = self._state(model)
+            state.in_flight = max(0, state.in_flight - 1)
+            previous = state.limit
+
+            if overloaded:
+                self._decrease(state)
+            elif not failed and latency is not None:
+                baseline = min(state.latencies) if state.latencies else None
+                state.latencies.append(latency)
+                state.successes += 1
+                if baseline and latency > baseline * self.latency_tolerance:
+                    self._decrease(state)
+                else:
+                    state.limit = min(self.max_limit, state.limit + 1.0 / state.limit)
+
+            if math.floor(state.limit) != math.floor(previous):
+                logger.info(
+                    "LLM concurrency for %s: %d -> %d",
+                    model,
+                    math.floor(previous),
+                    math.floor(state.limit),
+                )
+            self._cond.notify_all()
+
+    def _decrease(self, state: _ModelState) -> None:
+        state.overloads += 1
+        state.limit = max(self.min_limit, state.limit * self.backoff)
+
+    @contextmanager
+    def slot(self, model: str) -> Iterator[ConcurrencySlot]:
+        """Hold a permit for the duration of one call.
+
+        Exceptions propagate unchanged; an exception without an explicit mark
+        counts as a plain failure (the limit is left alone).
+        """
+        self.acquire(model)
+        handle = ConcurrencySlot()
+        started = self._clock()
+        try:
+            yield handle
+        except BaseException:
+            if not handle.overloaded:
+                handle.failed = True
+            raise
+        finally:
+            self.release(
+                model,
+                latency=self._clock() - started,
+                overloaded=handle.overloaded,
+                failed=handle.failed,
+            )
+
+    def snapshot(self) -> Dict[str, Dict[str, float]]:
+        """Current limit / in-flight / counters per model (for /status)."""
+        with self._cond:
+            return {
+                model: {
+                    "limit": math.floor(state.limit),
+                    "in_flight": state.in_flight,
+                    "successes": state.successes,
+                    "overloads": state.overloads,
+                }
+                for model, state in self._models.items()
+            }
+
+
+_default_limiter: Optional[AdaptiveConcurrencyLimiter] = None
+_default_limiter_lock = threading.Lock()
+
+
+def get_default_limiter() -> AdaptiveConcurrencyLimiter:
+    """Return the process-wide limiter, configured from env on first use.
+
+    Env:
+        LLM_MAX_CONCURRENCY: upper bound per model (default 8)
+        LLM_INITIAL_CONCURRENCY: starting limit per model (default 2)
+    """
+    global _default_limiter
+    with _default_limiter_lock:
+        if _default_limiter is None:
+            _default_limiter = AdaptiveConcurrencyLimiter(
+                initial_limit=float(
+                    os.getenv("LLM_INITIAL_CONCURRENCY", str(DEFAULT_INITIAL_LIMIT))
+                ),
+                max_limit=float(os.getenv("LLM_MAX_CONCURRENCY", str(DEFAULT_MAX_LIMIT))),
+            )
+        return _default_limiter
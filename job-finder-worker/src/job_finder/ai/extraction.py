@@ -13,12 +13,34 @@ Post-extraction validation guards catch common hallucinations:
 import json
 import logging
 import re
+import threading
 from dataclasses import dataclass, field
-from typing import Any, Dict, List, Literal, Optional, cast, get_args
-
-from job_finder.ai.extraction_prompts import build_extraction_prompt, build_repair_prompt
+from typing import TYPE_CHECKING, Any, Dict, Iterable, List, Literal, Optional, cast, get_args
+
+from job_finder.ai.compaction import DescriptionCompactor
+from job_finder.ai.extraction_prompts import (
+    BATCH_EXTRACTION_RESPONSE_KEYS,
+    EXTRACTION_FIELD_KEYS,
+    EXTRACTION_RESPONSE_KEYS,
+    build_batch_extraction_prompt,
+    build_extraction_prompt,
+    build_repair_prompt,
+)
+from job_finder.ai.json_stream import OUTCOME_COMPLETE
+from job_finder.ai.prompts import FUSED_RESPONSE_KEYS
+from job_finder.ai.pre_extraction import (
+    EQUITY_MATCHER,
+    SALARY_MATCHER,
+    PreExtraction,
+    PreExtractor,
+)
+from job_finder.ai.repair import select_repair_excerpts
 from job_finder.ai.response_parser import extract_json_from_response
 from job_finder.exceptions import ExtractionError
+from job_finder.metrics import EXTRACTION_PLANS, FUSED_EXTRACTIONS
+
+if TYPE_CHECKING:
+    from job_finder.ai.matcher import AIJobMatcher
 
 logger = logging.getLogger(__name__)
 
@@ -28,44 +50,20 @@ logger = logging.getLogger(__name__)
 # this are broken scrapes (requisition IDs, stubs) that produce garbage.
 MIN_DESCRIPTION_LENGTH = 200
 
+# Micro-batching: only short listings are packed together (long ones would
+# dominate the context and gain nothing from shared prefill).
+BATCH_MAX_DESCRIPTION_LENGTH = 3000
+DEFAULT_EXTRACTION_BATCH_SIZE = 4
+# Output budget per listing in a batch response.
+_BATCH_TOKENS_PER_ITEM = 1024
+
+# extraction_model of results settled entirely by pre-extraction
+RULES_MODEL = "rules"
+
 # Maximum length / word count for a single technology entry.
 _MAX_TECH_LENGTH = 35
 _MAX_TECH_WORDS = 4
 
-# Keywords whose presence in the description indicates salary info exists.
-# Checked case-insensitively.
-_SALARY_KEYWORDS = (
-    "$",
-    "salary",
-    "compensation",
-    "per year",
-    "per annum",
-    "annually",
-    "usd ",
-    "usd,",
-    "pay range",
-    "base pay",
-    "hourly rate",
-    "wage",
-    "total comp",
-    "on-target earnings",
-)
-
-# Keywords indicating genuine compensation-equity (not DEI "equity").
-_EQUITY_KEYWORDS = (
-    "stock",
-    "rsu",
-    "rsus",
-    "vest",
-    "vesting",
-    "shares",
-    "options",
-    "equity compensation",
-    "equity grant",
-    "equity package",
-    "equity award",
-)
-
 # Type checking import to avoid circular dependency
 from typing import TYPE_CHECKING
 
@@ -188,6 +186,9 @@ class JobExtractionResult:
             else:
                 if repair_value is not None and current_value is None:
                     setattr(self, field_name, repair_value)
+                    # salary_min stands for the whole range in repair requests
+                    if field_name == "salary_min" and self.salary_max is None:
+                        self.salary_max = repair_data.salary_max
         # Also merge timezone_flexible if repair found it
         if repair_data.timezone_flexible and not self.timezone_flexible:
             self.timezone_flexible = True
@@ -430,10 +431,8 @@ def _guard_salary(
     if salary_range:
         return
 
-    desc_lower = description.lower()
-    for kw in _SALARY_KEYWORDS:
-        if kw in desc_lower:
-            return  # description mentions salary, trust the extraction
+    if SALARY_MATCHER.contains_any(description.lower()):
+        return  # description mentions salary, trust the extraction
 
     logger.info(
         "Salary guard: nulling hallucinated salary %s-%s (no salary text in description)",
@@ -458,9 +457,8 @@ def _guard_equity(result: "JobExtractionResult", description: str) -> None:
 
     desc_lower = description.lower()
 
-    for kw in _EQUITY_KEYWORDS:
-        if re.search(r"\b" + re.escape(kw) + r"\b", desc_lower):
-            return  # genuine compensation-equity mention
+    if EQUITY_MATCHER.contains_any(desc_lower):
+        return  # genuine compensation-equity mention
 
     # Check for standalone "equity" NOT in DEI context
     # Look for "equity" that is NOT preceded/followed by diversity/inclusion
@@ -478,6 +476,102 @@ def _guard_equity(result: "JobExtractionResult", description: str) -> None:
     result.includes_equity = False
 
 
+@dataclass
+class BatchExtractionOutcome:
+    """Per-listing outcome of JobExtractor.extract_batch.
+
+    Exactly one of ``result`` / ``error`` is set. ``batched`` is True when the
+    result came from a multi-listing request (False for single fallbacks).
+    """
+
+    result: Optional[JobExtractionResult] = None
+    error: Optional[str] = None
+    batched: bool = False
+
+
+@dataclass
+class FusedExtraction:
+    """Outcome of JobExtractor.extract_fused: both validated parts of one call.
+
+    ``analysis`` is the raw match-analysis object, already checked with
+    ``AIJobMatcher.is_valid_analysis``; pass it to ``analyze_job(analysis=...)``.
+    """
+
+    extraction: JobExtractionResult
+    analysis: Dict[str, Any]
+
+
+def _apply_guards(
+    extraction: "JobExtractionResult", description: str, salary_range: Optional[str]
+) -> None:
+    """Run the post-extraction validation guards in place."""
+    _sanitize_technologies(extraction)
+    _guard_salary(extraction, description, salary_range)
+    _guard_equity(extraction, description)
+
+
+# How much of each extraction was left for the LLM after pre-extraction
+_pre_stats: Dict[str, int] = {
+    "skipped": 0,  # every field settled, no LLM call
+    "targeted": 0,  # LLM asked only for the unsettled fields
+    "full": 0,  # nothing settled
+    "fields_settled": 0,
+    "repairs_avoided": 0,  # repair pass unnecessary once settled-empty fields count
+    "repairs_no_evidence": 0,  # no sentence could answer the missing fields
+}
+_pre_stats_lock = threading.Lock()
+
+
+def _record_pre_stat(plan: str, fields_settled: int = 0) -> None:
+    EXTRACTION_PLANS.inc(plan=plan)
+    with _pre_stats_lock:
+        _pre_stats[plan] += 1
+        _pre_stats["fields_settled"] += fields_settled
+
+
+def get_pre_extraction_stats() -> Dict[str, int]:
+    """Process-wide pre-extraction counters (exposed in ``/status``)."""
+    with _pre_stats_lock:
+        return dict(_pre_stats)
+
+
+def reset_pre_extraction_stats() -> None:
+    with _pre_stats_lock:
+        for key in _pre_stats:
+            _pre_stats[key] = 0
+
+
+# Fused extraction + match analysis calls: "fused" when both parts validated,
+# "fallbacks" when the caller has to run the separate calls instead
+_fused_stats: Dict[str, int] = {"fused": 0, "fallbacks": 0}
+_fused_stats_lock = threading.Lock()
+
+
+def _record_fused(outcome: str) -> None:
+    FUSED_EXTRACTIONS.inc(outcome="fused" if outcome == "fused" else "fallback")
+    with _fused_stats_lock:
+        _fused_stats[outcome] += 1
+
+
+def get_fused_extraction_stats() -> Dict[str, int]:
+    """Process-wide fused-call counters (exposed in ``/status``)."""
+    with _fused_stats_lock:
+        return dict(_fused_stats)
+
+
+def reset_fused_extraction_stats() -> None:
+    with _fused_stats_lock:
+        for key in _fused_stats:
+            _fused_stats[key] = 0
+
+
+def _apply_settled(extraction: "JobExtractionResult", pre: PreExtraction) -> None:
+    """Overwrite *extraction* with the fields pre-extraction settled."""
+    for name, value in pre.settled.items():
+        setattr(extraction, name, value)
+    extraction.confidence = extraction.compute_confidence()
+
+
 class JobExtractor:
     """
     Extract structured semantic data from job postings using AI.
@@ -492,14 +586,43 @@ class JobExtractor:
     - Employment type
     """
 
-    def __init__(self, agent_manager: "InferenceClient"):
+    def __init__(
+        self,
+        agent_manager: "InferenceClient",
+        compactor: Optional[DescriptionCompactor] = None,
+        pre_extractor: Optional[PreExtractor] = None,
+        known_technologies: Iterable[str] = (),
+    ):
         """
         Initialize the extractor.
 
         Args:
             agent_manager: InferenceClient for executing AI tasks
+            compactor: Description compactor applied before prompting (default:
+                token budget and legal boilerplate only, no per-company store)
+            pre_extractor: Rule-based extractor whose settled fields the LLM is
+                not asked for (default: ``PreExtractor()``)
+            known_technologies: Technology names (e.g. the skill taxonomy terms)
+                recognised as evidence when selecting repair excerpts
         """
         self.agent_manager = agent_manager
+        self.compactor = compactor or DescriptionCompactor()
+        self.pre_extractor = pre_extractor or PreExtractor()
+        self.known_technologies = frozenset(t.lower() for t in known_technologies)
+
+    def _compact(self, description: str, company: Optional[str], observe: bool = False) -> str:
+        return self.compactor.compact(description, company=company, observe=observe).text
+
+    @staticmethod
+    def _validate_input(title: str, description: str) -> None:
+        if not description or not title:
+            raise ExtractionError("Empty title or description provided for extraction")
+
+        if len(description) < MIN_DESCRIPTION_LENGTH:
+            raise ExtractionError(
+                f"Description too short for reliable extraction "
+                f"({len(description)} chars < {MIN_DESCRIPTION_LENGTH})"
+            )
 
     def extract(
         self,
@@ -509,6 +632,8 @@ class JobExtractor:
         posted_date: Optional[str] = None,
         salary_range: Optional[str] = None,
         url: Optional[str] = None,
+        company: Optional[str] = None,
+        structured: Optional[Dict[str, Any]] = None,
     ) -> JobExtractionResult:
         """
         Extract structured data from a job posting.
@@ -520,6 +645,8 @@ class JobExtractor:
             posted_date: Optional posted date string from posting
             salary_range: Optional pre-extracted salary range from ATS API
             url: Optional job listing URL (may contain metadata)
+            company: Optional company name (keys per-company boilerplate removal)
+            structured: Optional structured ATS fields (see ``structured_fields``)
 
         Returns:
             JobExtractionResult with extracted data
@@ -527,41 +654,251 @@ class JobExtractor:
         Raises:
             ExtractionError: If title/description empty or description too short
         """
-        if not description or not title:
-            raise ExtractionError("Empty title or description provided for extraction")
+        self._validate_input(title, description)
+        compacted = self._compact(description, company, observe=True)
+        pre = self.pre_extractor.extract(
+            title, description, location, posted_date, salary_range, structured
+        )
+        return self._extract(
+            title, description, compacted, location, posted_date, salary_range, url, pre
+        )
 
-        if len(description) < MIN_DESCRIPTION_LENGTH:
-            raise ExtractionError(
-                f"Description too short for reliable extraction "
-                f"({len(description)} chars < {MIN_DESCRIPTION_LENGTH})"
-            )
+    def _extract(
+        self,
+        title: str,
+        description: str,
+        compacted: str,
+        location: Optional[str],
+        posted_date: Optional[str],
+        salary_range: Optional[str],
+        url: Optional[str],
+        pre: Optional[PreExtraction] = None,
+    ) -> JobExtractionResult:
+        """Prompt with the *compacted* text; guard against the full *description*.
+
+        Fields *pre* settled are not asked for (no call at all when every
+        field is settled) and override whatever the model returns.
+        """
+        pre = pre or PreExtraction()
+        fields: Optional[List[str]] = None
+        settled = len(pre.settled)
+        if settled:
+            fields = pre.remaining(EXTRACTION_FIELD_KEYS)
+            if not fields:
+                _record_pre_stat("skipped", settled)
+                extraction = JobExtractionResult(extraction_model=RULES_MODEL)
+                _apply_settled(extraction, pre)
+                _apply_guards(extraction, description, salary_range)
+                return extraction
+        _record_pre_stat("targeted" if settled else "full", settled)
 
         system_prompt, user_prompt = build_extraction_prompt(
             title,
-            description,
+            compacted,
             location,
             posted_date,
             salary_range=salary_range,
             url=url,
+            fields=fields,
         )
         result = self.agent_manager.execute(
             task_type="extraction",
             prompt=user_prompt,
             system_prompt=system_prompt,
             response_format="json",
+            expected_keys=EXTRACTION_RESPONSE_KEYS,
             max_tokens=2048,
             temperature=0.1,  # Low temperature for consistent extraction
         )
-        extraction = self._parse_response(result.text)
-        extraction.extraction_model = result.model
+        # A stopped stream keeps the complete fields (extract_with_repair fills
+        # the rest); one that stopped before any field is a failed extraction.
+        stream_outcome = getattr(result, "stream_outcome", None)
+        if isinstance(stream_outcome, str) and stream_outcome != OUTCOME_COMPLETE:
+            if result.text.strip() == "{}":
+                raise ExtractionError(
+                    f"AI response stream stopped ({stream_outcome}) before any field"
+                )
+        return self._finish(
+            self._parse_response(result.text), result.model, description, salary_range, pre
+        )
+
+    def _finish(
+        self,
+        extraction: JobExtractionResult,
+        model: str,
+        description: str,
+        salary_range: Optional[str],
+        pre: PreExtraction,
+    ) -> JobExtractionResult:
+        """Stamp the model on a parsed extraction, apply settled fields and guards."""
+        extraction.extraction_model = model
+        _apply_settled(extraction, pre)
 
         # Post-extraction validation guards
-        _sanitize_technologies(extraction)
-        _guard_salary(extraction, description, salary_range)
-        _guard_equity(extraction, description)
+        _apply_guards(extraction, description, salary_range)
 
         return extraction
 
+    def extract_batch(
+        self,
+        jobs: List[Dict[str, Any]],
+        batch_size: int = DEFAULT_EXTRACTION_BATCH_SIZE,
+    ) -> List[BatchExtractionOutcome]:
+        """
+        Extract several job postings, packing short ones into shared requests.
+
+        Listings with descriptions up to BATCH_MAX_DESCRIPTION_LENGTH are sent
+        ``batch_size`` at a time with a multi-result prompt; each sub-result is
+        validated with the same parser and guards as ``extract``. Any listing
+        that is long, missing from the batch response, or fails validation is
+        retried with a single ``extract`` call.
+
+        Args:
+            jobs: Dicts with ``title``, ``description`` and optional
+                ``location``, ``posted_date``, ``salary_range``, ``url``,
+                ``structured`` keys
+            batch_size: Maximum listings per batched request
+
+        Returns:
+            One BatchExtractionOutcome per input job, in input order
+        """
+        outcomes: List[Optional[BatchExtractionOutcome]] = [None] * len(jobs)
+        batchable: List[int] = []
+
+        for i, job in enumerate(jobs):
+            description = job.get("description") or ""
+            if not description or not job.get("title"):
+                outcomes[i] = BatchExtractionOutcome(
+                    error="Empty title or description provided for extraction"
+                )
+            elif len(description) < MIN_DESCRIPTION_LENGTH:
+                outcomes[i] = BatchExtractionOutcome(
+                    error=(
+                        f"Description too short for reliable extraction "
+                        f"({len(description)} chars < {MIN_DESCRIPTION_LENGTH})"
+                    )
+                )
+            elif batch_size > 1 and len(description) <= BATCH_MAX_DESCRIPTION_LENGTH:
+                batchable.append(i)
+
+        for start in range(0, len(batchable), batch_size):
+            group = batchable[start : start + batch_size]
+            if len(group) < 2:
+                continue
+            for i, extraction in self._extract_group([jobs[i] for i in group], group).items():
+                outcomes[i] = BatchExtractionOutcome(result=extraction, batched=True)
+
+        for i, job in enumerate(jobs):
+            if outcomes[i] is not None:
+                continue
+            try:
+                outcomes[i] = BatchExtractionOutcome(
+                    result=self.extract(
+                        job.get("title", ""),
+                        job.get("description", ""),
+                        job.get("location"),
+                        job.get("posted_date"),
+                        salary_range=job.get("salary_range"),
+                        url=job.get("url"),
+                        company=job.get("company"),
+                        structured=job.get("structured"),
+                    )
+                )
+            except ExtractionError as e:
+                outcomes[i] = BatchExtractionOutcome(error=str(e))
+
+        return cast(List[BatchExtractionOutcome], outcomes)
+
+    def _extract_group(
+        self, group_jobs: List[Dict[str, Any]], indices: List[int]
+    ) -> Dict[int, JobExtractionResult]:
+        """Run one batched request; return validated results by input index.
+
+        Listings whose sub-result is missing or invalid are simply absent from
+        the returned mapping so the caller falls back to single extraction.
+        """
+        prompt_jobs = [
+            {**job, "description": self._compact(job.get("description", ""), job.get("company"))}
+            for job in group_jobs
+        ]
+        system_prompt, user_prompt = build_batch_extraction_prompt(prompt_jobs)
+        try:
+            result = self.agent_manager.execute(
+                task_type="extraction",
+                prompt=user_prompt,
+                system_prompt=system_prompt,
+                response_format="json",
+                expected_keys=BATCH_EXTRACTION_RESPONSE_KEYS,
+                max_tokens=_BATCH_TOKENS_PER_ITEM * len(group_jobs),
+                temperature=0.1,
+            )
+            entries = self._parse_batch_entries(result.text)
+        except ExtractionError as e:
+            logger.warning("Batch extraction of %d listings failed: %s", len(group_jobs), e)
+            return {}
+
+        extracted: Dict[int, JobExtractionResult] = {}
+        for position, (job, index) in enumerate(zip(group_jobs, indices), start=1):
+            entry = entries.get(position)
+            if entry is None:
+                logger.debug("Batch result missing for listing %d; falling back", position)
+                continue
+            pre = self.pre_extractor.extract(
+                job.get("title", ""),
+                job.get("description", ""),
+                job.get("location"),
+                job.get("posted_date"),
+                job.get("salary_range"),
+                job.get("structured"),
+            )
+            try:
+                extraction = self._finish(
+                    self._result_from_data(entry),
+                    result.model,
+                    job.get("description", ""),
+                    job.get("salary_range"),
+                    pre,
+                )
+            except (ExtractionError, TypeError, ValueError) as e:
+                logger.debug("Batch result %d invalid (%s); falling back", position, e)
+                continue
+            extracted[index] = extraction
+
+        logger.info(
+            "Batch extraction: %d/%d listings extracted in one request",
+            len(extracted),
+            len(group_jobs),
+        )
+        return extracted
+
+    def _parse_batch_entries(self, response: str) -> Dict[int, Dict[str, Any]]:
+        """Decode ``{"results": [...]}`` into {1-based index: entry}."""
+        if not response or not response.strip():
+            raise ExtractionError("AI returned empty response")
+
+        json_str = extract_json_from_response(response)
+        json_str = re.sub(r'"timezone"\s*:\s*\+(\d+(?:\.\d+)?)', r'"timezone": \1', json_str)
+        try:
+            data = json.loads(json_str)
+        except json.JSONDecodeError as e:
+            raise ExtractionError(f"Failed to parse batch response as JSON: {e}") from e
+
+        results = data.get("results") if isinstance(data, dict) else data
+        if not isinstance(results, list):
+            raise ExtractionError("Batch response has no results array")
+
+        entries: Dict[int, Dict[str, Any]] = {}
+        for position, entry in enumerate(results, start=1):
+            if not isinstance(entry, dict):
+                continue
+            index = entry.pop("index", position)
+            try:
+                index = int(index)
+            except (TypeError, ValueError):
+                index = position
+            entries.setdefault(index, entry)
+        return entries
+
     def _parse_response(self, response: str) -> JobExtractionResult:
         """
         Parse AI response into JobExtractionResult.
@@ -575,6 +912,10 @@ class JobExtractor:
         Raises:
             ExtractionError: If response cannot be parsed as valid JSON
         """
+        return self._result_from_data(self._decode_response(response))
+
+    def _decode_response(self, response: str) -> Any:
+        """Decode the JSON value of an AI response (ExtractionError if there is none)."""
         if not response or not response.strip():
             raise ExtractionError("AI returned empty response")
 
@@ -591,12 +932,17 @@ class JobExtractor:
         json_str = re.sub(r'"timezone"\s*:\s*\+(\d+(?:\.\d+)?)', r'"timezone": \1', json_str)
 
         try:
-            data = json.loads(json_str)
+            return json.loads(json_str)
         except json.JSONDecodeError as e:
             raise ExtractionError(
                 f"Failed to parse AI response as JSON: {e}. JSON preview: {json_str[:200]}"
             ) from e
 
+    def _result_from_data(self, data: Any) -> JobExtractionResult:
+        """Build a JobExtractionResult from one decoded extraction object."""
+        if not isinstance(data, dict):
+            raise ExtractionError(f"Expected a JSON object, got {type(data).__name__}")
+
         # Normalize technologies to lowercase
         if "technologies" in data and isinstance(data["technologies"], list):
             data["technologies"] = [
@@ -614,9 +960,17 @@ class JobExtractor:
         salary_range: Optional[str] = None,
         url: Optional[str] = None,
         confidence_threshold: float = 0.7,
+        company: Optional[str] = None,
+        structured: Optional[Dict[str, Any]] = None,
+        pre: Optional[PreExtraction] = None,
     ) -> JobExtractionResult:
         """Extract with a single repair pass if confidence is below threshold.
 
+        Fields pre-extraction settled as empty (e.g. no salary text at all)
+        count as known for the threshold and are never sent to repair. The
+        repair prompt carries only the description sentences that can answer
+        the missing fields (``select_repair_excerpts``), not the description.
+
         Args:
             title: Job title
             description: Full job description
@@ -625,18 +979,37 @@ class JobExtractor:
             salary_range: Optional pre-extracted salary range
             url: Optional job listing URL
             confidence_threshold: Minimum confidence to skip repair (default 0.7)
+            company: Optional company name (keys per-company boilerplate removal)
+            structured: Optional structured ATS fields (see ``structured_fields``)
+            pre: Optional pre-extraction already run on these inputs
 
         Returns:
             JobExtractionResult, potentially repaired
         """
-        result = self.extract(
-            title,
-            description,
-            location,
-            posted_date,
-            salary_range=salary_range,
-            url=url,
+        self._validate_input(title, description)
+        compacted = self._compact(description, company, observe=True)
+        if pre is None:
+            pre = self.pre_extractor.extract(
+                title, description, location, posted_date, salary_range, structured
+            )
+        result = self._extract(
+            title, description, compacted, location, posted_date, salary_range, url, pre
         )
+        return self._repair(
+            result, title, compacted, location, posted_date, pre, confidence_threshold
+        )
+
+    def _repair(
+        self,
+        result: JobExtractionResult,
+        title: str,
+        compacted: str,
+        location: Optional[str],
+        posted_date: Optional[str],
+        pre: PreExtraction,
+        confidence_threshold: float,
+    ) -> JobExtractionResult:
+        """Run the repair pass on *result* when its confidence is below threshold."""
         initial_confidence = result.confidence
         if result.confidence >= confidence_threshold:
             logger.debug(
@@ -646,27 +1019,50 @@ class JobExtractor:
             )
             return result
 
-        missing = result.missing_fields()
+        missing = pre.remaining(result.missing_fields())
+        known = 1 - len(missing) / len(JobExtractionResult.CONFIDENCE_FIELDS)
+        if known >= confidence_threshold:
+            logger.debug(
+                "Extraction confidence %.2f, but %s settled as empty; skipping repair",
+                result.confidence,
+                [f for f in result.missing_fields() if f not in missing],
+            )
+            _record_pre_stat("repairs_avoided")
+            return result
+
+        plan = select_repair_excerpts(
+            compacted, missing, location, known_technologies=self.known_technologies
+        )
+        if not plan.fields:
+            logger.debug("No description text mentions %s; skipping repair", missing)
+            _record_pre_stat("repairs_no_evidence")
+            return result
+
         logger.info(
-            "Extraction confidence %.2f < %.2f, attempting repair for: %s",
+            "Extraction confidence %.2f < %.2f, attempting repair for: %s "
+            "(%d excerpts, ~%d tokens)",
             result.confidence,
             confidence_threshold,
-            missing,
+            plan.fields,
+            len(plan.excerpts),
+            plan.tokens,
         )
 
         try:
             repair_system, repair_user = build_repair_prompt(
                 title,
-                description,
-                missing,
+                compacted,
+                plan.fields,
                 location,
                 posted_date,
+                excerpts=plan.excerpts,
             )
             repair_response = self.agent_manager.execute(
                 task_type="extraction",
                 prompt=repair_user,
                 system_prompt=repair_system,
                 response_format="json",
+                expected_keys=EXTRACTION_RESPONSE_KEYS,
                 max_tokens=1024,
                 temperature=0.1,
             )
@@ -682,3 +1078,99 @@ class JobExtractor:
             logger.warning("Extraction repair failed, keeping original: %s", e, exc_info=True)
 
         return result
+
+    def extract_fused(
+        self,
+        job: Dict[str, Any],
+        matcher: "AIJobMatcher",
+        pre: Optional[PreExtraction] = None,
+        confidence_threshold: float = 0.7,
+    ) -> Optional[FusedExtraction]:
+        """Extract and analyze the match in one call; None means "use the separate calls".
+
+        One "fused" task call answers the extraction prompt (field list and
+        all) and the match-analysis prompt together, with the posting sent
+        once. Each part is validated on its own: the extraction part gets the
+        settled fields and guards of ``extract`` (and the repair pass of
+        ``extract_with_repair``), the analysis part
+        ``matcher.is_valid_analysis``. If either part fails, nothing is kept
+        and the caller falls back to ``extract_with_repair`` +
+        ``analyze_job``. Also None, without a call, when pre-extraction
+        settles every field (extraction then makes no call to fuse with).
+
+        Args:
+            job: Dict with ``title``, ``description`` and optional
+                ``location``, ``posted_date``, ``salary_range``, ``url``,
+                ``company``, ``company_info``, ``structured`` keys
+            matcher: AIJobMatcher whose profile and instructions the
+                analysis part uses
+            pre: Optional pre-extraction already run on these inputs
+            confidence_threshold: Minimum confidence to skip repair (default 0.7)
+
+        Raises:
+            ExtractionError: If title/description empty or description too short
+        """
+        title = job.get("title", "")
+        description = job.get("description", "")
+        location = job.get("location")
+        posted_date = job.get("posted_date")
+        salary_range = job.get("salary_range")
+        self._validate_input(title, description)
+        compacted = self._compact(description, job.get("company"), observe=True)
+        if pre is None:
+            pre = self.pre_extractor.extract(
+                title, description, location, posted_date, salary_range, job.get("structured")
+            )
+        fields: Optional[List[str]] = None
+        if pre.settled:
+            fields = pre.remaining(EXTRACTION_FIELD_KEYS)
+            if not fields:
+                return None
+
+        extraction_prompt = build_extraction_prompt(
+            title,
+            compacted,
+            location,
+            posted_date,
+            salary_range=salary_range,
+            url=job.get("url"),
+            fields=fields,
+        )
+        system_prompt, user_prompt = matcher.build_fused_prompt(job, extraction_prompt)
+        result = self.agent_manager.execute(
+            task_type="fused",
+            prompt=user_prompt,
+            system_prompt=system_prompt,
+            response_format="json",
+            expected_keys=FUSED_RESPONSE_KEYS,
+            max_tokens=2048 + 1400,  # extraction + analysis budgets
+            temperature=0.1,
+        )
+        try:
+            stream_outcome = getattr(result, "stream_outcome", None)
+            if isinstance(stream_outcome, str) and stream_outcome != OUTCOME_COMPLETE:
+                raise ExtractionError(f"response stream stopped ({stream_outcome})")
+            data = self._decode_response(result.text)
+            if not isinstance(data, dict):
+                raise ExtractionError(f"Expected a JSON object, got {type(data).__name__}")
+            extraction = self._finish(
+                self._result_from_data(data.get("extraction")),
+                result.model,
+                description,
+                salary_range,
+                pre,
+            )
+            analysis = data.get("analysis")
+            if not matcher.is_valid_analysis(analysis):
+                raise ExtractionError("analysis part missing or incomplete")
+        except (ExtractionError, TypeError, ValueError) as e:
+            logger.warning("Fused extraction of %r unusable (%s); using separate calls", title, e)
+            _record_fused("fallbacks")
+            return None
+
+        _record_pre_stat("targeted" if pre.settled else "full", len(pre.settled))
+        _record_fused("fused")
+        extraction = self._repair(
+            extraction, title, compacted, location, posted_date, pre, confidence_threshold
+        )
+        return FusedExtraction(extraction=extraction, analysis=cast(Dict[str, Any], analysis))
@@ -2,27 +2,37 @@
 
 Each prompt function returns a PromptPair (system, user) to enable:
 - Clear separation of general instructions (system) from per-request context (user)
-- Prompt caching on providers that support it (system prompt is stable per day)
+- Prefix reuse: system prompts are byte-identical across calls (no dates,
+  counts or field lists), so providers with prompt caching and backends with
+  prefix/KV caching (vLLM, llama.cpp behind LiteLLM) skip re-processing them
 - Better instruction following on local models (clear system/user separation)
+
+Everything that varies per request (today's date, the posting, missing-field
+lists, batch sizes) goes in the user message, after the stable prefix.
 """
 
+import hashlib
+import json
 from datetime import date
-from typing import List, Optional, Tuple
+from typing import Any, Dict, List, Optional, Tuple
+
+from job_finder.ai.compaction import fit_description
 
 # (system_prompt, user_prompt)
 PromptPair = Tuple[str, str]
 
 
-def _build_extraction_system_prompt() -> str:
-    """Build the system prompt for extraction (stable per day, cacheable intra-day)."""
-    today_str = date.today().isoformat()
+def _today_line() -> str:
+    """First line of every extraction user prompt (kept out of the stable prefix)."""
+    return f"Today's date: {date.today().isoformat()}"
+
 
-    return f"""You are a job posting data extractor. Extract structured information and return ONLY a valid JSON object.
+_EXTRACTION_SYSTEM_PROMPT = """You are a job posting data extractor. Extract structured information and return ONLY a valid JSON object.
 
-Today's date: {today_str}
+Today's date is given on the first line of each request. When the request lists the only fields to return, return just those.
 
 Extract and return this exact JSON structure (use null for unknown values, false for unknown booleans):
-{{
+{
   "seniority": "<junior|mid|senior|staff|lead|principal|unknown>",
   "workArrangement": "<remote|hybrid|onsite|unknown>",
   "timezone": <UTC offset as float, e.g. -8 for PST, +5.5 for India, or null>,
@@ -42,7 +52,7 @@ Extract and return this exact JSON structure (use null for unknown values, false
   "isLead": <true if technical lead role, false otherwise>,
   "roleTypes": ["<role-type-1>", "<role-type-2>", ...],
   "timezoneFlexible": <true if no timezone requirement, false otherwise>
-}}
+}
 
 Rules:
 1. Infer seniority from title and description:
@@ -87,9 +97,9 @@ Rules:
    - India -> +5.5
    - If no location/timezone info, use null
 
-6. For daysOld, calculate days between posted date and today ({today_str}):
+6. For daysOld, calculate days between posted date and today's date:
    - "Posted 3 days ago" -> 3
-   - "Posted December 1, 2025" with today {today_str} -> calculate difference
+   - "Posted December 1, 2025" with today's date 2025-12-15 -> 14
    - If no posted date or unclear, use null
 
 7. roleTypes - array of role type strings that describe the position. Include ALL that apply:
@@ -121,6 +131,40 @@ Rules:
 Return ONLY the JSON object, no explanation or markdown."""
 
 
+# JobExtractionResult attribute -> response key, in schema order
+EXTRACTION_FIELD_KEYS: Dict[str, str] = {
+    "seniority": "seniority",
+    "work_arrangement": "workArrangement",
+    "timezone": "timezone",
+    "city": "city",
+    "salary_min": "salaryMin",
+    "salary_max": "salaryMax",
+    "experience_min": "experienceMin",
+    "experience_max": "experienceMax",
+    "technologies": "technologies",
+    "days_old": "daysOld",
+    "is_repost": "isRepost",
+    "relocation_required": "relocationRequired",
+    "includes_equity": "includesEquity",
+    "is_contract": "isContract",
+    "employment_type": "employmentType",
+    "is_management": "isManagement",
+    "is_lead": "isLead",
+    "role_types": "roleTypes",
+    "timezone_flexible": "timezoneFlexible",
+}
+
+# Top-level keys each response schema allows (lets streamed calls stop off-schema output)
+EXTRACTION_RESPONSE_KEYS = frozenset(EXTRACTION_FIELD_KEYS.values())
+BATCH_EXTRACTION_RESPONSE_KEYS = frozenset({"results"})
+TAXONOMY_RESPONSE_KEYS = frozenset({"result"})
+
+
+def _build_extraction_system_prompt() -> str:
+    """System prompt for extraction (byte-stable across calls and days)."""
+    return _EXTRACTION_SYSTEM_PROMPT
+
+
 def build_extraction_prompt(
     title: str,
     description: str,
@@ -128,12 +172,17 @@ def build_extraction_prompt(
     posted_date: Optional[str] = None,
     salary_range: Optional[str] = None,
     url: Optional[str] = None,
+    fields: Optional[List[str]] = None,
 ) -> PromptPair:
     """
     Build prompt for extracting structured data from a job posting.
 
     AI extracts DATA ONLY - no scoring or match calculations.
 
+    With *fields* (attribute names, see ``EXTRACTION_FIELD_KEYS``) the user
+    message asks for just those; the system prompt is unchanged, so targeted
+    calls share the cached prefix and only the response gets shorter.
+
     Args:
         title: Job title
         description: Job description text
@@ -141,12 +190,29 @@ def build_extraction_prompt(
         posted_date: Optional posted date string
         salary_range: Optional pre-extracted salary range from ATS API
         url: Optional job listing URL (may contain metadata like employmentType)
+        fields: Optional subset of fields to return (None: all)
 
     Returns:
         PromptPair of (system_prompt, user_prompt) for AI extraction
     """
     system = _build_extraction_system_prompt()
+    job = _build_job_section(title, description, location, posted_date, salary_range, url)
+    header = _today_line()
+    if fields is not None:
+        names = ", ".join(EXTRACTION_FIELD_KEYS.get(f, f) for f in fields)
+        header += f"\nReturn only these fields: {names}"
+    return (system, f"{header}\n\n{job}")
 
+
+def _build_job_section(
+    title: str,
+    description: str,
+    location: Optional[str] = None,
+    posted_date: Optional[str] = None,
+    salary_range: Optional[str] = None,
+    url: Optional[str] = None,
+) -> str:
+    """Per-job user content shared by single and batch extraction prompts."""
     location_section = f"\nLocation: {location}" if location else ""
     posted_section = f"\nPosted: {posted_date}" if posted_date else ""
 
@@ -163,12 +229,94 @@ def build_extraction_prompt(
             + "\n".join(structured_lines)
         )
 
-    user = f"""Job Title: {title}{location_section}{posted_section}{structured_section}
+    return f"""Job Title: {title}{location_section}{posted_section}{structured_section}
 
 Job Description:
-{description[:8000]}"""
+{fit_description(description)}"""
+
+
+_BATCH_SYSTEM_PROMPT = (
+    _EXTRACTION_SYSTEM_PROMPT.replace(
+        "\n\nReturn ONLY the JSON object, no explanation or markdown.", ""
+    )
+    + """
+
+BATCH MODE: You will receive several job postings, each introduced by a line "=== JOB <n> ===".
+Extract each posting independently — never copy values between postings.
+Return ONLY a JSON object of this form, with exactly one entry per posting in order:
+{"results": [{"index": 1, <extraction fields for job 1>}, {"index": 2, <extraction fields for job 2>}]}
+
+Return ONLY the JSON object, no explanation or markdown."""
+)
+
+
+def build_batch_extraction_prompt(jobs: List[Dict[str, Any]]) -> PromptPair:
+    """
+    Build one prompt that extracts several job postings at once.
 
-    return (system, user)
+    The system prompt is the single-job extraction prompt plus batch framing,
+    so per-field rules stay identical. It does not depend on the batch size,
+    so batches of any size share one cached prefix. The model must return
+    ``{"results": [{"index": 1, ...}, ...]}`` with one object per posting.
+
+    Args:
+        jobs: Dicts with ``title``, ``description`` and optional ``location``,
+            ``posted_date``, ``salary_range``, ``url`` keys
+
+    Returns:
+        PromptPair of (system_prompt, user_prompt) for batch extraction
+    """
+    sections = [f"{_today_line()}\n\n{len(jobs)} job postings follow."]
+    for n, job in enumerate(jobs, start=1):
+        section = _build_job_section(
+            job.get("title", ""),
+            job.get("description", ""),
+            job.get("location"),
+            job.get("posted_date"),
+            job.get("salary_range"),
+            job.get("url"),
+        )
+        sections.append(f"=== JOB {n} ===\n{section}")
+
+    return (_BATCH_SYSTEM_PROMPT, "\n\n".join(sections))
+
+
+# Repair field key -> (JSON field name, where to look)
+_REPAIR_FIELDS: Dict[str, Tuple[str, str]] = {
+    "seniority": (
+        "seniority",
+        "(junior/mid/senior/staff/lead/principal) — infer from title, years of experience mentioned, or responsibility level",
+    ),
+    "work_arrangement": (
+        "workArrangement",
+        '(remote/hybrid/onsite) — look for "remote", "hybrid", "on-site", office mentions, or location field',
+    ),
+    "timezone": (
+        "timezone",
+        "(UTC offset as float) — infer from city, state, country, or office location mentioned",
+    ),
+    "salary_min": (
+        "salaryMin/salaryMax",
+        "(annual USD integers) — look for salary ranges, hourly rates (convert to annual), or compensation sections",
+    ),
+    "employment_type": (
+        "employmentType",
+        "(full-time/part-time/contract) — look for benefits, contract language, or employment type mentions",
+    ),
+    "technologies": (
+        "technologies",
+        "(array of lowercase strings) — programming languages, frameworks, tools, platforms mentioned in requirements",
+    ),
+}
+
+_REPAIR_SYSTEM_PROMPT = f"""You are a job posting data extractor performing a repair pass. The initial extraction returned null/unknown for several fields; the request lists which ones.
+
+Field guide:
+{chr(10).join(f"- {name} {hint}" for name, hint in _REPAIR_FIELDS.values())}
+
+Re-examine the posting and try harder to infer the listed fields. The request carries either the job description or only the excerpts of it that mention those fields; use the title and location as well. Return ONLY a JSON object with the fields you can now fill. Use camelCase field names. For fields you still cannot determine, use null or "unknown" as appropriate. Do not include fields that were not listed as missing.
+
+Return ONLY the JSON object, no explanation or markdown."""
 
 
 def build_repair_prompt(
@@ -177,6 +325,7 @@ def build_repair_prompt(
     missing_fields: List[str],
     location: Optional[str] = None,
     posted_date: Optional[str] = None,
+    excerpts: Optional[List[str]] = None,
 ) -> PromptPair:
     """Build a targeted repair prompt for fields the initial extraction missed.
 
@@ -186,40 +335,86 @@ def build_repair_prompt(
         missing_fields: List of field names that were null/unknown
         location: Optional location string
         posted_date: Optional posted date string
+        excerpts: Optional description sentences relevant to the missing
+            fields (see ``repair.select_repair_excerpts``); sent in place of
+            the description when given
 
     Returns:
         PromptPair of (system_prompt, user_prompt) for repair extraction
     """
-    today_str = date.today().isoformat()
+    missing_names = ", ".join(_REPAIR_FIELDS.get(f, (f, ""))[0] for f in missing_fields)
+    location_section = f"\nLocation: {location}" if location else ""
+    posted_section = f"\nPosted: {posted_date}" if posted_date else ""
+    if excerpts is not None:
+        quoted = "\n".join(f"- {excerpt}" for excerpt in excerpts) or "(none)"
+        body = f"Relevant excerpts:\n{quoted}"
+    else:
+        body = f"Job Description:\n{fit_description(description)}"
 
-    field_hints = {
-        "seniority": "seniority (junior/mid/senior/staff/lead/principal) — infer from title, years of experience mentioned, or responsibility level",
-        "work_arrangement": 'workArrangement (remote/hybrid/onsite) — look for "remote", "hybrid", "on-site", office mentions, or location field',
-        "timezone": "timezone (UTC offset as float) — infer from city, state, country, or office location mentioned",
-        "salary_min": "salaryMin/salaryMax (annual USD integers) — look for salary ranges, hourly rates (convert to annual), or compensation sections",
-        "employment_type": "employmentType (full-time/part-time/contract) — look for benefits, contract language, or employment type mentions",
-        "technologies": "technologies (array of lowercase strings) — programming languages, frameworks, tools, platforms mentioned in requirements",
-    }
+    user = f"""{_today_line()}
+Missing fields to fill: {missing_names}
 
-    field_descriptions = "\n".join(f"- {field_hints.get(f, f)}" for f in missing_fields)
+Job Title: {title}{location_section}{posted_section}
 
-    system = f"""You are a job posting data extractor performing a repair pass. The initial extraction returned null/unknown for several fields.
+{body}"""
 
-Today's date: {today_str}
+    return (_REPAIR_SYSTEM_PROMPT, user)
 
-Missing fields to fill:
-{field_descriptions}
 
-Re-examine the posting and try harder to infer these specific fields. Return ONLY a JSON object with the fields you can now fill. Use camelCase field names. For fields you still cannot determine, use null or "unknown" as appropriate. Do not include fields that were already successfully extracted.
+# Extraction prompt version recorded with cached extraction results
+# (``job_extraction_cache``). The hash covers the stable system prompts and the
+# field list, so editing them retires cached results; bump the revision for
+# changes the prompt text does not show (guards, pre-extraction rules,
+# response parsing). Today's date lives in the user message and is excluded.
+_EXTRACTION_REVISION = 1
+EXTRACTION_PROMPT_VERSION = (
+    f"r{_EXTRACTION_REVISION}-"
+    + hashlib.sha256(
+        json.dumps(
+            [
+                _EXTRACTION_SYSTEM_PROMPT,
+                _BATCH_SYSTEM_PROMPT,
+                _REPAIR_SYSTEM_PROMPT,
+                EXTRACTION_FIELD_KEYS,
+            ],
+            sort_keys=True,
+        ).encode()
+    ).hexdigest()[:10]
+)
 
-Return ONLY the JSON object, no explanation or markdown."""
 
-    location_section = f"\nLocation: {location}" if location else ""
-    posted_section = f"\nPosted: {posted_date}" if posted_date else ""
+_TAXONOMY_ENRICH_SYSTEM_PROMPT = """You map technology terms found in job postings onto canonical skill names for a skill taxonomy.
 
-    user = f"""Job Title: {title}{location_section}{posted_section}
+For each unknown term in the request, return:
+- term: the term exactly as given
+- canonical: the common lowercase name of the skill (e.g. "reactjs" -> "react", "postgres" -> "postgresql"); use the term itself, lowercased, when it is already canonical
+- category: one of language, frontend, backend, database, cloud, devops, api, cache, data, ml, mobile, testing, security, tool, other
 
-Job Description:
-{description[:8000]}"""
+Use the job title and description only to disambiguate terms. Skip terms that are not technologies or skills.
+
+Return ONLY a JSON object of this form, no explanation or markdown:
+{"result": [{"term": "<term>", "canonical": "<canonical>", "category": "<category>"}]}"""
+
+
+def build_taxonomy_enrich_prompt(
+    unknown_terms: List[str], title: str, description: str
+) -> PromptPair:
+    """Build the prompt that maps unknown technology terms onto canonical skills.
+
+    Args:
+        unknown_terms: Extracted technologies missing from the skill taxonomy
+        title: Job title (context for ambiguous terms)
+        description: Job description (context for ambiguous terms)
+
+    Returns:
+        PromptPair of (system_prompt, user_prompt) for taxonomy enrichment
+    """
+    terms = "\n".join(f"- {term}" for term in unknown_terms)
+    user = f"""Unknown terms:
+{terms}
+
+Job Title: {title}
 
-    return (system, user)
+Job Description:
+{fit_description(description)}"""
+    return (_TAXONOMY_ENRICH_SYSTEM_PROMPT, user)
@@ -9,14 +9,37 @@ AgentManager so callers can swap with minimal changes.
 
 from __future__ import annotations
 
+import hashlib
+import json
 import logging
 import os
+import threading
+import time
+from collections import OrderedDict
 from dataclasses import dataclass
-from typing import Optional
+from typing import Any, Collection, Dict, Optional, Set
 
 from openai import OpenAI, APIConnectionError, APIStatusError, APITimeoutError
 
-from job_finder.ai.task_router import get_model_for_task
+from job_finder.ai.concurrency import AdaptiveConcurrencyLimiter, get_default_limiter
+from job_finder.ai.json_stream import OUTCOME_COMPLETE, JSONStreamScanner
+from job_finder.ai.response_parser import extract_json_from_response
+from job_finder.ai.task_router import (
+    DEFAULT_CACHE_TTL_SECONDS,
+    MAX_CACHEABLE_TEMPERATURE,
+    TASK_CACHE_TTL_SECONDS,
+    get_model_for_task,
+)
+from job_finder.metrics import (
+    LLM_PREFIX_CALLS,
+    LLM_REQUEST_SECONDS,
+    LLM_STREAM_ABORTS,
+    LLM_STREAM_RESULT_SECONDS,
+    LLM_STREAM_TOKENS,
+    LLM_TOKENS,
+)
+from job_finder.storage.llm_response_cache import LLMResponseCache, make_request_key
+from job_finder.tracing import record, span
 from job_finder.exceptions import (
     AIProviderError,
     NoAgentsAvailableError,
@@ -30,17 +53,154 @@ logger = logging.getLogger(__name__)
 _DEFAULT_BASE_URL = "http://litellm:4000"
 _DEFAULT_TIMEOUT = 120
 
+# HTTP statuses that signal backend congestion (shrink the concurrency limit)
+_OVERLOAD_STATUSES = (429, 502, 503)
+
+
+# Process-wide response-cache counters (several InferenceClients share one DB).
+_cache_stats: Dict[str, Dict[str, int]] = {}
+_cache_stats_lock = threading.Lock()
+
+
+def _record_cache_event(task_type: str, event: str) -> None:
+    with _cache_stats_lock:
+        stats = _cache_stats.setdefault(task_type, {"hits": 0, "misses": 0})
+        stats[event] += 1
+
+
+def get_response_cache_stats() -> Dict[str, Dict[str, int]]:
+    """Return response-cache hit/miss counts per task type for this process."""
+    with _cache_stats_lock:
+        return {task: dict(stats) for task, stats in _cache_stats.items()}
+
+
+def reset_response_cache_stats() -> None:
+    """Clear the process-wide response-cache counters."""
+    with _cache_stats_lock:
+        _cache_stats.clear()
+
+
+# Process-wide prompt-prefix counters: how often each task re-sends a prefix
+# the backend may already hold in its prefix/KV cache.
+_PREFIX_HASHES_PER_TASK = 256
+_prefix_seen: Dict[str, "OrderedDict[str, None]"] = {}
+_prefix_stats: Dict[str, Dict[str, int]] = {}
+_prefix_stats_lock = threading.Lock()
+
+
+def prefix_hash(system_prompt: Optional[str]) -> Optional[str]:
+    """Hash of the exact bytes of the stable prompt prefix (the system message)."""
+    if not system_prompt:
+        return None
+    return hashlib.sha256(system_prompt.encode("utf-8")).hexdigest()[:16]
+
+
+def _record_prefix(task_type: str, digest: Optional[str]) -> bool:
+    """Count a call's prefix; True when this process sent the same prefix before."""
+    if digest is None:
+        return False
+    with _prefix_stats_lock:
+        seen = _prefix_seen.setdefault(task_type, OrderedDict())
+        stats = _prefix_stats.setdefault(
+            task_type,
+            {"calls": 0, "repeats": 0, "distinct": 0, "prompt_tokens": 0, "cached_tokens": 0},
+        )
+        stats["calls"] += 1
+        repeat = digest in seen
+        if repeat:
+            stats["repeats"] += 1
+            seen.move_to_end(digest)
+        else:
+            seen[digest] = None
+            if len(seen) > _PREFIX_HASHES_PER_TASK:
+                seen.popitem(last=False)
+        stats["distinct"] = len(seen)
+    LLM_PREFIX_CALLS.inc(task=task_type, prefix="repeat" if repeat else "new")
+    return repeat
+
+
+def _record_prefix_usage(task_type: str, usage: Dict[str, int]) -> None:
+    with _prefix_stats_lock:
+        stats = _prefix_stats.get(task_type)
+        if stats is not None:
+            stats["prompt_tokens"] += usage.get("prompt_tokens", 0)
+            stats["cached_tokens"] += usage.get("cached_tokens", 0)
+
+
+def get_prefix_stats() -> Dict[str, Dict[str, int]]:
+    """Per task type: calls, repeated prefixes, distinct prefixes and cached prompt tokens.
+
+    ``repeats / calls`` is the best-case prefix-cache hit rate; ``cached_tokens /
+    prompt_tokens`` is what the backend actually reported reusing.
+    """
+    with _prefix_stats_lock:
+        return {task: dict(stats) for task, stats in _prefix_stats.items()}
+
+
+def reset_prefix_stats() -> None:
+    """Clear the process-wide prompt-prefix counters."""
+    with _prefix_stats_lock:
+        _prefix_seen.clear()
+        _prefix_stats.clear()
+
+
+def _record_token_usage(model: str, usage) -> Dict[str, int]:
+    """Count prompt/completion tokens in ``LLM_TOKENS``; returns them for the trace.
+
+    Prompt tokens the backend served from its prefix cache (OpenAI-style
+    ``prompt_tokens_details.cached_tokens``) are counted as ``cached_prompt``.
+    """
+    counts: Dict[str, int] = {}
+    for kind in ("prompt_tokens", "completion_tokens"):
+        count = getattr(usage, kind, None)
+        if isinstance(count, int) and count > 0:
+            LLM_TOKENS.inc(count, model=model, kind=kind[: -len("_tokens")])
+            counts[kind] = count
+    cached = getattr(getattr(usage, "prompt_tokens_details", None), "cached_tokens", None)
+    if isinstance(cached, int) and cached > 0:
+        LLM_TOKENS.inc(cached, model=model, kind="cached_prompt")
+        counts["cached_tokens"] = cached
+    return counts
+
+
+def _is_cacheable_text(text: str, response_format: Optional[str]) -> bool:
+    """Never cache empty output or JSON-mode output that doesn't parse."""
+    if not text.strip():
+        return False
+    if response_format == "json":
+        try:
+            json.loads(extract_json_from_response(text))
+        except ValueError:
+            return False
+    return True
+
 
 @dataclass
 class AgentResult:
     """Result from an inference execution.
 
     Kept identical to the old agent_manager.AgentResult so callers don't change.
+    ``stream_outcome`` is set for streamed calls: ``complete``, or why the
+    stream stopped early (``text`` then holds the salvaged partial object).
     """
 
     text: str
     agent_id: str
     model: str
+    cached: bool = False
+    prefix_hash: Optional[str] = None
+    stream_outcome: Optional[str] = None
+
+
+@dataclass
+class _StreamedCompletion:
+    """What a streamed completion produced (the SDK has no response object for it)."""
+
+    text: str
+    model: Optional[str]
+    outcome: str
+    generated_tokens: int
+    usage: Any = None
 
 
 class InferenceClient:
@@ -55,6 +215,11 @@ class InferenceClient:
     - Fallback chains (configured in litellm-config.yaml)
     - Retries and timeouts
     - Budget tracking
+
+    When a ``db_path`` (or ``response_cache``) is given, responses for
+    cacheable task types are served from a persistent prompt-level cache.
+    Task types listed in ``cache_ttls`` are cacheable (extraction by default);
+    callers can opt other types in by adding them, or per call via ``cache=``.
     """
 
     def __init__(
@@ -62,6 +227,9 @@ class InferenceClient:
         base_url: Optional[str] = None,
         api_key: Optional[str] = None,
         timeout: Optional[int] = None,
+        db_path: Optional[str] = None,
+        response_cache: Optional[LLMResponseCache] = None,
+        concurrency_limiter: Optional[AdaptiveConcurrencyLimiter] = None,
     ):
         """Initialize the inference client.
 
@@ -69,6 +237,10 @@ class InferenceClient:
             base_url: LiteLLM proxy origin (default: http://litellm:4000)
             api_key: LiteLLM master key (default: from LITELLM_MASTER_KEY env)
             timeout: Request timeout in seconds (default: 120)
+            db_path: SQLite path for the response cache (cache disabled when None)
+            response_cache: Explicit cache instance (overrides db_path)
+            concurrency_limiter: Per-model in-flight limiter (default: the
+                process-wide adaptive limiter shared by all clients)
         """
         self._base_url = base_url or os.getenv("LITELLM_BASE_URL", _DEFAULT_BASE_URL)
         # The OpenAI SDK rejects empty/None api_key at construction time. Fall back
@@ -92,6 +264,133 @@ class InferenceClient:
         # Set from worker-settings.runtime.useLocalModels by the queue runner.
         self.use_local_models: bool = True
 
+        self.response_cache: Optional[LLMResponseCache] = response_cache or (
+            LLMResponseCache(db_path) if db_path else None
+        )
+        # Task type → TTL seconds for responses that may be served from cache.
+        self.cache_ttls: Dict[str, int] = dict(TASK_CACHE_TTL_SECONDS)
+
+        # Calls from concurrent queue items share per-model in-flight limits.
+        self.concurrency_limiter = concurrency_limiter or get_default_limiter()
+
+        # Task types whose JSON-mode calls stream with early abort (opt-in,
+        # e.g. LITELLM_STREAM_TASKS=extraction,analysis); per call via ``stream=``.
+        self.stream_tasks: Set[str] = {
+            task.strip()
+            for task in os.getenv("LITELLM_STREAM_TASKS", "").split(",")
+            if task.strip()
+        }
+
+    def _create_completion(
+        self,
+        model: str,
+        kwargs: dict,
+        task_type: str = "",
+        digest: Optional[str] = None,
+        scanner: Optional[JSONStreamScanner] = None,
+    ):
+        """Run the chat completion inside a concurrency slot for *model*.
+
+        With a *scanner* the completion is streamed (still inside the slot)
+        and a ``_StreamedCompletion`` is returned instead of the SDK response.
+        Timeouts and 429/502/503 responses are reported to the limiter as
+        congestion; the original exception is re-raised for mapping.
+        """
+        started = time.perf_counter()
+        outcome = "error"
+        try:
+            with span("llm", task=task_type, model=model, prefix=digest) as llm_span:
+                with self.concurrency_limiter.slot(model) as slot:
+                    try:
+                        if scanner is not None:
+                            response = self._stream_completion(model, kwargs, scanner, started)
+                        else:
+                            response = self._client.chat.completions.create(**kwargs)
+                        outcome = "ok"
+                    except APITimeoutError:
+                        outcome = "timeout"
+                        slot.mark_overloaded()
+                        raise
+                    except APIStatusError as e:
+                        outcome = f"http_{e.status_code}"
+                        if e.status_code in _OVERLOAD_STATUSES:
+                            slot.mark_overloaded()
+                        raise
+                usage = _record_token_usage(model, response.usage)
+                _record_prefix_usage(task_type, usage)
+                if llm_span is not None:
+                    llm_span.set(**usage)
+                    if scanner is not None:
+                        llm_span.set(
+                            stream_outcome=response.outcome,
+                            generated_tokens=response.generated_tokens,
+                        )
+                return response
+        finally:
+            LLM_REQUEST_SECONDS.observe(time.perf_counter() - started, model=model, outcome=outcome)
+
+    def _stream_completion(
+        self, model: str, kwargs: dict, scanner: JSONStreamScanner, started: float
+    ) -> _StreamedCompletion:
+        """Stream the completion into *scanner*, closing the stream once it decides."""
+        stream = self._client.chat.completions.create(
+            **kwargs, stream=True, stream_options={"include_usage": True}
+        )
+        actual_model: Optional[str] = None
+        usage = None
+        deltas = 0
+        try:
+            for chunk in stream:
+                actual_model = actual_model or getattr(chunk, "model", None)
+                usage = getattr(chunk, "usage", None) or usage
+                if not chunk.choices:
+                    continue
+                delta = chunk.choices[0].delta.content or ""
+                if delta:
+                    deltas += 1
+                    if scanner.feed(delta):
+                        break
+        finally:
+            # Stops generation on the backend when we abort mid-stream
+            stream.close()
+
+        outcome = scanner.finish()
+        # Servers stream about one token per delta; usage only arrives on a full read
+        reported = getattr(usage, "completion_tokens", None)
+        generated = reported if isinstance(reported, int) else deltas
+        LLM_STREAM_RESULT_SECONDS.observe(
+            time.perf_counter() - started, model=model, outcome=outcome
+        )
+        LLM_STREAM_TOKENS.observe(generated, model=model, outcome=outcome)
+        if outcome != OUTCOME_COMPLETE:
+            LLM_STREAM_ABORTS.inc(model=model, reason=outcome)
+            logger.warning(
+                "LiteLLM stream ended early (%s) after %d tokens; keeping partial result",
+                outcome,
+                generated,
+            )
+        return _StreamedCompletion(
+            text=scanner.salvage(),
+            model=actual_model,
+            outcome=outcome,
+            generated_tokens=generated,
+            usage=usage,
+        )
+
+    def _cache_ttl_for(
+        self, task_type: str, temperature: float, cache: Optional[bool]
+    ) -> Optional[int]:
+        """Return the TTL to cache this request with, or None if uncacheable."""
+        if self.response_cache is None or cache is False:
+            return None
+        if temperature > MAX_CACHEABLE_TEMPERATURE:
+            return None
+        if task_type in self.cache_ttls:
+            return self.cache_ttls[task_type]
+        if cache:
+            return DEFAULT_CACHE_TTL_SECONDS
+        return None
+
     def execute(
         self,
         task_type: str,
@@ -102,6 +401,9 @@ class InferenceClient:
         scope: Optional[str] = None,  # Accepted for API compat, unused
         system_prompt: Optional[str] = None,
         response_format: Optional[str] = None,
+        cache: Optional[bool] = None,
+        stream: Optional[bool] = None,
+        expected_keys: Optional[Collection[str]] = None,
     ) -> AgentResult:
         """Execute an AI task via LiteLLM proxy.
 
@@ -117,9 +419,22 @@ class InferenceClient:
             temperature: Sampling temperature
             scope: Ignored (kept for API compatibility)
             system_prompt: Optional system message prepended to the messages array.
-                Enables prompt caching on providers that support it (e.g. Claude).
+                Keep it byte-stable (instructions, schema, profile) and put per-call
+                data in ``prompt``: providers with prompt caching and backends with
+                prefix/KV caching then reuse it. Its hash is recorded per call
+                (``AgentResult.prefix_hash``, ``get_prefix_stats``).
             response_format: When "json", passes response_format={"type": "json_object"}
                 to guarantee valid JSON output from the model.
+            cache: None follows the task-type policy (``cache_ttls``); True opts
+                this call in, False bypasses the response cache.
+            stream: JSON-mode calls only. None follows ``stream_tasks``. When
+                streaming, the response is scanned as it arrives: generation
+                stops once the top-level object closes, or as soon as the output
+                is clearly not the expected object (prose, an array, an
+                unexpected first key). A stopped or truncated stream returns the
+                complete members received so far (``AgentResult.stream_outcome``).
+            expected_keys: Top-level keys the response schema allows, used to
+                stop off-schema streams early
 
         Returns:
             AgentResult with response text and metadata
@@ -146,10 +461,47 @@ class InferenceClient:
         if response_format == "json":
             kwargs["response_format"] = {"type": "json_object"}
 
+        cache_ttl = self._cache_ttl_for(task_type, temperature, cache)
+        cache_key: Optional[str] = None
+        if cache_ttl is not None and self.response_cache is not None:
+            cache_key = make_request_key(
+                model,
+                prompt,
+                system_prompt=system_prompt,
+                temperature=temperature,
+                max_tokens=max_tokens,
+                response_format=response_format,
+            )
+            cached = self.response_cache.get(cache_key)
+            if cached is not None:
+                _record_cache_event(task_type, "hits")
+                record("llm_cache_hit", task_type, 0.0)
+                cached_text, cached_model = cached
+                logger.debug("LLM response cache hit: task=%s model=%s", task_type, model)
+                return AgentResult(
+                    text=cached_text,
+                    agent_id=f"litellm:{model}",
+                    model=cached_model or model,
+                    cached=True,
+                )
+            _record_cache_event(task_type, "misses")
+
+        digest = prefix_hash(system_prompt)
+        repeat = _record_prefix(task_type, digest)
+        logger.debug("LLM prefix: task=%s hash=%s repeat=%s", task_type, digest, repeat)
+        use_stream = response_format == "json" and (
+            stream if stream is not None else task_type in self.stream_tasks
+        )
+        scanner = JSONStreamScanner(expected_keys) if use_stream else None
         try:
-            response = self._client.chat.completions.create(**kwargs)
-
-            text = response.choices[0].message.content or ""
+            response = self._create_completion(model, kwargs, task_type, digest, scanner)
+
+            stream_outcome: Optional[str] = None
+            if isinstance(response, _StreamedCompletion):
+                text = response.text
+                stream_outcome = response.outcome
+            else:
+                text = response.choices[0].message.content or ""
             actual_model = response.model or model
 
             logger.info(
@@ -159,10 +511,21 @@ class InferenceClient:
                 getattr(response.usage, "total_tokens", "?"),
             )
 
+            if (
+                cache_key is not None
+                and stream_outcome in (None, OUTCOME_COMPLETE)
+                and cache_ttl is not None
+                and self.response_cache is not None
+                and _is_cacheable_text(text, response_format)
+            ):
+                self.response_cache.set(cache_key, task_type, model, text, actual_model, cache_ttl)
+
             return AgentResult(
                 text=text,
                 agent_id=f"litellm:{model}",
                 model=actual_model,
+                prefix_hash=digest,
+                stream_outcome=stream_outcome,
             )
 
         except APITimeoutError as e:
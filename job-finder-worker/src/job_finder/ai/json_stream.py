@@ -0,0 +1,194 @@
+"""Incremental scanning of streamed JSON responses.
+
+``InferenceClient`` normally waits for the whole completion before handing
+it to ``extract_json_from_response``, so a model that rambles past the
+object, answers in prose, or runs into ``max_tokens`` costs the full
+generation time. ``JSONStreamScanner`` is fed the streamed deltas and
+decides as early as possible:
+
+- ``complete``: the top-level object closed; anything after it (trailing
+  chatter, a closing code fence) is never generated
+- ``prose``: no ``{`` within ``max_preamble_chars`` of visible text
+- ``not_object``: the response opened with ``[`` or a bare scalar
+- ``off_schema``: the first top-level key is not one the caller expects
+
+Whitespace, a ```json fence and ``<think>...</think>`` blocks before the
+object are skipped. Whatever the outcome, ``salvage()`` returns the longest
+valid JSON built from the complete members seen so far (closing any open
+containers), so a truncated or aborted response still yields a partial
+object for the callers' repair paths.
+"""
+
+from __future__ import annotations
+
+from typing import Collection, List, Optional
+
+OUTCOME_COMPLETE = "complete"
+ABORT_PROSE = "prose"
+ABORT_NOT_OBJECT = "not_object"
+ABORT_OFF_SCHEMA = "off_schema"
+# Stream ended (finish_reason "length", or it just stopped) before the object closed
+OUTCOME_TRUNCATED = "truncated"
+
+DEFAULT_MAX_PREAMBLE_CHARS = 200
+
+_THINK_OPEN = "<think>"
+_THINK_CLOSE = "</think>"
+_SCALAR_END = ",}] \t\r\n"
+
+
+class JSONStreamScanner:
+    """Character-level tracker for one streamed top-level JSON object."""
+
+    def __init__(
+        self,
+        expected_keys: Optional[Collection[str]] = None,
+        max_preamble_chars: int = DEFAULT_MAX_PREAMBLE_CHARS,
+    ):
+        """
+        Args:
+            expected_keys: Top-level keys the caller's schema allows (None: any)
+            max_preamble_chars: Visible characters tolerated before the ``{``
+        """
+        self.expected_keys = set(expected_keys) if expected_keys is not None else None
+        self.max_preamble_chars = max_preamble_chars
+        self.outcome: Optional[str] = None
+
+        self._raw: List[str] = []
+        self._preamble = ""
+        self._in_think = False
+        # Scanning state once the object has started
+        self._text: List[str] = []
+        self._started = False
+        self._stack: List[str] = []  # closers
+        self._expect_key: List[bool] = []  # per container (always False for arrays)
+        self._in_string = False
+        self._string_is_key = False
+        self._escape = False
+        self._in_scalar = False
+        self._key_chars: List[str] = []
+        self._seen_first_key = False
+        # Longest prefix ending on a complete member, and the closers it needs
+        self._safe_len = 0
+        self._safe_closers = ""
+
+    @property
+    def raw_text(self) -> str:
+        """Everything fed so far."""
+        return "".join(self._raw)
+
+    @property
+    def text(self) -> str:
+        """The JSON text from the opening ``{`` (trailing content excluded)."""
+        return "".join(self._text)
+
+    def feed(self, chunk: str) -> Optional[str]:
+        """Consume one streamed delta; return the outcome once decided."""
+        if self.outcome is not None or not chunk:
+            return self.outcome
+        self._raw.append(chunk)
+        for char in chunk:
+            if not self._started:
+                self._scan_preamble(char)
+            else:
+                self._scan_json(char)
+            if self.outcome is not None:
+                break
+        return self.outcome
+
+    def finish(self) -> str:
+        """The outcome once the stream has ended."""
+        if self.outcome is None:
+            self.outcome = OUTCOME_TRUNCATED if self._started else ABORT_PROSE
+        return self.outcome
+
+    def salvage(self) -> str:
+        """Valid JSON for what was received: the full object, or its complete members."""
+        if self.outcome == OUTCOME_COMPLETE:
+            return self.text
+        if not self._started or not self._safe_len:
+            return "{}"
+        return "".join(self._text[: self._safe_len]) + self._safe_closers
+
+    # ------------------------------------------------------------------ #
+
+    def _scan_preamble(self, char: str) -> None:
+        self._preamble += char
+        if self._in_think:
+            if self._preamble.endswith(_THINK_CLOSE):
+                self._in_think = False
+                self._preamble = ""
+            return
+        if self._preamble.endswith(_THINK_OPEN):
+            self._in_think = True
+            self._preamble = ""
+            return
+        if char == "{":
+            self._started = True
+            self._scan_json(char)
+            return
+        visible = self._preamble.replace("```json", "").replace("```", "").strip()
+        if char == "[" and not visible.strip("["):
+            self.outcome = ABORT_NOT_OBJECT
+        elif visible and visible[0] in '"-0123456789':
+            self.outcome = ABORT_NOT_OBJECT
+        elif len(visible) > self.max_preamble_chars:
+            self.outcome = ABORT_PROSE
+
+    def _mark_safe(self) -> None:
+        self._safe_len = len(self._text)
+        self._safe_closers = "".join(reversed(self._stack))
+
+    def _scan_json(self, char: str) -> None:
+        if self._in_string:
+            self._text.append(char)
+            if self._escape:
+                self._escape = False
+            elif char == "\\":
+                self._escape = True
+            elif char == '"':
+                self._in_string = False
+                if self._string_is_key:
+                    self._check_key("".join(self._key_chars))
+                else:
+                    self._mark_safe()
+            elif self._string_is_key:
+                self._key_chars.append(char)
+            return
+
+        if self._in_scalar and char in _SCALAR_END:
+            self._in_scalar = False
+            self._mark_safe()
+
+        self._text.append(char)
+        if char == '"':
+            self._in_string = True
+            self._string_is_key = bool(self._expect_key) and self._expect_key[-1]
+            self._key_chars = []
+        elif char in "{[":
+            self._stack.append("}" if char == "{" else "]")
+            self._expect_key.append(char == "{")
+        elif char in "}]":
+            if not self._stack:
+                return
+            self._stack.pop()
+            self._expect_key.pop()
+            if not self._stack:
+                self.outcome = OUTCOME_COMPLETE
+                return
+            self._mark_safe()
+        elif char == ":":
+            if self._expect_key:
+                self._expect_key[-1] = False
+        elif char == ",":
+            if self._stack and self._stack[-1] == "}":
+                self._expect_key[-1] = True
+        elif not char.isspace():
+            self._in_scalar = True
+
+    def _check_key(self, key: str) -> None:
+        if len(self._stack) != 1 or self._seen_first_key:
+            return
+        self._seen_first_key = True
+        if self.expected_keys is not None and key not in self.expected_keys:
+            self.outcome = ABORT_OFF_SCHEMA
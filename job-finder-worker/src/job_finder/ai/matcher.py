@@ -15,7 +15,9 @@ from typing import Any, Dict, List, Optional
 from pydantic import BaseModel, Field
 from typing import TYPE_CHECKING
 
-from job_finder.ai.prompts import JobMatchPrompts
+from job_finder.ai.compaction import DescriptionCompactor
+from job_finder.ai.extraction_prompts import PromptPair
+from job_finder.ai.prompts import MATCH_RESPONSE_KEYS, JobMatchPrompts
 from job_finder.ai.response_parser import extract_json_from_response
 from job_finder.exceptions import AIProviderError
 from job_finder.profile.schema import Profile
@@ -83,6 +85,7 @@ class AIJobMatcher:
         agent_manager: "InferenceClient",
         profile: Profile,
         min_match_score: int = 50,
+        compactor: Optional[DescriptionCompactor] = None,
     ):
         """
         Initialize AI job matcher.
@@ -94,6 +97,8 @@ class AIJobMatcher:
             agent_manager: InferenceClient for executing AI tasks.
             profile: User profile for matching context.
             min_match_score: Minimum score threshold (from deterministic scoring).
+            compactor: Description compactor applied before prompting (default:
+                token budget and legal boilerplate only).
 
         Note:
             This matcher performs a single AI call per job; resume/cover letter guidance
@@ -103,11 +108,13 @@ class AIJobMatcher:
         self.profile = profile
         self.min_match_score = min_match_score
         self.prompts = JobMatchPrompts()
+        self.compactor = compactor or DescriptionCompactor()
 
     def analyze_job(
         self,
         job: Dict[str, Any],
         return_below_threshold: bool = False,
+        analysis: Optional[Dict[str, Any]] = None,
     ) -> Optional[JobMatchResult]:
         """
         Analyze a single job posting against the profile.
@@ -116,6 +123,8 @@ class AIJobMatcher:
             job: Job posting dictionary with keys: title, company, location, description, url.
                  Must include 'deterministic_score' from ScoringEngine.
             return_below_threshold: If True, return results even if below min score.
+            analysis: Match analysis already produced by a fused extraction
+                call (see ``JobExtractor.extract_fused``); skips the AI call.
 
         Returns:
             JobMatchResult if successful, None if analysis fails.
@@ -139,7 +148,7 @@ class AIJobMatcher:
         try:
             # Step 1: Analyze job match with AI (for reasoning, skills, concerns)
             logger.info(f"Analyzing job: {job.get('title')} at {job.get('company')}")
-            match_analysis = self._analyze_match(job)
+            match_analysis = analysis if analysis is not None else self._analyze_match(job)
 
             if not match_analysis:
                 logger.warning(f"Failed to analyze job: {job.get('title')}")
@@ -299,6 +308,14 @@ class AIJobMatcher:
 
     _REQUIRED_FIELDS = ("matched_skills", "missing_skills")
 
+    def is_valid_analysis(self, analysis: Any) -> bool:
+        """True when *analysis* is a match-analysis object with the required fields."""
+        return isinstance(analysis, dict) and all(f in analysis for f in self._REQUIRED_FIELDS)
+
+    def build_fused_prompt(self, job: Dict[str, Any], extraction_prompt: PromptPair) -> PromptPair:
+        """Prompt pair for a fused extraction + match analysis call on *job*."""
+        return self.prompts.fused_extraction_match(self.profile, extraction_prompt, job)
+
     def _analyze_match(self, job: Dict[str, Any]) -> Optional[Dict[str, Any]]:
         """
         Internal method to analyze job match using AI.
@@ -311,6 +328,10 @@ class AIJobMatcher:
         """
         response = None
         try:
+            description = job.get("description")
+            if description:
+                compacted = self.compactor.compact(description, company=job.get("company"))
+                job = {**job, "description": compacted.text}
             system_prompt, user_prompt = self.prompts.analyze_job_match(self.profile, job)
 
             # Use InferenceClient for AI execution (analysis task type)
@@ -319,6 +340,7 @@ class AIJobMatcher:
                 prompt=user_prompt,
                 system_prompt=system_prompt,
                 response_format="json",
+                expected_keys=MATCH_RESPONSE_KEYS,
                 max_tokens=1400,
                 temperature=0.2,
             )
@@ -393,6 +415,7 @@ class AIJobMatcher:
                 prompt=correction_prompt,
                 system_prompt=system_prompt,
                 response_format="json",
+                expected_keys=MATCH_RESPONSE_KEYS,
                 max_tokens=1400,
                 temperature=0.0,
             )
@@ -498,6 +498,7 @@ class PageDataExtractor:
             # schema.org: jobLocationType "TELECOMMUTE" indicates remote
             loc_type = jp.get("jobLocationType")
             if isinstance(loc_type, str) and loc_type.upper() == "TELECOMMUTE":
+                job["is_remote"] = True
                 current_loc = job.get("location", "")
                 if current_loc and "remote" not in current_loc.lower():
                     job["location"] = f"Remote - {current_loc}"
@@ -506,6 +507,8 @@ class PageDataExtractor:
 
             if not job.get("posted_date") and jp.get("datePosted"):
                 job["posted_date"] = jp.get("datePosted")
+            if jp.get("employmentType") and not job.get("employment_type"):
+                job["employment_type"] = jp.get("employmentType")
 
             # Salary from JSON-LD
             base_salary = jp.get("baseSalary")
@@ -0,0 +1,462 @@
+"""Deterministic pre-extraction from structured ATS data and plain-text rules.
+
+Many postings already carry the fields the extraction LLM is asked for:
+Ashby ``employmentType``/``isRemote``, Greenhouse ``metadata`` ("Location
+Type"), Lever ``categories.commitment``/``workplaceType``, Workday
+``timeType``, JSON-LD ``employmentType``/``jobLocationType`` and the ATS
+salary range. ``PreExtractor`` reads those (and a few unambiguous text
+patterns: seniority words in the title, a location the gazetteer resolves,
+salary figures next to a currency sign) and returns each field it can settle
+with a confidence.
+
+Fields settled at or above ``min_confidence`` are taken as final:
+``JobExtractor`` asks the LLM only for the rest, skips the call when nothing
+is left, and does not send settled-but-empty fields (no salary text, so no
+salary) to the repair pass.
+
+Values are keyed by ``JobExtractionResult`` attribute name.
+"""
+
+import re
+from dataclasses import dataclass, field
+from datetime import datetime, timezone as dt_timezone
+from typing import Any, Dict, Iterable, List, Mapping, Optional, Tuple
+from zoneinfo import ZoneInfo
+
+from job_finder.utils.date_utils import parse_job_date
+from job_finder.utils.keyword_matcher import KeywordMatcher
+from job_finder.utils.location_utils import COUNTRY_ONLY_LOCATIONS
+from job_finder.utils.timezone_gazetteer import lookup_timezone
+
+DEFAULT_MIN_CONFIDENCE = 0.8
+
+# job_data keys copied from scraped payloads into queue metadata at intake so
+# the extraction stage still sees them (job_listings stores only core columns).
+STRUCTURED_FIELDS = (
+    "employment_type",
+    "job_type",
+    "commitment",
+    "time_type",
+    "is_remote",
+    "workplace_type",
+    "job_level",
+    "metadata",
+)
+# Greenhouse custom fields worth keeping (the rest can be arbitrarily large)
+_METADATA_KEYS = ("Location Type", "Workplace Type", "Remote", "Employment Type")
+
+# Confidence by evidence source
+_STRUCTURED = 0.95
+_LOCATION = 0.9
+_TITLE = 0.9
+_TEXT = 0.85
+_ABSENT = 0.9  # no supporting text anywhere in the posting
+
+# Keywords whose presence in the description indicates salary info exists.
+# Checked case-insensitively.
+SALARY_KEYWORDS = (
+    "$",
+    "salary",
+    "compensation",
+    "per year",
+    "per annum",
+    "annually",
+    "usd ",
+    "usd,",
+    "pay range",
+    "base pay",
+    "hourly rate",
+    "wage",
+    "total comp",
+    "on-target earnings",
+)
+
+# Keywords indicating genuine compensation-equity (not DEI "equity").
+EQUITY_KEYWORDS = (
+    "stock",
+    "rsu",
+    "rsus",
+    "vest",
+    "vesting",
+    "shares",
+    "options",
+    "equity compensation",
+    "equity grant",
+    "equity package",
+    "equity award",
+)
+
+SALARY_MATCHER = KeywordMatcher(SALARY_KEYWORDS, word_boundary=False)
+EQUITY_MATCHER = KeywordMatcher(EQUITY_KEYWORDS)
+
+# Regex for parsing salary strings like "USD 165000-220000", "$150,000 - $170,000"
+_SALARY_PATTERN = re.compile(r"[\$]?\s*([\d,]+(?:\.\d+)?)\s*[-–—to]+\s*[\$]?\s*([\d,]+(?:\.\d+)?)")
+
+# "$118,600.00 - $195,680.00", "$150K – $200K", "$140,000 to $160,000 USD"
+_TEXT_SALARY_RANGE = re.compile(
+    r"\$\s?(\d{2,3}(?:,\d{3})+|\d{2,3}(?:\.\d)?\s?[kK])(?:\.\d{2})?"
+    r"\s*(?:-|–|—|to)\s*"
+    r"\$?\s?(\d{2,3}(?:,\d{3})+|\d{2,3}(?:\.\d)?\s?[kK])(?:\.\d{2})?"
+)
+_HOURLY_HINT = re.compile(r"per hour|/\s?hr\b|/\s?hour|hourly", re.I)
+
+_SENIORITY_TITLE: Tuple[Tuple[str, re.Pattern], ...] = (
+    ("principal", re.compile(r"\b(?:principal|distinguished)\b", re.I)),
+    ("staff", re.compile(r"\bstaff\b", re.I)),
+    ("senior", re.compile(r"\b(?:senior|sr\.?)(?=\s|$|,)|\bIII\b", re.I)),
+    ("lead", re.compile(r"\blead\b", re.I)),
+    ("junior", re.compile(r"\b(?:junior|jr\.?|entry[- ]level|new grad|graduate)(?=\s|$|,)", re.I)),
+    ("mid", re.compile(r"\b(?:mid[- ]level|intermediate|II)\b")),
+)
+_JOB_LEVEL = {
+    "senior": "senior",
+    "midweight": "mid",
+    "mid": "mid",
+    "mid-level": "mid",
+    "junior": "junior",
+    "entry": "junior",
+    "entry-level": "junior",
+    "lead": "lead",
+    "staff": "staff",
+    "principal": "principal",
+}
+_MANAGEMENT_TITLE = re.compile(
+    r"\b(?:engineering manager|manager,? (?:software )?engineering|director|head of|"
+    r"vp\b|vice president)",
+    re.I,
+)
+_LEAD_TITLE = re.compile(r"\b(?:tech(?:nical)? lead|team lead|lead)\b", re.I)
+_CONTRACT_TITLE = re.compile(r"\b(?:contract(?:or)?|freelance|temporary|temp)\b", re.I)
+_PART_TIME_TITLE = re.compile(r"\bpart[- ]time\b", re.I)
+
+# Benefits only permanent employees get, and the contract / part-time / fixed-term
+# language that overrides them ("6-month contract", "part-time, 20 hours a week")
+_FULL_TIME_TEXT = re.compile(
+    r"\bfull[- ]time\b|401\(?k\)?|health insurance|dental|paid time off|\bPTO\b|"
+    r"parental leave|\bRSUs?\b",
+    re.I,
+)
+_CONTRACT_TEXT = re.compile(
+    r"\b(?:contract(?:ors?|ing)?|freelance|c2c|corp[- ]to[- ]corp|temporary|1099|hourly|"
+    r"part[- ]time|fixed[- ]term|\d+[- ]months?)\b",
+    re.I,
+)
+# "5+ years", "3-5 years", "7 to 10 yrs"
+_MAX_EXPERIENCE_YEARS = 15
+_EXPERIENCE_TEXT = re.compile(r"(\d{1,2})\+?\s*(?:-|–|to)?\s*(\d{1,2})?\+?\s*(?:years|yrs)", re.I)
+
+_REMOTE_LOCATION = re.compile(r"\b(?:remote|distributed|anywhere)\b", re.I)
+_HYBRID_LOCATION = re.compile(r"\bhybrid\b", re.I)
+_MULTI_LOCATION = re.compile(r";|\||\bor\b|\band\b|\d+ locations", re.I)
+_LOCATION_NOISE = re.compile(r"[\s-]*\b(?:hq|headquarters|office)\b.*$", re.I)
+
+_RELOCATION_TEXT = re.compile(r"relocat", re.I)
+_REPOST_TEXT = re.compile(r"re-?post", re.I)
+_FLEXIBLE_TZ_TEXT = re.compile(
+    r"time ?zones?|anywhere|async|asynchronous|flexible (?:hours|schedule)", re.I
+)
+
+
+def parse_salary_range(salary_str: str) -> Optional[Tuple[int, int]]:
+    """Parse a salary range string into (min, max) integers.
+
+    Handles formats like:
+      - "USD 165000-220000"
+      - "$150,000 - $170,000"
+      - "150000-200000"
+
+    Returns None if parsing fails.
+    """
+    # Strip currency prefix (e.g. "USD ", "CAD ")
+    cleaned = re.sub(r"^[A-Z]{3}\s*", "", salary_str.strip())
+    match = _SALARY_PATTERN.search(cleaned)
+    if not match:
+        return None
+    try:
+        low = int(float(match.group(1).replace(",", "")))
+        high = int(float(match.group(2).replace(",", "")))
+        if low > 0 and high > 0:
+            return (min(low, high), max(low, high))
+    except (ValueError, OverflowError):
+        pass
+    return None
+
+
+def _salary_amount(text: str) -> int:
+    text = text.replace(",", "").replace(" ", "")
+    if text[-1] in "kK":
+        return int(float(text[:-1]) * 1000)
+    return int(text)
+
+
+def _normalize_employment_type(value: Any) -> Optional[str]:
+    """Map ATS employment-type spellings ("FullTime", "Full time", ["Full-Time"])."""
+    if isinstance(value, list):
+        value = value[0] if value else ""
+    if not value or not isinstance(value, str):
+        return None
+    lowered = value.lower().replace("_", "-").replace(" ", "-")
+    if "full" in lowered or lowered == "permanent":
+        return "full-time"
+    if "part" in lowered:
+        return "part-time"
+    if any(kw in lowered for kw in ("contract", "freelance", "temporary", "temp")):
+        return "contract"
+    return None
+
+
+def _normalize_work_arrangement(value: Any) -> Optional[str]:
+    if not isinstance(value, str) or not value:
+        return None
+    lowered = value.lower()
+    if "remote" in lowered or "telecommute" in lowered:
+        return "remote"
+    if "hybrid" in lowered:
+        return "hybrid"
+    if any(kw in lowered for kw in ("onsite", "on-site", "in-office", "office", "in person")):
+        return "onsite"
+    return None
+
+
+def _standard_offset(timezone_name: str) -> Optional[float]:
+    """UTC offset outside daylight saving (the convention the extraction prompt uses)."""
+    try:
+        zone = ZoneInfo(timezone_name)
+    except (KeyError, ValueError):
+        return None
+    year = datetime.now(dt_timezone.utc).year
+    offsets = []
+    for month in (1, 7):
+        moment = datetime(year, month, 1, tzinfo=zone)
+        offset = moment.utcoffset()
+        dst = moment.dst()
+        if offset is not None and not dst:
+            offsets.append(offset.total_seconds() / 3600)
+    return offsets[0] if offsets else None
+
+
+def structured_fields(job: Mapping[str, Any]) -> Dict[str, Any]:
+    """The structured ATS fields of a scraped payload that pre-extraction reads."""
+    picked: Dict[str, Any] = {}
+    for key in STRUCTURED_FIELDS:
+        value = job.get(key)
+        if value in (None, "", [], {}):
+            continue
+        if key == "metadata":
+            if not isinstance(value, dict):
+                continue
+            value = {k: value[k] for k in _METADATA_KEYS if isinstance(value.get(k), str)}
+            if not value:
+                continue
+        picked[key] = value
+    return picked
+
+
+@dataclass
+class PreExtraction:
+    """Fields settled without the LLM, with per-field confidence."""
+
+    values: Dict[str, Any] = field(default_factory=dict)
+    confidence: Dict[str, float] = field(default_factory=dict)
+    min_confidence: float = DEFAULT_MIN_CONFIDENCE
+
+    def set(self, name: str, value: Any, confidence: float) -> None:
+        """Record *value* unless the field is already settled more confidently."""
+        if confidence > self.confidence.get(name, 0.0):
+            self.values[name] = value
+            self.confidence[name] = confidence
+
+    @property
+    def settled(self) -> Dict[str, Any]:
+        """Fields confident enough to skip the LLM for."""
+        return {
+            name: value
+            for name, value in self.values.items()
+            if self.confidence[name] >= self.min_confidence
+        }
+
+    def remaining(self, fields: Iterable[str]) -> List[str]:
+        """Which of *fields* still need the LLM."""
+        settled = self.settled
+        return [name for name in fields if name not in settled]
+
+
+class PreExtractor:
+    """Rule-based extraction of the fields that need no model."""
+
+    def __init__(self, min_confidence: float = DEFAULT_MIN_CONFIDENCE, enabled: bool = True):
+        """
+        Args:
+            min_confidence: Confidence at which a field is taken as final
+            enabled: False settles nothing (every field goes to the LLM)
+        """
+        self.min_confidence = min_confidence
+        self.enabled = enabled
+
+    def extract(
+        self,
+        title: str,
+        description: str,
+        location: Optional[str] = None,
+        posted_date: Optional[str] = None,
+        salary_range: Optional[str] = None,
+        structured: Optional[Mapping[str, Any]] = None,
+    ) -> PreExtraction:
+        """Settle what the structured data and text rules allow."""
+        pre = PreExtraction(min_confidence=self.min_confidence)
+        if not self.enabled:
+            return pre
+        structured = structured or {}
+        title = title or ""
+        description = description or ""
+        location = (location or "").strip()
+
+        self._seniority(pre, title, structured)
+        self._work_arrangement(pre, location, structured)
+        self._employment(pre, title, description, structured)
+        self._salary(pre, description, salary_range)
+        self._experience(pre, description)
+        self._location(pre, location)
+        self._days_old(pre, posted_date)
+        self._flags(pre, title, description)
+        return pre
+
+    # ------------------------------------------------------------------ #
+
+    @staticmethod
+    def _seniority(pre: PreExtraction, title: str, structured: Mapping[str, Any]) -> None:
+        level = structured.get("job_level")
+        if isinstance(level, str) and level.strip().lower() in _JOB_LEVEL:
+            pre.set("seniority", _JOB_LEVEL[level.strip().lower()], _STRUCTURED)
+        for seniority, pattern in _SENIORITY_TITLE:
+            if pattern.search(title):
+                pre.set("seniority", seniority, _TITLE)
+                break
+
+    @staticmethod
+    def _work_arrangement(pre: PreExtraction, location: str, structured: Mapping[str, Any]) -> None:
+        if structured.get("is_remote") is True:
+            pre.set("work_arrangement", "remote", _STRUCTURED)
+        metadata = structured.get("metadata")
+        candidates = [structured.get("workplace_type")]
+        if isinstance(metadata, dict):
+            candidates += [metadata.get("Location Type"), metadata.get("Workplace Type")]
+        for candidate in candidates:
+            arrangement = _normalize_work_arrangement(candidate)
+            if arrangement:
+                pre.set("work_arrangement", arrangement, _STRUCTURED)
+                break
+        # Same signals job_processor's remote override trusts over the model
+        if _REMOTE_LOCATION.search(location) or location.lower() in COUNTRY_ONLY_LOCATIONS:
+            pre.set("work_arrangement", "remote", _LOCATION)
+        elif _HYBRID_LOCATION.search(location):
+            pre.set("work_arrangement", "hybrid", _LOCATION)
+
+    @staticmethod
+    def _employment(
+        pre: PreExtraction, title: str, description: str, structured: Mapping[str, Any]
+    ) -> None:
+        for key in ("employment_type", "job_type", "commitment", "time_type"):
+            employment = _normalize_employment_type(structured.get(key))
+            if employment:
+                pre.set("employment_type", employment, _STRUCTURED)
+                break
+        metadata = structured.get("metadata")
+        if isinstance(metadata, dict):
+            employment = _normalize_employment_type(metadata.get("Employment Type"))
+            if employment:
+                pre.set("employment_type", employment, _STRUCTURED)
+        if _CONTRACT_TITLE.search(title):
+            pre.set("employment_type", "contract", _TITLE)
+        elif _PART_TIME_TITLE.search(title):
+            pre.set("employment_type", "part-time", _TITLE)
+        elif _FULL_TIME_TEXT.search(description) and not _CONTRACT_TEXT.search(description):
+            pre.set("employment_type", "full-time", _TEXT)
+        if "employment_type" in pre.values:
+            is_contract = pre.values["employment_type"] == "contract"
+            pre.set("is_contract", is_contract, pre.confidence["employment_type"])
+
+    @staticmethod
+    def _salary(pre: PreExtraction, description: str, salary_range: Optional[str]) -> None:
+        parsed = parse_salary_range(salary_range) if salary_range else None
+        if parsed:
+            pre.set("salary_min", parsed[0], _STRUCTURED)
+            pre.set("salary_max", parsed[1], _STRUCTURED)
+            return
+        if not SALARY_MATCHER.contains_any(description.lower()):
+            # Nothing to extract (and _guard_salary would discard a guess)
+            pre.set("salary_min", None, _ABSENT)
+            pre.set("salary_max", None, _ABSENT)
+            return
+        ranges = []
+        for match in _TEXT_SALARY_RANGE.finditer(description):
+            context = description[match.end() : match.end() + 30]
+            if _HOURLY_HINT.search(context):
+                return  # hourly pay needs conversion: leave it to the model
+            low, high = _salary_amount(match.group(1)), _salary_amount(match.group(2))
+            if 20_000 <= low <= high <= 2_000_000:
+                ranges.append((low, high))
+        if len(ranges) == 1:
+            # Several ranges are usually geographic tiers; the model picks those
+            pre.set("salary_min", ranges[0][0], _TEXT)
+            pre.set("salary_max", ranges[0][1], _TEXT)
+
+    @staticmethod
+    def _experience(pre: PreExtraction, description: str) -> None:
+        mentions = {
+            (int(low), int(high) if high else None)
+            for low, high in _EXPERIENCE_TEXT.findall(description)
+            if int(low) <= _MAX_EXPERIENCE_YEARS  # "30 years in business" is the company
+        }
+        # Several different figures usually belong to different requirements
+        if len(mentions) == 1:
+            low, high = mentions.pop()
+            if high is None or low <= high:
+                pre.set("experience_min", low, _TEXT)
+                pre.set("experience_max", high, _TEXT)
+
+    @staticmethod
+    def _location(pre: PreExtraction, location: str) -> None:
+        if not location or _MULTI_LOCATION.search(location):
+            return
+        if pre.values.get("work_arrangement") == "remote":
+            return
+        match = lookup_timezone(location)
+        if match is None or match.level != "city" or not match.timezone_name:
+            return
+        offset = _standard_offset(match.timezone_name)
+        if offset is None:
+            return
+        city = _LOCATION_NOISE.sub("", location.split(",")[0]).strip()
+        if city:
+            pre.set("city", city, _LOCATION)
+        pre.set("timezone", offset, _LOCATION)
+
+    @staticmethod
+    def _days_old(pre: PreExtraction, posted_date: Optional[str]) -> None:
+        posted = parse_job_date(posted_date) if posted_date else None
+        if posted is None:
+            return
+        days = (datetime.now(dt_timezone.utc) - posted).days
+        if 0 <= days <= 365:
+            pre.set("days_old", days, _STRUCTURED)
+
+    @staticmethod
+    def _flags(pre: PreExtraction, title: str, description: str) -> None:
+        if _MANAGEMENT_TITLE.search(title):
+            pre.set("is_management", True, _TITLE)
+        if _LEAD_TITLE.search(title):
+            pre.set("is_lead", True, _TITLE)
+        lowered = description.lower()
+        # Absent evidence settles the boolean flags the model defaults to false
+        if not EQUITY_MATCHER.contains_any(lowered) and "equity" not in lowered:
+            pre.set("includes_equity", False, _ABSENT)
+        if not _RELOCATION_TEXT.search(description):
+            pre.set("relocation_required", False, _ABSENT)
+        if not _REPOST_TEXT.search(description):
+            pre.set("is_repost", False, _ABSENT)
+        # Timezone flexibility only applies to remote roles
+        if pre.settled.get("work_arrangement") in ("hybrid", "onsite"):
+            pre.set("timezone_flexible", False, _LOCATION)
+        elif not _FLEXIBLE_TZ_TEXT.search(description) and not pre.settled.get("work_arrangement"):
+            pre.set("timezone_flexible", False, _ABSENT)
@@ -11,6 +11,64 @@ from typing import Any, Dict
 from job_finder.ai.extraction_prompts import PromptPair
 from job_finder.profile.schema import Profile
 
+# Static instructions and output schema first, candidate profile second: the
+# prefix is byte-identical for every match call, and the whole system prompt
+# for every job scored against the same profile.
+_MATCH_INSTRUCTIONS = """You are a concise job-match assistant. Summarize how the candidate fits this role and give only the guidance needed to tailor a resume and cover letter.
+
+# Deliverables (be brief and factual)
+
+1) matched_skills: skills the candidate already has that are explicitly relevant (max 12)
+2) missing_skills: real gaps or weak areas (max 8)
+3) experience_match: 1-2 sentences on seniority/domain fit
+4) key_strengths: 3-5 bullets that would impress this hiring team
+5) potential_concerns: concrete risks/gaps the candidate should address
+6) customization_recommendations:
+   - resume_focus: 3-5 bullets to emphasize on the resume for THIS job
+   - cover_letter_points: 2-4 talking points to address gaps or motivation
+   - keywords: 8-12 ATS keywords from the posting (exact casing)
+
+# Rules:
+- Use only information from the profile and posting; do not invent facts.
+- Keep bullets short (8-14 words) and specific.
+- Do not score or rank the job; deterministic scoring is handled elsewhere.
+
+Return ONLY valid JSON in this shape (no prose, no markdown):
+{
+  "matched_skills": [],
+  "missing_skills": [],
+  "experience_match": "",
+  "key_strengths": [],
+  "potential_concerns": [],
+  "customization_recommendations": {
+    "resume_focus": [],
+    "cover_letter_points": [],
+    "keywords": []
+  }
+}"""
+
+MATCH_RESPONSE_KEYS = frozenset(
+    {
+        "matched_skills",
+        "missing_skills",
+        "experience_match",
+        "key_strengths",
+        "potential_concerns",
+        "customization_recommendations",
+    }
+)
+
+# Fused mode: extraction and match analysis answered by one call. The
+# extraction system prompt and the match instructions keep their own wording
+# (and so their accuracy); this preamble only sets the combined envelope.
+_FUSED_INSTRUCTIONS = """You will complete two tasks for the job posting in the user message and answer both in ONE JSON object:
+
+{"extraction": <Task 1 JSON object>, "analysis": <Task 2 JSON object>}
+
+Each task describes the JSON object for its own part. Return ONLY the combined object (no prose, no markdown)."""
+
+FUSED_RESPONSE_KEYS = frozenset({"extraction", "analysis"})
+
 
 class JobMatchPrompts:
     """Prompt templates for job matching tasks."""
@@ -199,40 +257,9 @@ class JobMatchPrompts:
         """
         profile_summary = JobMatchPrompts.build_profile_summary(profile)
 
-        system = f"""You are a concise job-match assistant. Summarize how the candidate fits this role and give only the guidance needed to tailor a resume and cover letter.
+        system = f"""{_MATCH_INSTRUCTIONS}
 
-{profile_summary}
-
-# Deliverables (be brief and factual)
-
-1) matched_skills: skills the candidate already has that are explicitly relevant (max 12)
-2) missing_skills: real gaps or weak areas (max 8)
-3) experience_match: 1-2 sentences on seniority/domain fit
-4) key_strengths: 3-5 bullets that would impress this hiring team
-5) potential_concerns: concrete risks/gaps the candidate should address
-6) customization_recommendations:
-   - resume_focus: 3-5 bullets to emphasize on the resume for THIS job
-   - cover_letter_points: 2-4 talking points to address gaps or motivation
-   - keywords: 8-12 ATS keywords from the posting (exact casing)
-
-# Rules:
-- Use only information from the profile and posting; do not invent facts.
-- Keep bullets short (8-14 words) and specific.
-- Do not score or rank the job; deterministic scoring is handled elsewhere.
-
-Return ONLY valid JSON in this shape (no prose, no markdown):
-{{
-  "matched_skills": [],
-  "missing_skills": [],
-  "experience_match": "",
-  "key_strengths": [],
-  "potential_concerns": [],
-  "customization_recommendations": {{
-    "resume_focus": [],
-    "cover_letter_points": [],
-    "keywords": []
-  }}
-}}"""
+{profile_summary}"""
 
         user = f"""# Job Posting
 
@@ -245,6 +272,51 @@ Return ONLY valid JSON in this shape (no prose, no markdown):
 {f'''
 **Company Information:**
 {job.get('company_info', '')}
+''' if job.get('company_info') else ''}"""
+
+        return (system, user)
+
+    @staticmethod
+    def fused_extraction_match(
+        profile: Profile, extraction_prompt: PromptPair, job: Dict[str, Any]
+    ) -> PromptPair:
+        """
+        Create prompt pair asking for extraction and match analysis at once.
+
+        The posting is sent once, in the extraction user message (with its
+        field list); company details follow. The system prompt is the fused
+        preamble, the extraction system prompt, the match instructions and the
+        profile, so it stays byte-identical for every job of one profile.
+
+        Args:
+            profile: User profile.
+            extraction_prompt: PromptPair from ``build_extraction_prompt``.
+            job: Job posting dictionary (company, company_info).
+
+        Returns:
+            PromptPair of (system_prompt, user_prompt).
+        """
+        extraction_system, extraction_user = extraction_prompt
+        profile_summary = JobMatchPrompts.build_profile_summary(profile)
+
+        system = f"""{_FUSED_INSTRUCTIONS}
+
+# Task 1: extraction
+
+{extraction_system}
+
+# Task 2: analysis
+
+{_MATCH_INSTRUCTIONS}
+
+{profile_summary}"""
+
+        user = f"""{extraction_user}
+
+Company: {job.get('company', 'N/A')}
+{f'''
+Company Information:
+{job.get('company_info', '')}
 ''' if job.get('company_info') else ''}"""
 
         return (system, user)
@@ -0,0 +1,282 @@
+"""Field-scoped excerpts for the extraction repair pass.
+
+The repair pass used to resend the whole (compacted) description to ask for
+a handful of missing fields. ``select_repair_excerpts`` instead splits the
+description into sentences / bullet lines, finds the ones that can carry
+each missing field with cheap lexical cues (salary figures, location and
+arrangement words, seniority and years-of-experience terms, employment
+terms, requirement bullets and known technology names), ranks each field's
+matches by how strong the evidence is (a salary figure over "competitive
+compensation") and packs them, round-robin across fields, into a small
+token budget, in document order.
+
+Fields that only the description text can answer (salary, employment type,
+technologies) are dropped when no sentence matches their cues: a repair
+call would have nothing to read. Seniority can still come from the title
+and work arrangement / timezone from the location, so those stay with or
+without excerpts. ``JobExtractor.extract_with_repair`` skips the call when
+no field is left.
+
+Technology names are matched against ``KNOWN_TECHNOLOGIES`` plus any terms
+the caller passes (the worker passes the skill taxonomy the scorer loads),
+case-insensitively, so "Python and Go required." is evidence while an
+acronym such as "US" or "PTO" is not.
+"""
+
+from __future__ import annotations
+
+import functools
+import re
+from dataclasses import dataclass, field
+from typing import Dict, FrozenSet, Iterable, List, Optional, Pattern, Tuple
+
+from job_finder.ai.compaction import count_tokens, segment_sections
+
+# Excerpt budget for one repair prompt (the full description budget is 2000)
+DEFAULT_REPAIR_EXCERPT_TOKENS = 500
+MAX_EXCERPTS_PER_FIELD = 8
+# Longer sentences (run-on bullet lists) are cut at a word boundary
+_MAX_EXCERPT_CHARS = 320
+
+_FIELD_CUES: Dict[str, Pattern[str]] = {
+    "seniority": re.compile(
+        r"\b(?:junior|entry[- ]level|mid[- ]level|intermediate|senior|sr\b|staff|principal|"
+        r"lead|new grad|graduate|individual contributor|years|yrs)\b",
+        re.I,
+    ),
+    "work_arrangement": re.compile(
+        r"\b(?:remote(?:ly)?|hybrid|on-?site|in[- ](?:office|person)|office|wfh|"
+        r"work from (?:home|anywhere)|distributed|days? (?:a|per) week|commut)",
+        re.I,
+    ),
+    "timezone": re.compile(
+        r"\b(?:time ?zones?|utc|gmt|pst|pdt|est|edt|cst|cdt|mst|mdt|cet|bst|"
+        r"based in|located in|headquarter|office in|hours? of overlap|business hours)\b|"
+        r"(?-i:\b(?:PT|ET|CT|MT)\b)",
+        re.I,
+    ),
+    "salary_min": re.compile(
+        r"[$£€]\s?\d|\b\d{2,3}[,.]?\d{3}\b|\b\d{2,3}k\b|salary|compensation|base pay|"
+        r"pay range|per (?:hour|year|annum)|hourly|\bote\b",
+        re.I,
+    ),
+    "employment_type": re.compile(
+        r"\b(?:full[- ]time|part[- ]time|contract(?:or)?|contract[- ]to[- ]hire|temporary|"
+        r"freelance|permanent|w-?2|c2c|corp[- ]to[- ]corp|1099|401\(?k\)?|benefits|pto|"
+        r"internship)\b",
+        re.I,
+    ),
+    "technologies": re.compile(
+        r"\b(?:experience (?:with|in|using)|proficien|familiar|knowledge of|expertise in|"
+        r"stack|languages?|frameworks?|tools?|technolog|platforms?|built (?:with|on)|using)\b",
+        re.I,
+    ),
+}
+
+# Common technologies (lowercase), matched case-insensitively as whole words.
+# Ambiguous English words ("rest", "express", "excel", single letters) are
+# left out; callers add their own vocabulary (the skill taxonomy).
+KNOWN_TECHNOLOGIES: FrozenSet[str] = frozenset(
+    {
+        # Languages
+        "python", "go", "golang", "java", "kotlin", "scala", "rust", "ruby", "php", "perl",
+        "swift", "objective-c", "c++", "c#", ".net", "dotnet", "javascript", "typescript",
+        "elixir", "erlang", "haskell", "clojure", "matlab", "julia", "dart", "lua", "bash",
+        "sql", "nosql", "graphql", "html", "css", "sass", "solidity",
+        # Frameworks and libraries
+        "react", "react native", "angular", "vue", "svelte", "next.js", "node.js", "nodejs",
+        "django", "flask", "fastapi", "rails", "ruby on rails", "spring", "spring boot",
+        "laravel", "asp.net", "nestjs", "express.js", "tailwind", "redux", "webpack", "jest",
+        "cypress", "selenium", "playwright", "pytorch", "tensorflow", "keras", "pandas",
+        "numpy", "scikit-learn", "flutter", "android", "ios", "grpc", "celery",
+        # Data and messaging
+        "postgres", "postgresql", "mysql", "mariadb", "sqlite", "mongodb", "redis",
+        "elasticsearch", "opensearch", "cassandra", "dynamodb", "oracle", "kafka", "rabbitmq",
+        "spark", "hadoop", "airflow", "dbt", "snowflake", "databricks", "bigquery",
+        "redshift", "clickhouse",
+        # Cloud and infrastructure
+        "aws", "gcp", "azure", "kubernetes", "k8s", "docker", "terraform", "ansible",
+        "helm", "jenkins", "github actions", "gitlab", "linux", "unix", "git", "nginx",
+        "lambda", "ec2", "s3", "sqs", "cloudformation", "pulumi", "serverless",
+        "microservices", "datadog", "prometheus", "grafana", "splunk",
+        # Other tools
+        "llm", "llms", "figma", "salesforce", "tableau", "power bi", "jira",
+    }
+)  # fmt: skip
+
+# Acronyms that look like technologies in a posting but are places,
+# currencies or benefits; never technology evidence, whatever the caller adds
+_NOT_TECHNOLOGIES = frozenset(
+    {"us", "usa", "uk", "eu", "emea", "apac", "latam", "usd", "eur", "gbp", "pto", "hr", "ote"}
+)
+
+# Shapes of names missing from any vocabulary: mixed case inside a word
+# (PostgreSQL, GraphQL, iOS) and dotted / symbol names (Deno.js, C++, C#).
+# Bare acronyms (US, PTO) do not count.
+_TECH_NAME = r"\b[A-Za-z]*[a-z][A-Z][A-Za-z0-9]*\b|\b\w+\.(?:js|net|io)\b|\b[A-Za-z]\+\+|\bC#"
+
+# Sentences with more of these come first within a field (a salary figure
+# over "competitive compensation", a named technology over "our tools")
+_FIELD_STRENGTH: Dict[str, Pattern[str]] = {
+    "seniority": re.compile(r"\d+\+?\s*(?:-|–|to)?\s*\d*\+?\s*(?:years|yrs)", re.I),
+    "work_arrangement": re.compile(r"\b(?:remote|hybrid|on-?site)\b", re.I),
+    "salary_min": re.compile(r"[$£€]\s?\d|\b\d{2,3}[,.]?\d{3}\b|\b\d{2,3}k\b", re.I),
+    "employment_type": re.compile(r"\b(?:full|part)[- ]time\b|\bcontract", re.I),
+}
+
+# Fields only the description can answer; the rest fall back to title/location
+_TEXT_ONLY_FIELDS = ("salary_min", "employment_type", "technologies")
+# Section kinds whose bullets are technology evidence even without a cue word
+_TECHNOLOGY_SECTIONS = ("requirements", "responsibilities")
+
+_LINE_SPLIT_RE = re.compile(r"\n+")
+_SENTENCE_SPLIT_RE = re.compile(r"(?<=[.!?])\s+(?=[A-Z0-9\"'(])")
+_BULLET_PREFIX_RE = re.compile(r"^\s*(?:[*\-•·]|\d+[.)])\s+")
+_WHITESPACE_RE = re.compile(r"\s+")
+
+
+@dataclass
+class RepairPlan:
+    """Fields to send to repair and the excerpts that may answer them."""
+
+    fields: List[str] = field(default_factory=list)
+    excerpts: List[str] = field(default_factory=list)
+    # Missing fields dropped for lack of any evidence in the text
+    dropped: List[str] = field(default_factory=list)
+
+    @property
+    def tokens(self) -> int:
+        return sum(count_tokens(excerpt) for excerpt in self.excerpts)
+
+
+def _clip(sentence: str) -> str:
+    if len(sentence) <= _MAX_EXCERPT_CHARS:
+        return sentence
+    cut = sentence[:_MAX_EXCERPT_CHARS].rsplit(" ", 1)[0]
+    return cut + " ..."
+
+
+def split_sentences(text: str) -> List[Tuple[str, str]]:
+    """``(section kind, sentence)`` pairs in document order.
+
+    Each line is its own unit (bullets, headings); lines are further split
+    at sentence ends. Bullet markers and runs of whitespace are removed.
+    """
+    units: List[Tuple[str, str]] = []
+    for section in segment_sections(text):
+        for paragraph in section.paragraphs:
+            for line in _LINE_SPLIT_RE.split(paragraph):
+                line = _BULLET_PREFIX_RE.sub("", line).strip()
+                for sentence in _SENTENCE_SPLIT_RE.split(line):
+                    sentence = _WHITESPACE_RE.sub(" ", sentence).strip()
+                    if len(sentence) > 2:
+                        units.append((section.kind, sentence))
+    return units
+
+
+@functools.lru_cache(maxsize=8)
+def _technology_regex(known: FrozenSet[str]) -> Pattern[str]:
+    """Whole-word matcher for *known* names (longest first) or a ``_TECH_NAME`` shape."""
+    names = sorted((KNOWN_TECHNOLOGIES | known) - _NOT_TECHNOLOGIES, key=len, reverse=True)
+    vocabulary = "|".join(re.escape(name) for name in names if name)
+    return re.compile(
+        rf"(?<![\w.+#])(?i:{vocabulary})(?![\w+#])|{_TECH_NAME}" if vocabulary else _TECH_NAME
+    )
+
+
+def _candidates(
+    field_name: str,
+    units: List[Tuple[str, str]],
+    location_terms: Iterable[str],
+    technologies: Optional[Pattern[str]] = None,
+) -> List[int]:
+    """Indexes of the units that can carry *field_name*, strongest first."""
+    cue = _FIELD_CUES.get(field_name)
+    terms = [t.lower() for t in location_terms] if field_name == "timezone" else []
+    tech = technologies if field_name == "technologies" else None
+    matches = []
+    for index, (kind, sentence) in enumerate(units):
+        if cue is not None and cue.search(sentence):
+            matches.append(index)
+        elif tech is not None and (kind in _TECHNOLOGY_SECTIONS or tech.search(sentence)):
+            matches.append(index)
+        elif terms and any(term in sentence.lower() for term in terms):
+            matches.append(index)
+    if tech is not None:
+        # Named technologies, then list separators
+        matches.sort(
+            key=lambda index: (
+                -len(tech.findall(units[index][1])),
+                -len(re.findall(r"[,/]", units[index][1])),
+            )
+        )
+        return matches
+    strength = _FIELD_STRENGTH.get(field_name)
+    if strength is not None:
+        matches.sort(key=lambda index: -len(strength.findall(units[index][1])))
+    return matches
+
+
+def _location_terms(location: Optional[str]) -> List[str]:
+    """City / region words from the location string (for timezone evidence)."""
+    if not location:
+        return []
+    parts = re.split(r"[,;/|()]", location)
+    return [p.strip() for p in parts if len(p.strip()) > 2 and p.strip().lower() != "remote"]
+
+
+def select_repair_excerpts(
+    description: str,
+    missing_fields: List[str],
+    location: Optional[str] = None,
+    budget_tokens: int = DEFAULT_REPAIR_EXCERPT_TOKENS,
+    max_per_field: int = MAX_EXCERPTS_PER_FIELD,
+    known_technologies: FrozenSet[str] = frozenset(),
+) -> RepairPlan:
+    """Pick the description sentences that can answer *missing_fields*.
+
+    Args:
+        description: Description text (plain text; compacted is fine)
+        missing_fields: ``JobExtractionResult`` field names to repair
+        location: Optional location string (kept fields and timezone cues)
+        budget_tokens: Token budget for all excerpts together
+        max_per_field: Most excerpts taken for any single field
+        known_technologies: Lowercase technology names added to
+            ``KNOWN_TECHNOLOGIES`` (e.g. the skill taxonomy terms)
+
+    Returns:
+        RepairPlan with the fields worth repairing and their excerpts
+    """
+    units = split_sentences(description)
+    location_terms = _location_terms(location)
+    technologies = _technology_regex(known_technologies)
+    plan = RepairPlan()
+    queues: Dict[str, List[int]] = {}
+    for name in missing_fields:
+        matches = _candidates(name, units, location_terms, technologies)
+        if not matches and (name in _TEXT_ONLY_FIELDS or (name != "seniority" and not location)):
+            plan.dropped.append(name)
+            continue
+        plan.fields.append(name)
+        queues[name] = matches[:max_per_field]
+
+    # Round-robin so one field's many matches cannot starve the others
+    chosen: Dict[int, str] = {}
+    used = 0
+    while any(queues.values()):
+        for name in plan.fields:
+            queue = queues[name]
+            while queue and queue[0] in chosen:
+                queue.pop(0)
+            if not queue:
+                continue
+            index = queue.pop(0)
+            excerpt = _clip(units[index][1])
+            cost = count_tokens(excerpt)
+            if used + cost > budget_tokens:
+                queues[name] = []
+                continue
+            chosen[index] = excerpt
+            used += cost
+    plan.excerpts = [chosen[index] for index in sorted(chosen)]
+    return plan
@@ -12,6 +12,9 @@ from typing import Dict, List, Optional
 
 import requests
 
+from job_finder.metrics import RATE_LIMIT_WAIT_SECONDS
+from job_finder.utils.rate_limiter import get_rate_limiter
+
 logger = logging.getLogger(__name__)
 
 
@@ -183,13 +186,14 @@ class FallbackSearchClient(SearchClient):
 
     Features:
     - Rotates between providers (round-robin) to spread load
-    - Enforces minimum delay between API calls to prevent rate limits
+    - Paces each provider through the shared rate limiter (key ``search:<provider>``)
     - Falls back to next provider on errors
     - Cooldown period for providers that hit rate limits
     """
 
-    # Minimum delay between API calls (seconds) - prevents rate limiting
+    # Minimum average delay between calls to one provider (seconds) - prevents rate limiting
     MIN_CALL_DELAY_SECONDS = 1.0
+    CALL_BURST = 1
 
     def __init__(self, clients: List[SearchClient]):
         """
@@ -234,13 +238,14 @@ class FallbackSearchClient(SearchClient):
         return available
 
     def _wait_for_rate_limit(self, client_name: str) -> None:
-        """Wait if needed to respect rate limits."""
-        if client_name in self._last_call_time:
-            elapsed = time.time() - self._last_call_time[client_name]
-            if elapsed < self.MIN_CALL_DELAY_SECONDS:
-                wait_time = self.MIN_CALL_DELAY_SECONDS - elapsed
-                logger.debug(f"Rate limiting: waiting {wait_time:.2f}s before {client_name} call")
-                time.sleep(wait_time)
+        """Wait if needed to respect this provider's rate limit."""
+        waited = get_rate_limiter().acquire(
+            f"search:{client_name}",
+            rate=1.0 / self.MIN_CALL_DELAY_SECONDS,
+            burst=self.CALL_BURST,
+        )
+        if waited:
+            RATE_LIMIT_WAIT_SECONDS.observe(waited, scope="search")
 
     def search(self, query: str, max_results: int = 5) -> List[SearchResult]:
         """
@@ -290,6 +295,7 @@ class FallbackSearchClient(SearchClient):
 
             try:
                 results = client.search(query, max_results)
+                get_rate_limiter().record_response(f"search:{client_name}", 200)
                 # Record successful call time
                 self._last_call_time[client_name] = time.time()
                 # Advance rotation for next call
@@ -304,7 +310,13 @@ class FallbackSearchClient(SearchClient):
                 self._last_call_time[client_name] = time.time()
 
                 # Check for quota/rate limit errors (don't retry these immediately)
-                status_code = getattr(getattr(e, "response", None), "status_code", None)
+                response = getattr(e, "response", None)
+                status_code = getattr(response, "status_code", None)
+                if status_code == 429:
+                    retry_after = (getattr(response, "headers", None) or {}).get("Retry-After")
+                    get_rate_limiter().record_response(
+                        f"search:{client_name}", status_code, retry_after
+                    )
                 if status_code in (429, 432, 402, 403):
                     # Quota exceeded, rate limited, or payment required - cooldown
                     # Use _last_call_time for consistency (already recorded above)
@@ -325,6 +337,54 @@ class FallbackSearchClient(SearchClient):
         raise requests.exceptions.RequestException(f"All search providers failed: {all_errors}")
 
 
+class CachedSearchClient(SearchClient):
+    """Search client wrapper that serves repeated queries from a persistent cache.
+
+    Queries are keyed by normalized text + ``max_results``. Only non-empty
+    result lists are stored; errors always propagate to the caller so the
+    fallback/cooldown logic of the wrapped client is unchanged.
+    """
+
+    def __init__(self, client: SearchClient, cache, ttl_seconds: Optional[int] = None):
+        """
+        Args:
+            client: Underlying SearchClient that performs real API calls
+            cache: EnrichmentCache instance used for persistence
+            ttl_seconds: Entry lifetime (defaults to SEARCH_TTL_SECONDS)
+        """
+        from job_finder.storage.enrichment_cache import SEARCH_TTL_SECONDS
+
+        self._client = client
+        self._cache = cache
+        self._ttl_seconds = ttl_seconds if ttl_seconds is not None else SEARCH_TTL_SECONDS
+        self.hits = 0
+        self.misses = 0
+
+    def search(self, query: str, max_results: int = 5) -> List[SearchResult]:
+        from job_finder.storage.enrichment_cache import MISSING
+
+        cache_key = f"{max_results}|{query.strip()}"
+        cached = self._cache.get("search", cache_key)
+        if cached is not MISSING and isinstance(cached, list):
+            self.hits += 1
+            logger.debug(f"Search cache hit for '{query}'")
+            return [
+                SearchResult(
+                    title=item.get("title", ""),
+                    url=item.get("url", ""),
+                    snippet=item.get("snippet", ""),
+                )
+                for item in cached
+                if isinstance(item, dict)
+            ]
+
+        self.misses += 1
+        results = self._client.search(query, max_results)
+        if results:
+            self._cache.set("search", cache_key, [r.to_dict() for r in results], self._ttl_seconds)
+        return results
+
+
 def get_search_client() -> Optional[SearchClient]:
     """
     Get a configured search client with automatic fallback.
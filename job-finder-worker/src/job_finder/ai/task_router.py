@@ -10,6 +10,9 @@ Model selection (2026-03-10 benchmark):
 
 from __future__ import annotations
 
+import os
+from typing import FrozenSet
+
 # Task type → LiteLLM model name
 # LiteLLM config defines what provider each model routes to and its fallback chain.
 TASK_MODEL_MAP = {
@@ -17,11 +20,31 @@ TASK_MODEL_MAP = {
     "analysis": "local-extract",  # Same — local for classification/scoring
     "document": "claude-document",  # Claude for quality generation
     "chat": "claude-document",  # Claude for conversational
+    "fused": "local-extract",  # Extraction + match analysis in one call
 }
 
+# Task types that may be fused with match analysis into one "fused" call
+# (validated per part, with the separate calls as fallback). Opt-in per task
+# type via LITELLM_FUSED_TASKS=extraction: the fused call runs before scoring,
+# so it also spends analysis tokens on jobs that score below minScore.
+FUSABLE_TASKS: FrozenSet[str] = frozenset({"extraction"})
+
 # Default model when task type isn't in the map
 DEFAULT_MODEL = "gemini-general"
 
+# Task types whose responses are cached by default (task type → TTL seconds).
+# Extraction runs at temperature 0.1 and is effectively deterministic; other
+# task types opt in per InferenceClient or per call.
+TASK_CACHE_TTL_SECONDS = {
+    "extraction": 14 * 24 * 3600,
+}
+
+# TTL applied when a caller opts a task type in without choosing one
+DEFAULT_CACHE_TTL_SECONDS = 3 * 24 * 3600
+
+# Requests sampled above this temperature are never cached
+MAX_CACHEABLE_TEMPERATURE = 0.2
+
 
 def get_model_for_task(
     task_type: str,
@@ -30,7 +53,7 @@ def get_model_for_task(
     """Return the LiteLLM model name for a given task type.
 
     Args:
-        task_type: One of "extraction", "analysis", "document", "chat"
+        task_type: One of "extraction", "analysis", "document", "chat", "fused"
         use_local: When False, any local-* model is replaced with DEFAULT_MODEL.
             This lets callers skip Ollama when it's intentionally offline.
 
@@ -42,3 +65,9 @@ def get_model_for_task(
     if not use_local and model.startswith("local-"):
         return DEFAULT_MODEL
     return model
+
+
+def is_fused_task(task_type: str) -> bool:
+    """True when *task_type* is opted in to the fused call (``LITELLM_FUSED_TASKS``)."""
+    enabled = {task.strip() for task in os.getenv("LITELLM_FUSED_TASKS", "").split(",")}
+    return task_type in FUSABLE_TASKS and task_type in enabled
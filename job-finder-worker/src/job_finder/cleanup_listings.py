@@ -3,6 +3,11 @@
 Deletes listings that fail the pre-filter check, along with associated job_matches
 (via CASCADE).
 
+Listings are streamed in rowid-keyset chunks (memory stays bounded by the
+chunk size, not the table size), sources are preloaded in one query, the
+pre-filter runs in a process pool with ``--workers > 1``, and failures are
+deleted in batched transactions.
+
 Usage:
     # Local development (uses .env for SQLITE_DB_PATH)
     ENVIRONMENT=development python -m job_finder.cleanup_listings --dry-run
@@ -15,16 +20,20 @@ Usage:
     ENVIRONMENT=production python -m job_finder.cleanup_listings
 
 Options:
-    --dry-run       Show what would be deleted without actually deleting
-    --batch-size N  Process N listings at a time (default: 100)
-    --verbose, -v   Show each failed listing with reason
+    --dry-run         Show what would be deleted without actually deleting
+    --batch-size N    Delete N listings per transaction (default: 1000)
+    --chunk-size N    Read N listings per query (default: 500)
+    --workers N       Pre-filter processes (default: 1, in-process)
+    --verbose, -v     Show each failed listing with reason
 """
 
 import argparse
 import logging
 import sys
+import time
+from concurrent.futures import Future, ProcessPoolExecutor
 from pathlib import Path
-from typing import Any, Dict, List, Tuple
+from typing import Any, Dict, Iterator, List, Optional, Tuple
 
 # Add src to Python path for imports
 sys.path.insert(0, str(Path(__file__).parent.parent))
@@ -35,29 +44,58 @@ from job_finder.storage.sqlite_client import sqlite_connection
 
 logger = logging.getLogger(__name__)
 
+DEFAULT_CHUNK_SIZE = 500
+DEFAULT_DELETE_BATCH_SIZE = 1000
+# Ids per DELETE statement (stays under SQLite's host-parameter limit)
+_DELETE_STATEMENT_SIZE = 500
+# Chunks in flight per worker; bounds memory when the pool falls behind
+_CHUNKS_PER_WORKER = 2
+_PROGRESS_INTERVAL_SECONDS = 5.0
+
+# (listing id, title, company, is_remote_source, job_data)
+ListingRecord = Tuple[str, str, str, bool, Dict[str, Any]]
+# (listing id, title, company, reason) for failed listings
+Failure = Tuple[str, str, str, str]
+
 
-def get_all_listings(db_path: str | None = None) -> List[Dict[str, Any]]:
-    """Fetch all job listings from the database."""
+def count_listings(db_path: str | None = None) -> int:
     with sqlite_connection(db_path) as conn:
-        rows = conn.execute("""
-            SELECT id, url, title, company_name, location, description,
-                   posted_date, salary_range, source_id, status
-            FROM job_listings
-            ORDER BY created_at ASC
-            """).fetchall()
-        return [dict(row) for row in rows]
+        return conn.execute("SELECT COUNT(*) FROM job_listings").fetchone()[0]
 
 
-def get_source_info(db_path: str | None, source_id: str | None) -> Dict[str, Any]:
-    """Get source information to determine if it's a remote-only source."""
-    if not source_id:
-        return {}
+def iter_listing_chunks(
+    db_path: str | None = None, chunk_size: int = DEFAULT_CHUNK_SIZE
+) -> Iterator[List[Dict[str, Any]]]:
+    """Yield job listings in rowid order, *chunk_size* rows per query.
 
+    Each chunk uses its own short-lived connection, so deleting rows that
+    were already read does not disturb the scan.
+    """
+    last_rowid = 0
+    while True:
+        with sqlite_connection(db_path) as conn:
+            rows = conn.execute(
+                """
+                SELECT rowid AS _rowid, id, url, title, company_name, location, description,
+                       posted_date, salary_range, source_id, status
+                FROM job_listings
+                WHERE rowid > ?
+                ORDER BY rowid
+                LIMIT ?
+                """,
+                (last_rowid, chunk_size),
+            ).fetchall()
+        if not rows:
+            return
+        last_rowid = rows[-1]["_rowid"]
+        yield [dict(row) for row in rows]
+
+
+def load_sources(db_path: str | None = None) -> Dict[str, Dict[str, Any]]:
+    """Fetch every job source (id, name, source_type) in one query."""
     with sqlite_connection(db_path) as conn:
-        row = conn.execute(
-            "SELECT id, name, source_type FROM job_sources WHERE id = ?", (source_id,)
-        ).fetchone()
-        return dict(row) if row else {}
+        rows = conn.execute("SELECT id, name, source_type FROM job_sources").fetchall()
+        return {row["id"]: dict(row) for row in rows}
 
 
 def is_remote_source(source_info: Dict[str, Any]) -> bool:
@@ -71,20 +109,114 @@ def is_remote_source(source_info: Dict[str, Any]) -> bool:
 
 
 def delete_listings(db_path: str | None, listing_ids: List[str]) -> int:
-    """Delete listings by ID. Returns count of deleted rows."""
+    """Delete listings by ID in a single transaction. Returns count of deleted rows."""
     if not listing_ids:
         return 0
 
+    deleted = 0
     with sqlite_connection(db_path) as conn:
-        placeholders = ",".join("?" for _ in listing_ids)
-        conn.execute(f"DELETE FROM job_listings WHERE id IN ({placeholders})", tuple(listing_ids))
-        return conn.total_changes
+        for start in range(0, len(listing_ids), _DELETE_STATEMENT_SIZE):
+            batch = listing_ids[start : start + _DELETE_STATEMENT_SIZE]
+            placeholders = ",".join("?" for _ in batch)
+            cursor = conn.execute(
+                f"DELETE FROM job_listings WHERE id IN ({placeholders})", tuple(batch)
+            )
+            deleted += cursor.rowcount
+    return deleted
+
+
+def to_records(listings: List[Dict[str, Any]], remote_source_ids: frozenset) -> List[ListingRecord]:
+    """Reduce listing rows to what the pre-filter needs (keeps worker IPC small)."""
+    return [
+        (
+            listing["id"],
+            listing.get("title") or "",
+            listing.get("company_name") or "",
+            listing.get("source_id") in remote_source_ids,
+            {
+                "title": listing.get("title", ""),
+                "description": listing.get("description", ""),
+                "location": listing.get("location", ""),
+                "posted_date": listing.get("posted_date"),
+                "salary_range": listing.get("salary_range"),
+                "company_name": listing.get("company_name", ""),
+            },
+        )
+        for listing in listings
+    ]
+
+
+def evaluate_records(prefilter: PreFilter, records: List[ListingRecord]) -> List[Failure]:
+    """Run the pre-filter over *records*, returning the ones that fail."""
+    failures = []
+    for listing_id, title, company, remote, job_data in records:
+        result = prefilter.filter(job_data, is_remote_source=remote)
+        if not result.passed:
+            failures.append((listing_id, title, company, result.reason or ""))
+    return failures
+
+
+# Per-process pre-filter for --workers > 1 (set by _init_worker in each child)
+_worker_prefilter: Optional[PreFilter] = None
+
+
+def _init_worker(prefilter_config: Dict[str, Any]) -> None:
+    global _worker_prefilter
+    _worker_prefilter = PreFilter(prefilter_config)
+
+
+def _evaluate_in_worker(records: List[ListingRecord]) -> List[Failure]:
+    assert _worker_prefilter is not None, "worker not initialized"
+    return evaluate_records(_worker_prefilter, records)
+
+
+def iter_failures(
+    prefilter_config: Dict[str, Any],
+    chunks: Iterator[List[ListingRecord]],
+    workers: int = 1,
+) -> Iterator[Tuple[int, List[Failure]]]:
+    """Yield ``(chunk_length, failures)`` per chunk, in input order.
+
+    With ``workers > 1`` chunks are evaluated in a process pool, with at most
+    ``workers * _CHUNKS_PER_WORKER`` chunks in flight.
+    """
+    if workers <= 1:
+        prefilter = PreFilter(prefilter_config)
+        for chunk in chunks:
+            yield len(chunk), evaluate_records(prefilter, chunk)
+        return
+
+    max_pending = workers * _CHUNKS_PER_WORKER
+    pending: List[Tuple[int, Future]] = []
+    with ProcessPoolExecutor(
+        max_workers=workers, initializer=_init_worker, initargs=(prefilter_config,)
+    ) as pool:
+        for chunk in chunks:
+            pending.append((len(chunk), pool.submit(_evaluate_in_worker, chunk)))
+            if len(pending) >= max_pending:
+                size, future = pending.pop(0)
+                yield size, future.result()
+        for size, future in pending:
+            yield size, future.result()
+
+
+def _log_progress(processed: int, total: int, failed: int, started: float) -> None:
+    elapsed = time.perf_counter() - started
+    rate = processed / elapsed if elapsed > 0 else 0.0
+    remaining = max(0, total - processed)
+    eta = remaining / rate if rate > 0 else 0.0
+    logger.info(
+        f"Progress: {processed}/{total} ({processed - failed} passed, {failed} failed) "
+        f"{rate:.0f} listings/s, ETA {eta:.0f}s"
+    )
 
 
 def run_cleanup(
     db_path: str | None = None,
     dry_run: bool = False,
-    batch_size: int = 100,
+    batch_size: int = DEFAULT_DELETE_BATCH_SIZE,
+    chunk_size: int = DEFAULT_CHUNK_SIZE,
+    workers: int = 1,
 ) -> Tuple[int, int, int]:
     """
     Run the cleanup process.
@@ -106,74 +238,56 @@ def run_cleanup(
     logger.info(f"  Allow onsite: {prefilter.allow_onsite}")
     logger.info(f"  Min salary: {prefilter.min_salary}")
 
-    # Fetch all listings
-    listings = get_all_listings(db_path)
-    total = len(listings)
+    total = count_listings(db_path)
     logger.info(f"Found {total} job listings to process")
 
     if total == 0:
         return 0, 0, 0
 
-    # Cache source info to avoid repeated lookups
-    source_cache: Dict[str, Dict[str, Any]] = {}
+    sources = load_sources(db_path)
+    remote_source_ids = frozenset(sid for sid, info in sources.items() if is_remote_source(info))
 
-    passed_count = 0
+    processed = 0
     failed_count = 0
     to_delete: List[str] = []
+    started = time.perf_counter()
+    last_report = started
 
-    for i, listing in enumerate(listings):
-        listing_id = listing["id"]
-        source_id = listing.get("source_id")
-
-        # Get source info (cached)
-        if source_id and source_id not in source_cache:
-            source_cache[source_id] = get_source_info(db_path, source_id)
-        source_info = source_cache.get(source_id, {}) if source_id else {}
-
-        # Build job_data dict for pre-filter
-        job_data = {
-            "title": listing.get("title", ""),
-            "description": listing.get("description", ""),
-            "location": listing.get("location", ""),
-            "posted_date": listing.get("posted_date"),
-            "salary_range": listing.get("salary_range"),
-            "company_name": listing.get("company_name", ""),
-        }
-
-        # Run pre-filter
-        result = prefilter.filter(job_data, is_remote_source=is_remote_source(source_info))
-
-        if result.passed:
-            passed_count += 1
+    def flush() -> None:
+        if dry_run:
+            logger.info(f"[DRY RUN] Would delete {len(to_delete)} listings")
         else:
-            failed_count += 1
+            deleted = delete_listings(db_path, to_delete)
+            logger.info(f"Deleted {deleted} listings")
+        to_delete.clear()
+
+    chunks = (
+        to_records(listings, remote_source_ids)
+        for listings in iter_listing_chunks(db_path, chunk_size)
+    )
+    for size, failures in iter_failures(prefilter_config, chunks, workers):
+        processed += size
+        failed_count += len(failures)
+        for listing_id, title, company, reason in failures:
             to_delete.append(listing_id)
             logger.debug(
-                f"FAIL: {listing.get('title', 'No title')[:50]} @ {listing.get('company_name', 'Unknown')[:30]} - {result.reason}"
+                f"FAIL: {title[:50] or 'No title'} @ {company[:30] or 'Unknown'} - {reason}"
             )
 
-        # Process in batches
         if len(to_delete) >= batch_size:
-            if dry_run:
-                logger.info(f"[DRY RUN] Would delete {len(to_delete)} listings")
-            else:
-                deleted = delete_listings(db_path, to_delete)
-                logger.info(f"Deleted {deleted} listings")
-            to_delete = []
+            flush()
 
-        # Progress logging
-        if (i + 1) % 100 == 0 or (i + 1) == total:
-            logger.info(f"Progress: {i + 1}/{total} ({passed_count} passed, {failed_count} failed)")
+        now = time.perf_counter()
+        if now - last_report >= _PROGRESS_INTERVAL_SECONDS:
+            _log_progress(processed, total, failed_count, started)
+            last_report = now
 
     # Delete remaining
     if to_delete:
-        if dry_run:
-            logger.info(f"[DRY RUN] Would delete {len(to_delete)} listings")
-        else:
-            deleted = delete_listings(db_path, to_delete)
-            logger.info(f"Deleted {deleted} listings")
+        flush()
+    _log_progress(processed, total, failed_count, started)
 
-    return total, passed_count, failed_count
+    return processed, processed - failed_count, failed_count
 
 
 def main():
@@ -200,8 +314,20 @@ Examples:
     parser.add_argument(
         "--batch-size",
         type=int,
-        default=100,
-        help="Process N listings at a time (default: 100)",
+        default=DEFAULT_DELETE_BATCH_SIZE,
+        help=f"Delete N listings per transaction (default: {DEFAULT_DELETE_BATCH_SIZE})",
+    )
+    parser.add_argument(
+        "--chunk-size",
+        type=int,
+        default=DEFAULT_CHUNK_SIZE,
+        help=f"Read N listings per query (default: {DEFAULT_CHUNK_SIZE})",
+    )
+    parser.add_argument(
+        "--workers",
+        type=int,
+        default=1,
+        help="Pre-filter worker processes (default: 1, in-process)",
     )
     parser.add_argument(
         "--verbose",
@@ -233,6 +359,8 @@ Examples:
             db_path=None,  # Uses SQLITE_DB_PATH env var via resolve_db_path
             dry_run=args.dry_run,
             batch_size=args.batch_size,
+            chunk_size=args.chunk_size,
+            workers=args.workers,
         )
 
         logger.info("=" * 60)
@@ -7,6 +7,8 @@ Scraping is supplementary, not primary. URL is a hint, not a requirement.
 import json
 import logging
 import re
+import threading
+import time
 from collections import OrderedDict
 from typing import Any, Dict, List, Optional, TYPE_CHECKING
 from urllib.parse import urlparse
@@ -15,10 +17,18 @@ import requests
 from bs4 import BeautifulSoup
 
 from job_finder.ai.response_parser import extract_json_from_response
-from job_finder.ai.search_client import get_search_client, SearchResult
+from job_finder.ai.search_client import CachedSearchClient, get_search_client, SearchResult
 from job_finder.ai.wikipedia_client import get_wikipedia_client
 from job_finder.logging_config import format_company_name
 from job_finder.settings import get_text_limits
+from job_finder.tracing import span, traced
+from job_finder.storage.enrichment_cache import (
+    MISSING,
+    PAGE_TTL_SECONDS,
+    WIKIPEDIA_NEGATIVE_TTL_SECONDS,
+    WIKIPEDIA_TTL_SECONDS,
+    EnrichmentCache,
+)
 
 if TYPE_CHECKING:
     from job_finder.ai.inference_client import InferenceClient
@@ -47,6 +57,9 @@ DISCOURAGED_DOMAINS = {
     "rottentomatoes.com",
 }
 
+# How often expired enrichment_cache rows are purged (seconds).
+CACHE_CLEANUP_INTERVAL_SECONDS = 24 * 3600
+
 # Tokens that indicate non-company entities we should avoid (movies, songs, etc.)
 NON_COMPANY_TOKENS = {"film", "movie", "episode", "song", "album", "soundtrack"}
 
@@ -105,12 +118,34 @@ class CompanyInfoFetcher:
         self.session.headers.update(
             {"User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36"}
         )
+        # Persistent search/Wikipedia/page cache shared across companies and
+        # re-runs. Only enabled with an explicit DB so ad-hoc instances never
+        # touch the default database.
+        self.enrichment_cache: Optional[EnrichmentCache] = (
+            EnrichmentCache(db_path) if db_path else None
+        )
+        self._last_cache_cleanup = 0.0
         self.search_client = get_search_client()
+        if self.search_client and self.enrichment_cache:
+            self.search_client = CachedSearchClient(self.search_client, self.enrichment_cache)
         self.wikipedia_client = get_wikipedia_client()
         # LRU cache for Wikipedia lookups — bounded to prevent unbounded memory growth.
         # 500 entries ≈ a few MB; oldest entries evicted when full.
         self._wiki_cache: OrderedDict[str, Any] = OrderedDict()
         self._wiki_cache_maxsize = 500
+        # Per-call artifacts (search results by query, page text by URL) so the
+        # focused pass reuses what the fast pass already fetched. Only set while
+        # fetch_company_info() is running. Thread-local so concurrent queue
+        # items sharing this fetcher don't see each other's artifacts.
+        self._local = threading.local()
+
+    @property
+    def _pass_artifacts(self) -> Optional[Dict[str, Dict[str, Any]]]:
+        return getattr(self._local, "pass_artifacts", None)
+
+    @_pass_artifacts.setter
+    def _pass_artifacts(self, value: Optional[Dict[str, Dict[str, Any]]]) -> None:
+        self._local.pass_artifacts = value
 
     def close(self) -> None:
         """Release resources held by this fetcher."""
@@ -123,6 +158,7 @@ class CompanyInfoFetcher:
     # MAIN ENTRY POINT
     # ============================================================
 
+    @traced("company_enrichment")
     def fetch_company_info(
         self,
         company_name: str,
@@ -135,19 +171,40 @@ class CompanyInfoFetcher:
         2) FOCUSED (only if needed): stronger instructions + broader queries/scrape
 
         The first acceptable result is returned; otherwise the better of the two.
+        Search results, Wikipedia lookups and page fetches from the fast pass are
+        reused by the focused pass instead of being refetched.
         """
-        fast = self._run_enrichment_pass(company_name, url_hint, source_context, mode="fast")
-        if self._is_acceptable(fast):
-            return fast
-
-        focused = self._run_enrichment_pass(company_name, url_hint, source_context, mode="focused")
-        if self._is_acceptable(focused):
-            return focused
+        self._maybe_cleanup_cache()
+        self._pass_artifacts = {"search": {}, "page": {}, "wikipedia": {}}
+        try:
+            fast = self._run_enrichment_pass(company_name, url_hint, source_context, mode="fast")
+            if self._is_acceptable(fast):
+                return fast
 
-        # Fall back to whichever is more informative
-        return (
-            focused if self._score_completeness(focused) >= self._score_completeness(fast) else fast
-        )
+            focused = self._run_enrichment_pass(
+                company_name, url_hint, source_context, mode="focused"
+            )
+            if self._is_acceptable(focused):
+                return focused
+
+            # Fall back to whichever is more informative
+            return (
+                focused
+                if self._score_completeness(focused) >= self._score_completeness(fast)
+                else fast
+            )
+        finally:
+            self._pass_artifacts = None
+
+    def _maybe_cleanup_cache(self) -> None:
+        """Purge expired enrichment cache rows at most once per day."""
+        if not self.enrichment_cache:
+            return
+        now = time.time()
+        if now - self._last_cache_cleanup < CACHE_CLEANUP_INTERVAL_SECONDS:
+            return
+        self._last_cache_cleanup = now
+        self.enrichment_cache.cleanup_expired()
 
     # ============================================================
     # Pass runner
@@ -294,6 +351,7 @@ class CompanyInfoFetcher:
     # WIKIPEDIA LOOKUP (STEP 0)
     # ============================================================
 
+    @traced("wikipedia")
     def _try_wikipedia(self, company_name: str) -> Optional[Dict[str, Any]]:
         """
         Attempt Wikipedia lookup for company.
@@ -304,12 +362,33 @@ class CompanyInfoFetcher:
         Returns:
             Dict with company info fields, or None if not found/error
         """
+        artifacts = self._pass_artifacts["wikipedia"] if self._pass_artifacts else None
+        key = company_name.lower()
+        if artifacts is not None and key in artifacts:
+            return artifacts[key]
+
+        if self.enrichment_cache:
+            cached = self.enrichment_cache.get("wikipedia", company_name)
+            if cached is not MISSING:
+                if artifacts is not None:
+                    artifacts[key] = cached
+                return cached
+
         try:
-            return self.wikipedia_client.search_company(company_name)
+            info = self.wikipedia_client.search_company(company_name)
         except Exception as e:
             logger.debug(f"Wikipedia lookup failed for {company_name}: {e}")
             return None
 
+        if artifacts is not None:
+            artifacts[key] = info
+        if self.enrichment_cache:
+            # Negative lookups are cached briefly so a missing page isn't
+            # re-queried on every re-enrichment of the same stub company.
+            ttl = WIKIPEDIA_TTL_SECONDS if info else WIKIPEDIA_NEGATIVE_TTL_SECONDS
+            self.enrichment_cache.set("wikipedia", company_name, info, ttl)
+        return info
+
     # ============================================================
     # SEARCH + AI EXTRACTION (Primary Method)
     # ============================================================
@@ -403,7 +482,7 @@ class CompanyInfoFetcher:
 
         for query in queries:
             try:
-                results = self.search_client.search(query, max_results=8)
+                results = self._search(query)
                 if results and self._has_quality_results(results, company_name):
                     return results
             except Exception as e:
@@ -412,10 +491,23 @@ class CompanyInfoFetcher:
 
         # Return whatever we got from the last query, even if low quality
         try:
-            return self.search_client.search(queries[0], max_results=8)
+            return self._search(queries[0])
         except Exception:
             return []
 
+    def _search(self, query: str, max_results: int = 8) -> List[SearchResult]:
+        """Run a search, reusing results already fetched earlier in this enrichment."""
+        artifacts = self._pass_artifacts["search"] if self._pass_artifacts else None
+        key = f"{max_results}|{query}"
+        if artifacts is not None and key in artifacts:
+            return artifacts[key]
+
+        with span("search", query=query[:100]):
+            results = self.search_client.search(query, max_results=max_results)
+        if artifacts is not None:
+            artifacts[key] = results
+        return results
+
     def _build_search_queries(
         self, company_name: str, source_context: Optional[Dict[str, Any]] = None, mode: str = "fast"
     ) -> List[str]:
@@ -797,11 +889,32 @@ Be factual. Use empty string/null/false if unknown. Return ONLY valid JSON."""
         return self._extract_with_heuristics(content)
 
     def _fetch_page_content(self, url: str, timeout: int = 10) -> Optional[str]:
-        """Fetch and clean page content."""
-        try:
-            if not url.startswith("http"):
-                url = f"https://{url}"
+        """Fetch and clean page content (served from cache when previously fetched)."""
+        if not url.startswith("http"):
+            url = f"https://{url}"
 
+        artifacts = self._pass_artifacts["page"] if self._pass_artifacts else None
+        if artifacts is not None and url in artifacts:
+            return artifacts[url]
+
+        if self.enrichment_cache:
+            cached = self.enrichment_cache.get("page", url)
+            if isinstance(cached, str):
+                if artifacts is not None:
+                    artifacts[url] = cached
+                return cached
+
+        content = self._download_page_content(url, timeout)
+        if artifacts is not None:
+            artifacts[url] = content
+        if content and self.enrichment_cache:
+            self.enrichment_cache.set("page", url, content, PAGE_TTL_SECONDS)
+        return content
+
+    @traced("page_fetch")
+    def _download_page_content(self, url: str, timeout: int = 10) -> Optional[str]:
+        """Fetch and clean page content over HTTP."""
+        try:
             response = self.session.get(url, timeout=timeout, allow_redirects=True)
             response.raise_for_status()
 
@@ -1168,6 +1281,7 @@ Be factual. Return ONLY valid JSON."""
         tokens = [t for t in re.findall(r"[a-z0-9]+", company_lower) if len(t) >= 3]
         return any(tok in sld or sld in tok for tok in tokens)
 
+    @traced("homepage_check")
     def _homepage_mentions_brand(self, url: str, company_name: str, timeout: int = 5) -> bool:
         """
         Light validation: fetch homepage and see if brand tokens appear in text.
@@ -0,0 +1,92 @@
+"""Inspect and invalidate the job extraction cache.
+
+``job_extraction_cache`` rows are keyed by extraction prompt version
+(``EXTRACTION_PROMPT_VERSION``). A new version stops matching old rows on its
+own, but they keep occupying the LRU cap until evicted; a prompt version can
+also be retired by hand after a bad model or guard change.
+
+Usage:
+    # List stored prompt versions (entries, hits); the current one is marked
+    ENVIRONMENT=production python -m job_finder.extraction_cache_admin
+
+    # Delete one or more prompt versions
+    python -m job_finder.extraction_cache_admin --prompt-version VERSION
+
+    # Delete every version except the current one
+    python -m job_finder.extraction_cache_admin --stale
+
+    # Delete everything
+    python -m job_finder.extraction_cache_admin --all
+"""
+
+from __future__ import annotations
+
+import argparse
+import logging
+import os
+import sys
+from pathlib import Path
+from typing import Optional
+
+# Add src to path when run as a script
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from job_finder.ai.extraction_prompts import EXTRACTION_PROMPT_VERSION
+from job_finder.storage.job_extraction_cache import JobExtractionCache
+
+logger = logging.getLogger(__name__)
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="Inspect and invalidate the job extraction cache")
+    target = parser.add_mutually_exclusive_group()
+    target.add_argument(
+        "--prompt-version",
+        action="append",
+        metavar="VERSION",
+        help="Delete entries for this prompt version (repeatable)",
+    )
+    target.add_argument(
+        "--stale",
+        action="store_true",
+        help=f"Delete entries for every prompt version but {EXTRACTION_PROMPT_VERSION}",
+    )
+    target.add_argument("--all", action="store_true", help="Delete every entry")
+    args = parser.parse_args()
+
+    logging.basicConfig(level=logging.INFO, format="%(levelname)s %(message)s")
+
+    db_path: Optional[str] = os.environ.get("SQLITE_DB_PATH")
+    if not db_path:
+        try:
+            from job_finder.storage.sqlite_client import resolve_db_path
+
+            resolved = resolve_db_path(None)
+            db_path = str(resolved) if resolved else None
+        except Exception as exc:
+            logger.error("Could not resolve a SQLite path: %s", exc)
+            return 2
+    if not db_path:
+        logger.error("SQLITE_DB_PATH is not set and could not be resolved.")
+        return 2
+
+    cache = JobExtractionCache(db_path)
+    if args.prompt_version or args.stale or args.all:
+        deleted = cache.invalidate(
+            prompt_versions=args.prompt_version,
+            keep_version=EXTRACTION_PROMPT_VERSION if args.stale else None,
+        )
+        logger.info("Deleted %d job_extraction_cache entries", deleted)
+        return 0
+
+    versions = cache.versions()
+    if not versions:
+        logger.info("job_extraction_cache is empty (current version %s)", EXTRACTION_PROMPT_VERSION)
+    for version, entries, hits in versions:
+        current = "  (current)" if version == EXTRACTION_PROMPT_VERSION else ""
+        logger.info("%s: %d entries, %d hits%s", version, entries, hits, current)
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -20,6 +20,7 @@ from typing import Any, Dict, List, Optional, Tuple
 
 from job_finder.utils.date_utils import parse_job_date
 from job_finder.utils.location_utils import COUNTRY_ONLY_LOCATIONS
+from job_finder.utils.keyword_matcher import get_keyword_matcher
 from job_finder.utils.timezone_utils import get_timezone_diff_hours
 from job_finder.exceptions import InitializationError
 
@@ -390,13 +391,9 @@ class PreFilter:
 
         self.required_keywords = required_raw
 
-        # Compile word-boundary regex patterns for each keyword
-        self._required_patterns: list[re.Pattern] = [
-            re.compile(rf"\b{re.escape(kw)}\b", re.IGNORECASE) for kw in self.required_keywords
-        ]
-        self._excluded_patterns: list[re.Pattern] = [
-            re.compile(rf"\b{re.escape(kw)}\b", re.IGNORECASE) for kw in self.excluded_keywords
-        ]
+        # Word-boundary matchers compiled once per keyword list (one scan per title)
+        self._required_matcher = get_keyword_matcher(tuple(self.required_keywords))
+        self._excluded_matcher = get_keyword_matcher(tuple(self.excluded_keywords))
 
         # Freshness config
         freshness_config = config.get("freshness", {})
@@ -674,21 +671,20 @@ class PreFilter:
         )
 
     def _check_title(self, title: str) -> PreFilterResult:
-        """Check title against required and excluded keywords using word boundary regex."""
+        """Check title against required and excluded keywords using word boundaries."""
         title_lower = title.lower()
 
-        # Check excluded keywords first (fast reject) using word boundary regex
-        for keyword, pattern in zip(self.excluded_keywords, self._excluded_patterns):
-            if pattern.search(title_lower):
-                return PreFilterResult(
-                    passed=False,
-                    reason=f"Title contains excluded keyword: '{keyword}'",
-                )
+        # Check excluded keywords first (fast reject); reports the first listed match
+        keyword = self._excluded_matcher.first(title_lower)
+        if keyword:
+            return PreFilterResult(
+                passed=False,
+                reason=f"Title contains excluded keyword: '{keyword}'",
+            )
 
-        # Check required keywords (must have at least one) using word boundary regex
+        # Check required keywords (must have at least one) using word boundaries
         if self.required_keywords:
-            has_required = any(p.search(title_lower) for p in self._required_patterns)
-            if not has_required:
+            if not self._required_matcher.contains_any(title_lower):
                 return PreFilterResult(
                     passed=False,
                     reason=f"Title missing required keywords",
@@ -6,9 +6,10 @@ irrelevant jobs.
 """
 
 import logging
-import re
 from dataclasses import dataclass
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, Optional
+
+from job_finder.utils.keyword_matcher import get_keyword_matcher
 
 logger = logging.getLogger(__name__)
 
@@ -62,13 +63,9 @@ class TitleFilter:
 
         self.required = required_raw
 
-        # Compile word-boundary regex patterns for each keyword
-        self._required_patterns: List[re.Pattern] = [
-            re.compile(rf"\b{re.escape(kw)}\b", re.IGNORECASE) for kw in self.required
-        ]
-        self._excluded_patterns: List[re.Pattern] = [
-            re.compile(rf"\b{re.escape(kw)}\b", re.IGNORECASE) for kw in self.excluded
-        ]
+        # Word-boundary matchers compiled once per keyword list (one scan per title)
+        self._required_matcher = get_keyword_matcher(tuple(self.required))
+        self._excluded_matcher = get_keyword_matcher(tuple(self.excluded))
 
         logger.debug(
             f"TitleFilter initialized with {len(self.required)} required, "
@@ -98,18 +95,17 @@ class TitleFilter:
 
         title_lower = title.lower()
 
-        # Check excluded keywords first (fast reject) using word boundary regex
-        for keyword, pattern in zip(self.excluded, self._excluded_patterns):
-            if pattern.search(title_lower):
-                return TitleFilterResult(
-                    passed=False,
-                    reason=f"Title contains excluded keyword: '{keyword}'",
-                )
+        # Check excluded keywords first (fast reject); reports the first listed match
+        keyword = self._excluded_matcher.first(title_lower)
+        if keyword:
+            return TitleFilterResult(
+                passed=False,
+                reason=f"Title contains excluded keyword: '{keyword}'",
+            )
 
-        # Check required keywords (must have at least one) using word boundary regex
+        # Check required keywords (must have at least one) using word boundaries
         if self.required:
-            has_required = any(p.search(title_lower) for p in self._required_patterns)
-            if not has_required:
+            if not self._required_matcher.contains_any(title_lower):
                 return TitleFilterResult(
                     passed=False,
                     reason=f"Title missing required keywords (need one of: {', '.join(self.required[:5])}{'...' if len(self.required) > 5 else ''})",
@@ -27,25 +27,48 @@ sys.path.insert(0, str(Path(__file__).parent.parent))
 
 import yaml
 from dotenv import load_dotenv
-from flask import Flask, jsonify, request
+from flask import Flask, Response, jsonify, request
 
 from job_finder.ai import AIJobMatcher
-from job_finder.ai.inference_client import InferenceClient
+from job_finder.ai.compaction import DescriptionCompactor, get_compaction_stats
+from job_finder.ai.extraction import get_fused_extraction_stats, get_pre_extraction_stats
+from job_finder.ai.concurrency import get_default_limiter
+from job_finder.ai.inference_client import (
+    InferenceClient,
+    get_prefix_stats,
+    get_response_cache_stats,
+)
 from job_finder.company_info_fetcher import CompanyInfoFetcher
 from job_finder.logging_config import get_structured_logger, setup_logging
+from job_finder.metrics import (
+    QUEUE_ITEM_SECONDS,
+    QUEUE_ITEMS_PROCESSED,
+    QUEUE_PICKUP_SECONDS,
+    render_gauge,
+    render_metrics,
+)
 from job_finder.profile import SQLiteProfileLoader
 from job_finder.profile.schema import Profile
 from job_finder.job_queue import ConfigLoader, QueueManager
 from job_finder.job_queue.notifier import QueueEventNotifier
-from job_finder.job_queue.models import ProcessorContext, QueueStatus
+from job_finder.job_queue.models import ProcessorContext, QueueItemType, QueueStatus
 from job_finder.job_queue.processor import QueueItemProcessor
+from job_finder.job_queue.processors.job_processor import get_score_bound_stats
+from job_finder.job_queue.wakeup import QueueWakeup
 from job_finder.storage import JobStorage, JobListingStorage
+from job_finder.storage.job_extraction_cache import get_extraction_cache_stats
 from job_finder.storage.sqlite_client import sqlite_connection
 from job_finder.storage.companies_manager import CompaniesManager
 from job_finder.storage.job_sources_manager import JobSourcesManager
 from job_finder.storage.scrape_report_storage import ScrapeReportStorage
+from job_finder.storage.boilerplate_storage import BoilerplateStore
+from job_finder.storage.trace_storage import TraceStorage
 from job_finder.exceptions import InitializationError, NoAgentsAvailableError
 from job_finder.rendering.playwright_renderer import get_renderer
+from job_finder.rescore_scheduler import DEFAULT_SLICE_SECONDS, RescoreScheduler
+from job_finder.tracing import Tracer, render_trace_text
+from job_finder.utils.date_utils import get_date_parse_stats
+from job_finder.utils.timezone_utils import configure_persistent_cache as configure_timezone_cache
 
 # Load environment variables
 load_dotenv()
@@ -82,6 +105,15 @@ WORKER_AUTO_RESTART_ON_SIGNAL = (
     os.getenv("WORKER_AUTO_RESTART_ON_SIGNAL", "false").lower() == "true"
 )
 WORKER_RESTART_DELAY_SECONDS = 5
+# Upper bound for the per-item timeout executor (JOB lane runs up to this many)
+MAX_ITEM_EXECUTOR_WORKERS = 8
+# Rescore stale matches in idle poll windows after scoring-config changes
+AUTO_RESCORE_ENABLED = os.getenv("AUTO_RESCORE_ENABLED", "true").lower() == "true"
+AUTO_RESCORE_SLICE_SECONDS = float(
+    os.getenv("AUTO_RESCORE_SLICE_SECONDS", str(DEFAULT_SLICE_SECONDS))
+)
+# Fraction of queue items that get a stored span trace (/trace/<item_id>); 0 disables
+TRACE_SAMPLE_RATE = float(os.getenv("TRACE_SAMPLE_RATE", "0.1"))
 
 # Migration guards
 REQUIRED_CONFIG_MIGRATIONS = {
@@ -91,7 +123,7 @@ REQUIRED_SCHEMA_MIN_ID = 46  # latest known schema migration in repo
 
 # Global state with thread-safe access
 _state_lock = threading.Lock()
-worker_state = {
+worker_state: Dict[str, Any] = {
     "running": False,
     "shutdown_requested": False,
     "restart_requested": False,
@@ -101,6 +133,7 @@ worker_state = {
     "poll_interval": DEFAULT_POLL_INTERVAL_SECONDS,
     "iteration": 0,
     "current_item_id": None,
+    "items_in_flight": 0,
 }
 
 
@@ -222,8 +255,12 @@ processor: Optional[QueueItemProcessor] = None
 config_loader: Optional[ConfigLoader] = None
 ai_matcher: Optional[AIJobMatcher] = None
 scrape_report_storage: Optional[ScrapeReportStorage] = None
+rescore_scheduler: Optional[RescoreScheduler] = None
 worker_thread: Optional[threading.Thread] = None
 
+# Ends idle waits early on queue changes, /wake and command.wake (see job_queue.wakeup)
+queue_wakeup = QueueWakeup(lambda: queue_manager.get_pending_version() if queue_manager else None)
+
 # Flask app
 app = Flask(__name__)
 
@@ -308,9 +345,12 @@ def initialize_components(config: Dict[str, Any]) -> tuple:
 
     # Initialize config loader and inference client (LiteLLM proxy)
     config_loader = ConfigLoader(db_path)
-    inference_client = InferenceClient()
+    inference_client = InferenceClient(db_path=db_path)
     inference_client.use_local_models = config_loader.is_local_models_enabled()
 
+    # Persist geocoder fallbacks for locations the offline gazetteer can't place
+    configure_timezone_cache(db_path)
+
     # Get match policy (deterministic scoring settings) - required, fail loud
     match_policy = config_loader.get_match_policy()
 
@@ -318,6 +358,7 @@ def initialize_components(config: Dict[str, Any]) -> tuple:
         agent_manager=inference_client,
         profile=profile,
         min_match_score=match_policy["minScore"],
+        compactor=DescriptionCompactor(BoilerplateStore(db_path)),
     )
 
     # Company info fetcher uses InferenceClient for AI calls
@@ -329,6 +370,7 @@ def initialize_components(config: Dict[str, Any]) -> tuple:
     notifier = QueueEventNotifier()
     queue_manager = QueueManager(db_path, notifier=notifier)
     notifier.on_command = queue_manager.handle_command
+    queue_manager.on_wake = queue_wakeup.wake
 
     # Create ProcessorContext with all dependencies
     ctx = ProcessorContext(
@@ -342,6 +384,11 @@ def initialize_components(config: Dict[str, Any]) -> tuple:
         ai_matcher=ai_matcher,
         notifier=notifier,
         scrape_report_storage=report_storage,
+        tracer=(
+            Tracer(TraceStorage(db_path), sample_rate=TRACE_SAMPLE_RATE)
+            if TRACE_SAMPLE_RATE > 0
+            else None
+        ),
     )
     processor = QueueItemProcessor(ctx)
 
@@ -368,6 +415,22 @@ def _poll_remote_commands() -> None:
             queue_manager.handle_command({"event": f"command.{cmd.get('command')}", **cmd})
 
 
+def _run_idle_rescore() -> None:
+    """Advance background rescoring (if scoring config changed) in an idle window."""
+    global rescore_scheduler
+    if not AUTO_RESCORE_ENABLED or config_loader is None:
+        return
+    try:
+        if rescore_scheduler is None:
+            rescore_scheduler = RescoreScheduler(
+                config_loader.db_path, slice_seconds=AUTO_RESCORE_SLICE_SECONDS
+            )
+        # Yield to newly submitted work between rowid windows
+        rescore_scheduler.run_idle_slice(should_stop=queue_wakeup.pending)
+    except Exception as e:
+        slogger.worker_status("rescore_error", {"error": str(e)})
+
+
 def _verify_migrations(db_path: str) -> None:
     """
     Ensure required schema and config migrations have been applied before
@@ -403,6 +466,18 @@ def _get_task_delay() -> float:
         return 0.0
 
 
+def _observe_pickup_delay(item: Any, item_type: str) -> None:
+    """Record submit-to-start latency for first attempts (retries would skew it)."""
+    created_at = getattr(item, "created_at", None)
+    retry_count = getattr(item, "retry_count", 0)
+    if not isinstance(created_at, datetime) or retry_count:
+        return
+    if created_at.tzinfo is None:
+        created_at = created_at.replace(tzinfo=timezone.utc)
+    delay = (datetime.now(timezone.utc) - created_at).total_seconds()
+    QUEUE_PICKUP_SECONDS.observe(max(0.0, delay), type=item_type)
+
+
 def _process_single_item(
     executor: concurrent.futures.ThreadPoolExecutor,
     item: Any,
@@ -420,14 +495,21 @@ def _process_single_item(
         True if processing should pause (e.g., no agents available), False otherwise.
     """
     _set_state("current_item_id", item.id)
+    _increment_state("items_in_flight")
     pause_requested = False
+    item_type = getattr(item.type, "value", str(item.type))
+    outcome = "error"
+    started = time.perf_counter()
+    _observe_pickup_delay(item, item_type)
 
     try:
         future = executor.submit(processor.process_item, item)
         future.result(timeout=processing_timeout)
         _increment_state("items_processed_total")
+        outcome = "completed"
 
     except concurrent.futures.TimeoutError:
+        outcome = "timeout"
         msg = f"Processing exceeded timeout ({processing_timeout}s)"
         slogger.worker_status(
             "processing_timeout",
@@ -442,6 +524,7 @@ def _process_single_item(
         _set_state("last_error", msg)
 
     except NoAgentsAvailableError as nae:
+        outcome = "no_agents"
         # Critical: no agents available - stop queue and reset item
         slogger.worker_status(
             "no_agents_available",
@@ -484,11 +567,98 @@ def _process_single_item(
         _set_state("last_error", error_msg)
 
     finally:
-        _set_state("current_item_id", None)
+        QUEUE_ITEMS_PROCESSED.inc(type=item_type, outcome=outcome)
+        QUEUE_ITEM_SECONDS.observe(time.perf_counter() - started, type=item_type)
+        with _state_lock:
+            worker_state["items_in_flight"] = max(0, worker_state["items_in_flight"] - 1)
+            # Concurrent JOB lane: only clear if no other item has replaced us
+            if worker_state["current_item_id"] == item.id:
+                worker_state["current_item_id"] = None
 
     return pause_requested
 
 
+def _get_max_concurrent_jobs() -> int:
+    """Get JOB lane concurrency from config with fallback to 1 (sequential)."""
+    if config_loader is None:
+        return 1
+    try:
+        return config_loader.get_max_concurrent_jobs()
+    except Exception:
+        return 1
+
+
+def _should_stop_batch() -> Optional[bool]:
+    """Check shutdown/disable flags between items.
+
+    Returns:
+        None to keep going, otherwise the value _process_batch should return
+        (False for shutdown, True for processing disabled mid-batch).
+    """
+    if _get_state("shutdown_requested"):
+        slogger.worker_status("shutdown_in_progress")
+        return False
+
+    # Re-read processing toggle before each item so a stop request
+    # takes effect even mid-batch.
+    if not config_loader.is_processing_enabled():
+        slogger.worker_status(
+            "processing_paused",
+            {"iteration": _get_state("iteration"), "reason": "disabled_in_db_mid_batch"},
+        )
+        return True
+    return None
+
+
+def _process_job_lane(
+    executor: concurrent.futures.ThreadPoolExecutor,
+    items: list,
+    processing_timeout: int,
+    concurrency: int,
+    task_delay: float,
+) -> bool:
+    """
+    Process consecutive JOB items with up to `concurrency` in flight.
+
+    JOB items spend most of their time waiting on LLM round trips, so running
+    several lets those calls overlap (the InferenceClient's adaptive limiter
+    still caps in-flight requests per model). A pause from any item (e.g.
+    NoAgentsAvailableError) stops new submissions; in-flight items finish.
+
+    Returns:
+        True if processing was paused, False otherwise.
+    """
+    pending = list(items)
+    in_flight: set = set()
+    stop_result: Optional[bool] = None
+    paused = False
+
+    with concurrent.futures.ThreadPoolExecutor(
+        max_workers=concurrency, thread_name_prefix="job-lane"
+    ) as lane:
+        while pending or in_flight:
+            while pending and len(in_flight) < concurrency and not paused:
+                stop_result = _should_stop_batch()
+                if stop_result is not None:
+                    pending.clear()
+                    break
+                item = pending.pop(0)
+                in_flight.add(lane.submit(_process_single_item, executor, item, processing_timeout))
+                if task_delay and pending:
+                    time.sleep(task_delay)
+
+            if not in_flight:
+                break
+            done, in_flight = concurrent.futures.wait(
+                in_flight, return_when=concurrent.futures.FIRST_COMPLETED
+            )
+            if any(future.result() for future in done):
+                paused = True
+                pending.clear()
+
+    return paused or bool(stop_result)
+
+
 def _process_batch(
     executor: concurrent.futures.ThreadPoolExecutor,
     items: list,
@@ -497,6 +667,10 @@ def _process_batch(
     """
     Process a batch of queue items.
 
+    Runs of consecutive JOB items are processed concurrently (see
+    _process_job_lane) when maxConcurrentJobs > 1; everything else is
+    processed one at a time, in order.
+
     Args:
         executor: ThreadPoolExecutor for timeout enforcement
         items: List of queue items to process
@@ -506,20 +680,30 @@ def _process_batch(
         True if processing was paused, False if batch completed normally.
     """
     task_delay = _get_task_delay()
+    concurrency = _get_max_concurrent_jobs()
+
+    index = 0
+    while index < len(items):
+        item = items[index]
+
+        if concurrency > 1 and item.type == QueueItemType.JOB:
+            run_end = index
+            while run_end < len(items) and items[run_end].type == QueueItemType.JOB:
+                run_end += 1
+            if run_end - index > 1:
+                if _process_job_lane(
+                    executor, items[index:run_end], processing_timeout, concurrency, task_delay
+                ):
+                    return True
+                if _get_state("shutdown_requested"):
+                    slogger.worker_status("shutdown_in_progress")
+                    return False
+                index = run_end
+                continue
 
-    for item in items:
-        if _get_state("shutdown_requested"):
-            slogger.worker_status("shutdown_in_progress")
-            return False
-
-        # Re-read processing toggle before each item so a stop request
-        # takes effect even mid-batch.
-        if not config_loader.is_processing_enabled():
-            slogger.worker_status(
-                "processing_paused",
-                {"iteration": _get_state("iteration"), "reason": "disabled_in_db_mid_batch"},
-            )
-            return True
+        stop_result = _should_stop_batch()
+        if stop_result is not None:
+            return stop_result
 
         pause_requested = _process_single_item(executor, item, processing_timeout)
         if pause_requested:
@@ -527,17 +711,20 @@ def _process_batch(
 
         if task_delay:
             time.sleep(task_delay)
+        index += 1
 
     return False
 
 
 def worker_loop():
-    """Main worker loop - single thread drains the queue before sleeping."""
+    """Main worker loop - drains the queue before sleeping (JOB runs may overlap)."""
     slogger.worker_status("started")
     _update_state(running=True, iteration=0)
 
-    # One executor reused for per-item timeouts while keeping single-threaded processing
-    with concurrent.futures.ThreadPoolExecutor(max_workers=1) as executor:
+    # One executor reused for per-item timeouts; sized for the concurrent JOB lane
+    with concurrent.futures.ThreadPoolExecutor(
+        max_workers=MAX_ITEM_EXECUTOR_WORKERS, thread_name_prefix="queue-item"
+    ) as executor:
         while not _get_state("shutdown_requested"):
             try:
                 _increment_state("iteration")
@@ -554,13 +741,15 @@ def worker_loop():
                 # Check if processing is enabled (allows pausing via config)
                 if not config_loader.is_processing_enabled():
                     slogger.worker_status("processing_paused", {"iteration": current_iteration})
-                    time.sleep(poll_interval)
+                    queue_wakeup.checkpoint()
+                    queue_wakeup.wait(poll_interval)
                     continue
 
                 # Clear any stop reason now that processing is enabled
                 config_loader.clear_stop_reason()
 
-                # Drain the queue before sleeping
+                # Drain the queue before sleeping; changes after the checkpoint end the wait
+                queue_wakeup.checkpoint()
                 items = queue_manager.get_pending_items()
                 if not items:
                     slogger.worker_status(
@@ -570,7 +759,8 @@ def worker_loop():
                             "total_processed": _get_state("items_processed_total"),
                         },
                     )
-                    time.sleep(poll_interval)
+                    _run_idle_rescore()
+                    queue_wakeup.wait(poll_interval)
                     continue
 
                 slogger.worker_status(
@@ -584,6 +774,7 @@ def worker_loop():
                     batch_paused = _process_batch(executor, items, processing_timeout)
                     if batch_paused or _get_state("shutdown_requested"):
                         break
+                    queue_wakeup.checkpoint()
                     items = queue_manager.get_pending_items()
 
                 # Log batch completion status
@@ -601,7 +792,7 @@ def worker_loop():
 
                 if _get_state("shutdown_requested"):
                     break
-                time.sleep(poll_interval)
+                queue_wakeup.wait(poll_interval)
 
             except Exception as e:
                 slogger.worker_status("error", {"error": str(e), "recovery": True})
@@ -653,22 +844,84 @@ def cli_health():
 def status():
     """Detailed status endpoint."""
     queue_stats = {}
+    company_waiters: Any = []
     if queue_manager:
         try:
             queue_stats = queue_manager.get_queue_stats()
         except Exception as e:
             queue_stats = {"error": str(e)}
+        try:
+            company_waiters = queue_manager.get_company_waiter_counts()
+        except Exception as e:
+            company_waiters = {"error": str(e)}
 
     state = _get_state_snapshot()
     return jsonify(
         {
             "worker": state,
             "queue": queue_stats,
+            "company_waiters": company_waiters,
+            "llm_response_cache": get_response_cache_stats(),
+            "llm_prompt_prefix": get_prefix_stats(),
+            "description_compaction": get_compaction_stats(),
+            "pre_extraction": get_pre_extraction_stats(),
+            "score_pruning": get_score_bound_stats(),
+            "extraction_cache": get_extraction_cache_stats(),
+            "fused_extraction": get_fused_extraction_stats(),
+            "llm_concurrency": get_default_limiter().snapshot(),
+            "date_parsing": get_date_parse_stats(),
+            "rescore": (
+                rescore_scheduler.status()
+                if rescore_scheduler
+                else {"state": "idle" if AUTO_RESCORE_ENABLED else "disabled"}
+            ),
             "uptime": time.time() - state.get("start_time", time.time()),
         }
     )
 
 
+@app.route("/metrics")
+def metrics():
+    """Prometheus text-format counters and latency histograms."""
+    extra = []
+    if queue_manager:
+        try:
+            depths = sorted(queue_manager.get_queue_depths().items())
+            samples = [({"type": t, "status": st}, n) for (t, st), n in depths]
+            extra.append(
+                render_gauge(
+                    "jobfinder_queue_items",
+                    "Queue items by type and status.",
+                    ("type", "status"),
+                    samples,
+                )
+            )
+        except Exception as e:
+            logging.getLogger(__name__).warning("Queue depth unavailable for /metrics: %s", e)
+    return Response(render_metrics(extra), mimetype="text/plain; version=0.0.4")
+
+
+@app.route("/trace/<item_id>")
+def trace(item_id: str):
+    """Stored span traces for a queue item (JSON, or ``?format=text`` for a tree)."""
+    tracer = processor.ctx.tracer if processor else None
+    if tracer is None or tracer.storage is None:
+        return jsonify({"error": "Tracing is disabled (TRACE_SAMPLE_RATE=0)"}), 404
+    try:
+        traces = tracer.storage.get_traces(item_id)
+    except Exception as e:
+        return jsonify({"error": str(e)}), 500
+    if not traces:
+        return jsonify({"error": f"No trace recorded for {item_id} (not sampled?)"}), 404
+    if request.args.get("format") == "text":
+        text = "\n".join(
+            f"# {t['started_at']} ({t['item_type']})\n{render_trace_text(t['trace'])}"
+            for t in traces
+        )
+        return Response(text, mimetype="text/plain")
+    return jsonify({"item_id": item_id, "traces": traces})
+
+
 @app.route("/start", methods=["POST"])
 def start_worker():
     """Start the worker."""
@@ -707,6 +960,7 @@ def stop_worker():
         return jsonify({"message": "Worker is not running"}), 400
 
     _set_state("shutdown_requested", True)
+    queue_wakeup.wake("shutdown")
 
     # Wait for worker to stop (with timeout)
     if worker_thread and worker_thread.is_alive():
@@ -717,6 +971,13 @@ def stop_worker():
     return jsonify({"message": "Worker stopped"})
 
 
+@app.route("/wake", methods=["POST"])
+def wake_worker():
+    """Skip the rest of the idle poll sleep (e.g. right after a UI submission)."""
+    queue_wakeup.wake("http")
+    return jsonify({"message": "Worker woken", "running": _get_state("running")})
+
+
 @app.route("/restart", methods=["POST"])
 def restart_worker():
     """Restart the worker."""
@@ -796,6 +1057,7 @@ def signal_handler(signum, frame):
     else:
         slogger.worker_status("shutdown_requested", {"signal": signum, "auto_restart": False})
         _set_state("shutdown_requested", True)
+    queue_wakeup.wake("shutdown")
 
 
 def main():
@@ -874,6 +1136,7 @@ def main():
         # before closing resources it may still be using.
         slogger.worker_status("cleanup_starting")
         _set_state("shutdown_requested", True)
+        queue_wakeup.wake("shutdown")
         if worker_thread and worker_thread.is_alive():
             worker_thread.join(timeout=WORKER_SHUTDOWN_TIMEOUT_SECONDS)
 
@@ -331,6 +331,9 @@ class ConfigLoader:
     MIN_TASK_DELAY_SECONDS = 0
     MAX_TASK_DELAY_SECONDS = 60
     DEFAULT_TASK_DELAY_SECONDS = 1
+    MIN_CONCURRENT_JOBS = 1
+    MAX_CONCURRENT_JOBS = 8
+    DEFAULT_CONCURRENT_JOBS = 3
 
     def get_processing_timeout(self) -> int:
         """
@@ -379,3 +382,28 @@ class ConfigLoader:
                 self.DEFAULT_TASK_DELAY_SECONDS,
             )
             return float(self.DEFAULT_TASK_DELAY_SECONDS)
+
+    def get_max_concurrent_jobs(self) -> int:
+        """
+        Get how many JOB items may be processed concurrently.
+
+        JOB items are dominated by LLM round trips; running several at once
+        lets their calls overlap (per-model limits are enforced separately
+        by the adaptive concurrency limiter in InferenceClient).
+
+        Returns:
+            Concurrent JOB items (1-8, default 3).
+        """
+        worker_settings = self.get_worker_settings()
+        runtime = worker_settings.get("runtime", {})
+        raw = runtime.get("maxConcurrentJobs", self.DEFAULT_CONCURRENT_JOBS)
+        try:
+            value = int(raw)
+        except (TypeError, ValueError):
+            logger.warning(
+                "Invalid maxConcurrentJobs=%s (not a number), using default of %s",
+                raw,
+                self.DEFAULT_CONCURRENT_JOBS,
+            )
+            return self.DEFAULT_CONCURRENT_JOBS
+        return max(self.MIN_CONCURRENT_JOBS, min(self.MAX_CONCURRENT_JOBS, value))
@@ -8,7 +8,7 @@ import logging
 import re
 import sqlite3
 from datetime import datetime, timedelta, timezone
-from typing import Any, Dict, List, Optional
+from typing import Any, Callable, Dict, List, Optional, Tuple
 from uuid import uuid4
 
 from pydantic import ValidationError
@@ -26,6 +26,12 @@ from job_finder.utils.url_utils import normalize_url as _canonical_normalize_url
 
 logger = logging.getLogger(__name__)
 
+# Jobs parked on a company task become claimable again after this long even if
+# no wake-up arrives (e.g. the company item was deleted by hand).
+COMPANY_WAIT_TIMEOUT_MINUTES = 30
+
+_TERMINAL_STATUSES = (QueueStatus.SUCCESS, QueueStatus.FAILED, QueueStatus.SKIPPED)
+
 
 def _utcnow() -> datetime:
     return datetime.now(timezone.utc)
@@ -52,6 +58,43 @@ def _rows_to_items(rows: List[Any]) -> List[JobQueueItem]:
     return items
 
 
+# Change counter bumped whenever an item may have become claimable: a pending
+# insert, a transition back to pending, or a parked item's waiter row being
+# released. The idle worker polls it to wake early (see job_queue.wakeup).
+_PENDING_VERSION_DDL = (
+    """
+    CREATE TABLE IF NOT EXISTS table_versions (
+        table_name TEXT PRIMARY KEY,
+        version INTEGER NOT NULL DEFAULT 0
+    )
+    """,
+    "INSERT OR IGNORE INTO table_versions (table_name, version) VALUES ('job_queue_pending', 0)",
+    """
+    CREATE TRIGGER IF NOT EXISTS trg_job_queue_pending_insert
+    AFTER INSERT ON job_queue
+    WHEN NEW.status = 'pending'
+    BEGIN
+        UPDATE table_versions SET version = version + 1 WHERE table_name = 'job_queue_pending';
+    END
+    """,
+    """
+    CREATE TRIGGER IF NOT EXISTS trg_job_queue_pending_update
+    AFTER UPDATE OF status ON job_queue
+    WHEN NEW.status = 'pending' AND OLD.status IS NOT 'pending'
+    BEGIN
+        UPDATE table_versions SET version = version + 1 WHERE table_name = 'job_queue_pending';
+    END
+    """,
+    """
+    CREATE TRIGGER IF NOT EXISTS trg_company_waiters_release
+    AFTER DELETE ON company_waiters
+    BEGIN
+        UPDATE table_versions SET version = version + 1 WHERE table_name = 'job_queue_pending';
+    END
+    """,
+)
+
+
 class QueueManager:
     """Manage queue items stored inside the SQLite database."""
 
@@ -62,6 +105,8 @@ class QueueManager:
     ):
         self.db_path = db_path
         self.notifier = notifier
+        # Set by the worker: called with a reason when new work is announced
+        self.on_wake: Optional[Callable[[str], None]] = None
         self._max_string_length = 2000
         self._ensure_schema()
 
@@ -85,6 +130,20 @@ class QueueManager:
                 ON job_queue(dedupe_key)
                 WHERE dedupe_key IS NOT NULL AND status IN ('pending','processing');
                 """)
+            conn.execute("""
+                CREATE TABLE IF NOT EXISTS company_waiters (
+                    queue_item_id TEXT PRIMARY KEY,
+                    company_id TEXT,
+                    company_name TEXT,
+                    parked_at TEXT NOT NULL
+                );
+                """)
+            conn.execute(
+                "CREATE INDEX IF NOT EXISTS idx_company_waiters_company "
+                "ON company_waiters(company_id, company_name);"
+            )
+            for statement in _PENDING_VERSION_DDL:
+                conn.execute(statement)
 
     def _sanitize_payload(self, obj: Any) -> Any:
         """Trim oversized strings and drop heavy description fields before emitting events."""
@@ -297,15 +356,25 @@ class QueueManager:
         return item.id
 
     def get_pending_items(self, limit: int = 10) -> List[JobQueueItem]:
+        """Return claimable PENDING items, oldest first.
+
+        Items parked on an in-flight company task are skipped until the task
+        wakes them (or COMPANY_WAIT_TIMEOUT_MINUTES passes).
+        """
+        wait_cutoff = _iso(_utcnow() - timedelta(minutes=COMPANY_WAIT_TIMEOUT_MINUTES))
         with sqlite_connection(self.db_path) as conn:
             rows = conn.execute(
                 """
                 SELECT * FROM job_queue
                 WHERE status = ?
+                  AND NOT EXISTS (
+                    SELECT 1 FROM company_waiters w
+                    WHERE w.queue_item_id = job_queue.id AND w.parked_at > ?
+                  )
                 ORDER BY datetime(updated_at) ASC
                 LIMIT ?
                 """,
-                (QueueStatus.PENDING.value, limit),
+                (QueueStatus.PENDING.value, wait_cutoff, limit),
             ).fetchall()
 
         return _rows_to_items(rows)
@@ -377,17 +446,16 @@ class QueueManager:
             item.processed_at = now_dt
         # BLOCKED is intentionally excluded - it's not a terminal state,
         # items are waiting for manual intervention to resolve resource constraints
-        if status in (
-            QueueStatus.SUCCESS,
-            QueueStatus.FAILED,
-            QueueStatus.SKIPPED,
-        ):
+        if status in _TERMINAL_STATUSES:
             item.completed_at = now_dt
 
         self._persist_item(item)
         logger.debug("Updated queue item %s -> %s", item_id, status.value)
         self._notify_item_updated(item_id)
 
+        if item.type == QueueItemType.COMPANY and status in _TERMINAL_STATUSES:
+            self.release_company_waiters(item.company_id, item.company_name)
+
     def get_item(self, item_id: str) -> Optional[JobQueueItem]:
         with sqlite_connection(self.db_path) as conn:
             row = conn.execute("SELECT * FROM job_queue WHERE id = ?", (item_id,)).fetchone()
@@ -473,14 +541,32 @@ class QueueManager:
 
         return stats
 
+    def get_pending_version(self) -> Optional[int]:
+        """Counter that moves whenever an item may have become claimable."""
+        with sqlite_connection(self.db_path) as conn:
+            row = conn.execute(
+                "SELECT version FROM table_versions WHERE table_name = 'job_queue_pending'"
+            ).fetchone()
+        return row[0] if row else None
+
+    def get_queue_depths(self) -> Dict[Tuple[str, str], int]:
+        """Item counts keyed by ``(type, status)``."""
+        with sqlite_connection(self.db_path) as conn:
+            rows = conn.execute(
+                "SELECT type, status, COUNT(*) AS count FROM job_queue GROUP BY type, status"
+            ).fetchall()
+        return {(row["type"], row["status"]): row["count"] for row in rows}
+
     def handle_command(self, command: Dict[str, Any]) -> None:
-        """Handle external command (currently cancel).
+        """Handle external command (cancel, or wake the idle worker).
 
         This is invoked by the notifier's WebSocket callback.
         """
         if command.get("event") == "command.cancel" and command.get("itemId"):
             item_id = command["itemId"]
             self.update_status(item_id, QueueStatus.SKIPPED, "Cancelled by user (command)")
+        elif command.get("event") == "command.wake" and self.on_wake:
+            self.on_wake("command")
 
     def retry_item(self, item_id: str) -> bool:
         now = _iso(_utcnow())
@@ -633,6 +719,11 @@ class QueueManager:
             )
         self._notify_item_updated(item_id)
 
+        # A blocked company task will not finish on its own; let waiters proceed.
+        item = self.get_item(item_id)
+        if item and item.type == QueueItemType.COMPANY:
+            self.release_company_waiters(item.company_id, item.company_name)
+
     def unblock_items(self, error_category: Optional[str] = None) -> int:
         """
         Unblock BLOCKED items, resetting them to PENDING.
@@ -775,13 +866,17 @@ class QueueManager:
         return count
 
     def delete_item(self, item_id: str) -> bool:
+        item = self.get_item(item_id)
         with sqlite_connection(self.db_path) as conn:
             result = conn.execute("DELETE FROM job_queue WHERE id = ?", (item_id,))
+            conn.execute("DELETE FROM company_waiters WHERE queue_item_id = ?", (item_id,))
         deleted = result.rowcount > 0
         if deleted:
             logger.info("Deleted queue item %s", item_id)
             if self.notifier:
                 self.notifier.send_event("item.deleted", {"queueItemId": item_id})
+            if item and item.type == QueueItemType.COMPANY:
+                self.release_company_waiters(item.company_id, item.company_name)
         return deleted
 
     # --------------------------------------------------------------------- #
@@ -864,3 +959,170 @@ class QueueManager:
         item.completed_at = None
         self._persist_item(item)
         self._notify_item_updated(item_id)
+
+    # --------------------------------------------------------------------- #
+    # COMPANY DEPENDENCY (WAITERS)
+    # --------------------------------------------------------------------- #
+
+    def park_for_company(
+        self,
+        item_id: str,
+        company_id: Optional[str],
+        company_name: Optional[str],
+        pipeline_state: Dict[str, Any],
+    ) -> bool:
+        """Park a job until the active COMPANY task for this company finishes.
+
+        The item is put back to PENDING with its pipeline state but is not
+        returned by get_pending_items() while the waiter row exists. The
+        COMPANY item's terminal status update wakes every waiter exactly once
+        (see release_company_waiters).
+
+        The waiter row is only written if an active company task exists,
+        checked in the same transaction so a task that completes concurrently
+        can't strand the job.
+
+        Returns:
+            True if the item was parked, False if there is nothing to wait on.
+        """
+        if not company_id and not company_name:
+            return False
+
+        company_conditions = []
+        params: List[Any] = [QueueItemType.COMPANY.value]
+        if company_id:
+            company_conditions.append("json_extract(input, '$.company_id') = ?")
+            params.append(company_id)
+        if company_name:
+            company_conditions.append("json_extract(input, '$.company_name') = ?")
+            params.append(company_name)
+        params.extend([QueueStatus.PENDING.value, QueueStatus.PROCESSING.value])
+
+        item = self.get_item(item_id)
+        if not item:
+            logger.error("park_for_company: item %s not found", item_id)
+            return False
+
+        now_dt = _utcnow()
+        item.pipeline_state = pipeline_state
+        item.status = QueueStatus.PENDING
+        item.result_message = f"Waiting for company enrichment: {company_name or company_id}"
+        item.updated_at = now_dt
+        item.processed_at = None
+        item.completed_at = None
+        record = item.to_record()
+
+        with sqlite_connection(self.db_path) as conn:
+            active = conn.execute(
+                f"""
+                SELECT 1 FROM job_queue
+                WHERE type = ?
+                  AND ({" OR ".join(company_conditions)})
+                  AND status IN (?, ?)
+                LIMIT 1
+                """,
+                tuple(params),
+            ).fetchone()
+            if active is None:
+                return False
+
+            conn.execute(
+                """
+                INSERT OR REPLACE INTO company_waiters
+                    (queue_item_id, company_id, company_name, parked_at)
+                VALUES (?, ?, ?, ?)
+                """,
+                (item_id, company_id, company_name, _iso(now_dt)),
+            )
+            conn.execute(
+                """
+                UPDATE job_queue
+                SET status = ?, output = ?, result_message = ?, updated_at = ?,
+                    processed_at = NULL, completed_at = NULL
+                WHERE id = ?
+                """,
+                (
+                    record["status"],
+                    record["output"],
+                    record["result_message"],
+                    record["updated_at"],
+                    item_id,
+                ),
+            )
+
+        self._notify_item_updated(item_id)
+        return True
+
+    def release_company_waiters(
+        self, company_id: Optional[str], company_name: Optional[str]
+    ) -> int:
+        """Wake every job parked on this company (matched by id OR name).
+
+        Waiter rows are deleted and the woken items' updated_at is bumped so
+        they are picked up in FIFO order from now.
+
+        Returns:
+            Number of items woken.
+        """
+        if not company_id and not company_name:
+            return 0
+
+        conditions = []
+        params: List[Any] = []
+        if company_id:
+            conditions.append("company_id = ?")
+            params.append(company_id)
+        if company_name:
+            conditions.append("company_name = ?")
+            params.append(company_name)
+        match_sql = " OR ".join(conditions)
+
+        now = _iso(_utcnow())
+        with sqlite_connection(self.db_path) as conn:
+            rows = conn.execute(
+                f"SELECT queue_item_id FROM company_waiters WHERE {match_sql}", tuple(params)
+            ).fetchall()
+            if not rows:
+                return 0
+            item_ids = [row["queue_item_id"] for row in rows]
+            placeholders = ",".join("?" for _ in item_ids)
+            conn.execute(
+                f"DELETE FROM company_waiters WHERE queue_item_id IN ({placeholders})",
+                tuple(item_ids),
+            )
+            conn.execute(
+                f"""
+                UPDATE job_queue SET updated_at = ?
+                WHERE id IN ({placeholders}) AND status = ?
+                """,
+                (now, *item_ids, QueueStatus.PENDING.value),
+            )
+
+        logger.info(
+            "Woke %d job(s) waiting on company %s",
+            len(item_ids),
+            company_name or company_id,
+        )
+        for item_id in item_ids:
+            self._notify_item_updated(item_id)
+        return len(item_ids)
+
+    def get_company_waiter_counts(self) -> List[Dict[str, Any]]:
+        """Return the number of jobs parked on each company, largest first."""
+        with sqlite_connection(self.db_path) as conn:
+            rows = conn.execute("""
+                SELECT company_id, company_name, COUNT(*) AS count,
+                       MIN(parked_at) AS oldest_parked_at
+                FROM company_waiters
+                GROUP BY company_id, company_name
+                ORDER BY count DESC
+                """).fetchall()
+        return [
+            {
+                "company_id": row["company_id"],
+                "company_name": row["company_name"],
+                "count": row["count"],
+                "oldest_parked_at": row["oldest_parked_at"],
+            }
+            for row in rows
+        ]
@@ -25,6 +25,7 @@ if TYPE_CHECKING:
     from job_finder.storage.companies_manager import CompaniesManager
     from job_finder.storage.job_sources_manager import JobSourcesManager
     from job_finder.storage.scrape_report_storage import ScrapeReportStorage
+    from job_finder.tracing import Tracer
 
 
 @dataclass
@@ -46,6 +47,7 @@ class ProcessorContext:
         company_info_fetcher: Company info scraper
         ai_matcher: AI job matcher
         notifier: Optional event notifier for WebSocket progress updates
+        tracer: Optional tracer; sampled items get a span tree (see job_finder.tracing)
     """
 
     queue_manager: "QueueManager"
@@ -58,6 +60,7 @@ class ProcessorContext:
     ai_matcher: "AIJobMatcher"
     notifier: Optional["QueueEventNotifier"] = None
     scrape_report_storage: Optional["ScrapeReportStorage"] = None
+    tracer: Optional["Tracer"] = None
 
 
 class QueueItemType(str, Enum):
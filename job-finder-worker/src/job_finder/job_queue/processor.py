@@ -8,6 +8,7 @@ the state-driven pipeline as the single source of truth.
 
 import logging
 import traceback
+from contextlib import nullcontext
 from typing import Optional
 
 from job_finder.exceptions import QueueProcessingError
@@ -66,38 +67,41 @@ class QueueItemProcessor:
                 f"Processing queue item {item.id}: {item.type} - {(item.url or '')[:50]}..."
             )
 
-        try:
-            # Note: Status will be updated to PROCESSING by each stage method after
-            # dependency checks pass. This prevents premature "processing" events
-            # when items are re-queued due to unmet dependencies.
-
-            # Delegate to specialized processors
-            # Note: Job deduplication is handled in scraper_intake (for scraped jobs) and
-            # get_or_create_listing (for direct submissions). No duplicate check needed here.
-            if item.type == QueueItemType.COMPANY:
-                self.company_processor.process_company(item)
-            elif item.type == QueueItemType.JOB:
-                # Use decision tree routing based on pipeline_state
-                self.job_processor.process_job(item)
-            elif item.type == QueueItemType.SCRAPE:
-                self.job_processor.process_scrape(item)
-            elif item.type == QueueItemType.SOURCE_DISCOVERY:
-                self.source_processor.process_source_discovery(item)
-            elif item.type == QueueItemType.SCRAPE_SOURCE:
-                self.source_processor.process_scrape_source(item)
-            elif item.type == QueueItemType.SOURCE_RECOVER:
-                self.source_processor.process_source_recover(item)
-            else:
-                raise QueueProcessingError(f"Unknown item type: {item.type}")
-
-        except Exception as e:
-            error_msg = str(e)
-            error_details = traceback.format_exc()
-            logger.error(
-                f"Error processing item {item.id}: {error_msg}\n{error_details}",
-                exc_info=True,
-            )
-            self._handle_failure(item, e, error_msg, error_details)
+        item_type = getattr(item.type, "value", str(item.type))
+        tracer = self.ctx.tracer
+        with tracer.trace_item(item.id, item_type) if tracer else nullcontext():
+            try:
+                # Note: Status will be updated to PROCESSING by each stage method after
+                # dependency checks pass. This prevents premature "processing" events
+                # when items are re-queued due to unmet dependencies.
+
+                # Delegate to specialized processors
+                # Note: Job deduplication is handled in scraper_intake (for scraped jobs) and
+                # get_or_create_listing (for direct submissions). No duplicate check needed here.
+                if item.type == QueueItemType.COMPANY:
+                    self.company_processor.process_company(item)
+                elif item.type == QueueItemType.JOB:
+                    # Use decision tree routing based on pipeline_state
+                    self.job_processor.process_job(item)
+                elif item.type == QueueItemType.SCRAPE:
+                    self.job_processor.process_scrape(item)
+                elif item.type == QueueItemType.SOURCE_DISCOVERY:
+                    self.source_processor.process_source_discovery(item)
+                elif item.type == QueueItemType.SCRAPE_SOURCE:
+                    self.source_processor.process_scrape_source(item)
+                elif item.type == QueueItemType.SOURCE_RECOVER:
+                    self.source_processor.process_source_recover(item)
+                else:
+                    raise QueueProcessingError(f"Unknown item type: {item.type}")
+
+            except Exception as e:
+                error_msg = str(e)
+                error_details = traceback.format_exc()
+                logger.error(
+                    f"Error processing item {item.id}: {error_msg}\n{error_details}",
+                    exc_info=True,
+                )
+                self._handle_failure(item, e, error_msg, error_details)
 
     def _handle_failure(
         self,
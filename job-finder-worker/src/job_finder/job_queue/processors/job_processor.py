@@ -1,7 +1,7 @@
 """Job queue item processor (single-task pipeline).
 
 Processes a JOB item through the complete pipeline in a single task:
-SCRAPE -> CREATE_LISTING -> COMPANY_LOOKUP -> [WAIT_COMPANY] -> AI_EXTRACTION -> SCORING -> ANALYSIS -> SAVE_MATCH
+SCRAPE -> CREATE_LISTING -> COMPANY_LOOKUP -> [WAIT_COMPANY] -> [PRUNE] -> AI_EXTRACTION -> SCORING -> ANALYSIS -> SAVE_MATCH
 
 Filtering (title filter and prefilter) happens at scraper intake, NOT here.
 Jobs that reach this processor have already passed all filters.
@@ -14,6 +14,23 @@ Company Dependency:
 - If company data is sparse, spawns COMPANY task and requeues job to wait
 - Job resumes when company data becomes available (or after max retries)
 
+Upper-Bound Pruning:
+- Before AI extraction, fields settled by pre-extraction are scored exactly and
+  every still-unknown field at its best case (ScoringEngine.upper_bound)
+- A job whose bound is below minScore is skipped without any LLM call
+
+Extraction Cache:
+- Finished extractions are stored in job_extraction_cache keyed by content
+  fingerprint (+ location), extraction prompt version and model
+- A requeued, reposted or mirrored job reuses the stored extraction; fields
+  pre-extraction settles (days old, ATS salary, ...) are re-applied to it
+
+Fused Extraction (opt-in, LITELLM_FUSED_TASKS=extraction):
+- On a cache miss, one call returns the extraction and the match analysis;
+  the analysis stage then reuses that analysis instead of calling again
+- If either part fails validation, the separate extraction and analysis calls
+  run as usual
+
 Job Listings Integration:
 - Jobs are stored in job_listings table when they pass pre-filter (in scraper_intake)
 - This processor updates job_listing status as jobs progress through pipeline
@@ -22,17 +39,30 @@ Job Listings Integration:
 
 import json
 import logging
-import re
+import threading
 import time
 from dataclasses import dataclass
-from typing import Any, Dict, Optional, List
+from typing import Any, Dict, Optional, List, Tuple
 from urllib.parse import urlparse, quote_plus
 
+from job_finder.ai.compaction import DescriptionCompactor
 from job_finder.ai.inference_client import InferenceClient
 from job_finder.ai.response_parser import extract_json_from_response
-from job_finder.ai.extraction import JobExtractor, JobExtractionResult
+from job_finder.ai.extraction import RULES_MODEL, JobExtractor, JobExtractionResult
+from job_finder.ai.extraction_prompts import (
+    EXTRACTION_PROMPT_VERSION,
+    TAXONOMY_RESPONSE_KEYS,
+    build_taxonomy_enrich_prompt,
+)
 from job_finder.ai.page_data_extractor import PageDataExtractor
+from job_finder.ai.pre_extraction import (
+    PreExtraction,
+    PreExtractor,
+    parse_salary_range,
+    structured_fields,
+)
 from job_finder.ai.matcher import AIJobMatcher, JobMatchResult
+from job_finder.ai.task_router import get_model_for_task, is_fused_task
 from job_finder.exceptions import (
     AIProviderError,
     DuplicateQueueItemError,
@@ -48,10 +78,14 @@ from job_finder.job_queue.models import (
     QueueStatus,
 )
 from job_finder.job_queue.scraper_intake import ScraperIntake
+from job_finder.metrics import JOB_STAGE_SECONDS, SCORE_BOUND_CHECKS, timed
+from job_finder.tracing import span, traced
 from job_finder.scoring.engine import ScoringEngine, ScoreBreakdown
 from job_finder.scoring.taxonomy import SkillTaxonomyRepository
 from job_finder.profile.reducer import load_scoring_profile
 from job_finder.scrape_runner import ScrapeRunner
+from job_finder.storage.boilerplate_storage import BoilerplateStore
+from job_finder.storage.job_extraction_cache import JobExtractionCache, extraction_fingerprint
 from job_finder.utils.company_info import build_company_info_string
 from job_finder.utils.company_name_utils import clean_company_name, is_source_name
 from job_finder.utils.location_utils import COUNTRY_ONLY_LOCATIONS
@@ -61,11 +95,29 @@ from .base_processor import BaseProcessor
 
 logger = logging.getLogger(__name__)
 
-# Maximum number of times a job can wait for company data before proceeding anyway
-MAX_COMPANY_WAIT_RETRIES = 3
+# Score upper-bound checks run before extraction; each pruned job saves the
+# extraction call (plus repair, taxonomy enrichment and match analysis).
+_bound_stats: Dict[str, int] = {"checked": 0, "pruned": 0}
+_bound_stats_lock = threading.Lock()
+
+
+def _record_bound_check(pruned: bool) -> None:
+    SCORE_BOUND_CHECKS.inc(outcome="pruned" if pruned else "kept")
+    with _bound_stats_lock:
+        _bound_stats["checked"] += 1
+        _bound_stats["pruned"] += int(pruned)
+
+
+def get_score_bound_stats() -> Dict[str, int]:
+    """Process-wide upper-bound pruning counters (exposed in ``/status``)."""
+    with _bound_stats_lock:
+        return dict(_bound_stats)
+
 
-# Regex for parsing salary strings like "USD 165000-220000", "$150,000 - $170,000"
-_SALARY_PATTERN = re.compile(r"[\$]?\s*([\d,]+(?:\.\d+)?)\s*[-–—to]+\s*[\$]?\s*([\d,]+(?:\.\d+)?)")
+def reset_score_bound_stats() -> None:
+    with _bound_stats_lock:
+        for key in _bound_stats:
+            _bound_stats[key] = 0
 
 
 def _location_indicates_remote(location: str) -> bool:
@@ -90,31 +142,6 @@ def _location_indicates_remote(location: str) -> bool:
     return False
 
 
-def _parse_salary_range(salary_str: str) -> Optional[tuple[int, int]]:
-    """Parse a salary range string into (min, max) integers.
-
-    Handles formats like:
-      - "USD 165000-220000"
-      - "$150,000 - $170,000"
-      - "150000-200000"
-
-    Returns None if parsing fails.
-    """
-    # Strip currency prefix (e.g. "USD ", "CAD ")
-    cleaned = re.sub(r"^[A-Z]{3}\s*", "", salary_str.strip())
-    match = _SALARY_PATTERN.search(cleaned)
-    if not match:
-        return None
-    try:
-        low = int(float(match.group(1).replace(",", "")))
-        high = int(float(match.group(2).replace(",", "")))
-        if low > 0 and high > 0:
-            return (min(low, high), max(low, high))
-    except (ValueError, OverflowError):
-        pass
-    return None
-
-
 @dataclass
 class PipelineContext:
     """In-memory context passed through all pipeline stages."""
@@ -123,9 +150,11 @@ class PipelineContext:
     job_data: Optional[Dict[str, Any]] = None
     listing_id: Optional[str] = None
     company_data: Optional[Dict[str, Any]] = None
+    pre_extraction: Optional[PreExtraction] = None
     extraction: Optional[JobExtractionResult] = None
     score_result: Optional[ScoreBreakdown] = None
     match_result: Optional[JobMatchResult] = None
+    fused_analysis: Optional[Dict[str, Any]] = None
     error: Optional[str] = None
     stage: str = "init"
 
@@ -165,11 +194,31 @@ class JobProcessor(BaseProcessor):
 
         self.scoring_engine = self._build_scoring_engine(match_policy)
 
-        # Initialize InferenceClient for AI operations (LiteLLM proxy)
-        self.inference_client = InferenceClient()
+        # Initialize InferenceClient for AI operations (LiteLLM proxy). Sharing the
+        # config DB enables the prompt-level response cache for extraction.
+        config_db_path = getattr(ctx.config_loader, "db_path", None)
+        self.inference_client = InferenceClient(
+            db_path=config_db_path if isinstance(config_db_path, str) else None
+        )
         self.inference_client.use_local_models = self.config_loader.is_local_models_enabled()
-        self.extractor = JobExtractor(self.inference_client)
+        # Descriptions are compacted to a token budget, minus per-company boilerplate
+        self.description_compactor = DescriptionCompactor(
+            BoilerplateStore(config_db_path) if isinstance(config_db_path, str) else None
+        )
+        self.pre_extractor = PreExtractor()
+        self.extractor = JobExtractor(
+            self.inference_client,
+            self.description_compactor,
+            self.pre_extractor,
+            known_technologies=getattr(self.scoring_engine, "taxonomy_lookup", {}),
+        )
         self.page_data_extractor = PageDataExtractor(self.inference_client)
+        # Finished extractions, reused across requeues, reposts and mirrors
+        self.extraction_cache = (
+            JobExtractionCache(config_db_path) if isinstance(config_db_path, str) else None
+        )
+        # Extraction and match analysis in one call (separate calls as fallback)
+        self.fused_extraction = is_fused_task("extraction")
 
         # Initialize scrape runner with config_loader so it creates both title_filter and prefilter
         self.scrape_runner = ScrapeRunner(
@@ -247,7 +296,12 @@ class JobProcessor(BaseProcessor):
         self.inference_client.use_local_models = self.config_loader.is_local_models_enabled()
 
         # Recreate the extractor with the inference client
-        self.extractor = JobExtractor(self.inference_client)
+        self.extractor = JobExtractor(
+            self.inference_client,
+            self.description_compactor,
+            self.pre_extractor,
+            known_technologies=getattr(self.scoring_engine, "taxonomy_lookup", {}),
+        )
 
         # Update AI matcher min score from match policy (required, no default)
         self.ai_matcher.min_match_score = match_policy["minScore"]
@@ -294,7 +348,8 @@ class JobProcessor(BaseProcessor):
         """Emit a pipeline progress event via WebSocket (if notifier is available)."""
         if self.notifier:
             try:
-                self.notifier.send_event(event, {"itemId": item_id, **data})
+                with span("emit_event", event=event):
+                    self.notifier.send_event(event, {"itemId": item_id, **data})
             except Exception as e:
                 logger.debug(f"Failed to emit event {event}: {e}")
 
@@ -374,7 +429,8 @@ class JobProcessor(BaseProcessor):
         Pipeline stages (all in-memory, no respawning):
         1. SCRAPE - Extract job data from URL (or use manual submission data)
         2. COMPANY_LOOKUP - Get/create company data
-        2.5. WAIT_COMPANY - Requeue if company needs enrichment (up to 3 retries)
+        2.5. WAIT_COMPANY - Park until the company enrichment task finishes
+        2.75. PRUNE - Skip jobs whose best-case score is below minScore
         3. AI_EXTRACTION - Extract semantic data (seniority, tech, etc.)
         4. SCORING - Deterministic scoring from config
         5. ANALYSIS - AI match analysis with reasoning
@@ -462,7 +518,12 @@ class JobProcessor(BaseProcessor):
             # Before AI extraction, ensure company has good data (not just a stub)
             company_ready = self._check_company_dependency(ctx, state)
             if not company_ready:
-                # Job was requeued to wait for company enrichment
+                # Job was parked until company enrichment completes
+                return
+
+            # STAGE 2.75: UPPER-BOUND PRUNING
+            # Skip extraction when no extraction could lift the score to minScore
+            if not metadata.get("bypassFilter", False) and self._prune_by_upper_bound(ctx):
                 return
 
             # STAGE 3: AI EXTRACTION
@@ -616,6 +677,8 @@ class JobProcessor(BaseProcessor):
     # PIPELINE STAGE IMPLEMENTATIONS
     # ============================================================
 
+    @timed(JOB_STAGE_SECONDS, stage="scrape")
+    @traced("stage:scrape")
     def _execute_scrape(self, ctx: PipelineContext) -> Dict[str, Any]:
         """Execute scrape stage - get job data from job_listings (source of truth).
 
@@ -648,6 +711,8 @@ class JobProcessor(BaseProcessor):
             listing = self.job_listing_storage.get_by_id(listing_id)
             if listing:
                 return {
+                    # Structured ATS fields saved at intake (pre-extraction input)
+                    **(metadata.get("structured") or {}),
                     "title": listing.get("title", ""),
                     "description": listing.get("description", ""),
                     "company": listing.get("company_name", ""),
@@ -735,6 +800,8 @@ class JobProcessor(BaseProcessor):
             f"sources: {'; '.join(reasons)}"
         )
 
+    @timed(JOB_STAGE_SECONDS, stage="company")
+    @traced("stage:company")
     def _execute_company_lookup(self, ctx: PipelineContext) -> Optional[Dict[str, Any]]:
         """
         Execute company lookup stage.
@@ -815,8 +882,10 @@ class JobProcessor(BaseProcessor):
         """
         Check if company data is ready before proceeding to AI extraction.
 
-        If company data is sparse (just a stub), spawn enrichment and requeue so the
-        pipeline waits for richer company data instead of racing ahead with a stub.
+        If company data is sparse (just a stub), spawn enrichment (or reuse the
+        in-flight task) and park the job on it. The company task's terminal
+        status wakes every parked job exactly once, so jobs never poll. A job
+        that has already waited proceeds with whatever company data exists.
         """
         company = ctx.company_data
         item = ctx.item
@@ -834,33 +903,36 @@ class JobProcessor(BaseProcessor):
             logger.debug("Company %s has good data, proceeding to extraction", company_name)
             return True
 
-        # Otherwise spawn enrichment and wait (up to MAX_COMPANY_WAIT_RETRIES)
-        self._spawn_company_enrichment(ctx)
-
-        wait_count = state.get("company_wait_count", 0)
-
-        if wait_count >= MAX_COMPANY_WAIT_RETRIES:
-            logger.warning(
-                "Company %s still sparse after %d waits, proceeding with extraction",
+        # Woken (or timed out) after waiting once - don't wait again
+        if state.get("waiting_for_company_id") or state.get("company_wait_count", 0) > 0:
+            logger.info(
+                "Company %s still sparse after enrichment wait, proceeding with extraction",
                 company_name,
-                wait_count,
             )
             return True
 
+        self._spawn_company_enrichment(ctx)
+        company_id = (ctx.company_data or {}).get("id") or company_id
+
         updated_state = {
             **state,
             "job_data": job_data,
             "waiting_for_company_id": company_id,
-            "company_wait_count": wait_count + 1,
+            "company_wait_count": 1,
             "job_listing_id": ctx.listing_id,
         }
 
-        self.queue_manager.requeue_with_state(item.id, updated_state)
+        parked = item.id is not None and self.queue_manager.park_for_company(
+            item.id, company_id, company_name, updated_state
+        )
+        if not parked:
+            # No active enrichment task to wait on (spawn failed/blocked)
+            logger.debug("No active company task for %s; proceeding", company_name)
+            return True
+
         logger.info(
-            "[PIPELINE] %s -> WAIT_COMPANY (attempt %d/%d for %s)",
+            "[PIPELINE] %s -> WAIT_COMPANY (parked on %s)",
             (item.url or "")[:50],
-            wait_count + 1,
-            MAX_COMPANY_WAIT_RETRIES,
             company_name,
         )
 
@@ -870,7 +942,7 @@ class JobProcessor(BaseProcessor):
             {
                 "company": company_name,
                 "companyId": company_id,
-                "waitCount": wait_count + 1,
+                "waitCount": 1,
             },
         )
 
@@ -946,6 +1018,89 @@ class JobProcessor(BaseProcessor):
         except Exception as e:
             logger.warning("Failed to spawn company enrichment for %s: %s", company_name, e)
 
+    def _prune_by_upper_bound(self, ctx: PipelineContext) -> bool:
+        """Skip the job when its best-case score cannot reach minScore.
+
+        Pre-extraction settles what the raw listing determines (title seniority,
+        location/remote flags, posted date, salary text, ...). Settled values
+        override the model, so they are scored exactly; every other field is
+        taken at its best case. The pre-extraction is kept on ``ctx`` and reused
+        by the extraction stage.
+
+        Returns:
+            True if the job was finalized as skipped
+        """
+        job_data = ctx.job_data or {}
+        location = job_data.get("location", "")
+        ctx.pre_extraction = self.pre_extractor.extract(
+            job_data.get("title", ""),
+            job_data.get("description", ""),
+            location,
+            job_data.get("posted_date"),
+            job_data.get("salary") or job_data.get("salary_range"),
+            structured_fields(job_data),
+        )
+        known = dict(ctx.pre_extraction.settled)
+        # Same override _execute_ai_extraction applies after the model answers
+        if location and _location_indicates_remote(location):
+            known["work_arrangement"] = "remote"
+
+        bound = self.scoring_engine.upper_bound(known, ctx.company_data)
+        min_score = self.scoring_engine.min_score
+        pruned = bound < min_score
+        _record_bound_check(pruned)
+        if not pruned:
+            return False
+
+        self._finalize_skipped(
+            ctx,
+            f"Pruned: score upper bound {bound} below threshold {min_score}",
+            pruned={"upperBound": bound, "minScore": min_score, "settled": sorted(known)},
+        )
+        return True
+
+    def _extraction_cache_key(self, job_data: Dict[str, Any]) -> Optional[Tuple[str, str, str]]:
+        """``(fingerprint, prompt version, model)`` for job_extraction_cache, if enabled."""
+        if self.extraction_cache is None:
+            return None
+        fingerprint = extraction_fingerprint(
+            job_data.get("title", ""),
+            job_data.get("company", ""),
+            job_data.get("description", ""),
+            job_data.get("location", ""),
+        )
+        model = get_model_for_task("extraction", use_local=self.inference_client.use_local_models)
+        return (fingerprint, EXTRACTION_PROMPT_VERSION, model)
+
+    def _cached_extraction(
+        self, ctx: PipelineContext, cache_key: Optional[Tuple[str, str, str]]
+    ) -> Optional[JobExtractionResult]:
+        """Stored extraction for this job's content, with today's settled fields."""
+        if not cache_key or self.extraction_cache is None:
+            return None
+        cached = self.extraction_cache.get(*cache_key)
+        if cached is None:
+            return None
+        extraction = JobExtractionResult.from_dict(cached)
+        # Time-relative and listing-specific fields (daysOld, ATS salary, ...)
+        # come from this listing, as they would after a fresh extraction
+        job_data = ctx.job_data or {}
+        pre = ctx.pre_extraction or self.pre_extractor.extract(
+            job_data.get("title", ""),
+            job_data.get("description", ""),
+            job_data.get("location", ""),
+            job_data.get("posted_date"),
+            job_data.get("salary") or job_data.get("salary_range"),
+            structured_fields(job_data),
+        )
+        for name, value in pre.settled.items():
+            setattr(extraction, name, value)
+        extraction.confidence = extraction.compute_confidence()
+        logger.info("Extraction cache hit (%s)", cache_key[0][:12])
+        return extraction
+
+    @timed(JOB_STAGE_SECONDS, stage="extraction")
+    @traced("stage:extraction")
     def _execute_ai_extraction(self, ctx: PipelineContext) -> JobExtractionResult:
         """Execute AI extraction stage.
 
@@ -960,18 +1115,46 @@ class JobProcessor(BaseProcessor):
         salary_range = job_data.get("salary") or job_data.get("salary_range")
         url = job_data.get("url", "")
 
-        extraction = self.extractor.extract_with_repair(
-            title,
-            description,
-            location,
-            posted_date,
-            salary_range=salary_range,
-            url=url,
-        )
+        cache_key = self._extraction_cache_key(job_data)
+        extraction = self._cached_extraction(ctx, cache_key)
+        if extraction is None and self.fused_extraction:
+            fused = self.extractor.extract_fused(
+                {
+                    **job_data,
+                    "salary_range": salary_range,
+                    "structured": structured_fields(job_data),
+                },
+                self.ai_matcher,
+                pre=ctx.pre_extraction,
+            )
+            if fused is not None:
+                # Not cached: the cache is keyed by the extraction prompt version
+                extraction = fused.extraction
+                ctx.fused_analysis = fused.analysis
+        if extraction is None:
+            extraction = self.extractor.extract_with_repair(
+                title,
+                description,
+                location,
+                posted_date,
+                salary_range=salary_range,
+                url=url,
+                company=job_data.get("company"),
+                structured=structured_fields(job_data),
+                pre=ctx.pre_extraction,
+            )
+            if (
+                cache_key
+                and self.extraction_cache is not None
+                and extraction.extraction_model != RULES_MODEL
+            ):
+                self.extraction_cache.set(
+                    *cache_key, extraction.to_dict(), extraction.extraction_model
+                )
 
         # Overlay pre-extracted structured data the AI may have missed
         if salary_range and extraction.salary_min is None:
-            parsed = _parse_salary_range(salary_range)
+            parsed = parse_salary_range(salary_range)
             if parsed:
                 extraction.salary_min = parsed[0]
                 extraction.salary_max = parsed[1]
@@ -996,6 +1179,8 @@ class JobProcessor(BaseProcessor):
         )
         return extraction
 
+    @timed(JOB_STAGE_SECONDS, stage="scoring")
+    @traced("stage:scoring")
     def _execute_scoring(self, ctx: PipelineContext) -> ScoreBreakdown:
         """Execute deterministic scoring stage."""
         if not ctx.extraction:
@@ -1028,16 +1213,15 @@ class JobProcessor(BaseProcessor):
 
         if taxonomy_repo and unknown_terms:
             try:
+                system_prompt, user_prompt = build_taxonomy_enrich_prompt(
+                    unknown_terms, title, description
+                )
                 result = self.inference_client.execute(
                     task_type="analysis",
-                    prompt=json.dumps(
-                        {
-                            "action": "taxonomy_enrich",
-                            "unknown_terms": unknown_terms,
-                            "job_title": title,
-                            "job_description": description,
-                        }
-                    ),
+                    prompt=user_prompt,
+                    system_prompt=system_prompt,
+                    response_format="json",
+                    expected_keys=TAXONOMY_RESPONSE_KEYS,
                     max_tokens=1000,
                     temperature=0.3,
                 )
@@ -1053,7 +1237,7 @@ class JobProcessor(BaseProcessor):
                         existing = lookup.get(canonical)
                         synonyms = existing.synonyms if existing else []
                         synonyms = list(set(synonyms + [canonical, term]))
-                        taxonomy_repo.upsert(
+                        taxonomy_repo.learn(
                             canonical=canonical,
                             category=category,
                             synonyms_csv=",".join(sorted(synonyms)),
@@ -1083,6 +1267,8 @@ class JobProcessor(BaseProcessor):
         )
         return score_result
 
+    @timed(JOB_STAGE_SECONDS, stage="analysis")
+    @traced("stage:analysis")
     def _execute_match_analysis(self, ctx: PipelineContext) -> Optional[JobMatchResult]:
         """Execute AI match analysis stage."""
         job_data = ctx.job_data
@@ -1101,7 +1287,12 @@ class JobProcessor(BaseProcessor):
         }
 
         try:
-            result = self.ai_matcher.analyze_job(job_data_enriched, return_below_threshold=True)
+            if ctx.fused_analysis is not None:
+                result = self.ai_matcher.analyze_job(
+                    job_data_enriched, return_below_threshold=True, analysis=ctx.fused_analysis
+                )
+            else:
+                result = self.ai_matcher.analyze_job(job_data_enriched, return_below_threshold=True)
             if result:
                 logger.info(f"Match analysis complete: score={result.match_score}")
             return result
@@ -1110,6 +1301,8 @@ class JobProcessor(BaseProcessor):
             logger.error(f"AI match analysis failed: {e}")
             raise
 
+    @timed(JOB_STAGE_SECONDS, stage="save")
+    @traced("stage:save")
     def _execute_save_match(self, ctx: PipelineContext) -> str:
         """Execute save match stage."""
         # Update listing to matched status (analysis data goes ONLY to job_matches)
@@ -1154,22 +1347,30 @@ class JobProcessor(BaseProcessor):
             pipeline_state={"pipeline_stage": stage},
         )
 
-    def _finalize_skipped(self, ctx: PipelineContext, reason: str) -> None:
-        """Finalize pipeline with SKIPPED status."""
+    def _finalize_skipped(
+        self,
+        ctx: PipelineContext,
+        reason: str,
+        pruned: Optional[Dict[str, Any]] = None,
+    ) -> None:
+        """Finalize pipeline with SKIPPED status.
+
+        ``pruned`` records the upper-bound check when the job never reached
+        extraction.
+        """
         job_data = ctx.job_data or {}
         logger.info(f"[PIPELINE] SKIPPED: '{job_data.get('title')}' - {reason}")
 
         # Update listing with extraction and scoring data for UI visibility
         # Scoring breakdown shows users WHY the job was skipped
-        self._update_listing_status(
-            ctx.listing_id,
-            "skipped",
-            filter_result={
-                "extraction": ctx.extraction.to_dict() if ctx.extraction else {},
-                "scoring": ctx.score_result.to_dict() if ctx.score_result else None,
-                "skip_reason": reason,
-            },
-        )
+        filter_result: Dict[str, Any] = {
+            "extraction": ctx.extraction.to_dict() if ctx.extraction else {},
+            "scoring": ctx.score_result.to_dict() if ctx.score_result else None,
+            "skip_reason": reason,
+        }
+        if pruned:
+            filter_result["pruned"] = pruned
+        self._update_listing_status(ctx.listing_id, "skipped", filter_result=filter_result)
 
         self.queue_manager.update_status(
             ctx.item.id,
@@ -25,14 +25,15 @@ import re
 import uuid
 from typing import Any, Dict, List, Optional, Set, get_args
 
+from job_finder.ai.pre_extraction import structured_fields
 from job_finder.exceptions import DuplicateQueueItemError
 from job_finder.job_queue.manager import QueueManager
 from job_finder.job_queue.models import JobQueueItem, QueueItemType, QueueSource
 from job_finder.scrapers.text_sanitizer import sanitize_html_description
 from job_finder.utils.company_name_utils import clean_company_name
 from job_finder.utils.apply_url_resolver import resolve_apply_url
+from job_finder.utils.url_classifier import classify_url, get_url_classifier
 from job_finder.utils.url_utils import (
-    AGGREGATOR_HOST_SUBSTRINGS,
     compute_content_fingerprint,
     normalize_url,
 )
@@ -110,13 +111,8 @@ class ScraperIntake:
         if not self.sources_manager:
             return False
         try:
-            from urllib.parse import urlparse
-
-            host = urlparse(url).hostname or ""
-            if not host:
-                return False
             agg_domains = self.sources_manager.get_aggregator_domains()
-            return any(host.endswith(agg) for agg in agg_domains)
+            return get_url_classifier(agg_domains).classify(url).is_job_board
         except Exception:
             return False
 
@@ -203,10 +199,7 @@ class ScraperIntake:
             return None
 
         try:
-            from urllib.parse import urlparse
-
-            host = (urlparse(normalized_url).hostname or "").lower()
-            is_aggregator = any(agg in host for agg in AGGREGATOR_HOST_SUBSTRINGS)
+            is_aggregator = classify_url(normalized_url).aggregator_host
 
             search_client = self.search_client if is_aggregator else None
 
@@ -241,6 +234,27 @@ class ScraperIntake:
             logger.warning("Failed to store job listing for %s: %s", normalized_url, e)
             return None
 
+    @staticmethod
+    def _item_metadata(
+        source_label: Optional[str],
+        listing_id: str,
+        job: Dict[str, Any],
+        is_remote_source: bool,
+    ) -> Dict[str, Any]:
+        """Queue item metadata: listing pointer plus the structured ATS fields.
+
+        job_listings keeps only the core columns, so the fields pre-extraction
+        reads (employment type, remote flags, Greenhouse metadata) travel with
+        the queue item instead.
+        """
+        metadata: Dict[str, Any] = {"source_label": source_label, "job_listing_id": listing_id}
+        structured = structured_fields(job)
+        if is_remote_source:
+            structured.setdefault("is_remote", True)
+        if structured:
+            metadata["structured"] = structured
+        return metadata
+
     def submit_jobs(
         self,
         jobs: List[Dict[str, Any]],
@@ -494,13 +508,8 @@ class ScraperIntake:
                     tracking_id=tracking_id,  # Root tracking ID
                     ancestry_chain=[],  # Root has no ancestors
                     spawn_depth=0,  # Root starts at depth 0
-                    metadata=(
-                        {
-                            "source_label": source_label,
-                            "job_listing_id": listing_id,
-                        }
-                        if source_label or listing_id
-                        else ({"job_listing_id": listing_id} if listing_id else None)
+                    metadata=self._item_metadata(
+                        source_label, listing_id, job_payload, is_remote_source
                     ),
                     input={
                         "source_url": (
@@ -0,0 +1,121 @@
+"""Wake the idle worker loop as soon as new queue work may exist.
+
+Without this the worker sleeps ``poll_interval`` (60s by default) whenever
+the queue is empty, so a job submitted from the UI waits up to a minute
+before it is touched. ``QueueWakeup.wait`` keeps ``poll_interval`` as the
+ceiling but returns early when:
+
+- ``wake()`` is called (``POST /wake``, or a ``command.wake`` from the Node
+  API over the notifier websocket / HTTP command fallback)
+- the ``job_queue_pending`` counter in ``table_versions`` moves. Triggers on
+  ``job_queue`` and ``company_waiters`` bump it whenever an item may have
+  become claimable, so writes from the API or another process are seen too.
+  It is read every ``check_interval`` seconds (one indexed single-row
+  SELECT) only while the worker is idle.
+
+Call ``checkpoint()`` right before fetching pending items: a change that
+lands between that fetch and the next ``wait`` then still wakes the loop.
+Idle-time work (background rescoring) polls ``pending()`` to stop early;
+it does not consume the wake-up, so the following ``wait`` returns at once.
+A wait that returns ``"queue_change"`` adopts the new counter value, so the
+change wakes the loop once even if the caller does not act on it.
+"""
+
+from __future__ import annotations
+
+import logging
+import threading
+import time
+from typing import Callable, Optional
+
+from job_finder.metrics import QUEUE_WAKEUPS
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_CHECK_INTERVAL_SECONDS = 0.25
+
+
+class QueueWakeup:
+    """Event plus change-counter poll that ends idle waits early."""
+
+    def __init__(
+        self,
+        version_source: Optional[Callable[[], Optional[int]]] = None,
+        check_interval: float = DEFAULT_CHECK_INTERVAL_SECONDS,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        """
+        Args:
+            version_source: Returns the current pending-work counter (None when
+                unavailable, which disables change detection)
+            check_interval: Seconds between counter reads while waiting
+            clock: Monotonic clock (injectable for tests)
+        """
+        self._version_source = version_source
+        self.check_interval = check_interval
+        self._clock = clock
+        self._event = threading.Event()
+        self._lock = threading.Lock()
+        self._reason: Optional[str] = None
+        self._seen_version: Optional[int] = None
+
+    def wake(self, reason: str = "manual") -> None:
+        """End the current (or next) ``wait`` immediately."""
+        with self._lock:
+            if self._reason is None:
+                self._reason = reason
+        self._event.set()
+
+    def _read_version(self) -> Optional[int]:
+        if self._version_source is None:
+            return None
+        try:
+            return self._version_source()
+        except Exception as exc:
+            logger.debug("Queue change counter unavailable: %s", exc)
+            return None
+
+    def checkpoint(self) -> None:
+        """Record the counter value the caller is about to act on."""
+        self._seen_version = self._read_version()
+
+    def pending(self) -> bool:
+        """True when a ``wait`` would return immediately (wake or counter change)."""
+        if self._event.is_set():
+            return True
+        version = self._read_version()
+        return (
+            version is not None and self._seen_version is not None and version != self._seen_version
+        )
+
+    def wait(self, timeout: float) -> Optional[str]:
+        """Block up to *timeout* seconds; return the wake reason, or None on timeout."""
+        deadline = self._clock() + max(0.0, timeout)
+        reason: Optional[str] = None
+        while True:
+            version = self._read_version()
+            if version is not None and self._seen_version is not None:
+                if version != self._seen_version:
+                    # Adopt the new value: a change wakes one wait, not every
+                    # later one (e.g. while processing is paused)
+                    self._seen_version = version
+                    reason = "queue_change"
+                    break
+            elif version is not None:
+                self._seen_version = version
+
+            remaining = deadline - self._clock()
+            if remaining <= 0:
+                break
+            interval = self.check_interval if self._version_source else remaining
+            if self._event.wait(min(interval, remaining)):
+                break
+
+        with self._lock:
+            if self._event.is_set():
+                reason = reason or self._reason
+                self._event.clear()
+            self._reason = None
+        if reason:
+            QUEUE_WAKEUPS.inc(reason=reason)
+        return reason
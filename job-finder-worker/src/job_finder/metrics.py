@@ -0,0 +1,381 @@
+"""In-process counters and latency histograms, exposed at ``/metrics``.
+
+The worker's JSON ``/status`` counters say how much happened, not where the
+wall time went. This module keeps Prometheus-style counters and histograms
+for the hot paths (queue items, JobProcessor stages, LLM calls, scraper
+fetches, SQLite statements, Playwright renders) and renders them in the
+Prometheus text exposition format.
+
+Recording has to be cheap enough to leave on in production, so every
+metric is striped: each thread is assigned one of ``_STRIPES`` stripes
+(round-robin, on first use) and only takes that stripe's lock, which is
+effectively uncontended. Stripes are merged only when ``/metrics`` is
+scraped.
+
+All metrics are defined at the bottom of this module, so call sites share
+one registry:
+
+    from job_finder.metrics import JOB_STAGE_SECONDS
+
+    with JOB_STAGE_SECONDS.time(stage="scoring"):
+        ...
+"""
+
+from __future__ import annotations
+
+import functools
+import itertools
+import math
+import threading
+import time
+from bisect import bisect_left
+from contextlib import contextmanager
+from typing import Any, Callable, Dict, Iterable, Iterator, List, Optional, Sequence, Tuple
+from urllib.parse import urlparse
+
+_STRIPES = 16
+_stripe_local = threading.local()
+_stripe_counter = itertools.count()
+
+# Seconds; spans cache hits through multi-minute LLM calls
+DEFAULT_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1, 2.5, 5, 10, 30, 60, 120, 300)
+SQLITE_BUCKETS = (0.0001, 0.00025, 0.0005, 0.001, 0.0025, 0.005, 0.01, 0.025, 0.1, 0.5, 1, 5)
+# Completion tokens per LLM call (max_tokens tops out at a few thousand)
+TOKEN_BUCKETS = (16, 32, 64, 128, 256, 512, 1024, 2048, 4096)
+
+LabelKey = Tuple[str, ...]
+# (label values, value) pairs for a gauge computed at scrape time
+GaugeSamples = Iterable[Tuple[Dict[str, Any], float]]
+
+
+def _stripe_index() -> int:
+    try:
+        return _stripe_local.index
+    except AttributeError:
+        _stripe_local.index = next(_stripe_counter) % _STRIPES
+        return _stripe_local.index
+
+
+def _escape(value: str) -> str:
+    return value.replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
+
+
+def _format_labels(names: Sequence[str], values: Sequence[str], extra: str = "") -> str:
+    parts = [f'{name}="{_escape(value)}"' for name, value in zip(names, values)]
+    if extra:
+        parts.append(extra)
+    return "{" + ",".join(parts) + "}" if parts else ""
+
+
+def _format_value(value: float) -> str:
+    if math.isinf(value):
+        return "+Inf" if value > 0 else "-Inf"
+    if float(value).is_integer():
+        return str(int(value))
+    return repr(float(value))
+
+
+class _Metric:
+    kind = ""
+
+    def __init__(self, name: str, documentation: str, labelnames: Sequence[str] = ()):
+        self.name = name
+        self.documentation = documentation
+        self.labelnames = tuple(labelnames)
+        self._stripes: List[Tuple[threading.Lock, Dict[LabelKey, Any]]] = [
+            (threading.Lock(), {}) for _ in range(_STRIPES)
+        ]
+        _register(self)
+
+    def _key(self, labels: Dict[str, Any]) -> LabelKey:
+        return tuple(str(labels.get(name, "")) for name in self.labelnames)
+
+    def _stripe(self) -> Tuple[threading.Lock, Dict[LabelKey, Any]]:
+        return self._stripes[_stripe_index()]
+
+    def reset(self) -> None:
+        for lock, values in self._stripes:
+            with lock:
+                values.clear()
+
+    def render(self) -> List[str]:
+        raise NotImplementedError
+
+
+class Counter(_Metric):
+    """Monotonic counter."""
+
+    kind = "counter"
+
+    def inc(self, amount: float = 1, **labels: Any) -> None:
+        key = self._key(labels)
+        lock, values = self._stripe()
+        with lock:
+            values[key] = values.get(key, 0) + amount
+
+    def collect(self) -> Dict[LabelKey, float]:
+        merged: Dict[LabelKey, float] = {}
+        for lock, values in self._stripes:
+            with lock:
+                items = list(values.items())
+            for key, value in items:
+                merged[key] = merged.get(key, 0) + value
+        return merged
+
+    def value(self, **labels: Any) -> float:
+        return self.collect().get(self._key(labels), 0)
+
+    def render(self) -> List[str]:
+        return [
+            f"{self.name}{_format_labels(self.labelnames, key)} {_format_value(value)}"
+            for key, value in sorted(self.collect().items())
+        ]
+
+
+class Histogram(_Metric):
+    """Bucketed distribution of observed values (cumulative ``le`` buckets)."""
+
+    kind = "histogram"
+
+    def __init__(
+        self,
+        name: str,
+        documentation: str,
+        labelnames: Sequence[str] = (),
+        buckets: Sequence[float] = DEFAULT_BUCKETS,
+    ):
+        self.buckets = tuple(sorted(buckets))
+        super().__init__(name, documentation, labelnames)
+
+    def observe(self, value: float, **labels: Any) -> None:
+        key = self._key(labels)
+        # Slot i counts values in (buckets[i-1], buckets[i]]; the last bucket slot is +Inf
+        index = bisect_left(self.buckets, value)
+        lock, values = self._stripe()
+        with lock:
+            slot = values.get(key)
+            if slot is None:
+                slot = values[key] = [0] * (len(self.buckets) + 1) + [0.0]
+            slot[index] += 1
+            slot[-1] += value
+
+    @contextmanager
+    def time(self, **labels: Any) -> Iterator[None]:
+        """Observe the wall time of the ``with`` block (also when it raises)."""
+        started = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.observe(time.perf_counter() - started, **labels)
+
+    def collect(self) -> Dict[LabelKey, List[float]]:
+        """Per label set: non-cumulative bucket counts followed by the sum."""
+        merged: Dict[LabelKey, List[float]] = {}
+        for lock, values in self._stripes:
+            with lock:
+                items = [(key, list(slot)) for key, slot in values.items()]
+            for key, slot in items:
+                target = merged.get(key)
+                if target is None:
+                    merged[key] = slot
+                else:
+                    for i, value in enumerate(slot):
+                        target[i] += value
+        return merged
+
+    def snapshot(self, **labels: Any) -> Tuple[int, float]:
+        """``(count, sum)`` for one label set."""
+        slot = self.collect().get(self._key(labels))
+        if slot is None:
+            return 0, 0.0
+        return int(sum(slot[:-1])), slot[-1]
+
+    def render(self) -> List[str]:
+        lines = []
+        bounds = [_format_value(b) for b in self.buckets] + ["+Inf"]
+        for key, slot in sorted(self.collect().items()):
+            cumulative = 0.0
+            for bound, count in zip(bounds, slot[:-1]):
+                cumulative += count
+                labels = _format_labels(self.labelnames, key, f'le="{bound}"')
+                lines.append(f"{self.name}_bucket{labels} {int(cumulative)}")
+            labels = _format_labels(self.labelnames, key)
+            lines.append(f"{self.name}_sum{labels} {_format_value(slot[-1])}")
+            lines.append(f"{self.name}_count{labels} {int(cumulative)}")
+        return lines
+
+
+def timed(histogram: Histogram, **labels: Any) -> Callable:
+    """Decorator form of ``histogram.time(**labels)``."""
+
+    def decorator(func: Callable) -> Callable:
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs):
+            with histogram.time(**labels):
+                return func(*args, **kwargs)
+
+        return wrapper
+
+    return decorator
+
+
+# ---------------------------------------------------------------------- #
+# Registry
+# ---------------------------------------------------------------------- #
+
+_registry: Dict[str, _Metric] = {}
+_registry_lock = threading.Lock()
+
+
+def _register(metric: _Metric) -> None:
+    with _registry_lock:
+        if metric.name in _registry:
+            raise ValueError(f"Metric {metric.name} is already registered")
+        _registry[metric.name] = metric
+
+
+def render_gauge(
+    name: str, documentation: str, labelnames: Sequence[str], samples: GaugeSamples
+) -> str:
+    """Render a gauge computed at scrape time (e.g. queue depth from the DB)."""
+    lines = [f"# HELP {name} {documentation}", f"# TYPE {name} gauge"]
+    for labels, value in samples:
+        values = [str(labels.get(n, "")) for n in labelnames]
+        lines.append(f"{name}{_format_labels(labelnames, values)} {_format_value(value)}")
+    return "\n".join(lines) + "\n"
+
+
+def render_metrics(extra: Iterable[str] = ()) -> str:
+    """Prometheus text exposition of every registered metric plus *extra* blocks."""
+    with _registry_lock:
+        metrics = sorted(_registry.values(), key=lambda m: m.name)
+    blocks = []
+    for metric in metrics:
+        lines = [
+            f"# HELP {metric.name} {metric.documentation}",
+            f"# TYPE {metric.name} {metric.kind}",
+        ]
+        lines.extend(metric.render())
+        blocks.append("\n".join(lines) + "\n")
+    blocks.extend(extra)
+    return "".join(blocks)
+
+
+def reset_metrics() -> None:
+    """Clear every recorded value (tests)."""
+    with _registry_lock:
+        metrics = list(_registry.values())
+    for metric in metrics:
+        metric.reset()
+
+
+def url_host(url: Optional[str]) -> str:
+    """Host label for *url* (empty when unparseable)."""
+    try:
+        return (urlparse(url or "").hostname or "").lower()
+    except ValueError:
+        return ""
+
+
+# ---------------------------------------------------------------------- #
+# Worker metrics
+# ---------------------------------------------------------------------- #
+
+QUEUE_ITEMS_PROCESSED = Counter(
+    "jobfinder_queue_items_processed_total",
+    "Queue items processed by the worker loop.",
+    ("type", "outcome"),
+)
+QUEUE_PICKUP_SECONDS = Histogram(
+    "jobfinder_queue_pickup_delay_seconds",
+    "Time from queue item creation until the worker starts processing it.",
+    ("type",),
+)
+QUEUE_WAKEUPS = Counter(
+    "jobfinder_queue_wakeups_total",
+    "Idle waits that ended early, by wake source.",
+    ("reason",),
+)
+QUEUE_ITEM_SECONDS = Histogram(
+    "jobfinder_queue_item_duration_seconds",
+    "Wall time to process one queue item.",
+    ("type",),
+)
+JOB_STAGE_SECONDS = Histogram(
+    "jobfinder_job_stage_duration_seconds",
+    "Wall time per JobProcessor pipeline stage.",
+    ("stage",),
+)
+LLM_REQUEST_SECONDS = Histogram(
+    "jobfinder_llm_request_duration_seconds",
+    "LiteLLM chat completion latency, including concurrency-slot wait.",
+    ("model", "outcome"),
+)
+LLM_TOKENS = Counter(
+    "jobfinder_llm_tokens_total",
+    "Tokens reported by LiteLLM responses.",
+    ("model", "kind"),
+)
+LLM_PREFIX_CALLS = Counter(
+    "jobfinder_llm_prefix_calls_total",
+    "LiteLLM calls by whether their system-prompt prefix was sent before (this process).",
+    ("task", "prefix"),
+)
+LLM_STREAM_RESULT_SECONDS = Histogram(
+    "jobfinder_llm_stream_result_seconds",
+    "Streamed LLM calls: time until the JSON result was decided (object closed or aborted).",
+    ("model", "outcome"),
+)
+LLM_STREAM_TOKENS = Histogram(
+    "jobfinder_llm_stream_generated_tokens",
+    "Completion tokens generated per streamed LLM call.",
+    ("model", "outcome"),
+    buckets=TOKEN_BUCKETS,
+)
+LLM_STREAM_ABORTS = Counter(
+    "jobfinder_llm_stream_aborts_total",
+    "Streamed LLM calls that ended without a complete JSON object, by reason.",
+    ("model", "reason"),
+)
+EXTRACTION_PLANS = Counter(
+    "jobfinder_extraction_plans_total",
+    "Extractions by what pre-extraction left for the LLM "
+    "(skipped, targeted, full, repairs_avoided, repairs_no_evidence).",
+    ("plan",),
+)
+SCORE_BOUND_CHECKS = Counter(
+    "jobfinder_score_bound_checks_total",
+    "Pre-extraction score upper-bound checks, by outcome (pruned jobs skip every LLM call).",
+    ("outcome",),
+)
+EXTRACTION_CACHE_LOOKUPS = Counter(
+    "jobfinder_extraction_cache_lookups_total",
+    "job_extraction_cache lookups by content fingerprint, by outcome (hit skips extraction).",
+    ("outcome",),
+)
+FUSED_EXTRACTIONS = Counter(
+    "jobfinder_fused_extractions_total",
+    "Fused extraction + match analysis calls, by outcome (fallback reruns the separate calls).",
+    ("outcome",),
+)
+HTTP_FETCH_SECONDS = Histogram(
+    "jobfinder_http_fetch_duration_seconds",
+    "Scraper HTTP request latency per host.",
+    ("host", "outcome"),
+)
+RATE_LIMIT_WAIT_SECONDS = Histogram(
+    "jobfinder_rate_limit_wait_seconds",
+    "Time callers blocked on the per-host/provider rate limiter.",
+    ("scope",),
+)
+SQLITE_QUERY_SECONDS = Histogram(
+    "jobfinder_sqlite_query_duration_seconds",
+    "SQLite statement execution latency per statement family.",
+    ("family",),
+    buckets=SQLITE_BUCKETS,
+)
+RENDER_SECONDS = Histogram(
+    "jobfinder_render_duration_seconds",
+    "Playwright page render latency.",
+    ("outcome",),
+)
@@ -0,0 +1,226 @@
+"""Backtest score upper-bound pruning against stored extractions.
+
+The job pipeline skips extraction when ``ScoringEngine.upper_bound`` over the
+pre-extracted fields is below minScore. This read-only command replays that
+check over every listing with a stored extraction snapshot
+(``filter_result.extraction``) and compares it to the score the pipeline would
+give today: the stored extraction with pre-extraction's settled fields laid
+over it (settled values override the model), scored under the current
+match-policy.
+
+Reported:
+  - pruned: listings the bound would have skipped (one extraction call each,
+    plus any repair, taxonomy enrichment and match analysis)
+  - false prunes: pruned listings whose score reaches minScore (must be 0)
+  - bound violations: listings scoring above their bound (must be 0)
+  - pruned matches: pruned listings that have a job_matches row (informational;
+    non-zero only where settled fields disagree with the stored extraction)
+
+``posted_date`` is not replayed: ``daysOld`` is relative to the processing
+time, so the stored value is kept and freshness is bounded as unknown.
+
+Usage:
+    ENVIRONMENT=production python -m job_finder.prune_backtest
+
+    # Print each false prune / violation
+    python -m job_finder.prune_backtest --verbose
+
+Exits 1 when any false prune or bound violation is found.
+"""
+
+from __future__ import annotations
+
+import argparse
+import logging
+import sys
+from itertools import islice
+from pathlib import Path
+from typing import Any, Dict, Iterable, Iterator, Optional
+
+# Add src to path when run as a script
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from job_finder.ai.extraction import JobExtractionResult
+from job_finder.ai.pre_extraction import PreExtractor
+from job_finder.job_queue.processors.job_processor import _location_indicates_remote
+from job_finder.rescore_matches import (
+    DEFAULT_BATCH_SIZE,
+    RescoreContext,
+    load_context,
+    parse_filter_result,
+)
+from job_finder.storage.sqlite_client import sqlite_connection
+
+logger = logging.getLogger(__name__)
+
+
+def iter_listings(db_path: str, limit: Optional[int], batch_size: int) -> Iterator[Dict[str, Any]]:
+    """Stream listings that reached extraction, with their match (if any)."""
+    sql = """
+        SELECT l.id            AS listing_id,
+               l.title         AS title,
+               l.description   AS description,
+               l.location      AS location,
+               l.salary_range  AS salary_range,
+               l.filter_result AS filter_result,
+               l.company_id    AS company_id,
+               m.id            AS match_id
+          FROM job_listings l
+          LEFT JOIN job_matches m ON m.job_listing_id = l.id
+         WHERE l.filter_result LIKE '%"extraction"%'
+         ORDER BY l.rowid
+    """
+    params = []
+    if limit:
+        sql += " LIMIT ?"
+        params.append(limit)
+
+    with sqlite_connection(db_path) as conn:
+        cursor = conn.execute(sql, params)
+        while True:
+            rows = cursor.fetchmany(batch_size)
+            if not rows:
+                break
+            for row in rows:
+                yield dict(row)
+
+
+def backtest_one(
+    context: RescoreContext,
+    pre_extractor: PreExtractor,
+    record: Dict[str, Any],
+    company_data: Optional[Dict[str, Any]] = None,
+) -> Optional[Dict[str, Any]]:
+    """Replay the upper-bound check for one listing; None without a snapshot."""
+    extraction_dict = parse_filter_result(record.get("filter_result")).get("extraction")
+    if not extraction_dict:
+        return None
+
+    title = record.get("title") or ""
+    description = record.get("description") or ""
+    location = record.get("location") or ""
+    pre = pre_extractor.extract(title, description, location, None, record.get("salary_range"))
+    known = dict(pre.settled)
+    if location and _location_indicates_remote(location):
+        known["work_arrangement"] = "remote"
+
+    extraction = JobExtractionResult.from_dict(extraction_dict)
+    for name, value in known.items():
+        setattr(extraction, name, value)
+
+    score = context.engine.score(extraction, title, description, company_data=company_data)
+    bound = context.engine.upper_bound(known, company_data)
+    pruned = bound < context.min_score
+    return {
+        "listing_id": record["listing_id"],
+        "match_id": record.get("match_id"),
+        "score": score.final_score,
+        "bound": bound,
+        "pruned": pruned,
+        "false_prune": pruned and score.final_score >= context.min_score,
+        "violation": score.final_score > bound,
+    }
+
+
+def backtest_records(
+    context: RescoreContext,
+    records: Iterable[Dict[str, Any]],
+    counts: Dict[str, int],
+    prefetch_size: int = DEFAULT_BATCH_SIZE,
+) -> Iterator[Dict[str, Any]]:
+    """Yield a result per listing, prefetching companies one chunk at a time.
+
+    ``counts`` accumulates ``seen``, ``pruned``, ``false_prunes``,
+    ``violations`` and ``pruned_matches``.
+    """
+    pre_extractor = PreExtractor()
+    records = iter(records)
+    while True:
+        chunk = list(islice(records, max(1, prefetch_size)))
+        if not chunk:
+            return
+        context.prefetch_companies(rec.get("company_id") for rec in chunk)
+        for rec in chunk:
+            result = backtest_one(
+                context, pre_extractor, rec, context.get_company(rec.get("company_id"))
+            )
+            if result is None:
+                continue
+            counts["seen"] = counts.get("seen", 0) + 1
+            for key, flag in (
+                ("pruned", result["pruned"]),
+                ("false_prunes", result["false_prune"]),
+                ("violations", result["violation"]),
+                ("pruned_matches", result["pruned"] and result["match_id"] is not None),
+            ):
+                counts[key] = counts.get(key, 0) + int(flag)
+            yield result
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="Backtest score upper-bound pruning")
+    parser.add_argument("--limit", type=int, default=None, help="Max listings to replay")
+    parser.add_argument(
+        "--batch-size",
+        type=int,
+        default=DEFAULT_BATCH_SIZE,
+        help=f"Rows streamed per fetch and companies prefetched per query (default: {DEFAULT_BATCH_SIZE})",
+    )
+    parser.add_argument("--verbose", "-v", action="store_true")
+    args = parser.parse_args()
+
+    logging.basicConfig(
+        level=logging.DEBUG if args.verbose else logging.INFO,
+        format="%(levelname)s %(message)s",
+    )
+
+    import os
+
+    db_path: Optional[str] = os.environ.get("SQLITE_DB_PATH")
+    if not db_path:
+        try:
+            from job_finder.storage.sqlite_client import resolve_db_path
+
+            resolved = resolve_db_path(None)
+            db_path = str(resolved) if resolved else None
+        except Exception as exc:
+            logger.error("Could not resolve a SQLite path: %s", exc)
+            return 2
+    if not db_path:
+        logger.error("SQLITE_DB_PATH is not set and could not be resolved.")
+        return 2
+
+    batch_size = max(1, args.batch_size)
+    context = load_context(db_path)
+    counts: Dict[str, int] = {}
+    records = iter_listings(db_path, args.limit, batch_size)
+    for result in backtest_records(context, records, counts, batch_size):
+        if args.verbose and (result["false_prune"] or result["violation"]):
+            logger.info(
+                "  %s: score %s, bound %s%s",
+                result["listing_id"][:8],
+                result["score"],
+                result["bound"],
+                "  [false prune]" if result["false_prune"] else "  [bound violation]",
+            )
+
+    seen = counts.get("seen", 0)
+    pruned = counts.get("pruned", 0)
+    logger.info(
+        "Replayed %d listings (minScore %d): pruned %d (%.1f%% of extraction calls saved)",
+        seen,
+        context.min_score,
+        pruned,
+        100.0 * pruned / seen if seen else 0.0,
+    )
+    logger.info(
+        "False prunes: %d, bound violations: %d, pruned listings with a match: %d",
+        counts.get("false_prunes", 0),
+        counts.get("violations", 0),
+        counts.get("pruned_matches", 0),
+    )
+    return 1 if counts.get("false_prunes") or counts.get("violations") else 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
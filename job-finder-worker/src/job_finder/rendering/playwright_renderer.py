@@ -18,6 +18,9 @@ from concurrent.futures import ThreadPoolExecutor, TimeoutError as FuturesTimeou
 from dataclasses import dataclass, field
 from typing import Dict, List, Literal, Optional, TYPE_CHECKING
 
+from job_finder.metrics import RENDER_SECONDS
+from job_finder.tracing import traced
+
 if TYPE_CHECKING:  # pragma: no cover - typing only
     from playwright.sync_api import Playwright, Browser
 
@@ -186,6 +189,7 @@ class PlaywrightRenderer:
                 except Exception:
                     pass
 
+    @traced("render")
     def render(self, req: RenderRequest) -> RenderResult:
         if not req.url.startswith(("http://", "https://")):
             raise ValueError(f"Invalid URL scheme for rendering: {req.url}")
@@ -218,6 +222,7 @@ class PlaywrightRenderer:
         def _do_render():
             return self._render_internal(req, timeout, render_context, force_restart_needed)
 
+        outcome = "error"
         try:
             executor = self._get_executor()
             future = executor.submit(_do_render)
@@ -225,9 +230,11 @@ class PlaywrightRenderer:
 
             # Success - reset failure counter
             self._consecutive_failures = 0
+            outcome = "ok"
             return result
 
         except FuturesTimeoutError:
+            outcome = "hard_timeout"
             # Hard timeout exceeded - browser likely hung
             # Try to clean up the abandoned context
             self._cleanup_abandoned_context(render_context)
@@ -252,6 +259,9 @@ class PlaywrightRenderer:
             self._consecutive_failures += 1
             raise
 
+        finally:
+            RENDER_SECONDS.observe(time.monotonic() - start, outcome=outcome)
+
     def _cleanup_abandoned_context(self, render_context: Dict[str, Optional[object]]) -> None:
         """Attempt to close an abandoned browser context after hard timeout."""
         context = render_context.get("context")
@@ -32,6 +32,10 @@ Usage:
 
     # Tune batch size for memory pressure on large databases
     python -m job_finder.rescore_matches --batch-size 500
+
+    # Rescore across 8 processes (rowid-range shards; ScoringEngine built once
+    # per worker process)
+    python -m job_finder.rescore_matches --workers 8 --apply
 """
 
 from __future__ import annotations
@@ -40,9 +44,13 @@ import argparse
 import json
 import logging
 import sys
+import time
 import uuid
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass, field
+from itertools import islice
 from pathlib import Path
-from typing import Any, Dict, Iterator, List, Optional, Set
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Set, Tuple
 
 # Add src to path when run as a script
 sys.path.insert(0, str(Path(__file__).parent.parent))
@@ -61,6 +69,10 @@ logger = logging.getLogger(__name__)
 DEFAULT_STATUSES = ("active", "ignored")
 TERMINAL_USER_STATUSES = frozenset({"applied", "acknowledged", "interviewing", "denied"})
 DEFAULT_BATCH_SIZE = 500
+DEFAULT_WRITE_BATCH_SIZE = 5000
+# Shards per worker process; several per worker keeps the pool busy when
+# rowid ranges are unevenly populated.
+SHARDS_PER_WORKER = 4
 
 
 def build_engine(config_loader: ConfigLoader, db_path: Optional[str]) -> ScoringEngine:
@@ -96,15 +108,68 @@ def parse_filter_result(raw: Optional[str]) -> Dict[str, Any]:
         return {}
 
 
+@dataclass
+class RescoreContext:
+    """Everything needed to rescore rows; built once per process."""
+
+    engine: ScoringEngine
+    min_score: int
+    title_filter: Optional[TitleFilter]
+    companies_manager: CompaniesManager
+    company_cache: Dict[str, Optional[Dict[str, Any]]] = field(default_factory=dict)
+
+    def prefetch_companies(self, company_ids: Iterable[Optional[str]]) -> None:
+        """Load uncached companies with one batched query."""
+        missing = list({cid for cid in company_ids if cid and cid not in self.company_cache})
+        if not missing:
+            return
+        found = self.companies_manager.batch_get_companies(missing)
+        for company_id in missing:
+            self.company_cache[company_id] = found.get(company_id)
+
+    def get_company(self, company_id: Optional[str]) -> Optional[Dict[str, Any]]:
+        if not company_id:
+            return None
+        if company_id not in self.company_cache:
+            self.company_cache[company_id] = self.companies_manager.get_company_by_id(company_id)
+        return self.company_cache[company_id]
+
+
+def load_context(db_path: str) -> RescoreContext:
+    config_loader = ConfigLoader(db_path=db_path)
+    match_policy = config_loader.get_match_policy()
+    min_score = int(match_policy.get("minScore", 0))
+    engine = build_engine(config_loader, db_path)
+
+    prefilter_policy = config_loader.get_prefilter_policy() or {}
+    title_filter = (
+        TitleFilter(prefilter_policy.get("title") or {})
+        if (prefilter_policy.get("title") or {}).get("requiredKeywords")
+        else None
+    )
+    return RescoreContext(
+        engine=engine,
+        min_score=min_score,
+        title_filter=title_filter,
+        companies_manager=CompaniesManager(db_path=db_path),
+    )
+
+
 def iter_candidates(
-    db_path: str, statuses: Set[str], limit: Optional[int], batch_size: int
+    db_path: str,
+    statuses: Set[str],
+    limit: Optional[int],
+    batch_size: int,
+    rowid_range: Optional[Tuple[int, int]] = None,
 ) -> Iterator[Dict[str, Any]]:
     """Stream matching rows from sqlite in chunks via fetchmany().
 
     Avoids loading the entire job_matches table into memory — production has
     tens of thousands of rows and a naive fetchall() can OOM the worker.
+    ``rowid_range`` (inclusive) restricts the scan to one shard.
     """
     placeholders = ",".join("?" for _ in statuses)
+    shard_clause = "AND m.rowid BETWEEN ? AND ?" if rowid_range else ""
     sql = f"""
         SELECT m.id            AS match_id,
                m.status        AS status,
@@ -119,9 +184,12 @@ def iter_candidates(
           JOIN job_listings l ON l.id = m.job_listing_id
          WHERE m.status IN ({placeholders})
            AND m.is_ghost = 0
+           {shard_clause}
          ORDER BY m.analyzed_at DESC
     """
     params: List[Any] = list(statuses)
+    if rowid_range:
+        params.extend(rowid_range)
     if limit:
         sql += " LIMIT ?"
         params.append(limit)
@@ -144,7 +212,9 @@ def rescore_one(
     title_filter: Optional[TitleFilter] = None,
 ) -> Optional[Dict[str, Any]]:
     """Return a diff dict if the row needs an UPDATE, else None."""
-    filter_result = parse_filter_result(record.get("filter_result"))
+    filter_result = record.get("filter_result")
+    if not isinstance(filter_result, dict):
+        filter_result = parse_filter_result(filter_result)
     extraction_dict = (filter_result or {}).get("extraction")
     if not extraction_dict:
         return None  # No snapshot to re-score against; skip silently
@@ -207,58 +277,162 @@ def rescore_one(
     }
 
 
+def rescore_records(
+    context: RescoreContext,
+    records: Iterable[Dict[str, Any]],
+    counts: Dict[str, int],
+    prefetch_size: int = DEFAULT_BATCH_SIZE,
+) -> Iterator[Dict[str, Any]]:
+    """Yield diffs for *records*, prefetching companies one chunk at a time.
+
+    ``counts`` accumulates ``seen`` and ``skipped_no_extraction``.
+    """
+    records = iter(records)
+    while True:
+        chunk = list(islice(records, max(1, prefetch_size)))
+        if not chunk:
+            return
+        scorable = []
+        for rec in chunk:
+            counts["seen"] = counts.get("seen", 0) + 1
+            # Parse once; rescore_one accepts the decoded dict
+            rec["filter_result"] = parse_filter_result(rec.get("filter_result"))
+            if not rec["filter_result"].get("extraction"):
+                counts["skipped_no_extraction"] = counts.get("skipped_no_extraction", 0) + 1
+                continue
+            scorable.append(rec)
+
+        context.prefetch_companies(rec.get("company_id") for rec in scorable)
+        for rec in scorable:
+            diff = rescore_one(
+                context.engine,
+                rec,
+                context.min_score,
+                company_data=context.get_company(rec.get("company_id")),
+                title_filter=context.title_filter,
+            )
+            if diff is not None:
+                yield diff
+
+
+def plan_shards(db_path: str, statuses: Set[str], shard_count: int) -> List[Tuple[int, int]]:
+    """Split the candidate job_matches rowid span into *shard_count* ranges."""
+    placeholders = ",".join("?" for _ in statuses)
+    with sqlite_connection(db_path) as conn:
+        row = conn.execute(
+            f"SELECT MIN(rowid), MAX(rowid) FROM job_matches "
+            f"WHERE status IN ({placeholders}) AND is_ghost = 0",
+            list(statuses),
+        ).fetchone()
+    low, high = row[0], row[1]
+    if low is None:
+        return []
+    span = high - low + 1
+    step = max(1, -(-span // max(1, shard_count)))
+    return [(start, min(start + step - 1, high)) for start in range(low, high + 1, step)]
+
+
+# Per-process state for --workers > 1 (set by _init_worker in each child)
+_worker_context: Optional[RescoreContext] = None
+
+
+def _init_worker(db_path: str) -> None:
+    global _worker_context
+    _worker_context = load_context(db_path)
+
+
+def _rescore_shard(
+    db_path: str, statuses: Set[str], rowid_range: Tuple[int, int], batch_size: int
+) -> Tuple[Dict[str, int], List[Dict[str, Any]]]:
+    assert _worker_context is not None, "worker not initialized"
+    counts: Dict[str, int] = {}
+    records = iter_candidates(db_path, statuses, None, batch_size, rowid_range=rowid_range)
+    diffs = []
+    for diff in rescore_records(_worker_context, records, counts, batch_size):
+        diff.pop("breakdown", None)  # not needed by the parent; keeps IPC small
+        diffs.append(diff)
+    return counts, diffs
+
+
+def iter_parallel_diffs(
+    db_path: str,
+    statuses: Set[str],
+    workers: int,
+    batch_size: int,
+    counts: Dict[str, int],
+) -> Iterator[Dict[str, Any]]:
+    """Rescore rowid-range shards in a process pool, yielding diffs as shards finish."""
+    shards = plan_shards(db_path, statuses, workers * SHARDS_PER_WORKER)
+    if not shards:
+        return
+    with ProcessPoolExecutor(
+        max_workers=workers, initializer=_init_worker, initargs=(db_path,)
+    ) as pool:
+        futures = [
+            pool.submit(_rescore_shard, db_path, statuses, shard, batch_size) for shard in shards
+        ]
+        for future in futures:
+            shard_counts, diffs = future.result()
+            for key, value in shard_counts.items():
+                counts[key] = counts.get(key, 0) + value
+            yield from diffs
+
+
 def apply_changes(db_path: str, changes: List[Dict[str, Any]]) -> None:
     """Apply a chunk of changes inside a single transaction.
 
     Caller is responsible for chunking; we keep this function small and atomic
-    so partial failures don't leave half-written batches.
+    so partial failures don't leave half-written batches. Each statement runs
+    once per chunk via executemany().
     """
     if not changes:
         return
     now = utcnow_iso()
+    flips = [change for change in changes if change["next_status"] != change["status"]]
     with sqlite_connection(db_path) as conn:
-        for change in changes:
-            conn.execute(
+        conn.executemany(
+            """
+            UPDATE job_matches
+               SET match_score = ?,
+                   static_score = ?,
+                   updated_at = ?
+             WHERE id = ?
+            """,
+            [
+                (change["new_match_score"], change["new_static_score"], now, change["match_id"])
+                for change in changes
+            ],
+        )
+
+        if flips:
+            conn.executemany(
                 """
                 UPDATE job_matches
-                   SET match_score = ?,
-                       static_score = ?,
-                       updated_at = ?
+                   SET status = ?,
+                       status_note = ?,
+                       status_updated_by = 'reconciliation-script',
+                       ignored_at = CASE WHEN ? = 'ignored' THEN ? ELSE ignored_at END
                  WHERE id = ?
                 """,
-                (
-                    change["new_match_score"],
-                    change["new_static_score"],
-                    now,
-                    change["match_id"],
-                ),
-            )
-
-            if change["next_status"] != change["status"]:
-                conn.execute(
-                    """
-                    UPDATE job_matches
-                       SET status = ?,
-                           status_note = ?,
-                           status_updated_by = 'reconciliation-script',
-                           ignored_at = CASE WHEN ? = 'ignored' THEN ? ELSE ignored_at END
-                     WHERE id = ?
-                    """,
+                [
                     (
                         change["next_status"],
                         change["note"],
                         change["next_status"],
                         now,
                         change["match_id"],
-                    ),
-                )
-                conn.execute(
-                    """
-                    INSERT INTO application_status_history
-                       (id, job_match_id, from_status, to_status, changed_by,
-                        application_email_id, note, created_at)
-                    VALUES (?, ?, ?, ?, 'reconciliation-script', NULL, ?, ?)
-                    """,
+                    )
+                    for change in flips
+                ],
+            )
+            conn.executemany(
+                """
+                INSERT INTO application_status_history
+                   (id, job_match_id, from_status, to_status, changed_by,
+                    application_email_id, note, created_at)
+                VALUES (?, ?, ?, ?, 'reconciliation-script', NULL, ?, ?)
+                """,
+                [
                     (
                         str(uuid.uuid4()),
                         change["match_id"],
@@ -266,13 +440,15 @@ def apply_changes(db_path: str, changes: List[Dict[str, Any]]) -> None:
                         change["next_status"],
                         change["note"],
                         now,
-                    ),
-                )
-
-            conn.execute(
-                "UPDATE job_listings SET match_score = ?, updated_at = ? WHERE id = ?",
-                (change["new_match_score"], now, change["listing_id"]),
+                    )
+                    for change in flips
+                ],
             )
+
+        conn.executemany(
+            "UPDATE job_listings SET match_score = ?, updated_at = ? WHERE id = ?",
+            [(change["new_match_score"], now, change["listing_id"]) for change in changes],
+        )
         conn.commit()
 
 
@@ -294,7 +470,19 @@ def main() -> int:
         "--batch-size",
         type=int,
         default=DEFAULT_BATCH_SIZE,
-        help=f"Rows streamed per fetch and written per transaction (default: {DEFAULT_BATCH_SIZE})",
+        help=f"Rows streamed per fetch and companies prefetched per query (default: {DEFAULT_BATCH_SIZE})",
+    )
+    parser.add_argument(
+        "--write-batch-size",
+        type=int,
+        default=DEFAULT_WRITE_BATCH_SIZE,
+        help=f"Changes written per transaction (default: {DEFAULT_WRITE_BATCH_SIZE})",
+    )
+    parser.add_argument(
+        "--workers",
+        type=int,
+        default=1,
+        help="Rescore in N processes over rowid-range shards (default: 1, in-process)",
     )
     parser.add_argument("--verbose", "-v", action="store_true")
     args = parser.parse_args()
@@ -327,35 +515,26 @@ def main() -> int:
     if not db_path:
         logger.error("SQLITE_DB_PATH is not set and could not be resolved.")
         return 2
-    config_loader = ConfigLoader(db_path=db_path)
-
-    match_policy = config_loader.get_match_policy()
-    min_score = int(match_policy.get("minScore", 0))
-    engine = build_engine(config_loader, db_path)
-
-    prefilter_policy = config_loader.get_prefilter_policy() or {}
-    title_filter = (
-        TitleFilter(prefilter_policy.get("title") or {})
-        if (prefilter_policy.get("title") or {}).get("requiredKeywords")
-        else None
-    )
-
-    companies_manager = CompaniesManager(db_path=db_path)
-    company_cache: Dict[str, Optional[Dict[str, Any]]] = {}
-
-    def get_company(company_id: Optional[str]) -> Optional[Dict[str, Any]]:
-        if not company_id:
-            return None
-        if company_id not in company_cache:
-            company_cache[company_id] = companies_manager.get_company_by_id(company_id)
-        return company_cache[company_id]
 
     batch_size = max(1, args.batch_size)
+    write_batch_size = max(1, args.write_batch_size)
+    workers = max(1, args.workers)
+    if workers > 1 and args.limit:
+        logger.warning("--limit selects the newest matches; ignoring --workers")
+        workers = 1
+
+    counts: Dict[str, int] = {}
+    started = time.perf_counter()
+    if workers > 1:
+        diffs = iter_parallel_diffs(db_path, statuses, workers, batch_size, counts)
+    else:
+        context = load_context(db_path)
+        records = iter_candidates(db_path, statuses, args.limit, batch_size)
+        diffs = rescore_records(context, records, counts, batch_size)
+
     pending_batch: List[Dict[str, Any]] = []
     total_changes = 0
     flipped = 0
-    skipped_no_extraction = 0
-    seen = 0
 
     def flush() -> None:
         nonlocal pending_batch
@@ -368,19 +547,7 @@ def main() -> int:
         logger.debug("Applied batch of %d changes", len(pending_batch))
         pending_batch = []
 
-    for rec in iter_candidates(db_path, statuses, args.limit, batch_size):
-        seen += 1
-        if not parse_filter_result(rec.get("filter_result")).get("extraction"):
-            skipped_no_extraction += 1
-            continue
-
-        company_data = get_company(rec.get("company_id"))
-        diff = rescore_one(
-            engine, rec, min_score, company_data=company_data, title_filter=title_filter
-        )
-        if diff is None:
-            continue
-
+    for diff in diffs:
         if args.verbose and total_changes < 20:
             logger.info(
                 "  %s: %s->%s, score %d->%d (static %s->%d)%s",
@@ -399,17 +566,26 @@ def main() -> int:
         if diff["next_status"] != diff["status"]:
             flipped += 1
 
-        if len(pending_batch) >= batch_size:
+        if len(pending_batch) >= write_batch_size:
             flush()
 
     flush()
 
+    seen = counts.get("seen", 0)
+    elapsed = time.perf_counter() - started
     logger.info(
         "Scanned %d matches; planned %d changes (status flips: %d, skipped no-extraction: %d)",
         seen,
         total_changes,
         flipped,
-        skipped_no_extraction,
+        counts.get("skipped_no_extraction", 0),
+    )
+    logger.info(
+        "Throughput: %.0f rows/sec (%.1fs, %d worker%s)",
+        seen / elapsed if elapsed > 0 else 0.0,
+        elapsed,
+        workers,
+        "s" if workers != 1 else "",
     )
 
     if not args.apply:
@@ -0,0 +1,359 @@
+"""Background, resumable rescoring after scoring-config changes.
+
+``rescore_matches`` is a one-shot CLI: until somebody runs it, matches scored
+under an old match-policy keep stale scores while new jobs are scored under
+the new one. ``RescoreScheduler`` closes that gap from inside the worker:
+
+- on every idle poll it fingerprints the inputs ``ScoringEngine`` depends on
+  (the ``match-policy``, ``personal-info`` and ``prefilter-policy`` config
+  rows, the curated ``skill_taxonomy`` relationships and ``content_items``)
+- when the fingerprint differs from the last run it starts a new run over
+  every candidate match up to the current max rowid (newer rows are already
+  scored under the new config)
+- each idle window processes rowid windows for at most ``slice_seconds``
+  (stopping between windows as soon as ``should_stop`` reports new queue
+  work) through the same ``rescore_records``/``apply_changes`` path as the CLI,
+  using the stored ``filter_result.extraction`` snapshots (no LLM calls), and
+  checkpoints ``last_rowid`` in ``rescore_runs``
+- a restart resumes from the checkpoint; another config change supersedes the
+  running run and starts over
+
+The first time the scheduler sees a database it records the current
+fingerprint as a baseline instead of rescoring everything.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import logging
+import sqlite3
+import threading
+import time
+import uuid
+from typing import Any, Callable, Dict, List, Optional
+
+from job_finder.rescore_matches import (
+    DEFAULT_STATUSES,
+    RescoreContext,
+    apply_changes,
+    iter_candidates,
+    load_context,
+    rescore_records,
+)
+from job_finder.storage.sqlite_client import resolve_db_path, sqlite_connection, utcnow_iso
+
+logger = logging.getLogger(__name__)
+
+SCORING_CONFIG_IDS = ("match-policy", "personal-info", "prefilter-policy")
+SCORING_TABLES = ("content_items",)
+DEFAULT_SLICE_SECONDS = 10.0
+DEFAULT_WINDOW_ROWS = 500
+
+
+def _digest(value: str) -> str:
+    return hashlib.sha256(value.encode("utf-8")).hexdigest()[:16]
+
+
+def scoring_input_versions(conn: sqlite3.Connection) -> Dict[str, str]:
+    """Return a short version hash per scoring input.
+
+    Config rows are hashed by payload; tables by row count plus latest
+    ``updated_at`` (edits bump it, deletes change the count).
+
+    ``skill_taxonomy`` is hashed by its implies/parallels relationships only.
+    The scoring stage records every term it learns (``learn``: synonyms,
+    relationships untouched) on routine jobs; counting those rows would
+    restart a full rescore after nearly every processed job.
+    """
+    versions: Dict[str, str] = {}
+    for config_id in SCORING_CONFIG_IDS:
+        try:
+            row = conn.execute(
+                "SELECT payload_json FROM job_finder_config WHERE id = ?", (config_id,)
+            ).fetchone()
+        except sqlite3.OperationalError:
+            row = None
+        versions[config_id] = _digest(row[0] if row else "")
+    for table in SCORING_TABLES:
+        try:
+            count, latest = conn.execute(
+                f"SELECT COUNT(*), MAX(updated_at) FROM {table}"
+            ).fetchone()
+            versions[table] = _digest(f"{count}|{latest}")
+        except sqlite3.OperationalError:
+            versions[table] = "missing"
+    try:
+        rows = conn.execute("""
+            SELECT canonical, implies_csv, parallels_csv FROM skill_taxonomy
+             WHERE implies_csv != '' OR parallels_csv != ''
+             ORDER BY canonical
+            """).fetchall()
+        versions["skill_taxonomy"] = _digest(json.dumps([list(row) for row in rows]))
+    except sqlite3.OperationalError:
+        versions["skill_taxonomy"] = "missing"
+    return versions
+
+
+def combined_version(versions: Dict[str, str]) -> str:
+    return _digest(json.dumps(versions, sort_keys=True))
+
+
+class RescoreScheduler:
+    """Detects scoring-config changes and rescores matches in idle time slices."""
+
+    def __init__(
+        self,
+        db_path: Optional[str],
+        statuses: tuple = DEFAULT_STATUSES,
+        slice_seconds: float = DEFAULT_SLICE_SECONDS,
+        window_rows: int = DEFAULT_WINDOW_ROWS,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        # Resolved once: a missing database fails here, not inside the first slice
+        self.db_path = str(resolve_db_path(db_path))
+        self.statuses = set(statuses)
+        self.slice_seconds = slice_seconds
+        self.window_rows = max(1, window_rows)
+        self._clock = clock
+        self._table_ready = False
+        self._context: Optional[RescoreContext] = None
+        self._context_version: Optional[str] = None
+        self._lock = threading.Lock()
+        self._status: Dict[str, Any] = {"state": "idle"}
+
+    # ------------------------------------------------------------------ #
+    # Storage
+    # ------------------------------------------------------------------ #
+
+    def _ensure_table(self, conn: sqlite3.Connection) -> None:
+        if self._table_ready:
+            return
+        conn.execute("""
+            CREATE TABLE IF NOT EXISTS rescore_runs (
+                id TEXT PRIMARY KEY,
+                config_hash TEXT NOT NULL,
+                components_json TEXT NOT NULL,
+                changed_json TEXT NOT NULL DEFAULT '[]',
+                status TEXT NOT NULL,
+                last_rowid INTEGER NOT NULL DEFAULT 0,
+                max_rowid INTEGER NOT NULL DEFAULT 0,
+                total INTEGER NOT NULL DEFAULT 0,
+                processed INTEGER NOT NULL DEFAULT 0,
+                changed INTEGER NOT NULL DEFAULT 0,
+                flipped INTEGER NOT NULL DEFAULT 0,
+                last_error TEXT,
+                created_at TEXT NOT NULL,
+                updated_at TEXT NOT NULL,
+                completed_at TEXT
+            )
+            """)
+        conn.execute(
+            "CREATE INDEX IF NOT EXISTS idx_rescore_runs_created ON rescore_runs(created_at)"
+        )
+        self._table_ready = True
+
+    @staticmethod
+    def _latest_run(conn: sqlite3.Connection) -> Optional[Dict[str, Any]]:
+        row = conn.execute(
+            "SELECT * FROM rescore_runs ORDER BY created_at DESC, rowid DESC LIMIT 1"
+        ).fetchone()
+        return dict(row) if row else None
+
+    def _start_run(
+        self,
+        conn: sqlite3.Connection,
+        versions: Dict[str, str],
+        previous: Optional[Dict[str, Any]],
+    ) -> Dict[str, Any]:
+        now = utcnow_iso()
+        placeholders = ",".join("?" for _ in self.statuses)
+        if previous is None:
+            # Baseline: nothing to reconcile against yet
+            status, changed, max_rowid, total = "completed", [], 0, 0
+        else:
+            prior = json.loads(previous["components_json"] or "{}")
+            changed = sorted(k for k in versions if prior.get(k) != versions[k])
+            max_rowid, total = conn.execute(
+                f"SELECT COALESCE(MAX(rowid), 0), COUNT(*) FROM job_matches "
+                f"WHERE status IN ({placeholders}) AND is_ghost = 0",
+                list(self.statuses),
+            ).fetchone()
+            status = "running" if total else "completed"
+        run = {
+            "id": str(uuid.uuid4()),
+            "config_hash": combined_version(versions),
+            "components_json": json.dumps(versions, sort_keys=True),
+            "changed_json": json.dumps(changed),
+            "status": status,
+            "last_rowid": 0,
+            "max_rowid": max_rowid,
+            "total": total,
+            "processed": 0,
+            "changed": 0,
+            "flipped": 0,
+            "last_error": None,
+            "created_at": now,
+            "updated_at": now,
+            "completed_at": None if status == "running" else now,
+        }
+        columns = ", ".join(run)
+        conn.execute(
+            f"INSERT INTO rescore_runs ({columns}) VALUES ({', '.join('?' for _ in run)})",
+            list(run.values()),
+        )
+        if previous is not None:
+            logger.info(
+                "Scoring inputs changed (%s); rescoring %d matches in the background",
+                ", ".join(changed) or "unknown",
+                total,
+            )
+        return run
+
+    def _save_progress(self, run: Dict[str, Any]) -> None:
+        run["updated_at"] = utcnow_iso()
+        with sqlite_connection(self.db_path) as conn:
+            conn.execute(
+                """
+                UPDATE rescore_runs
+                   SET status = ?, last_rowid = ?, processed = ?, changed = ?, flipped = ?,
+                       last_error = ?, updated_at = ?, completed_at = ?
+                 WHERE id = ?
+                """,
+                (
+                    run["status"],
+                    run["last_rowid"],
+                    run["processed"],
+                    run["changed"],
+                    run["flipped"],
+                    run["last_error"],
+                    run["updated_at"],
+                    run["completed_at"],
+                    run["id"],
+                ),
+            )
+
+    # ------------------------------------------------------------------ #
+    # Scheduling
+    # ------------------------------------------------------------------ #
+
+    def run_idle_slice(self, should_stop: Optional[Callable[[], bool]] = None) -> Dict[str, Any]:
+        """Detect config changes and advance the active run for one idle window.
+
+        Args:
+            should_stop: Checked before each rowid window; the slice ends early
+                once it returns True (e.g. new queue work is pending)
+
+        Returns the same progress dict as ``status()``.
+        """
+        with self._lock:
+            deadline = self._clock() + self.slice_seconds
+            run = self._current_run()
+            if run is not None and run["status"] == "running":
+                self._advance(run, deadline, should_stop)
+            self._publish(run)
+            return self.status()
+
+    def _current_run(self) -> Optional[Dict[str, Any]]:
+        """Return the latest run, starting a new one if scoring inputs changed."""
+        with sqlite_connection(self.db_path) as conn:
+            self._ensure_table(conn)
+            versions = scoring_input_versions(conn)
+            latest = self._latest_run(conn)
+            if latest is not None and latest["config_hash"] == combined_version(versions):
+                return latest
+            if latest is None:
+                return self._start_run(conn, versions, None)
+            if latest["status"] == "running":
+                conn.execute(
+                    "UPDATE rescore_runs SET status = 'superseded', updated_at = ? WHERE id = ?",
+                    (utcnow_iso(), latest["id"]),
+                )
+
+        # Build the engine before fingerprinting the run: loading the taxonomy
+        # can seed skill_taxonomy rows, which would otherwise look like a change.
+        self._context = load_context(self.db_path)
+        with sqlite_connection(self.db_path) as conn:
+            versions = scoring_input_versions(conn)
+            run = self._start_run(conn, versions, latest)
+        self._context_version = run["config_hash"]
+        return run
+
+    def _advance(
+        self,
+        run: Dict[str, Any],
+        deadline: float,
+        should_stop: Optional[Callable[[], bool]] = None,
+    ) -> None:
+        if self._context is None or self._context_version != run["config_hash"]:
+            self._context = load_context(self.db_path)
+            self._context_version = run["config_hash"]
+
+        try:
+            while run["last_rowid"] < run["max_rowid"] and self._clock() < deadline:
+                if should_stop is not None and should_stop():
+                    break
+                window = (
+                    run["last_rowid"] + 1,
+                    min(run["last_rowid"] + self.window_rows, run["max_rowid"]),
+                )
+                counts: Dict[str, int] = {}
+                records = iter_candidates(
+                    self.db_path, self.statuses, None, self.window_rows, rowid_range=window
+                )
+                diffs: List[Dict[str, Any]] = list(
+                    rescore_records(self._context, records, counts, self.window_rows)
+                )
+                apply_changes(self.db_path, diffs)
+
+                run["last_rowid"] = window[1]
+                run["processed"] += counts.get("seen", 0)
+                run["changed"] += len(diffs)
+                run["flipped"] += sum(1 for d in diffs if d["next_status"] != d["status"])
+                run["last_error"] = None
+                if run["last_rowid"] >= run["max_rowid"]:
+                    run["status"] = "completed"
+                    run["completed_at"] = utcnow_iso()
+                self._save_progress(run)
+        except Exception as exc:
+            logger.warning("Background rescore failed at rowid %s: %s", run["last_rowid"], exc)
+            run["last_error"] = str(exc)
+            self._save_progress(run)
+            return
+
+        if run["status"] == "completed":
+            logger.info(
+                "Background rescore complete: %d matches, %d updated, %d flipped",
+                run["processed"],
+                run["changed"],
+                run["flipped"],
+            )
+
+    # ------------------------------------------------------------------ #
+    # Status
+    # ------------------------------------------------------------------ #
+
+    def _publish(self, run: Optional[Dict[str, Any]]) -> None:
+        if run is None:
+            self._status = {"state": "idle"}
+            return
+        total = run["total"] or 0
+        self._status = {
+            "state": run["status"],
+            "run_id": run["id"],
+            "config_version": run["config_hash"],
+            "changed_inputs": json.loads(run["changed_json"] or "[]"),
+            "processed": run["processed"],
+            "total": total,
+            "progress": round(run["processed"] / total, 4) if total else 1.0,
+            "updated": run["changed"],
+            "flipped": run["flipped"],
+            "last_error": run["last_error"],
+            "started_at": run["created_at"],
+            "updated_at": run["updated_at"],
+            "completed_at": run["completed_at"],
+        }
+
+    def status(self) -> Dict[str, Any]:
+        """Progress of the latest run (as of the last idle slice)."""
+        return dict(self._status)
@@ -31,16 +31,33 @@ If you need a new scoring adjustment, ADD IT TO THE CONFIG. Do not hardcode.
 ================================================================================
 """
 
+import itertools
 import logging
-import re
+import math
 from dataclasses import dataclass, field
-from typing import Any, Dict, List, Optional, Set
+from typing import Any, Dict, List, Optional, Set, get_args
 
-from job_finder.ai.extraction import JobExtractionResult
+from job_finder.ai.extraction import JobExtractionResult, SeniorityLevel, WorkArrangement
 from job_finder.scoring.taxonomy import SkillTaxonomyRepository
+from job_finder.utils.keyword_matcher import KeywordMatcher
 
 logger = logging.getLogger(__name__)
 
+# AI/ML indicators for the company aiMlFocusScore fallback. Word boundaries
+# avoid false positives (e.g., 'llm' in 'small').
+_AI_DESCRIPTION_KEYWORDS = KeywordMatcher(
+    [
+        "machine learning",
+        "artificial intelligence",
+        "ai",
+        "ml",
+        "deep learning",
+        "llm",
+        "generative ai",
+    ]
+)
+_AI_TECH_KEYWORDS = KeywordMatcher(["pytorch", "tensorflow", "ml", "ai"])
+
 
 @dataclass
 class ScoreAdjustment:
@@ -348,6 +365,120 @@ class ScoringEngine:
             ),
         )
 
+    def upper_bound(
+        self,
+        known: Dict[str, Any],
+        company_data: Optional[Dict[str, Any]] = None,
+    ) -> int:
+        """
+        Highest final score any extraction consistent with ``known`` can reach.
+
+        Each scoring component reads its own disjoint set of extraction fields,
+        so the bound is the neutral baseline plus every component's best case
+        over the values its unknown fields could still take. Components are
+        evaluated with the same ``_score_*`` methods as ``score()``; a component
+        whose every case hard-rejects bounds the whole score at 0.
+
+        Args:
+            known: JobExtractionResult field values the extraction is guaranteed
+                to end up with (e.g. settled by pre-extraction)
+            company_data: Optional company data for company signal scoring
+
+        Returns:
+            Upper bound on ``score(...).final_score``, clamped to 0-100
+        """
+        domains = self._bound_domains()
+        components = (
+            (("seniority",), lambda e: self._score_seniority(e.seniority)),
+            (
+                (
+                    "work_arrangement",
+                    "relocation_required",
+                    "timezone",
+                    "timezone_flexible",
+                    "city",
+                ),
+                self._score_location,
+            ),
+            (("technologies",), lambda e: self._score_skill_match(e.technologies)),
+            (
+                ("salary_min", "salary_max", "includes_equity", "is_contract"),
+                lambda e: self._score_salary(
+                    e.salary_min,
+                    e.salary_max,
+                    includes_equity=e.includes_equity,
+                    is_contract=e.is_contract,
+                ),
+            ),
+            (("days_old", "is_repost"), self._score_freshness),
+            (("role_types",), self._score_role_fit),
+        )
+
+        score: float = 50.0
+        for fields, scorer in components:
+            choices = [[known[f]] if f in known else domains[f] for f in fields]
+            best: Optional[float] = None
+            for values in itertools.product(*choices):
+                result = scorer(JobExtractionResult(**dict(zip(fields, values))))
+                if result.get("hard_reject"):
+                    continue
+                best = result["points"] if best is None else max(best, result["points"])
+            if best is None:
+                return 0
+            score += best
+
+        if company_data:
+            score += self._score_company_signals(company_data)["points"]
+
+        return max(0, min(100, math.ceil(score)))
+
+    def _bound_domains(self) -> Dict[str, List[Any]]:
+        """Values worth trying for each field ``upper_bound`` does not know.
+
+        Every value that changes a component's points is represented, so the
+        best case over these equals the best case over all possible values.
+        """
+        user_tz = self.location_config["userTimezone"]
+        max_diff = self.location_config["maxTimezoneDiffHours"]
+        user_city = self.location_config.get("userCity") or None
+        salary = max(self.salary_config["minimum"] or 0, self.salary_config["target"] or 0, 1)
+
+        matchable = self.canonical_user_skills | set(self.user_implied_skills)
+        parallels = set(self.user_parallel_skills)
+        missing = {t.canonical.lower() for t in self.taxonomy_lookup.values()} - matchable
+        missing -= parallels
+
+        preferred = sorted(self._preferred_roles)
+        penalized = sorted(self._penalized_roles)
+
+        return {
+            "seniority": list(get_args(SeniorityLevel)),
+            "work_arrangement": list(get_args(WorkArrangement)),
+            "relocation_required": [False, True],
+            "timezone": [None, user_tz, user_tz - max_diff, user_tz + max_diff],
+            "timezone_flexible": [False, True],
+            "city": [None, user_city, "elsewhere"],
+            "technologies": [
+                [],
+                sorted(matchable),
+                sorted(matchable | parallels),
+                sorted(matchable | missing),
+                sorted(matchable | parallels | missing),
+            ],
+            "salary_min": [None, salary],
+            "salary_max": [None, salary],
+            "includes_equity": [False, True],
+            "is_contract": [False, True],
+            "days_old": [
+                None,
+                0,
+                self.freshness_config["staleDays"],
+                self.freshness_config["veryStaleDays"],
+            ],
+            "is_repost": [False, True],
+            "role_types": [[], preferred, penalized, preferred + penalized],
+        }
+
     def _score_seniority(self, seniority: Optional[str]) -> Dict[str, Any]:
         """Score based on seniority match. All scores from config (no defaults)."""
         if not seniority or seniority == "unknown":
@@ -1094,30 +1225,10 @@ class ScoringEngine:
         if ai_ml_score:
             # Use the aiMlFocus field from company data (set during enrichment)
             # Also check description and tech stack for AI/ML indicators
-            # Use word boundaries to avoid false positives (e.g., 'llm' in 'small')
-            ai_keywords = [
-                "machine learning",
-                "artificial intelligence",
-                "ai",
-                "ml",
-                "deep learning",
-                "llm",
-                "generative ai",
-            ]
-            tech_keywords = ["pytorch", "tensorflow", "ml", "ai"]
             has_ai_focus = (
                 ai_ml_focus
-                or any(
-                    re.search(rf"\b{re.escape(kw)}\b", description, re.IGNORECASE)
-                    for kw in ai_keywords
-                )
-                or any(
-                    any(
-                        re.search(rf"\b{re.escape(kw)}\b", str(t), re.IGNORECASE)
-                        for kw in tech_keywords
-                    )
-                    for t in tech_stack
-                )
+                or _AI_DESCRIPTION_KEYWORDS.contains_any(description)
+                or any(_AI_TECH_KEYWORDS.contains_any(str(t)) for t in tech_stack)
             )
             if has_ai_focus:
                 points += ai_ml_score
@@ -170,6 +170,21 @@ class SkillTaxonomyRepository:
                 (canonical, category, synonyms_csv, implies_csv, parallels_csv, utcnow_iso()),
             )
 
+    def learn(self, canonical: str, synonyms_csv: str, category: Optional[str] = None):
+        """Record a learned term: like ``upsert`` but keeps existing implies/parallels."""
+        with sqlite_connection(self.db_path) as conn:
+            conn.execute(
+                """
+                INSERT INTO skill_taxonomy (canonical, category, synonyms_csv, updated_at)
+                VALUES (?, ?, ?, ?)
+                ON CONFLICT(canonical) DO UPDATE SET
+                    category=excluded.category,
+                    synonyms_csv=excluded.synonyms_csv,
+                    updated_at=excluded.updated_at
+                """,
+                (canonical, category, synonyms_csv, utcnow_iso()),
+            )
+
 
 def _core_seeds():
     now = utcnow_iso()
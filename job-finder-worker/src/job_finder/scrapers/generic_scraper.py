@@ -6,7 +6,7 @@ import re
 import time
 from dataclasses import dataclass
 from datetime import datetime, timezone
-from typing import Any, Dict, List, Optional, Set
+from typing import Any, Dict, List, Optional, Set, Tuple
 from urllib.parse import parse_qs, urlencode, urlparse, urlunparse
 
 import feedparser
@@ -14,6 +14,8 @@ import requests
 from requests.exceptions import InvalidSchema, InvalidURL, MissingSchema, URLRequired
 from bs4 import BeautifulSoup
 
+from job_finder.metrics import HTTP_FETCH_SECONDS, RATE_LIMIT_WAIT_SECONDS, url_host
+from job_finder.tracing import span
 from job_finder.exceptions import (
     ScrapeBlockedError,
     ScrapeAuthError,
@@ -32,9 +34,10 @@ from job_finder.scrapers.text_sanitizer import (
     sanitize_html_description,
     sanitize_title,
 )
-from job_finder.settings import get_fetch_delay_seconds
+from job_finder.settings import get_fetch_burst, get_fetch_delay_seconds, get_host_rate_limits
 from job_finder.utils.date_utils import parse_job_date
-from job_finder.utils.url_utils import AGGREGATOR_HOST_SUBSTRINGS
+from job_finder.utils.rate_limiter import get_rate_limiter
+from job_finder.utils.url_classifier import classify_url
 
 logger = logging.getLogger(__name__)
 
@@ -217,6 +220,54 @@ class PreExtractedJob:
     data: Dict[str, Any]
 
 
+def _host_rate_limit(host: str) -> Tuple[float, int]:
+    """``(requests per second, burst)`` for *host*; a rate of 0 disables pacing.
+
+    Defaults come from ``fetchDelaySeconds`` (one request per delay on
+    average) and ``fetchBurst``; ``hostRateLimits`` overrides both per host.
+    """
+    delay = get_fetch_delay_seconds()
+    rate = 1.0 / delay if delay > 0 else 0.0
+    burst = get_fetch_burst()
+    overrides = get_host_rate_limits()
+    if overrides and host:
+        for domain, limit in overrides.items():
+            if host == domain or host.endswith("." + domain):
+                rate = float(limit.get("requestsPerSecond", rate))
+                burst = int(limit.get("burst", burst))
+                break
+    return rate, burst
+
+
+def _throttle(url: str) -> str:
+    """Wait until *url*'s host may take another request; returns the host key."""
+    host = url_host(url)
+    rate, burst = _host_rate_limit(host)
+    if rate > 0:
+        waited = get_rate_limiter().acquire(host, rate=rate, burst=burst)
+        if waited:
+            RATE_LIMIT_WAIT_SECONDS.observe(waited, scope="http")
+    return host
+
+
+def _http_request(method: str, url: str, **kwargs: Any) -> requests.Response:
+    """``requests.get``/``requests.post`` paced per host, with latency metrics and a trace span."""
+    host = _throttle(url)
+    started = time.perf_counter()
+    outcome = "error"
+    try:
+        with span("http", method=method, host=host):
+            response = (requests.post if method == "POST" else requests.get)(url, **kwargs)
+        outcome = "ok"
+        status_code = getattr(response, "status_code", None)
+        if isinstance(status_code, int):
+            headers = getattr(response, "headers", None) or {}
+            get_rate_limiter().record_response(host, status_code, headers.get("Retry-After"))
+        return response
+    finally:
+        HTTP_FETCH_SECONDS.observe(time.perf_counter() - started, host=host, outcome=outcome)
+
+
 class GenericScraper:
     """
     Generic scraper that works with any job source type.
@@ -468,11 +519,15 @@ class GenericScraper:
         # Make request based on method
         if self.config.method.upper() == "POST":
             headers["Content-Type"] = "application/json"
-            response = requests.post(
-                url, headers=headers, json=self.config.post_body, timeout=self.request_timeout
+            response = _http_request(
+                "POST",
+                url,
+                headers=headers,
+                json=self.config.post_body,
+                timeout=self.request_timeout,
             )
         else:
-            response = requests.get(url, headers=headers, timeout=self.request_timeout)
+            response = _http_request("GET", url, headers=headers, timeout=self.request_timeout)
 
         try:
             response.raise_for_status()
@@ -542,14 +597,13 @@ class GenericScraper:
         limit = self._parse_int_with_default(body.get("limit"), 20)
         offset = self._parse_int_with_default(body.get("offset"), 0)
         max_pages = self.config.max_pages
-        delay = get_fetch_delay_seconds()
 
         for page_num in range(max_pages):
             payload = dict(body)
             payload["offset"] = offset
             payload["limit"] = limit
-            response = requests.post(
-                url, headers=headers, json=payload, timeout=self.request_timeout
+            response = _http_request(
+                "POST", url, headers=headers, json=payload, timeout=self.request_timeout
             )
             try:
                 response.raise_for_status()
@@ -576,10 +630,6 @@ class GenericScraper:
 
             offset += limit
 
-            # Rate-limit between pages
-            if delay > 0 and page_num < max_pages - 1:
-                time.sleep(delay)
-
         if len(results) and len(results) / max(limit, 1) >= max_pages:
             logger.warning(
                 "Pagination hit max_pages=%s for %s; results may be truncated",
@@ -647,7 +697,7 @@ class GenericScraper:
         # Fetch with requests first to get raw content for anti-bot detection
         url = self._get_effective_url()
         headers = {**DEFAULT_HEADERS, **self.config.headers}
-        response = requests.get(url, headers=headers, timeout=self.request_timeout)
+        response = _http_request("GET", url, headers=headers, timeout=self.request_timeout)
         try:
             response.raise_for_status()
         except requests.HTTPError as e:
@@ -752,7 +802,6 @@ class GenericScraper:
 
         results: List[Any] = []
         cursor: Optional[str] = None
-        delay = get_fetch_delay_seconds()
         hit_max_pages = True
         early_stopped = False
         consecutive_known_pages = 0
@@ -829,10 +878,6 @@ class GenericScraper:
                     hit_max_pages = False
                     break
 
-            # Rate-limit between pages
-            if delay > 0 and page_num < self.config.max_pages - 1:
-                time.sleep(delay)
-
         if hit_max_pages and results:
             logger.warning(
                 "Pagination hit max_pages=%s for %s; results may be truncated",
@@ -907,9 +952,11 @@ class GenericScraper:
             body = dict(self.config.post_body or {})
             if cursor_token and self.config.cursor_send_in == "body":
                 body[self.config.pagination_param] = cursor_token
-            response = requests.post(url, headers=headers, json=body, timeout=self.request_timeout)
+            response = _http_request(
+                "POST", url, headers=headers, json=body, timeout=self.request_timeout
+            )
         else:
-            response = requests.get(url, headers=headers, timeout=self.request_timeout)
+            response = _http_request("GET", url, headers=headers, timeout=self.request_timeout)
 
         try:
             response.raise_for_status()
@@ -942,6 +989,7 @@ class GenericScraper:
         headers = {**DEFAULT_HEADERS, **self.config.headers}
 
         if self.config.requires_js:
+            _throttle(url)
             try:
                 result = get_renderer().render(
                     RenderRequest(
@@ -981,7 +1029,7 @@ class GenericScraper:
                 else:
                     raise ScrapeBlockedError(self.config.url, f"Render failed: {exc}") from exc
         else:
-            response = requests.get(url, headers=headers, timeout=self.request_timeout)
+            response = _http_request("GET", url, headers=headers, timeout=self.request_timeout)
             try:
                 response.raise_for_status()
             except requests.HTTPError as e:
@@ -1191,7 +1239,7 @@ class GenericScraper:
              meta tags, <time> elements, CSS selectors, text patterns
 
         Only fills fields that are missing to avoid clobbering list-page data.
-        Applies rate limiting delay after HTTP requests, even on failure.
+        Requests are paced per host by ``_http_request``.
 
         403/404/410 errors are handled gracefully (blocked or stale listings) -
         the job is returned unmodified. Other HTTP errors propagate to allow
@@ -1207,44 +1255,38 @@ class GenericScraper:
         if platform == "workday":
             return self._enrich_workday(job)
 
-        delay = get_fetch_delay_seconds()
-        try:
-            headers = {**DEFAULT_HEADERS, **self.config.headers}
-            response = requests.get(url, headers=headers, timeout=min(self.request_timeout, 15))
+        headers = {**DEFAULT_HEADERS, **self.config.headers}
+        response = _http_request("GET", url, headers=headers, timeout=min(self.request_timeout, 15))
 
-            # Handle inaccessible detail pages gracefully
-            if response.status_code in (403, 404, 410):
-                logger.debug(
-                    "Detail page inaccessible (%d), skipping enrichment: %s",
-                    response.status_code,
-                    url,
-                )
-                return job
+        # Handle inaccessible detail pages gracefully
+        if response.status_code in (403, 404, 410):
+            logger.debug(
+                "Detail page inaccessible (%d), skipping enrichment: %s",
+                response.status_code,
+                url,
+            )
+            return job
 
-            try:
-                response.raise_for_status()
-            except requests.HTTPError as exc:
-                logger.warning(
-                    "Detail page HTTP %d for %s, skipping enrichment: %s",
-                    response.status_code,
-                    url,
-                    exc,
-                )
-                return job
-            soup = BeautifulSoup(response.text, "html.parser")
+        try:
+            response.raise_for_status()
+        except requests.HTTPError as exc:
+            logger.warning(
+                "Detail page HTTP %d for %s, skipping enrichment: %s",
+                response.status_code,
+                url,
+                exc,
+            )
+            return job
+        soup = BeautifulSoup(response.text, "html.parser")
 
-            # Strategy 1: JSON-LD JobPosting schema (most reliable)
-            self._extract_from_jsonld(soup, job)
+        # Strategy 1: JSON-LD JobPosting schema (most reliable)
+        self._extract_from_jsonld(soup, job)
 
-            # Strategy 2-5: If no posted_date yet, try HTML extraction methods
-            if not job.get("posted_date"):
-                html_date = self._extract_posted_date_from_html(soup)
-                if html_date:
-                    job["posted_date"] = html_date
-        finally:
-            # Rate limit after request, even on failure, to avoid overwhelming the source
-            if delay > 0:
-                time.sleep(delay)
+        # Strategy 2-5: If no posted_date yet, try HTML extraction methods
+        if not job.get("posted_date"):
+            html_date = self._extract_posted_date_from_html(soup)
+            if html_date:
+                job["posted_date"] = html_date
 
         return job
 
@@ -1260,19 +1302,15 @@ class GenericScraper:
     def _enrich_smartrecruiters(self, job: Dict[str, Any]) -> Dict[str, Any]:
         """Fetch SmartRecruiters job detail to fill description and metadata."""
         ref_url = job.get("url") or ""
-        delay = get_fetch_delay_seconds()
         try:
-            response = requests.get(
-                ref_url, headers=DEFAULT_HEADERS, timeout=min(self.request_timeout, 15)
+            response = _http_request(
+                "GET", ref_url, headers=DEFAULT_HEADERS, timeout=min(self.request_timeout, 15)
             )
             response.raise_for_status()
             data = response.json()
         except (requests.RequestException, json.JSONDecodeError) as e:
             logger.info("SmartRecruiters detail fetch failed for %s: %s", ref_url, e)
             return job
-        finally:
-            if delay > 0:
-                time.sleep(delay)
 
         ad = (data.get("jobAd") or {}).get("sections") or {}
         desc = ((ad.get("jobDescription") or {}).get("text") or "").strip()
@@ -1362,19 +1400,15 @@ class GenericScraper:
         else:
             human_url = job_url
 
-        delay = get_fetch_delay_seconds()
         try:
-            response = requests.get(
-                detail_url, headers=DEFAULT_HEADERS, timeout=min(self.request_timeout, 15)
+            response = _http_request(
+                "GET", detail_url, headers=DEFAULT_HEADERS, timeout=min(self.request_timeout, 15)
             )
             response.raise_for_status()
             data = response.json()
         except (requests.RequestException, json.JSONDecodeError) as e:
             logger.info("Workday detail fetch failed for %s: %s", detail_url, e)
             return job
-        finally:
-            if delay > 0:
-                time.sleep(delay)
 
         info = data.get("jobPostingInfo") or {}
         desc = (info.get("jobDescription") or "").strip()
@@ -1386,6 +1420,7 @@ class GenericScraper:
             or job.get("location")
         )
         posted = info.get("startDate") or info.get("postedOn")
+        time_type = info.get("timeType")
 
         if desc:
             job["description"] = desc
@@ -1397,6 +1432,8 @@ class GenericScraper:
             job.setdefault("location", location)
         if posted:
             job.setdefault("posted_date", posted)
+        if time_type:
+            job.setdefault("time_type", time_type)
 
         # Extract additional locations for work arrangement inference
         additional_locations = info.get("additionalLocations")
@@ -1461,6 +1498,13 @@ class GenericScraper:
             if not job.get("posted_date") and jp.get("datePosted"):
                 job["posted_date"] = jp.get("datePosted")
 
+            # Structured fields read by extraction's pre-extractor
+            if jp.get("employmentType") and not job.get("employment_type"):
+                job["employment_type"] = jp.get("employmentType")
+            loc_type = jp.get("jobLocationType")
+            if isinstance(loc_type, str) and loc_type.upper() == "TELECOMMUTE":
+                job.setdefault("is_remote", True)
+
             return  # Found and processed JobPosting, done
 
     def _extract_posted_date_from_html(self, soup: BeautifulSoup) -> Optional[str]:
@@ -1916,8 +1960,7 @@ class GenericScraper:
             try:
                 url = url.rstrip(".,;)")
                 parsed = urlparse(url)
-                host = (parsed.hostname or "").lower()
-                if any(agg in host for agg in AGGREGATOR_HOST_SUBSTRINGS):
+                if classify_url(url).aggregator_host:
                     return None
                 if parsed.scheme in ("http", "https") and parsed.netloc:
                     return url
@@ -11,10 +11,11 @@ without hardcoding vendor-specific logic. Each pattern includes:
 New platforms can be added by extending PLATFORM_PATTERNS without code changes.
 """
 
-import re
 from dataclasses import dataclass, field
 from typing import Any, Dict, List, Optional, Tuple
 
+from job_finder.utils.url_classifier import get_url_classifier
+
 
 @dataclass
 class PlatformPattern:
@@ -197,6 +198,8 @@ PLATFORM_PATTERNS: List[PlatformPattern] = [
             "description": "descriptionPlain",
             "url": "hostedUrl",
             "posted_date": "createdAt",
+            "commitment": "categories.commitment",
+            "workplace_type": "workplaceType",
         },
         validation_key="",  # Array response, check for list
     ),
@@ -512,7 +515,7 @@ PLATFORM_PATTERNS: List[PlatformPattern] = [
 ]
 
 
-def match_platform(url: str) -> Optional[Tuple[PlatformPattern, Dict[str, str]]]:
+def match_platform(url: str) -> Optional[Tuple[PlatformPattern, Dict[str, Optional[str]]]]:
     """
     Match a URL against known platform patterns.
 
@@ -520,13 +523,10 @@ def match_platform(url: str) -> Optional[Tuple[PlatformPattern, Dict[str, str]]]
         url: URL to match
 
     Returns:
-        Tuple of (matched pattern, extracted groups) or None
+        Tuple of (matched pattern, extracted groups) or None. Like
+        ``re.Match.groupdict``, groups that did not participate are None.
     """
-    for pattern in PLATFORM_PATTERNS:
-        match = re.search(pattern.url_pattern, url)
-        if match:
-            return pattern, match.groupdict()
-    return None
+    return get_url_classifier().classify(url).platform_match()
 
 
 def is_single_company_platform(url: str) -> bool:
@@ -91,6 +91,29 @@ def get_fetch_delay_seconds(db_path: Optional[str] = None) -> float:
         return 1.0
 
 
+def get_fetch_burst(db_path: Optional[str] = None) -> int:
+    """Get how many back-to-back requests a host may take before pacing (default: 3)."""
+    try:
+        scraping = get_scraping_settings(db_path)
+        return max(1, int(scraping.get("fetchBurst", 3)))
+    except Exception:
+        logger.debug("Using default fetch burst (3) due to missing settings")
+        return 3
+
+
+def get_host_rate_limits(db_path: Optional[str] = None) -> Dict[str, Dict[str, float]]:
+    """Get per-host overrides: ``{host: {"requestsPerSecond": r, "burst": b}}``.
+
+    A host entry also covers its subdomains (``greenhouse.io`` matches
+    ``boards-api.greenhouse.io``).
+    """
+    try:
+        limits = get_scraping_settings(db_path).get("hostRateLimits") or {}
+        return limits if isinstance(limits, dict) else {}
+    except Exception:
+        return {}
+
+
 def get_request_timeout(db_path: Optional[str] = None) -> int:
     """Get per-request HTTP timeout in seconds (default: 30)."""
     try:
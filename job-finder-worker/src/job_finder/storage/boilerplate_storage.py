@@ -0,0 +1,126 @@
+"""SQLite-backed per-company boilerplate shingle fingerprints."""
+
+from __future__ import annotations
+
+import hashlib
+import logging
+import sqlite3
+import threading
+from datetime import datetime, timedelta, timezone
+from typing import Iterable, Optional, Set
+
+from job_finder.ai.compaction import paragraph_shingles
+from job_finder.storage.sqlite_client import sqlite_connection
+
+logger = logging.getLogger(__name__)
+
+# A paragraph counts as boilerplate once seen in this many distinct postings
+DEFAULT_MIN_POSTINGS = 3
+# Fingerprints seen only once are forgotten after this long
+DEFAULT_RETENTION_DAYS = 90
+
+# Retention is enforced every N new postings rather than on every write.
+_PRUNE_EVERY_N_POSTINGS = 200
+
+
+class BoilerplateStore:
+    """Read/write for ``company_boilerplate`` and ``company_boilerplate_postings``.
+
+    Each distinct posting (by description hash) of a company adds one to the
+    count of every paragraph shingle fingerprint in it, so a shingle's count
+    is the number of that company's postings containing it.
+    """
+
+    def __init__(
+        self,
+        db_path: Optional[str] = None,
+        min_postings: int = DEFAULT_MIN_POSTINGS,
+        retention_days: int = DEFAULT_RETENTION_DAYS,
+    ):
+        self.db_path = db_path
+        self.min_postings = min_postings
+        self.retention_days = retention_days
+        self._table_ready = False
+        self._postings_since_prune = 0
+        self._lock = threading.Lock()
+
+    def _ensure_table(self, conn: sqlite3.Connection) -> None:
+        if self._table_ready:
+            return
+        conn.execute("""
+            CREATE TABLE IF NOT EXISTS company_boilerplate (
+                company_key TEXT NOT NULL,
+                fingerprint TEXT NOT NULL,
+                postings INTEGER NOT NULL DEFAULT 0,
+                last_seen_at TEXT NOT NULL,
+                PRIMARY KEY (company_key, fingerprint)
+            )
+            """)
+        conn.execute("""
+            CREATE TABLE IF NOT EXISTS company_boilerplate_postings (
+                company_key TEXT NOT NULL,
+                posting_hash TEXT NOT NULL,
+                seen_at TEXT NOT NULL,
+                PRIMARY KEY (company_key, posting_hash)
+            )
+            """)
+        self._table_ready = True
+
+    def observe(self, company_key: str, description: str, paragraphs: Iterable[str]) -> bool:
+        """Count *paragraphs* for *company_key* once per distinct posting.
+
+        Returns True when the posting was new.
+        """
+        posting_hash = hashlib.sha1(description.encode("utf-8")).hexdigest()[:16]
+        fingerprints = set().union(*map(paragraph_shingles, paragraphs))
+        now = datetime.now(timezone.utc).isoformat()
+        with sqlite_connection(self.db_path) as conn:
+            self._ensure_table(conn)
+            inserted = conn.execute(
+                """
+                INSERT OR IGNORE INTO company_boilerplate_postings
+                  (company_key, posting_hash, seen_at)
+                VALUES (?, ?, ?)
+                """,
+                (company_key, posting_hash, now),
+            ).rowcount
+            if not inserted:
+                return False
+            conn.executemany(
+                """
+                INSERT INTO company_boilerplate (company_key, fingerprint, postings, last_seen_at)
+                VALUES (?, ?, 1, ?)
+                ON CONFLICT(company_key, fingerprint)
+                DO UPDATE SET postings = postings + 1, last_seen_at = excluded.last_seen_at
+                """,
+                [(company_key, fp, now) for fp in sorted(fingerprints)],
+            )
+            with self._lock:
+                self._postings_since_prune += 1
+                prune = self._postings_since_prune >= _PRUNE_EVERY_N_POSTINGS
+                if prune:
+                    self._postings_since_prune = 0
+            if prune:
+                self._prune(conn)
+        return True
+
+    def _prune(self, conn: sqlite3.Connection) -> None:
+        cutoff = (datetime.now(timezone.utc) - timedelta(days=self.retention_days)).isoformat()
+        conn.execute(
+            "DELETE FROM company_boilerplate WHERE postings < ? AND last_seen_at < ?",
+            (self.min_postings, cutoff),
+        )
+        conn.execute("DELETE FROM company_boilerplate_postings WHERE seen_at < ?", (cutoff,))
+
+    def get_boilerplate(self, company_key: str) -> Set[str]:
+        """Fingerprints seen in at least ``min_postings`` of the company's postings."""
+        with sqlite_connection(self.db_path) as conn:
+            self._ensure_table(conn)
+            rows = conn.execute(
+                """
+                SELECT fingerprint FROM company_boilerplate
+                WHERE company_key = ? AND postings >= ?
+                """,
+                (company_key, self.min_postings),
+            ).fetchall()
+        return {row[0] for row in rows}
@@ -0,0 +1,147 @@
+"""Persistent TTL cache for company-enrichment artifacts.
+
+Company enrichment re-runs for the same stub companies over and over (and
+``CompanyInfoFetcher`` runs up to two passes per company). Search API calls
+are paid, Wikipedia/page fetches are slow, and the answers rarely change
+within a few days. This table stores those artifacts keyed by a normalized
+query or URL so repeated enrichments skip the network entirely.
+
+Entries are namespaced (``search``, ``wikipedia``, ``page``) and expire via
+``expires_at``. The cache is strictly best-effort: any SQLite error is logged
+and treated as a miss so enrichment never fails because of it.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import logging
+import re
+import sqlite3
+from datetime import datetime, timedelta, timezone
+from typing import Any, Optional
+
+from job_finder.storage.sqlite_client import sqlite_connection, utcnow_iso
+from job_finder.utils.url_utils import normalize_url
+
+logger = logging.getLogger(__name__)
+
+# Sentinel distinguishing "not cached" from a cached ``None`` (negative result).
+MISSING = object()
+
+# Default TTLs per namespace (seconds).
+SEARCH_TTL_SECONDS = 7 * 24 * 3600
+WIKIPEDIA_TTL_SECONDS = 30 * 24 * 3600
+WIKIPEDIA_NEGATIVE_TTL_SECONDS = 24 * 3600
+PAGE_TTL_SECONDS = 3 * 24 * 3600
+
+
+def normalize_cache_key(value: str) -> str:
+    """Normalize a query or URL so equivalent lookups share an entry.
+
+    URLs go through ``normalize_url`` (paths can be case-sensitive); free-text
+    queries are lowercased with whitespace collapsed.
+    """
+    value = (value or "").strip()
+    if value.lower().startswith(("http://", "https://")):
+        return normalize_url(value)
+    return re.sub(r"\s+", " ", value.lower())
+
+
+def _key_hash(namespace: str, key: str) -> str:
+    return hashlib.sha256(f"{namespace}|{key}".encode()).hexdigest()[:40]
+
+
+class EnrichmentCache:
+    """Read/write for the ``enrichment_cache`` table."""
+
+    def __init__(self, db_path: Optional[str] = None):
+        self.db_path = db_path
+        self._table_ready = False
+
+    def _ensure_table(self, conn: sqlite3.Connection) -> None:
+        if self._table_ready:
+            return
+        conn.execute("""
+            CREATE TABLE IF NOT EXISTS enrichment_cache (
+                key_hash TEXT PRIMARY KEY,
+                namespace TEXT NOT NULL,
+                cache_key TEXT NOT NULL,
+                payload_json TEXT,
+                created_at TEXT NOT NULL,
+                expires_at TEXT NOT NULL
+            )
+            """)
+        conn.execute(
+            "CREATE INDEX IF NOT EXISTS idx_enrichment_cache_expires "
+            "ON enrichment_cache(expires_at)"
+        )
+        self._table_ready = True
+
+    def get(self, namespace: str, key: str) -> Any:
+        """Return the cached payload, or ``MISSING`` when absent/expired."""
+        normalized = normalize_cache_key(key)
+        if not normalized:
+            return MISSING
+        try:
+            with sqlite_connection(self.db_path) as conn:
+                self._ensure_table(conn)
+                row = conn.execute(
+                    "SELECT payload_json FROM enrichment_cache "
+                    "WHERE key_hash = ? AND expires_at > ?",
+                    (_key_hash(namespace, normalized), utcnow_iso()),
+                ).fetchone()
+        except Exception as exc:
+            logger.debug("enrichment_cache read failed (%s/%s): %s", namespace, normalized, exc)
+            return MISSING
+        if row is None:
+            return MISSING
+        try:
+            return json.loads(row["payload_json"]) if row["payload_json"] is not None else None
+        except (TypeError, ValueError):
+            return MISSING
+
+    def set(self, namespace: str, key: str, value: Any, ttl_seconds: int) -> None:
+        """Store *value* (JSON-serializable, ``None`` allowed) for *ttl_seconds*."""
+        normalized = normalize_cache_key(key)
+        if not normalized or ttl_seconds <= 0:
+            return
+        now = datetime.now(timezone.utc)
+        expires = (now + timedelta(seconds=ttl_seconds)).isoformat()
+        try:
+            payload = json.dumps(value) if value is not None else None
+            with sqlite_connection(self.db_path) as conn:
+                self._ensure_table(conn)
+                conn.execute(
+                    """
+                    INSERT OR REPLACE INTO enrichment_cache
+                        (key_hash, namespace, cache_key, payload_json, created_at, expires_at)
+                    VALUES (?, ?, ?, ?, ?, ?)
+                    """,
+                    (
+                        _key_hash(namespace, normalized),
+                        namespace,
+                        normalized[:500],
+                        payload,
+                        now.isoformat(),
+                        expires,
+                    ),
+                )
+        except Exception as exc:
+            logger.debug("enrichment_cache write failed (%s/%s): %s", namespace, normalized, exc)
+
+    def cleanup_expired(self) -> int:
+        """Delete expired entries. Returns the number of deleted rows."""
+        try:
+            with sqlite_connection(self.db_path) as conn:
+                self._ensure_table(conn)
+                cursor = conn.execute(
+                    "DELETE FROM enrichment_cache WHERE expires_at <= ?", (utcnow_iso(),)
+                )
+                deleted = cursor.rowcount
+        except Exception as exc:
+            logger.debug("enrichment_cache cleanup failed: %s", exc)
+            return 0
+        if deleted:
+            logger.info("enrichment_cache cleanup: removed %d expired entries", deleted)
+        return deleted
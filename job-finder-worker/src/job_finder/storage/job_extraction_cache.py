@@ -0,0 +1,250 @@
+"""Persistent store of extraction results keyed by job content.
+
+A job re-queued after a failure, reposted under a new URL, or mirrored on an
+aggregator and the company ATS reaches extraction again with a new queue item
+and listing. The prompt-level ``llm_response_cache`` rarely helps there: the
+user prompt carries today's date, the compacted description depends on the
+company's boilerplate store and the requested field list on what
+pre-extraction settled. This table stores the finished ``JobExtractionResult``
+instead, keyed by the job itself:
+
+- ``fingerprint``: ``compute_content_fingerprint`` (title, company,
+  description prefix) plus the normalized location, so multi-location
+  postings sharing one description keep their own city/timezone
+- ``prompt_version``: ``EXTRACTION_PROMPT_VERSION``, so prompt or schema
+  changes retire old results (``python -m job_finder.extraction_cache_admin``
+  deletes them)
+- ``model``: the model extraction is routed to
+
+The table is capped at ``max_entries`` rows; the least recently used rows are
+evicted first. Like the other caches this is strictly best-effort: SQLite
+errors are logged and treated as misses.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import logging
+import re
+import sqlite3
+import threading
+from typing import Any, Dict, List, Optional, Tuple
+
+from job_finder.metrics import EXTRACTION_CACHE_LOOKUPS
+from job_finder.storage.sqlite_client import sqlite_connection, utcnow_iso
+from job_finder.utils.url_utils import compute_content_fingerprint
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_MAX_ENTRIES = 50_000
+
+# Size cap is enforced every N writes rather than on every insert.
+_PRUNE_EVERY_N_WRITES = 50
+
+_LOCATION_STRIP_RE = re.compile(r"[^a-z0-9]+")
+
+# Process-wide counters (several processors may share one DB).
+_stats: Dict[str, int] = {"hits": 0, "misses": 0, "writes": 0, "evicted": 0}
+_stats_lock = threading.Lock()
+
+
+def _record(event: str, count: int = 1) -> None:
+    if event in ("hits", "misses"):
+        EXTRACTION_CACHE_LOOKUPS.inc(outcome="hit" if event == "hits" else "miss")
+    with _stats_lock:
+        _stats[event] += count
+
+
+def get_extraction_cache_stats() -> Dict[str, int]:
+    """Process-wide extraction-cache counters (exposed in ``/status``)."""
+    with _stats_lock:
+        return dict(_stats)
+
+
+def reset_extraction_cache_stats() -> None:
+    with _stats_lock:
+        for key in _stats:
+            _stats[key] = 0
+
+
+def extraction_fingerprint(
+    title: str, company: str, description: str, location: Optional[str] = None
+) -> str:
+    """Content fingerprint of a job plus its normalized location."""
+    content = compute_content_fingerprint(title or "", company or "", description or "")
+    location_key = _LOCATION_STRIP_RE.sub(" ", (location or "").lower()).strip()
+    if not location_key:
+        return content
+    return hashlib.sha256(f"{content}|{location_key}".encode()).hexdigest()
+
+
+class JobExtractionCache:
+    """Read/write for the ``job_extraction_cache`` table."""
+
+    def __init__(self, db_path: Optional[str] = None, max_entries: int = DEFAULT_MAX_ENTRIES):
+        self.db_path = db_path
+        self.max_entries = max_entries
+        self._table_ready = False
+        self._writes_since_prune = 0
+        self._lock = threading.Lock()
+
+    def _ensure_table(self, conn: sqlite3.Connection) -> None:
+        if self._table_ready:
+            return
+        conn.execute("""
+            CREATE TABLE IF NOT EXISTS job_extraction_cache (
+                fingerprint TEXT NOT NULL,
+                prompt_version TEXT NOT NULL,
+                model TEXT NOT NULL,
+                extraction_json TEXT NOT NULL,
+                response_model TEXT,
+                hit_count INTEGER NOT NULL DEFAULT 0,
+                created_at TEXT NOT NULL,
+                last_used_at TEXT NOT NULL,
+                PRIMARY KEY (fingerprint, prompt_version, model)
+            )
+            """)
+        conn.execute(
+            "CREATE INDEX IF NOT EXISTS idx_job_extraction_cache_last_used "
+            "ON job_extraction_cache(last_used_at)"
+        )
+        conn.execute(
+            "CREATE INDEX IF NOT EXISTS idx_job_extraction_cache_version "
+            "ON job_extraction_cache(prompt_version)"
+        )
+        self._table_ready = True
+
+    def get(self, fingerprint: str, prompt_version: str, model: str) -> Optional[Dict[str, Any]]:
+        """Return the cached extraction dict (``to_dict`` form) or None on miss."""
+        key = (fingerprint, prompt_version, model)
+        try:
+            with sqlite_connection(self.db_path) as conn:
+                self._ensure_table(conn)
+                row = conn.execute(
+                    "SELECT extraction_json FROM job_extraction_cache "
+                    "WHERE fingerprint = ? AND prompt_version = ? AND model = ?",
+                    key,
+                ).fetchone()
+                if row is not None:
+                    conn.execute(
+                        "UPDATE job_extraction_cache "
+                        "SET last_used_at = ?, hit_count = hit_count + 1 "
+                        "WHERE fingerprint = ? AND prompt_version = ? AND model = ?",
+                        (utcnow_iso(), *key),
+                    )
+            extraction = json.loads(row["extraction_json"]) if row is not None else None
+        except Exception as exc:
+            logger.debug("job_extraction_cache read failed: %s", exc)
+            extraction = None
+        _record("hits" if isinstance(extraction, dict) else "misses")
+        return extraction if isinstance(extraction, dict) else None
+
+    def set(
+        self,
+        fingerprint: str,
+        prompt_version: str,
+        model: str,
+        extraction: Dict[str, Any],
+        response_model: Optional[str] = None,
+    ) -> None:
+        """Store an extraction dict (``JobExtractionResult.to_dict``)."""
+        if not fingerprint or not extraction:
+            return
+        now = utcnow_iso()
+        try:
+            with sqlite_connection(self.db_path) as conn:
+                self._ensure_table(conn)
+                conn.execute(
+                    """
+                    INSERT OR REPLACE INTO job_extraction_cache
+                        (fingerprint, prompt_version, model, extraction_json, response_model,
+                         hit_count, created_at, last_used_at)
+                    VALUES (?, ?, ?, ?, ?, 0, ?, ?)
+                    """,
+                    (
+                        fingerprint,
+                        prompt_version,
+                        model,
+                        json.dumps(extraction),
+                        response_model,
+                        now,
+                        now,
+                    ),
+                )
+                with self._lock:
+                    self._writes_since_prune += 1
+                    should_prune = self._writes_since_prune >= _PRUNE_EVERY_N_WRITES
+                    if should_prune:
+                        self._writes_since_prune = 0
+                if should_prune:
+                    self._prune(conn)
+        except Exception as exc:
+            logger.debug("job_extraction_cache write failed: %s", exc)
+            return
+        _record("writes")
+
+    def _prune(self, conn: sqlite3.Connection) -> int:
+        """Evict the least recently used rows beyond ``max_entries``."""
+        count = conn.execute("SELECT COUNT(*) AS n FROM job_extraction_cache").fetchone()["n"]
+        overflow = count - self.max_entries
+        if overflow <= 0:
+            return 0
+        deleted = conn.execute(
+            """
+            DELETE FROM job_extraction_cache WHERE rowid IN (
+                SELECT rowid FROM job_extraction_cache
+                ORDER BY last_used_at ASC
+                LIMIT ?
+            )
+            """,
+            (overflow,),
+        ).rowcount
+        if deleted:
+            _record("evicted", deleted)
+            logger.info("job_extraction_cache prune: evicted %d entries", deleted)
+        return deleted
+
+    def prune(self) -> int:
+        """Enforce the size cap now. Returns the number of evicted rows."""
+        try:
+            with sqlite_connection(self.db_path) as conn:
+                self._ensure_table(conn)
+                return self._prune(conn)
+        except Exception as exc:
+            logger.debug("job_extraction_cache prune failed: %s", exc)
+            return 0
+
+    def versions(self) -> List[Tuple[str, int, int]]:
+        """``(prompt_version, entries, hits)`` per stored prompt version."""
+        with sqlite_connection(self.db_path) as conn:
+            self._ensure_table(conn)
+            rows = conn.execute("""
+                SELECT prompt_version, COUNT(*) AS entries, SUM(hit_count) AS hits
+                  FROM job_extraction_cache
+                 GROUP BY prompt_version
+                 ORDER BY MAX(last_used_at) DESC
+                """).fetchall()
+        return [(row["prompt_version"], row["entries"], row["hits"] or 0) for row in rows]
+
+    def invalidate(
+        self,
+        prompt_versions: Optional[List[str]] = None,
+        keep_version: Optional[str] = None,
+    ) -> int:
+        """Delete entries for *prompt_versions*, or for every version but *keep_version*.
+
+        With neither argument every entry is deleted. Returns the number of
+        deleted rows.
+        """
+        sql = "DELETE FROM job_extraction_cache"
+        params: List[str] = []
+        if prompt_versions:
+            sql += f" WHERE prompt_version IN ({', '.join('?' * len(prompt_versions))})"
+            params.extend(prompt_versions)
+        elif keep_version:
+            sql += " WHERE prompt_version != ?"
+            params.append(keep_version)
+        with sqlite_connection(self.db_path) as conn:
+            self._ensure_table(conn)
+            return conn.execute(sql, params).rowcount
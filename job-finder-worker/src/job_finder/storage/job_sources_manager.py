@@ -4,7 +4,9 @@ from __future__ import annotations
 
 import json
 import logging
-from typing import Any, Dict, List, Optional
+import sqlite3
+import threading
+from typing import Any, Dict, List, Optional, Tuple
 from urllib.parse import urlparse
 from uuid import uuid4
 
@@ -16,6 +18,8 @@ from job_finder.exceptions import (
 from job_finder.job_queue.models import SourceStatus
 from job_finder.storage.sqlite_client import sqlite_connection, utcnow_iso
 from job_finder.utils.company_name_utils import normalize_company_name
+from job_finder.utils.keyword_matcher import KeywordMatcher
+from job_finder.utils.url_classifier import UrlClassification, get_url_classifier
 
 logger = logging.getLogger(__name__)
 
@@ -30,6 +34,117 @@ VALID_SOURCE_TRANSITIONS = {
 }
 
 
+# Mirrors infra/sqlite/migrations/074_job_sources_version.sql (applied lazily).
+_SOURCES_VERSION_DDL = (
+    """
+    CREATE TABLE IF NOT EXISTS table_versions (
+        table_name TEXT PRIMARY KEY,
+        version INTEGER NOT NULL DEFAULT 0
+    )
+    """,
+    "INSERT OR IGNORE INTO table_versions (table_name, version) VALUES ('job_sources', 0)",
+    """
+    CREATE TRIGGER IF NOT EXISTS trg_job_sources_version_insert
+    AFTER INSERT ON job_sources
+    BEGIN
+        UPDATE table_versions SET version = version + 1 WHERE table_name = 'job_sources';
+    END
+    """,
+    """
+    CREATE TRIGGER IF NOT EXISTS trg_job_sources_version_delete
+    AFTER DELETE ON job_sources
+    BEGIN
+        UPDATE table_versions SET version = version + 1 WHERE table_name = 'job_sources';
+    END
+    """,
+    """
+    CREATE TRIGGER IF NOT EXISTS trg_job_sources_version_update
+    AFTER UPDATE OF name, config_json ON job_sources
+    WHEN OLD.name IS NOT NEW.name OR OLD.config_json IS NOT NEW.config_json
+    BEGIN
+        UPDATE table_versions SET version = version + 1 WHERE table_name = 'job_sources';
+    END
+    """,
+)
+
+# Partial company-name matches need this overlap ratio and length
+_PARTIAL_MATCH_RATIO = 0.6
+_PARTIAL_MATCH_MIN_LEN = 4
+
+
+class _SourceIndex:
+    """Lookup tables built from one snapshot of ``job_sources``.
+
+    Holds source ids only; callers re-read the matched row so status and
+    timestamps are never stale. Answers exactly what the old full-table
+    scans did:
+
+    - URL lookup: board tokens and base URLs, in table order, compiled into
+      one substring ``KeywordMatcher``; the earliest-listed key found in the
+      URL wins, as with the old per-row ``in`` checks
+    - company names: normalized source name -> first source, plus every
+      substring of a name that would pass the partial-match threshold, so a
+      query is resolved with dict hits over its own substrings
+    """
+
+    def __init__(self, rows: List[Tuple[str, str, Optional[str]]], version: Optional[int]):
+        self.version = version
+        url_keys: Dict[str, str] = {}
+        self._names: Dict[str, Tuple[int, str]] = {}
+        self._contained: Dict[str, Tuple[int, str]] = {}
+
+        for order, (source_id, name, config_json) in enumerate(rows):
+            try:
+                config = json.loads(config_json) if config_json else {}
+            except json.JSONDecodeError:
+                config = {}
+            if isinstance(config, dict):
+                for key in (config.get("board_token"), config.get("url")):
+                    if isinstance(key, str) and key:
+                        url_keys.setdefault(key.lower(), source_id)
+
+            normalized = normalize_company_name(name or "")
+            if not normalized or normalized in self._names:
+                continue
+            self._names[normalized] = (order, source_id)
+            length = len(normalized)
+            for size in range(_PARTIAL_MATCH_MIN_LEN, length):
+                if size / length < _PARTIAL_MATCH_RATIO:
+                    continue
+                for start in range(length - size + 1):
+                    self._contained.setdefault(normalized[start : start + size], (order, source_id))
+
+        self._url_keys = url_keys
+        self._url_matcher = KeywordMatcher(url_keys, word_boundary=False)
+
+    def source_id_for_url(self, url: str) -> Optional[str]:
+        key = self._url_matcher.first(url.lower())
+        return self._url_keys[key] if key is not None else None
+
+    def source_id_for_company(self, normalized: str) -> Optional[str]:
+        # Exact name match always wins
+        exact = self._names.get(normalized)
+        if exact:
+            return exact[1]
+        # Query inside a longer source name scores len(query), beating any shorter name
+        contained = self._contained.get(normalized)
+        if contained:
+            return contained[1]
+        # Source name inside the query: longest name wins, then table order
+        length = len(normalized)
+        for size in range(length - 1, _PARTIAL_MATCH_MIN_LEN - 1, -1):
+            if size / length < _PARTIAL_MATCH_RATIO:
+                break
+            hits = [
+                self._names[normalized[start : start + size]]
+                for start in range(length - size + 1)
+                if normalized[start : start + size] in self._names
+            ]
+            if hits:
+                return min(hits)[1]
+        return None
+
+
 class JobSourcesManager:
     """Manage the `job_sources` table."""
 
@@ -37,6 +152,10 @@ class JobSourcesManager:
         self.db_path = db_path
         # Cache for aggregator domains (invalidated on add_source with aggregator_domain)
         self._aggregator_domains_cache: Optional[List[str]] = None
+        # URL / company-name index (rebuilt when table_versions.job_sources moves)
+        self._source_index: Optional[_SourceIndex] = None
+        self._source_index_lock = threading.Lock()
+        self._version_tracking_ready = False
 
     def _validate_transition(self, current: SourceStatus, new: SourceStatus) -> None:
         allowed = VALID_SOURCE_TRANSITIONS.get(current, set()) | {current}
@@ -162,6 +281,7 @@ class JobSourcesManager:
         # Invalidate aggregator domains cache if this source has an aggregator_domain
         if aggregator_domain:
             self._aggregator_domains_cache = None
+        self.invalidate_source_index()
 
         logger.info("Added job source %s (%s)", name, source_id)
         if disabled_notes:
@@ -355,23 +475,55 @@ class JobSourcesManager:
     def get_source_for_url(self, url: str) -> Optional[Dict[str, Any]]:
         """
         Simple heuristic: find the first source whose config contains the board token or URL domain.
+
+        Served from the cached source index; only the matched row is read.
         """
-        normalized_url = url.lower()
         with sqlite_connection(self.db_path) as conn:
-            rows = conn.execute("SELECT * FROM job_sources").fetchall()
+            source_id = self._get_source_index(conn).source_id_for_url(url)
+            return self._fetch_source(conn, source_id)
 
-        for row in rows:
-            source = self._row_to_source(dict(row))
-            if not source:
-                continue
-            config = source.get("config") or {}
-            board_token = config.get("board_token") or ""
-            base_url = config.get("url") or ""
-            if board_token and board_token.lower() in normalized_url:
-                return source
-            if base_url and base_url.lower() in normalized_url:
-                return source
-        return None
+    # ------------------------------------------------------------------ #
+    # Source index
+    # ------------------------------------------------------------------ #
+
+    def invalidate_source_index(self) -> None:
+        """Drop the in-memory URL/company-name index (rebuilt on next lookup)."""
+        self._source_index = None
+
+    def _sources_version(self, conn: sqlite3.Connection) -> Optional[int]:
+        """Current job_sources change counter, or None if it cannot be tracked."""
+        try:
+            if not self._version_tracking_ready:
+                for statement in _SOURCES_VERSION_DDL:
+                    conn.execute(statement)
+                self._version_tracking_ready = True
+            row = conn.execute(
+                "SELECT version FROM table_versions WHERE table_name = 'job_sources'"
+            ).fetchone()
+        except sqlite3.Error as exc:
+            logger.debug("job_sources version tracking unavailable: %s", exc)
+            return None
+        return row[0] if row else None
+
+    def _get_source_index(self, conn: sqlite3.Connection) -> _SourceIndex:
+        version = self._sources_version(conn)
+        with self._source_index_lock:
+            index = self._source_index
+            if index is not None and version is not None and index.version == version:
+                return index
+            rows = conn.execute("SELECT id, name, config_json FROM job_sources").fetchall()
+            index = _SourceIndex([tuple(row) for row in rows], version)
+            # Without version tracking the index cannot be trusted across calls.
+            self._source_index = index if version is not None else None
+            return index
+
+    def _fetch_source(
+        self, conn: sqlite3.Connection, source_id: Optional[str]
+    ) -> Optional[Dict[str, Any]]:
+        if not source_id:
+            return None
+        row = conn.execute("SELECT * FROM job_sources WHERE id = ?", (source_id,)).fetchone()
+        return self._row_to_source(dict(row)) if row else None
 
     # ------------------------------------------------------------------ #
     # Updates
@@ -548,6 +700,7 @@ class JobSourcesManager:
                 (SourceStatus.DISABLED.value, json.dumps(config), now, source_id),
             )
 
+        self.invalidate_source_index()
         logger.info("Disabled source %s: %s", source_id, reason)
 
     def disable_source_with_tags(
@@ -607,6 +760,7 @@ class JobSourcesManager:
                 (SourceStatus.DISABLED.value, json.dumps(config), now, source_id),
             )
 
+        self.invalidate_source_index()
         logger.info("Disabled source %s: %s (tags=%s)", source_id, reason, tags)
 
     def update_config(self, source_id: str, config: Dict[str, Any]) -> None:
@@ -622,6 +776,7 @@ class JobSourcesManager:
             )
             if updated.rowcount == 0:
                 raise StorageError(f"Source {source_id} not found")
+        self.invalidate_source_index()
 
     def update_company_link(self, source_id: str, company_id: str) -> bool:
         """
@@ -764,21 +919,9 @@ class JobSourcesManager:
             return False
 
         try:
-            parsed = urlparse(url.lower())
-            netloc = parsed.netloc
-
-            if not netloc:
-                return False
-
-            # Check against database-driven aggregator domains
-            aggregator_domains = self.get_aggregator_domains()
-            for domain in aggregator_domains:
-                if netloc == domain or netloc.endswith("." + domain):
-                    return True
-
-            return False
+            return self.classify_url(url).is_job_board
         except Exception as e:
-            logger.warning("URL parsing failed in is_job_board_url for '%s': %s", url, e)
+            logger.warning("URL classification failed in is_job_board_url for '%s': %s", url, e)
             return False
 
     def get_aggregator_domain_for_url(self, url: str) -> Optional[str]:
@@ -797,21 +940,18 @@ class JobSourcesManager:
             return None
 
         try:
-            parsed = urlparse(url.lower())
-            netloc = parsed.netloc
-
-            if not netloc:
-                return None
-
-            aggregator_domains = self.get_aggregator_domains()
-            for domain in aggregator_domains:
-                if netloc == domain or netloc.endswith("." + domain):
-                    return domain
-
-            return None
+            return self.classify_url(url).aggregator_domain
         except Exception:
             return None
 
+    def classify_url(self, url: Optional[str]) -> UrlClassification:
+        """Classify a URL against this database's aggregator domains.
+
+        Returns the shared ``UrlClassifier`` result (job-board domain,
+        platform pattern, ATS/excluded flags) in one lookup.
+        """
+        return get_url_classifier(self.get_aggregator_domains()).classify(url)
+
     # ------------------------------------------------------------------ #
     # Company Resolution
     # ------------------------------------------------------------------ #
@@ -912,34 +1052,9 @@ class JobSourcesManager:
         if not normalized:
             return None
 
+        # Exact name first, then the best partial match scored like
+        # _compute_partial_match_score (>= 60% overlap, at least 4 chars),
+        # resolved against the precomputed index instead of every row.
         with sqlite_connection(self.db_path) as conn:
-            rows = conn.execute("SELECT * FROM job_sources").fetchall()
-
-        best_match = None
-        best_match_score = 0
-
-        for row in rows:
-            source = self._row_to_source(dict(row))
-            if not source:
-                continue
-
-            source_name = source.get("name", "")
-            # Normalize source name for comparison: "Coinbase Jobs" -> "coinbase"
-            source_normalized = normalize_company_name(source_name)
-
-            # Exact match on source base name
-            if normalized == source_normalized:
-                return source
-
-            # Partial match scoring: prefer longer matches
-            score = self._compute_partial_match_score(normalized, source_normalized)
-
-            if score > best_match_score:
-                best_match = source
-                best_match_score = score
-
-        # Only return partial matches if they're significant (at least 4 chars matched)
-        if best_match and best_match_score >= 4:
-            return best_match
-
-        return None
+            source_id = self._get_source_index(conn).source_id_for_company(normalized)
+            return self._fetch_source(conn, source_id)
@@ -0,0 +1,180 @@
+"""Persistent prompt-level cache for LLM responses.
+
+Re-processed queue items, retries after transient errors, manual re-analysis
+and near-duplicate listings all send byte-identical requests to LiteLLM.
+For low-temperature tasks the answer is effectively deterministic, so the
+response can be served from SQLite instead of paying for another call.
+
+Entries are keyed by a hash of the normalized request (model, system prompt,
+prompt, temperature, max_tokens, response_format), expire via ``expires_at``
+and the table is capped at ``max_entries`` rows (oldest evicted first). Like
+the enrichment cache this is strictly best-effort: SQLite errors are logged
+and treated as misses.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import logging
+import sqlite3
+import threading
+from datetime import datetime, timedelta, timezone
+from typing import Optional, Tuple
+
+from job_finder.storage.sqlite_client import sqlite_connection, utcnow_iso
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_MAX_ENTRIES = 20_000
+
+# Size cap is enforced every N writes rather than on every insert.
+_PRUNE_EVERY_N_WRITES = 50
+
+
+def make_request_key(
+    model: str,
+    prompt: str,
+    system_prompt: Optional[str] = None,
+    temperature: float = 0.0,
+    max_tokens: int = 0,
+    response_format: Optional[str] = None,
+) -> str:
+    """Hash a normalized chat request into a cache key."""
+    payload = json.dumps(
+        {
+            "model": model,
+            "system": (system_prompt or "").strip(),
+            "prompt": (prompt or "").strip(),
+            "temperature": round(float(temperature), 3),
+            "max_tokens": int(max_tokens),
+            "response_format": response_format or "",
+        },
+        sort_keys=True,
+        ensure_ascii=False,
+    )
+    return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+
+class LLMResponseCache:
+    """Read/write for the ``llm_response_cache`` table."""
+
+    def __init__(self, db_path: Optional[str] = None, max_entries: int = DEFAULT_MAX_ENTRIES):
+        self.db_path = db_path
+        self.max_entries = max_entries
+        self._table_ready = False
+        self._writes_since_prune = 0
+        self._lock = threading.Lock()
+
+    def _ensure_table(self, conn: sqlite3.Connection) -> None:
+        if self._table_ready:
+            return
+        conn.execute("""
+            CREATE TABLE IF NOT EXISTS llm_response_cache (
+                key_hash TEXT PRIMARY KEY,
+                task_type TEXT NOT NULL,
+                model TEXT NOT NULL,
+                response_text TEXT NOT NULL,
+                response_model TEXT,
+                created_at TEXT NOT NULL,
+                expires_at TEXT NOT NULL
+            )
+            """)
+        conn.execute(
+            "CREATE INDEX IF NOT EXISTS idx_llm_response_cache_created "
+            "ON llm_response_cache(created_at)"
+        )
+        self._table_ready = True
+
+    def get(self, key: str) -> Optional[Tuple[str, Optional[str]]]:
+        """Return ``(response_text, response_model)`` or None on miss/expiry."""
+        try:
+            with sqlite_connection(self.db_path) as conn:
+                self._ensure_table(conn)
+                row = conn.execute(
+                    "SELECT response_text, response_model FROM llm_response_cache "
+                    "WHERE key_hash = ? AND expires_at > ?",
+                    (key, utcnow_iso()),
+                ).fetchone()
+        except Exception as exc:
+            logger.debug("llm_response_cache read failed: %s", exc)
+            return None
+        if row is None:
+            return None
+        return row["response_text"], row["response_model"]
+
+    def set(
+        self,
+        key: str,
+        task_type: str,
+        model: str,
+        response_text: str,
+        response_model: Optional[str],
+        ttl_seconds: int,
+    ) -> None:
+        """Store a response for *ttl_seconds*. Empty responses are not cached."""
+        if not response_text or ttl_seconds <= 0:
+            return
+        now = datetime.now(timezone.utc)
+        expires = (now + timedelta(seconds=ttl_seconds)).isoformat()
+        try:
+            with sqlite_connection(self.db_path) as conn:
+                self._ensure_table(conn)
+                conn.execute(
+                    """
+                    INSERT OR REPLACE INTO llm_response_cache
+                        (key_hash, task_type, model, response_text, response_model,
+                         created_at, expires_at)
+                    VALUES (?, ?, ?, ?, ?, ?, ?)
+                    """,
+                    (
+                        key,
+                        task_type,
+                        model,
+                        response_text,
+                        response_model,
+                        now.isoformat(),
+                        expires,
+                    ),
+                )
+                with self._lock:
+                    self._writes_since_prune += 1
+                    should_prune = self._writes_since_prune >= _PRUNE_EVERY_N_WRITES
+                    if should_prune:
+                        self._writes_since_prune = 0
+                if should_prune:
+                    self._prune(conn)
+        except Exception as exc:
+            logger.debug("llm_response_cache write failed: %s", exc)
+
+    def _prune(self, conn: sqlite3.Connection) -> int:
+        """Drop expired rows, then the oldest rows beyond ``max_entries``."""
+        deleted = conn.execute(
+            "DELETE FROM llm_response_cache WHERE expires_at <= ?", (utcnow_iso(),)
+        ).rowcount
+        count = conn.execute("SELECT COUNT(*) AS n FROM llm_response_cache").fetchone()["n"]
+        overflow = count - self.max_entries
+        if overflow > 0:
+            deleted += conn.execute(
+                """
+                DELETE FROM llm_response_cache WHERE key_hash IN (
+                    SELECT key_hash FROM llm_response_cache
+                    ORDER BY created_at ASC
+                    LIMIT ?
+                )
+                """,
+                (overflow,),
+            ).rowcount
+        if deleted:
+            logger.info("llm_response_cache prune: removed %d entries", deleted)
+        return deleted
+
+    def prune(self) -> int:
+        """Enforce TTL and size cap now. Returns the number of deleted rows."""
+        try:
+            with sqlite_connection(self.db_path) as conn:
+                self._ensure_table(conn)
+                return self._prune(conn)
+        except Exception as exc:
+            logger.debug("llm_response_cache prune failed: %s", exc)
+            return 0
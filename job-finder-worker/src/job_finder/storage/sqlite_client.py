@@ -3,13 +3,18 @@
 from __future__ import annotations
 
 import os
+import re
 import sqlite3
+import time
 from contextlib import contextmanager
 from datetime import datetime, timezone
+from functools import lru_cache
 from pathlib import Path
 from typing import Iterator, Optional
 
 from job_finder.exceptions import ConfigurationError
+from job_finder.metrics import SQLITE_QUERY_SECONDS
+from job_finder.tracing import record as record_span_totals
 
 
 def utcnow_iso() -> str:
@@ -45,10 +50,78 @@ def resolve_db_path(db_path: Optional[str] = None) -> Path:
     return resolved
 
 
+_STATEMENT_RE = re.compile(
+    r"^\s*(?:WITH\b.*?\)\s*)?(\w+)(?:.*?\b(?:FROM|INTO|UPDATE|TABLE|INDEX|ON)\s+"
+    r"(?:IF\s+(?:NOT\s+)?EXISTS\s+)?[\"`\[]?(\w+))?",
+    re.IGNORECASE | re.DOTALL,
+)
+
+_UPDATE_RE = re.compile(r"\s*UPDATE\s+(?:OR\s+\w+\s+)?[\"`\[]?(\w+)", re.IGNORECASE)
+
+
+@lru_cache(maxsize=1024)
+def statement_family(sql: str) -> str:
+    """Low-cardinality label for *sql*: verb plus first table (``select job_queue``)."""
+    if sql.lstrip()[:6].upper() == "UPDATE":
+        match = _UPDATE_RE.match(sql)
+        return f"update {match.group(1).lower()}" if match else "update"
+    match = _STATEMENT_RE.match(sql)
+    if not match:
+        return "other"
+    verb = match.group(1).lower()
+    if verb == "pragma":
+        return verb
+    return f"{verb} {match.group(2).lower()}" if match.group(2) else verb
+
+
+def _observe(sql: str, seconds: float) -> None:
+    family = statement_family(sql)
+    SQLITE_QUERY_SECONDS.observe(seconds, family=family)
+    record_span_totals("sqlite", family, seconds)
+
+
+class _TimedCursor(sqlite3.Cursor):
+    """Cursor that records statement latency (``SQLITE_QUERY_SECONDS`` and trace totals)."""
+
+    def execute(self, sql, parameters=(), /):
+        started = time.perf_counter()
+        try:
+            return super().execute(sql, parameters)
+        finally:
+            _observe(sql, time.perf_counter() - started)
+
+    def executemany(self, sql, seq_of_parameters, /):
+        started = time.perf_counter()
+        try:
+            return super().executemany(sql, seq_of_parameters)
+        finally:
+            _observe(sql, time.perf_counter() - started)
+
+
+class _TimedConnection(sqlite3.Connection):
+    """Connection whose ``execute``/``cursor`` go through ``_TimedCursor``.
+
+    Timing covers statement execution up to the first row; rows fetched
+    afterwards are not included.
+    """
+
+    def cursor(self, factory=_TimedCursor):
+        return super().cursor(factory)
+
+    def execute(self, sql, parameters=(), /):
+        return self.cursor().execute(sql, parameters)
+
+    def executemany(self, sql, seq_of_parameters, /):
+        return self.cursor().executemany(sql, seq_of_parameters)
+
+
 def _create_connection(resolved_path: Path) -> sqlite3.Connection:
     """Create a configured sqlite3 connection."""
     conn = sqlite3.connect(
-        resolved_path, detect_types=sqlite3.PARSE_DECLTYPES, check_same_thread=False
+        resolved_path,
+        detect_types=sqlite3.PARSE_DECLTYPES,
+        check_same_thread=False,
+        factory=_TimedConnection,
     )
     conn.row_factory = sqlite3.Row
     conn.execute("PRAGMA foreign_keys = ON;")
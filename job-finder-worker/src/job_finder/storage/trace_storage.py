@@ -0,0 +1,108 @@
+"""SQLite-backed storage for per-queue-item span traces."""
+
+from __future__ import annotations
+
+import json
+import logging
+import sqlite3
+import threading
+from datetime import datetime, timedelta, timezone
+from typing import Any, Dict, List, Optional
+
+from job_finder.storage.sqlite_client import sqlite_connection
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_RETENTION_DAYS = 14
+
+# Retention is enforced every N writes rather than on every insert.
+_PRUNE_EVERY_N_WRITES = 100
+
+
+class TraceStorage:
+    """Read/write for the ``queue_item_traces`` table (one row per traced attempt)."""
+
+    def __init__(self, db_path: Optional[str] = None, retention_days: int = DEFAULT_RETENTION_DAYS):
+        self.db_path = db_path
+        self.retention_days = retention_days
+        self._table_ready = False
+        self._writes_since_prune = 0
+        self._lock = threading.Lock()
+
+    def _ensure_table(self, conn: sqlite3.Connection) -> None:
+        if self._table_ready:
+            return
+        conn.execute("""
+            CREATE TABLE IF NOT EXISTS queue_item_traces (
+                id INTEGER PRIMARY KEY AUTOINCREMENT,
+                queue_item_id TEXT NOT NULL,
+                item_type TEXT NOT NULL,
+                duration_ms REAL NOT NULL,
+                span_count INTEGER NOT NULL,
+                trace_json TEXT NOT NULL,
+                created_at TEXT NOT NULL
+            )
+            """)
+        conn.execute(
+            "CREATE INDEX IF NOT EXISTS idx_queue_item_traces_item "
+            "ON queue_item_traces(queue_item_id)"
+        )
+        conn.execute(
+            "CREATE INDEX IF NOT EXISTS idx_queue_item_traces_created "
+            "ON queue_item_traces(created_at)"
+        )
+        self._table_ready = True
+
+    def save(self, item_id: str, item_type: str, started_at: str, trace: Dict[str, Any]) -> None:
+        """Store one finished trace (the root span dict from ``Tracer``)."""
+        with sqlite_connection(self.db_path) as conn:
+            self._ensure_table(conn)
+            conn.execute(
+                """
+                INSERT INTO queue_item_traces
+                  (queue_item_id, item_type, duration_ms, span_count, trace_json, created_at)
+                VALUES (?, ?, ?, ?, ?, ?)
+                """,
+                (
+                    item_id,
+                    item_type,
+                    trace.get("duration_ms", 0.0),
+                    trace.get("span_count", 1),
+                    json.dumps(trace, separators=(",", ":"), default=str),
+                    started_at,
+                ),
+            )
+            with self._lock:
+                self._writes_since_prune += 1
+                prune = self._writes_since_prune >= _PRUNE_EVERY_N_WRITES
+                if prune:
+                    self._writes_since_prune = 0
+            if prune:
+                cutoff = datetime.now(timezone.utc) - timedelta(days=self.retention_days)
+                conn.execute(
+                    "DELETE FROM queue_item_traces WHERE created_at < ?", (cutoff.isoformat(),)
+                )
+
+    def get_traces(self, item_id: str, limit: int = 10) -> List[Dict[str, Any]]:
+        """Traces for *item_id*, newest attempt first."""
+        with sqlite_connection(self.db_path) as conn:
+            self._ensure_table(conn)
+            rows = conn.execute(
+                """
+                SELECT item_type, duration_ms, trace_json, created_at
+                FROM queue_item_traces
+                WHERE queue_item_id = ?
+                ORDER BY id DESC
+                LIMIT ?
+                """,
+                (item_id, limit),
+            ).fetchall()
+        return [
+            {
+                "item_type": row["item_type"],
+                "duration_ms": row["duration_ms"],
+                "started_at": row["created_at"],
+                "trace": json.loads(row["trace_json"]),
+            }
+            for row in rows
+        ]
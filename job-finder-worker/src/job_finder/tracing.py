@@ -0,0 +1,258 @@
+"""Lightweight per-queue-item span tracing.
+
+``/metrics`` says where wall time goes across all items; a trace says where
+it went for one item. ``QueueItemProcessor`` opens a root span per sampled
+queue item (``Tracer.trace_item``) and the layers below add child spans:
+pipeline stages, LLM calls, scraper HTTP fetches, company enrichment,
+search API calls, Playwright renders and event emission.
+
+The active span lives in a ``ContextVar``, so it follows the item through
+the processor, ``InferenceClient``, the storage managers and the scrapers
+without threading a parameter through every signature. Code running outside
+a sampled item (or in a thread pool the item hands work to) sees no active
+span and every call here is a no-op.
+
+High-volume operations are aggregated instead of getting a span each:
+``record("sqlite", "select job_queue", seconds)`` adds to per-span
+``{count, seconds}`` totals. Traces are capped at ``MAX_SPANS`` spans; later
+spans only count toward ``dropped_spans``.
+
+Finished traces are stored compactly by ``TraceStorage`` and served at
+``/trace/<item_id>``.
+"""
+
+from __future__ import annotations
+
+import functools
+import hashlib
+import logging
+import time
+from contextvars import ContextVar, Token
+from datetime import datetime, timezone
+from typing import TYPE_CHECKING, Any, Dict, List, Optional
+
+if TYPE_CHECKING:  # pragma: no cover
+    from job_finder.storage.trace_storage import TraceStorage
+
+logger = logging.getLogger(__name__)
+
+MAX_SPANS = 500
+_MAX_ERROR_LENGTH = 300
+
+_current_span: ContextVar[Optional["Span"]] = ContextVar("job_finder_span", default=None)
+
+
+class _TraceState:
+    __slots__ = ("origin", "span_count", "dropped")
+
+    def __init__(self) -> None:
+        self.origin = time.perf_counter()
+        self.span_count = 1
+        self.dropped = 0
+
+
+class Span:
+    """One timed operation; children and aggregated totals hang off it."""
+
+    __slots__ = ("name", "attrs", "start", "duration", "children", "totals", "error", "_trace")
+
+    def __init__(self, name: str, attrs: Dict[str, Any], trace: _TraceState):
+        self.name = name
+        self.attrs = attrs
+        self.start = time.perf_counter()
+        self.duration: Optional[float] = None
+        self.children: List[Span] = []
+        self.totals: Dict[str, List[float]] = {}
+        self.error: Optional[str] = None
+        self._trace = trace
+
+    def set(self, **attrs: Any) -> None:
+        """Attach attributes discovered while the span is open."""
+        self.attrs.update(attrs)
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Compact form: offsets/durations in ms relative to the trace start."""
+        data: Dict[str, Any] = {
+            "name": self.name,
+            "start_ms": round((self.start - self._trace.origin) * 1000, 1),
+            "duration_ms": round((self.duration or 0.0) * 1000, 1),
+        }
+        if self.attrs:
+            data["attrs"] = self.attrs
+        if self.error:
+            data["error"] = self.error
+        if self.totals:
+            data["totals"] = {
+                key: {"count": int(count), "ms": round(seconds * 1000, 1)}
+                for key, (count, seconds) in sorted(self.totals.items())
+            }
+        if self.children:
+            data["children"] = [child.to_dict() for child in self.children]
+        return data
+
+
+class _SpanScope:
+    """Context manager returned by ``span()``; binds the span as current."""
+
+    __slots__ = ("span", "_token")
+
+    def __init__(self, span: Span):
+        self.span = span
+        self._token: Optional[Token[Optional[Span]]] = None
+
+    def __enter__(self) -> Span:
+        self._token = _current_span.set(self.span)
+        return self.span
+
+    def __exit__(self, exc_type, exc, tb) -> None:
+        self.span.duration = time.perf_counter() - self.span.start
+        if exc is not None:
+            self.span.error = f"{exc_type.__name__}: {exc}"[:_MAX_ERROR_LENGTH]
+        if self._token is not None:
+            _current_span.reset(self._token)
+
+
+class _NullScope:
+    __slots__ = ()
+
+    def __enter__(self) -> None:
+        return None
+
+    def __exit__(self, exc_type, exc, tb) -> None:
+        return None
+
+
+_NULL_SCOPE = _NullScope()
+
+
+def current_span() -> Optional[Span]:
+    return _current_span.get()
+
+
+def span(name: str, **attrs: Any):
+    """Open a child of the current span (``with span("llm", model=m):``).
+
+    Yields the ``Span`` (or None when nothing is being traced).
+    """
+    parent = _current_span.get()
+    if parent is None:
+        return _NULL_SCOPE
+    trace = parent._trace
+    if trace.span_count >= MAX_SPANS:
+        trace.dropped += 1
+        return _NULL_SCOPE
+    trace.span_count += 1
+    child = Span(name, attrs, trace)
+    parent.children.append(child)
+    return _SpanScope(child)
+
+
+def traced(name: str, **attrs: Any):
+    """Decorator form of ``span(name, **attrs)``."""
+
+    def decorator(func):
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs):
+            with span(name, **attrs):
+                return func(*args, **kwargs)
+
+        return wrapper
+
+    return decorator
+
+
+def record(kind: str, label: str, seconds: float) -> None:
+    """Add one operation to the current span's ``kind:label`` totals."""
+    parent = _current_span.get()
+    if parent is None:
+        return
+    key = f"{kind}:{label}"
+    totals = parent.totals.get(key)
+    if totals is None:
+        parent.totals[key] = [1, seconds]
+    else:
+        totals[0] += 1
+        totals[1] += seconds
+
+
+def is_sampled(item_id: str, sample_rate: float) -> bool:
+    """Deterministic per-item sampling, so every attempt of an item agrees."""
+    if sample_rate >= 1.0:
+        return True
+    if sample_rate <= 0.0:
+        return False
+    bucket = int(hashlib.sha1(item_id.encode("utf-8")).hexdigest()[:8], 16)
+    return bucket / 0xFFFFFFFF < sample_rate
+
+
+class _ItemTrace:
+    """Context manager for one queue item's root span (see ``Tracer.trace_item``)."""
+
+    def __init__(self, tracer: "Tracer", item_id: str, item_type: str):
+        self._tracer = tracer
+        self._item_id = item_id
+        self._item_type = item_type
+        self._scope: Optional[_SpanScope] = None
+        self._started_at = ""
+
+    def __enter__(self) -> Optional[Span]:
+        if _current_span.get() is not None:
+            return None  # nested item (inline processing): stays part of the outer trace
+        if not is_sampled(self._item_id, self._tracer.sample_rate):
+            return None
+        self._started_at = datetime.now(timezone.utc).isoformat()
+        root = Span(f"item:{self._item_type}", {"item_id": self._item_id}, _TraceState())
+        self._scope = _SpanScope(root)
+        return self._scope.__enter__()
+
+    def __exit__(self, exc_type, exc, tb) -> None:
+        if self._scope is None:
+            return None
+        self._scope.__exit__(exc_type, exc, tb)
+        self._tracer._finish(self._item_id, self._item_type, self._started_at, self._scope.span)
+        return None
+
+
+class Tracer:
+    """Samples queue items and persists their span trees."""
+
+    def __init__(self, storage: Optional["TraceStorage"] = None, sample_rate: float = 0.1):
+        self.storage = storage
+        self.sample_rate = sample_rate
+
+    def trace_item(self, item_id: str, item_type: str) -> _ItemTrace:
+        """``with tracer.trace_item(item.id, "job"):`` around one item's processing."""
+        return _ItemTrace(self, item_id, item_type)
+
+    def _finish(self, item_id: str, item_type: str, started_at: str, root: Span) -> None:
+        trace = root._trace
+        payload = root.to_dict()
+        payload["span_count"] = trace.span_count
+        if trace.dropped:
+            payload["dropped_spans"] = trace.dropped
+        if self.storage is None:
+            return
+        try:
+            self.storage.save(item_id, item_type, started_at, payload)
+        except Exception as exc:
+            logger.warning("Failed to store trace for %s: %s", item_id, exc)
+
+
+def render_trace_text(trace: Dict[str, Any]) -> str:
+    """Indented text tree of a stored trace (``/trace/<id>?format=text``)."""
+    lines: List[str] = []
+
+    def walk(node: Dict[str, Any], depth: int) -> None:
+        attrs = " ".join(f"{k}={v}" for k, v in (node.get("attrs") or {}).items())
+        error = f" ERROR {node['error']}" if node.get("error") else ""
+        lines.append(
+            f"{'  ' * depth}{node['name']} {node['duration_ms']:.1f}ms "
+            f"@+{node['start_ms']:.1f}ms {attrs}".rstrip() + error
+        )
+        for key, total in (node.get("totals") or {}).items():
+            lines.append(f"{'  ' * (depth + 1)}[{key}] x{total['count']} {total['ms']:.1f}ms")
+        for child in node.get("children") or []:
+            walk(child, depth + 1)
+
+    walk(trace, 0)
+    return "\n".join(lines) + "\n"
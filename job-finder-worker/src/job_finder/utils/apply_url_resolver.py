@@ -16,43 +16,15 @@ from dataclasses import dataclass
 from typing import Any, Dict, List, Optional
 from urllib.parse import urlparse
 
-from job_finder.utils.url_utils import (
-    AGGREGATOR_HOST_SUBSTRINGS,
+from job_finder.utils.url_classifier import classify_url
+from job_finder.utils.url_utils import (  # noqa: F401 - ATS/EXCLUDED_DOMAINS re-exported
+    ATS_DOMAINS,
+    EXCLUDED_DOMAINS,
     derive_apply_url,
 )
 
 logger = logging.getLogger(__name__)
 
-# ATS domains that strongly indicate a real application page
-ATS_DOMAINS = (
-    "greenhouse.io",
-    "lever.co",
-    "ashbyhq.com",
-    "workable.com",
-    "myworkdayjobs.com",
-    "smartrecruiters.com",
-    "recruitee.com",
-    "breezy.hr",
-    "bamboohr.com",
-    "icims.com",
-    "jobvite.com",
-    "applytojob.com",
-    "dover.com",
-    "rippling.com",
-)
-
-# Domains to exclude from search results (aggregators / generic boards)
-EXCLUDED_DOMAINS = (
-    "linkedin.com",
-    "indeed.com",
-    "glassdoor.com",
-    "ziprecruiter.com",
-    "monster.com",
-    "dice.com",
-    "careerbuilder.com",
-    *AGGREGATOR_HOST_SUBSTRINGS,
-)
-
 # Path tokens that suggest a job/careers page
 _CAREER_PATH_TOKENS = ("/jobs/", "/careers/", "/openings/", "/position/", "/vacancies/")
 
@@ -84,10 +56,10 @@ def _is_valid_apply_url(url: str) -> bool:
         parsed = urlparse(url)
         if parsed.scheme not in ("http", "https"):
             return False
-        url_host = (parsed.hostname or "").lower()
-        if any(agg in url_host for agg in AGGREGATOR_HOST_SUBSTRINGS):
+        classification = classify_url(url)
+        if classification.aggregator_host:
             return False
-        return bool(url_host)
+        return bool(classification.host)
     except Exception:
         return False
 
@@ -127,17 +99,17 @@ def _score_search_result(url: str, title: str, snippet: str, company_slug: str)
     except Exception:
         return -1
 
-    host = (parsed.hostname or "").lower()
     path = (parsed.path or "").lower()
+    classification = classify_url(url)
 
     # Exclude aggregator / generic job board domains
-    if any(excl in host for excl in EXCLUDED_DOMAINS):
+    if classification.excluded:
         return -1
 
     score = 0
 
     # ATS domain bonus
-    if any(ats in host for ats in ATS_DOMAINS):
+    if classification.ats_domain:
         score += 2
 
     # Career/job path tokens
@@ -1,9 +1,27 @@
-"""Date parsing and scoring utilities for job postings."""
+"""Date parsing and scoring utilities for job postings.
 
+``parse_job_date`` runs on every intake job (prefilter freshness) and in
+the generic scraper, so it tries cheap, strict formats before dateutil:
+
+1. keywords ("today", "yesterday")
+2. ISO 8601 / RFC 3339 via ``datetime.fromisoformat``
+3. epoch seconds / milliseconds (10 or 13 digits)
+4. RFC 2822 via ``email.utils`` (numeric, GMT or UTC zones only)
+5. relative phrases ("2 days ago")
+6. ``dateutil.parser`` as the last resort
+
+Absolute results are memoized (bounded, reset daily because dateutil fills
+missing fields from today's date) and every call is counted per tier in a
+process-wide histogram (``get_date_parse_stats``).
+"""
+
+import email.utils
 import logging
 import re
-from datetime import datetime, timedelta, timezone
-from typing import Optional
+import threading
+from collections import OrderedDict
+from datetime import date, datetime, timedelta, timezone
+from typing import Dict, Optional, Tuple
 
 import dateutil.parser
 
@@ -14,6 +32,159 @@ logger = logging.getLogger(__name__)
 # Dates before this threshold are treated as missing/invalid.
 _MIN_VALID_DATE = datetime(2000, 1, 1, tzinfo=timezone.utc)
 
+_ISO_RE = re.compile(
+    r"(?P<date>\d{4}-\d{2}-\d{2})"
+    r"(?:[T ](?P<time>\d{2}:\d{2}(?::\d{2})?)(?:\.(?P<frac>\d+))?)?"
+    r"(?P<tz>Z|[+-]\d{2}(?::?\d{2})?)?",
+    re.IGNORECASE,
+)
+_EPOCH_RE = re.compile(r"\d{10}(?:\.\d+)?|\d{13}")
+_RFC2822_RE = re.compile(
+    r"(?:[A-Za-z]{3},\s*)?\d{1,2}\s+[A-Za-z]{3}\s+\d{4}\s+\d{1,2}:\d{2}(?::\d{2})?"
+    r"(?:\s*(?:[+-]\d{4}|GMT|UTC|UT|Z))?"
+)
+# Patterns like "2 days ago", "3 hrs ago", "5d ago", "30+ days ago"
+_RELATIVE_RE = re.compile(
+    r"(?P<num>\d+)\+?\s*(?P<unit>day|days|d|week|weeks|w|hour|hours|hr|hrs|minute|minutes|min|mins|month|months|mo)\s*(ago)?"
+)
+
+# Memo of absolute parse results (None included) keyed by the raw string.
+_MEMO_MAXSIZE = 4096
+_memo: "OrderedDict[str, Tuple[Optional[datetime], str]]" = OrderedDict()
+_memo_day: Optional[date] = None
+_memo_lock = threading.Lock()
+
+_parse_stats: Dict[str, int] = {}
+_parse_stats_lock = threading.Lock()
+
+
+def _record_parse(fmt: str) -> None:
+    with _parse_stats_lock:
+        _parse_stats[fmt] = _parse_stats.get(fmt, 0) + 1
+
+
+def get_date_parse_stats() -> Dict[str, int]:
+    """Return per-format parse counts (plus ``memo_hits``) for this process."""
+    with _parse_stats_lock:
+        return dict(_parse_stats)
+
+
+def reset_date_parse_stats() -> None:
+    """Clear the parse histogram and the memo."""
+    global _memo_day
+    with _parse_stats_lock:
+        _parse_stats.clear()
+    with _memo_lock:
+        _memo.clear()
+        _memo_day = None
+
+
+def _memo_get(key: str) -> Optional[Tuple[Optional[datetime], str]]:
+    global _memo_day
+    today = datetime.now(timezone.utc).date()
+    with _memo_lock:
+        if _memo_day != today:
+            _memo.clear()
+            _memo_day = today
+            return None
+        entry = _memo.get(key)
+        if entry is not None:
+            _memo.move_to_end(key)
+        return entry
+
+
+def _memo_set(key: str, value: Optional[datetime], fmt: str) -> None:
+    with _memo_lock:
+        _memo[key] = (value, fmt)
+        while len(_memo) > _MEMO_MAXSIZE:
+            _memo.popitem(last=False)
+
+
+def _parse_iso(text: str) -> Optional[datetime]:
+    """Strict ISO 8601 subset (what ATS APIs emit); None if not that shape."""
+    match = _ISO_RE.fullmatch(text)
+    if not match:
+        return None
+    normalized = match.group("date")
+    if match.group("time"):
+        normalized += "T" + match.group("time")
+        # dateutil truncates sub-microsecond digits; fromisoformat wants 3 or 6
+        if match.group("frac"):
+            normalized += "." + match.group("frac")[:6].ljust(6, "0")
+    tz = (match.group("tz") or "").upper()
+    if tz == "Z":
+        normalized += "+00:00"
+    elif tz:
+        digits = tz[1:].replace(":", "")
+        normalized += f"{tz[0]}{digits[:2]}:{digits[2:4] or '00'}"
+    try:
+        return datetime.fromisoformat(normalized)
+    except ValueError:
+        return None
+
+
+def _parse_epoch(text: str) -> Optional[datetime]:
+    """10-digit epoch seconds or 13-digit epoch milliseconds."""
+    if not _EPOCH_RE.fullmatch(text):
+        return None
+    timestamp = float(text)
+    if len(text) == 13:
+        timestamp /= 1000.0
+    try:
+        return datetime.fromtimestamp(timestamp, tz=timezone.utc)
+    except (OverflowError, OSError, ValueError):
+        return None
+
+
+def _parse_rfc2822(text: str) -> Optional[datetime]:
+    """RFC 2822 dates ("Mon, 15 Jan 2024 10:30:00 GMT")."""
+    if not _RFC2822_RE.fullmatch(text):
+        return None
+    try:
+        return email.utils.parsedate_to_datetime(text)
+    except (TypeError, ValueError):
+        return None
+
+
+def _parse_relative(lowered: str, now: datetime) -> Optional[datetime]:
+    rel_match = _RELATIVE_RE.search(lowered)
+    if not rel_match:
+        return None
+    num = int(rel_match.group("num"))
+    unit = rel_match.group("unit")
+
+    if unit.startswith(("day", "d")):
+        delta = timedelta(days=num)
+    elif unit.startswith(("week", "w")):
+        delta = timedelta(weeks=num)
+    elif unit.startswith("hour") or unit.startswith("hr"):
+        delta = timedelta(hours=num)
+    elif unit.startswith("min"):
+        delta = timedelta(minutes=num)
+    elif unit.startswith("month") or unit == "mo":
+        delta = timedelta(days=num * 30)  # rough approximation
+    else:
+        delta = timedelta(0)
+
+    return now - delta
+
+
+def _finalize(parsed: Optional[datetime], date_string: str) -> Optional[datetime]:
+    """Assume UTC for naive results and reject pre-2000 placeholders."""
+    if parsed is None:
+        return None
+    # Make timezone-aware if needed (assume UTC)
+    if parsed.tzinfo is None:
+        parsed = parsed.replace(tzinfo=timezone.utc)
+
+    # Reject dates before 2000-01-01 — these are epoch-zero placeholders
+    # or other invalid values (e.g. "1970-01-01T00:00:00" from APIs that
+    # return 0 for missing dates).
+    if parsed < _MIN_VALID_DATE:
+        logger.debug("Rejecting pre-2000 date as invalid: '%s' -> %s", date_string, parsed)
+        return None
+    return parsed
+
 
 def parse_job_date(date_string: Optional[str]) -> Optional[datetime]:
     """
@@ -34,58 +205,48 @@ def parse_job_date(date_string: Optional[str]) -> Optional[datetime]:
         Parsed datetime object (timezone-aware) or None if parsing fails
     """
     if not date_string:
+        _record_parse("empty")
         return None
 
-    # Handle common relative strings up-front
-    lowered = date_string.strip().lower()
+    memoized = _memo_get(date_string)
+    if memoized is not None:
+        _record_parse("memo_hits")
+        return memoized[0]
+
+    text = date_string.strip()
+    lowered = text.lower()
     now = datetime.now(timezone.utc)
 
+    # Handle common relative strings up-front (time-dependent: never memoized)
     if lowered in {"today", "just posted", "posted today"}:
+        _record_parse("keyword")
         return now
     if lowered == "yesterday":
+        _record_parse("keyword")
         return now - timedelta(days=1)
 
-    # Patterns like "2 days ago", "3 hrs ago", "5d ago", "30+ days ago"
-    rel_match = re.search(
-        r"(?P<num>\d+)\+?\s*(?P<unit>day|days|d|week|weeks|w|hour|hours|hr|hrs|minute|minutes|min|mins|month|months|mo)\s*(ago)?",
-        lowered,
-    )
-    if rel_match:
-        num = int(rel_match.group("num"))
-        unit = rel_match.group("unit")
-
-        if unit.startswith(("day", "d")):
-            delta = timedelta(days=num)
-        elif unit.startswith(("week", "w")):
-            delta = timedelta(weeks=num)
-        elif unit.startswith("hour") or unit.startswith("hr"):
-            delta = timedelta(hours=num)
-        elif unit.startswith("min"):
-            delta = timedelta(minutes=num)
-        elif unit.startswith("month") or unit == "mo":
-            delta = timedelta(days=num * 30)  # rough approximation
-        else:
-            delta = timedelta(0)
-
-        return now - delta
+    for fmt, parser in (("iso", _parse_iso), ("epoch", _parse_epoch), ("rfc2822", _parse_rfc2822)):
+        parsed = parser(text)
+        if parsed is not None:
+            result = _finalize(parsed, date_string)
+            _record_parse(fmt)
+            _memo_set(date_string, result, fmt)
+            return result
+
+    relative = _parse_relative(lowered, now)
+    if relative is not None:
+        _record_parse("relative")
+        return relative
 
     try:
         # Use dateutil.parser for flexible parsing
-        parsed_date = dateutil.parser.parse(date_string)
-
-        # Make timezone-aware if needed (assume UTC)
-        if parsed_date.tzinfo is None:
-            parsed_date = parsed_date.replace(tzinfo=timezone.utc)
-
-        # Reject dates before 2000-01-01 — these are epoch-zero placeholders
-        # or other invalid values (e.g. "1970-01-01T00:00:00" from APIs that
-        # return 0 for missing dates).
-        if parsed_date < _MIN_VALID_DATE:
-            logger.debug("Rejecting pre-2000 date as invalid: '%s' -> %s", date_string, parsed_date)
-            return None
-
-        return parsed_date
-
-    except (ValueError, TypeError) as e:
+        result = _finalize(dateutil.parser.parse(date_string), date_string)
+        fmt = "dateutil"
+    except (ValueError, TypeError, OverflowError) as e:
         logger.debug(f"Failed to parse date '{date_string}': {str(e)}")
-        return None
+        result = None
+        fmt = "unparsed"
+
+    _record_parse(fmt)
+    _memo_set(date_string, result, fmt)
+    return result
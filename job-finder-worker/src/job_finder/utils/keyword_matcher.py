@@ -0,0 +1,119 @@
+"""Multi-keyword matching compiled into a single regex.
+
+Filters and scoring test text against keyword lists ("senior", "machine
+learning", "c++", ...). Doing that with one ``\\bkw\\b`` regex per keyword
+scans the text once per keyword. ``KeywordMatcher`` folds the whole list
+into one trie-shaped alternation wrapped in the same word boundaries, so the
+text is scanned once and shared prefixes are tested once:
+
+    ["data", "data engineer", "devops"] -> \\b(?:d(?:ata(?:\\ engineer)?|evops))\\b
+
+Matching semantics are identical to the per-keyword patterns (each keyword
+still needs ``\\b`` on both sides, case-insensitive). ``first()`` reports the
+keyword that comes first in configuration order, exactly like looping over
+the list, so rejection reasons do not change.
+"""
+
+import re
+from functools import lru_cache
+from typing import Dict, Iterable, Optional, Tuple
+
+
+def _trie_pattern(keywords: Iterable[str]) -> str:
+    """Build a regex alternation that shares common prefixes."""
+    root: Dict[str, dict] = {}
+    for keyword in keywords:
+        node = root
+        for char in keyword:
+            node = node.setdefault(char, {})
+        node[""] = {}
+
+    def build(node: Dict[str, dict]) -> str:
+        branches = [re.escape(char) + build(child) for char, child in sorted(node.items()) if char]
+        if not branches:
+            return ""
+        optional = "" in node
+        if len(branches) == 1 and not optional:
+            return branches[0]
+        group = "(?:" + "|".join(branches) + ")"
+        return group + "?" if optional else group
+
+    return build(root)
+
+
+def _ends_at_boundary(text: str, end: int, word_boundary: bool) -> bool:
+    """Whether a keyword ending at *end* satisfies the trailing ``\\b``."""
+    if not word_boundary:
+        return True
+    before = text[end - 1].isalnum() or text[end - 1] == "_"
+    after = end < len(text) and (text[end].isalnum() or text[end] == "_")
+    return before != after
+
+
+class KeywordMatcher:
+    """Case-insensitive matcher for a fixed keyword list (thread-safe)."""
+
+    def __init__(self, keywords: Iterable[str], word_boundary: bool = True):
+        """
+        Args:
+            keywords: Keywords in priority order (lowercased; blanks dropped)
+            word_boundary: Require ``\\b`` on both sides of each keyword; when
+                False keywords match as plain substrings
+        """
+        normalized = (k.lower() for k in keywords if k and k.strip())
+        self.keywords: Tuple[str, ...] = tuple(dict.fromkeys(normalized))
+        self.word_boundary = word_boundary
+        self._boundary = r"\b" if word_boundary else ""
+        self._positions = {keyword: i for i, keyword in enumerate(self.keywords)}
+        self._pattern: Optional[re.Pattern] = None
+        self._overlapping: Optional[re.Pattern] = None
+        if self.keywords:
+            trie = _trie_pattern(self.keywords)
+            self._pattern = re.compile(
+                self._boundary + "(?:" + trie + ")" + self._boundary, re.IGNORECASE
+            )
+            # Zero-width lookahead reports the longest keyword starting at every position.
+            self._overlapping = re.compile(
+                "(?=" + self._boundary + "(" + trie + ")" + self._boundary + ")", re.IGNORECASE
+            )
+
+    def __len__(self) -> int:
+        return len(self.keywords)
+
+    def __bool__(self) -> bool:
+        return bool(self.keywords)
+
+    def contains_any(self, text: Optional[str]) -> bool:
+        """True if any keyword occurs in *text*."""
+        return bool(text) and self._pattern is not None and self._pattern.search(text) is not None
+
+    def first(self, text: Optional[str]) -> Optional[str]:
+        """Return the earliest-listed keyword that occurs anywhere in *text*.
+
+        Equivalent to ``next(kw for kw in keywords if re.search(rf"\\b{kw}\\b", text))``.
+        Every keyword matching at a position is a prefix of the longest match
+        there, so one overlapping scan plus a prefix check covers all of them.
+        """
+        if not text or self._overlapping is None:
+            return None
+        best: Optional[int] = None
+        for match in self._overlapping.finditer(text):
+            longest = match.group(1).lower()
+            start = match.start()
+            for length in range(1, len(longest) + 1):
+                index = self._positions.get(longest[:length])
+                if index is None or (best is not None and index >= best):
+                    continue
+                if length == len(longest) or _ends_at_boundary(
+                    text, start + length, self.word_boundary
+                ):
+                    best = index
+            if best == 0:
+                break
+        return self.keywords[best] if best is not None else None
+
+
+@lru_cache(maxsize=128)
+def get_keyword_matcher(keywords: Tuple[str, ...], word_boundary: bool = True) -> KeywordMatcher:
+    """Shared compiled matcher for a keyword tuple (compiled once per config)."""
+    return KeywordMatcher(keywords, word_boundary=word_boundary)
@@ -0,0 +1,212 @@
+"""Process-wide token-bucket rate limiting keyed by host (or API provider).
+
+Scrapers used to ``time.sleep(fetchDelaySeconds)`` after every page and
+every detail fetch, whatever the host, and ``FallbackSearchClient`` kept its
+own per-provider sleeps. ``RateLimiter`` replaces both with one bucket per
+key:
+
+- a bucket holds up to ``burst`` tokens and refills at ``rate`` tokens per
+  second; ``acquire(key)`` takes one, sleeping only when *that key* has none
+  left, so a slow career site never paces an unrelated ATS API
+- tokens are reserved under the bucket's own lock and the sleep happens
+  outside it, so concurrent callers on one host queue up in order and
+  callers on other hosts never contend
+- ``record_response`` adapts to the server: a 429 blocks the key until its
+  ``Retry-After`` (or an exponential backoff) and halves the bucket's rate;
+  each later success restores a tenth of the configured rate
+
+Rates are per key and may change between calls (settings reload); the
+bucket keeps its state and just adopts the new ceiling.
+
+Usage:
+    from job_finder.utils.rate_limiter import get_rate_limiter
+
+    limiter = get_rate_limiter()
+    limiter.acquire("boards-api.greenhouse.io", rate=2.0, burst=5)
+    response = requests.get(url)
+    limiter.record_response(host, response.status_code, response.headers.get("Retry-After"))
+"""
+
+from __future__ import annotations
+
+import logging
+import threading
+import time
+from datetime import datetime, timezone
+from email.utils import parsedate_to_datetime
+from typing import Any, Callable, Dict, Optional
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_RATE = 1.0
+DEFAULT_BURST = 3
+
+# Adaptive backoff on 429: rate never drops below this fraction of the configured rate
+_MIN_RATE_FACTOR = 1 / 16
+_RECOVERY_FACTOR = 0.1
+# Block used when a 429 carries no usable Retry-After: 2s, 4s, ... capped
+_BACKOFF_BASE_SECONDS = 2.0
+_MAX_BACKOFF_SECONDS = 300.0
+
+
+def parse_retry_after(value: Any, now: Optional[datetime] = None) -> Optional[float]:
+    """Seconds from a ``Retry-After`` header (delta-seconds or HTTP-date), else None."""
+    if value is None:
+        return None
+    if isinstance(value, (int, float)):
+        return max(0.0, float(value))
+    text = str(value).strip()
+    if not text:
+        return None
+    try:
+        return max(0.0, float(text))
+    except ValueError:
+        pass
+    try:
+        when = parsedate_to_datetime(text)
+    except (TypeError, ValueError, IndexError):
+        return None
+    if when.tzinfo is None:
+        when = when.replace(tzinfo=timezone.utc)
+    return max(0.0, (when - (now or datetime.now(timezone.utc))).total_seconds())
+
+
+class _Bucket:
+    __slots__ = ("lock", "base_rate", "rate", "burst", "tokens", "ready_at", "strikes")
+
+    def __init__(self, rate: float, burst: int, now: float):
+        self.lock = threading.Lock()
+        self.base_rate = rate
+        self.rate = rate
+        self.burst = burst
+        self.tokens = float(burst)
+        # Time from which tokens accrue; in the future while a 429 block lasts
+        self.ready_at = now
+        self.strikes = 0
+
+    def configure(self, rate: float, burst: int) -> None:
+        if rate != self.base_rate:
+            # Keep any 429 slowdown proportionally
+            self.rate = rate * min(1.0, self.rate / self.base_rate)
+            self.base_rate = rate
+        if burst != self.burst:
+            self.burst = burst
+            self.tokens = min(self.tokens, float(burst))
+
+    def refill(self, now: float) -> None:
+        if now > self.ready_at:
+            self.tokens = min(float(self.burst), self.tokens + (now - self.ready_at) * self.rate)
+            self.ready_at = now
+
+
+class RateLimiter:
+    """Thread-safe token buckets keyed by host or provider name."""
+
+    def __init__(
+        self,
+        rate: float = DEFAULT_RATE,
+        burst: int = DEFAULT_BURST,
+        clock: Callable[[], float] = time.monotonic,
+        sleep: Callable[[float], None] = time.sleep,
+    ):
+        """
+        Args:
+            rate: Default tokens per second for keys acquired without a rate
+            burst: Default bucket size
+            clock: Monotonic clock (injectable for tests)
+            sleep: Sleep function (injectable for tests)
+        """
+        self.rate = rate
+        self.burst = burst
+        self._clock = clock
+        self._sleep = sleep
+        self._buckets: Dict[str, _Bucket] = {}
+        self._lock = threading.Lock()
+
+    def _bucket(self, key: str, rate: float, burst: int) -> _Bucket:
+        bucket = self._buckets.get(key)
+        if bucket is None:
+            with self._lock:
+                bucket = self._buckets.get(key)
+                if bucket is None:
+                    bucket = self._buckets[key] = _Bucket(rate, burst, self._clock())
+        return bucket
+
+    def reserve(self, key: str, rate: Optional[float] = None, burst: Optional[int] = None) -> float:
+        """Take a token for *key* and return how long the caller must wait first.
+
+        A rate of 0 (or less) disables limiting for the call.
+        """
+        rate = self.rate if rate is None else rate
+        burst = max(1, int(self.burst if burst is None else burst))
+        if rate <= 0:
+            return 0.0
+        bucket = self._bucket(key, rate, burst)
+        with bucket.lock:
+            bucket.configure(rate, burst)
+            now = self._clock()
+            bucket.refill(now)
+            bucket.tokens -= 1
+            wait = max(0.0, bucket.ready_at - now)
+            if bucket.tokens < 0:
+                wait += -bucket.tokens / bucket.rate
+        return wait
+
+    def acquire(self, key: str, rate: Optional[float] = None, burst: Optional[int] = None) -> float:
+        """Block until *key* may make one request; return the seconds waited."""
+        wait = self.reserve(key, rate, burst)
+        if wait > 0:
+            logger.debug("Rate limiting %s: waiting %.2fs", key, wait)
+            self._sleep(wait)
+        return wait
+
+    def record_response(
+        self, key: str, status_code: Optional[int], retry_after: Any = None
+    ) -> None:
+        """Adapt *key*'s bucket to a response (429 slows it down, success recovers)."""
+        bucket = self._buckets.get(key)
+        if bucket is None or status_code is None:
+            return
+        with bucket.lock:
+            if status_code == 429:
+                self._penalize(bucket, key, parse_retry_after(retry_after))
+            elif status_code < 400 and (bucket.strikes or bucket.rate < bucket.base_rate):
+                bucket.strikes = 0
+                bucket.rate = min(
+                    bucket.base_rate, bucket.rate + bucket.base_rate * _RECOVERY_FACTOR
+                )
+
+    def _penalize(self, bucket: _Bucket, key: str, retry_after: Optional[float]) -> None:
+        bucket.strikes += 1
+        if retry_after is None:
+            retry_after = min(
+                _MAX_BACKOFF_SECONDS, _BACKOFF_BASE_SECONDS * 2 ** (bucket.strikes - 1)
+            )
+        bucket.rate = max(bucket.base_rate * _MIN_RATE_FACTOR, bucket.rate / 2)
+        now = self._clock()
+        # One token waits for the block to end; the rest refill at the reduced rate
+        bucket.ready_at = max(bucket.ready_at, now + retry_after)
+        bucket.tokens = 1.0
+        logger.info(
+            "Rate limited by %s: blocking %.1fs, rate now %.3f/s", key, retry_after, bucket.rate
+        )
+
+    def reset(self) -> None:
+        """Forget every bucket (tests, settings reload)."""
+        with self._lock:
+            self._buckets.clear()
+
+
+_limiter_singleton: Optional[RateLimiter] = None
+_singleton_lock = threading.Lock()
+
+
+def get_rate_limiter() -> RateLimiter:
+    """The process-wide limiter shared by scrapers and search clients."""
+    global _limiter_singleton
+    if _limiter_singleton:
+        return _limiter_singleton
+    with _singleton_lock:
+        if not _limiter_singleton:
+            _limiter_singleton = RateLimiter()
+    return _limiter_singleton
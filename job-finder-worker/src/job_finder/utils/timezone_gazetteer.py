@@ -0,0 +1,1111 @@
+"""Offline location -> IANA timezone gazetteer.
+
+Job locations arrive as free text ("Austin, TX", "Remote - Poland", "Greater
+Seattle Area", "Toronto, ON, Canada"). Resolving them through a geocoder
+costs a network round trip each (Nominatim allows ~1 req/s), so the prefilter
+resolves against this bundled table first:
+
+- ~500 cities (tech hubs plus every IANA zone city) with country and, for
+  US/CA/AU, state/province
+- US states, Canadian provinces and Australian states
+- every ISO country; multi-zone countries map to their dominant zone, and
+  countries spanning a continent (US, CA, AU, RU) are reported as ambiguous
+
+Names are indexed after ``normalize_location`` (accent-stripped, lowercased,
+punctuation collapsed), so lookups are plain dict hits. Country rows and the
+IANA city rows are generated from tzdata's ``zone.tab``/``iso3166.tab``.
+"""
+
+import re
+import unicodedata
+from dataclasses import dataclass
+from typing import Dict, List, Optional
+
+# country code | admin code | names (";"-separated) | timezone
+_ADMIN_DATA = """
+US|AL|Alabama|America/Chicago
+US|AK|Alaska|America/Anchorage
+US|AZ|Arizona|America/Phoenix
+US|AR|Arkansas|America/Chicago
+US|CA|California|America/Los_Angeles
+US|CO|Colorado|America/Denver
+US|CT|Connecticut|America/New_York
+US|DE|Delaware|America/New_York
+US|DC|District of Columbia|America/New_York
+US|FL|Florida|America/New_York
+US|GA|Georgia|America/New_York
+US|HI|Hawaii|Pacific/Honolulu
+US|ID|Idaho|America/Boise
+US|IL|Illinois|America/Chicago
+US|IN|Indiana|America/Indiana/Indianapolis
+US|IA|Iowa|America/Chicago
+US|KS|Kansas|America/Chicago
+US|KY|Kentucky|America/New_York
+US|LA|Louisiana|America/Chicago
+US|ME|Maine|America/New_York
+US|MD|Maryland|America/New_York
+US|MA|Massachusetts|America/New_York
+US|MI|Michigan|America/Detroit
+US|MN|Minnesota|America/Chicago
+US|MS|Mississippi|America/Chicago
+US|MO|Missouri|America/Chicago
+US|MT|Montana|America/Denver
+US|NE|Nebraska|America/Chicago
+US|NV|Nevada|America/Los_Angeles
+US|NH|New Hampshire|America/New_York
+US|NJ|New Jersey|America/New_York
+US|NM|New Mexico|America/Denver
+US|NY|New York;New York State|America/New_York
+US|NC|North Carolina|America/New_York
+US|ND|North Dakota|America/Chicago
+US|OH|Ohio|America/New_York
+US|OK|Oklahoma|America/Chicago
+US|OR|Oregon|America/Los_Angeles
+US|PA|Pennsylvania|America/New_York
+US|PR|Puerto Rico|America/Puerto_Rico
+US|RI|Rhode Island|America/New_York
+US|SC|South Carolina|America/New_York
+US|SD|South Dakota|America/Chicago
+US|TN|Tennessee|America/Chicago
+US|TX|Texas|America/Chicago
+US|UT|Utah|America/Denver
+US|VT|Vermont|America/New_York
+US|VA|Virginia|America/New_York
+US|WA|Washington;Washington State|America/Los_Angeles
+US|WV|West Virginia|America/New_York
+US|WI|Wisconsin|America/Chicago
+US|WY|Wyoming|America/Denver
+CA|AB|Alberta|America/Edmonton
+CA|BC|British Columbia|America/Vancouver
+CA|MB|Manitoba|America/Winnipeg
+CA|NB|New Brunswick|America/Moncton
+CA|NL|Newfoundland and Labrador;Newfoundland|America/St_Johns
+CA|NS|Nova Scotia|America/Halifax
+CA|NT|Northwest Territories|America/Edmonton
+CA|NU|Nunavut|America/Iqaluit
+CA|ON|Ontario|America/Toronto
+CA|PE|Prince Edward Island;PEI|America/Halifax
+CA|QC|Quebec|America/Toronto
+CA|SK|Saskatchewan|America/Regina
+CA|YT|Yukon|America/Whitehorse
+AU|NSW|New South Wales|Australia/Sydney
+AU|VIC|Victoria|Australia/Melbourne
+AU|QLD|Queensland|Australia/Brisbane
+AU|WA|Western Australia|Australia/Perth
+AU|SA|South Australia|Australia/Adelaide
+AU|TAS|Tasmania|Australia/Hobart
+AU|ACT|Australian Capital Territory|Australia/Sydney
+AU|NT|Northern Territory|Australia/Darwin
+"""
+
+# country code | timezone (empty = spans too many zones) | names
+_COUNTRY_DATA = """
+AD|Europe/Andorra|Andorra
+AE|Asia/Dubai|United Arab Emirates;UAE
+AF|Asia/Kabul|Afghanistan
+AG|America/Antigua|Antigua and Barbuda
+AI|America/Anguilla|Anguilla
+AL|Europe/Tirane|Albania
+AM|Asia/Yerevan|Armenia
+AO|Africa/Luanda|Angola
+AQ||Antarctica
+AR|America/Argentina/Buenos_Aires|Argentina
+AS|Pacific/Pago_Pago|American Samoa
+AT|Europe/Vienna|Austria
+AU||Australia
+AW|America/Aruba|Aruba
+AX|Europe/Mariehamn|Aland Islands
+AZ|Asia/Baku|Azerbaijan
+BA|Europe/Sarajevo|Bosnia and Herzegovina;Bosnia
+BB|America/Barbados|Barbados
+BD|Asia/Dhaka|Bangladesh
+BE|Europe/Brussels|Belgium
+BF|Africa/Ouagadougou|Burkina Faso
+BG|Europe/Sofia|Bulgaria
+BH|Asia/Bahrain|Bahrain
+BI|Africa/Bujumbura|Burundi
+BJ|Africa/Porto-Novo|Benin
+BL|America/St_Barthelemy|Saint Barthelemy
+BM|Atlantic/Bermuda|Bermuda
+BN|Asia/Brunei|Brunei
+BO|America/La_Paz|Bolivia
+BQ|America/Kralendijk|Caribbean NL
+BR|America/Sao_Paulo|Brazil
+BS|America/Nassau|Bahamas
+BT|Asia/Thimphu|Bhutan
+BW|Africa/Gaborone|Botswana
+BY|Europe/Minsk|Belarus
+BZ|America/Belize|Belize
+CA||Canada
+CC|Indian/Cocos|Cocos Islands
+CD|Africa/Kinshasa|Democratic Republic of the Congo;DR Congo;DRC
+CF|Africa/Bangui|Central African Rep.
+CG|Africa/Brazzaville|Republic of the Congo;Congo
+CH|Europe/Zurich|Switzerland
+CI|Africa/Abidjan|Cote d'Ivoire;Ivory Coast
+CK|Pacific/Rarotonga|Cook Islands
+CL|America/Santiago|Chile
+CM|Africa/Douala|Cameroon
+CN|Asia/Shanghai|China
+CO|America/Bogota|Colombia
+CR|America/Costa_Rica|Costa Rica
+CU|America/Havana|Cuba
+CV|Atlantic/Cape_Verde|Cape Verde
+CW|America/Curacao|Curaçao
+CX|Indian/Christmas|Christmas Island
+CY|Asia/Nicosia|Cyprus
+CZ|Europe/Prague|Czechia;Czech Republic
+DE|Europe/Berlin|Germany
+DJ|Africa/Djibouti|Djibouti
+DK|Europe/Copenhagen|Denmark
+DM|America/Dominica|Dominica
+DO|America/Santo_Domingo|Dominican Republic
+DZ|Africa/Algiers|Algeria
+EC|America/Guayaquil|Ecuador
+EE|Europe/Tallinn|Estonia
+EG|Africa/Cairo|Egypt
+EH|Africa/El_Aaiun|Western Sahara
+ER|Africa/Asmara|Eritrea
+ES|Europe/Madrid|Spain
+ET|Africa/Addis_Ababa|Ethiopia
+FI|Europe/Helsinki|Finland
+FJ|Pacific/Fiji|Fiji
+FK|Atlantic/Stanley|Falkland Islands
+FM|Pacific/Pohnpei|Micronesia
+FO|Atlantic/Faroe|Faroe Islands
+FR|Europe/Paris|France
+GA|Africa/Libreville|Gabon
+GB|Europe/London|United Kingdom;UK;Great Britain;Britain;England;Scotland;Wales;Northern Ireland
+GD|America/Grenada|Grenada
+GE|Asia/Tbilisi|Georgia
+GF|America/Cayenne|French Guiana
+GG|Europe/Guernsey|Guernsey
+GH|Africa/Accra|Ghana
+GI|Europe/Gibraltar|Gibraltar
+GL|America/Nuuk|Greenland
+GM|Africa/Banjul|Gambia
+GN|Africa/Conakry|Guinea
+GP|America/Guadeloupe|Guadeloupe
+GQ|Africa/Malabo|Equatorial Guinea
+GR|Europe/Athens|Greece
+GS|Atlantic/South_Georgia|South Georgia & the South Sandwich Islands
+GT|America/Guatemala|Guatemala
+GU|Pacific/Guam|Guam
+GW|Africa/Bissau|Guinea-Bissau
+GY|America/Guyana|Guyana
+HK|Asia/Hong_Kong|Hong Kong
+HN|America/Tegucigalpa|Honduras
+HR|Europe/Zagreb|Croatia
+HT|America/Port-au-Prince|Haiti
+HU|Europe/Budapest|Hungary
+ID|Asia/Jakarta|Indonesia
+IE|Europe/Dublin|Ireland
+IL|Asia/Jerusalem|Israel
+IM|Europe/Isle_of_Man|Isle of Man
+IN|Asia/Kolkata|India
+IO|Indian/Chagos|British Indian Ocean Territory
+IQ|Asia/Baghdad|Iraq
+IR|Asia/Tehran|Iran
+IS|Atlantic/Reykjavik|Iceland
+IT|Europe/Rome|Italy
+JE|Europe/Jersey|Jersey
+JM|America/Jamaica|Jamaica
+JO|Asia/Amman|Jordan
+JP|Asia/Tokyo|Japan
+KE|Africa/Nairobi|Kenya
+KG|Asia/Bishkek|Kyrgyzstan
+KH|Asia/Phnom_Penh|Cambodia
+KI|Pacific/Tarawa|Kiribati
+KM|Indian/Comoro|Comoros
+KN|America/St_Kitts|Saint Kitts and Nevis
+KP|Asia/Pyongyang|North Korea
+KR|Asia/Seoul|South Korea;Korea;Republic of Korea
+KW|Asia/Kuwait|Kuwait
+KY|America/Cayman|Cayman Islands
+KZ|Asia/Almaty|Kazakhstan
+LA|Asia/Vientiane|Laos
+LB|Asia/Beirut|Lebanon
+LC|America/St_Lucia|Saint Lucia
+LI|Europe/Vaduz|Liechtenstein
+LK|Asia/Colombo|Sri Lanka
+LR|Africa/Monrovia|Liberia
+LS|Africa/Maseru|Lesotho
+LT|Europe/Vilnius|Lithuania
+LU|Europe/Luxembourg|Luxembourg
+LV|Europe/Riga|Latvia
+LY|Africa/Tripoli|Libya
+MA|Africa/Casablanca|Morocco
+MC|Europe/Monaco|Monaco
+MD|Europe/Chisinau|Moldova
+ME|Europe/Podgorica|Montenegro
+MF|America/Marigot|Saint Martin
+MG|Indian/Antananarivo|Madagascar
+MH|Pacific/Majuro|Marshall Islands
+MK|Europe/Skopje|North Macedonia;Macedonia
+ML|Africa/Bamako|Mali
+MM|Asia/Yangon|Myanmar;Burma
+MN|Asia/Ulaanbaatar|Mongolia
+MO|Asia/Macau|Macau
+MP|Pacific/Saipan|Northern Mariana Islands
+MQ|America/Martinique|Martinique
+MR|Africa/Nouakchott|Mauritania
+MS|America/Montserrat|Montserrat
+MT|Europe/Malta|Malta
+MU|Indian/Mauritius|Mauritius
+MV|Indian/Maldives|Maldives
+MW|Africa/Blantyre|Malawi
+MX|America/Mexico_City|Mexico
+MY|Asia/Kuala_Lumpur|Malaysia
+MZ|Africa/Maputo|Mozambique
+NA|Africa/Windhoek|Namibia
+NC|Pacific/Noumea|New Caledonia
+NE|Africa/Niamey|Niger
+NF|Pacific/Norfolk|Norfolk Island
+NG|Africa/Lagos|Nigeria
+NI|America/Managua|Nicaragua
+NL|Europe/Amsterdam|Netherlands;The Netherlands;Holland
+NO|Europe/Oslo|Norway
+NP|Asia/Kathmandu|Nepal
+NR|Pacific/Nauru|Nauru
+NU|Pacific/Niue|Niue
+NZ|Pacific/Auckland|New Zealand
+OM|Asia/Muscat|Oman
+PA|America/Panama|Panama
+PE|America/Lima|Peru
+PF|Pacific/Tahiti|French Polynesia
+PG|Pacific/Port_Moresby|Papua New Guinea
+PH|Asia/Manila|Philippines;The Philippines
+PK|Asia/Karachi|Pakistan
+PL|Europe/Warsaw|Poland
+PM|America/Miquelon|Saint Pierre and Miquelon
+PN|Pacific/Pitcairn|Pitcairn
+PR|America/Puerto_Rico|Puerto Rico
+PS|Asia/Hebron|Palestine
+PT|Europe/Lisbon|Portugal
+PW|Pacific/Palau|Palau
+PY|America/Asuncion|Paraguay
+QA|Asia/Qatar|Qatar
+RE|Indian/Reunion|Réunion
+RO|Europe/Bucharest|Romania
+RS|Europe/Belgrade|Serbia
+RU||Russia;Russian Federation
+RW|Africa/Kigali|Rwanda
+SA|Asia/Riyadh|Saudi Arabia
+SB|Pacific/Guadalcanal|Solomon Islands
+SC|Indian/Mahe|Seychelles
+SD|Africa/Khartoum|Sudan
+SE|Europe/Stockholm|Sweden
+SG|Asia/Singapore|Singapore
+SH|Atlantic/St_Helena|Saint Helena
+SI|Europe/Ljubljana|Slovenia
+SJ|Arctic/Longyearbyen|Svalbard & Jan Mayen
+SK|Europe/Bratislava|Slovakia
+SL|Africa/Freetown|Sierra Leone
+SM|Europe/San_Marino|San Marino
+SN|Africa/Dakar|Senegal
+SO|Africa/Mogadishu|Somalia
+SR|America/Paramaribo|Suriname
+SS|Africa/Juba|South Sudan
+ST|Africa/Sao_Tome|Sao Tome and Principe
+SV|America/El_Salvador|El Salvador
+SX|America/Lower_Princes|Sint Maarten
+SY|Asia/Damascus|Syria
+SZ|Africa/Mbabane|Eswatini;Swaziland
+TC|America/Grand_Turk|Turks and Caicos Islands
+TD|Africa/Ndjamena|Chad
+TF|Indian/Kerguelen|French S. Terr.
+TG|Africa/Lome|Togo
+TH|Asia/Bangkok|Thailand
+TJ|Asia/Dushanbe|Tajikistan
+TK|Pacific/Fakaofo|Tokelau
+TL|Asia/Dili|East Timor
+TM|Asia/Ashgabat|Turkmenistan
+TN|Africa/Tunis|Tunisia
+TO|Pacific/Tongatapu|Tonga
+TR|Europe/Istanbul|Turkey;Turkiye
+TT|America/Port_of_Spain|Trinidad and Tobago
+TV|Pacific/Funafuti|Tuvalu
+TW|Asia/Taipei|Taiwan
+TZ|Africa/Dar_es_Salaam|Tanzania
+UA|Europe/Kyiv|Ukraine
+UG|Africa/Kampala|Uganda
+UM|Pacific/Wake|US minor outlying islands
+US||United States;United States of America;USA;America
+UY|America/Montevideo|Uruguay
+UZ|Asia/Tashkent|Uzbekistan
+VA|Europe/Vatican|Vatican City
+VC|America/St_Vincent|Saint Vincent
+VE|America/Caracas|Venezuela
+VG|America/Tortola|British Virgin Islands
+VI|America/St_Thomas|US Virgin Islands
+VN|Asia/Ho_Chi_Minh|Vietnam;Viet Nam
+VU|Pacific/Efate|Vanuatu
+WF|Pacific/Wallis|Wallis & Futuna
+WS|Pacific/Apia|Samoa
+YE|Asia/Aden|Yemen
+YT|Indian/Mayotte|Mayotte
+ZA|Africa/Johannesburg|South Africa
+ZM|Africa/Lusaka|Zambia
+ZW|Africa/Harare|Zimbabwe
+"""
+
+# names | admin code | country code | timezone. Earlier rows win for bare names.
+_CITY_DATA = """
+London||GB|Europe/London
+Birmingham||GB|Europe/London
+New York;New York City;NYC;Manhattan;Brooklyn;Queens;Bronx|NY|US|America/New_York
+San Francisco;SF;San Francisco Bay Area;SF Bay Area;Bay Area;Silicon Valley|CA|US|America/Los_Angeles
+Los Angeles|CA|US|America/Los_Angeles
+Seattle|WA|US|America/Los_Angeles
+Austin|TX|US|America/Chicago
+Boston|MA|US|America/New_York
+Chicago|IL|US|America/Chicago
+Denver|CO|US|America/Denver
+Washington;Washington DC;DC|DC|US|America/New_York
+Atlanta|GA|US|America/New_York
+Portland|OR|US|America/Los_Angeles
+Portland|ME|US|America/New_York
+San Jose|CA|US|America/Los_Angeles
+San Diego|CA|US|America/Los_Angeles
+Dallas|TX|US|America/Chicago
+Houston|TX|US|America/Chicago
+San Antonio|TX|US|America/Chicago
+Fort Worth|TX|US|America/Chicago
+El Paso|TX|US|America/Denver
+Plano|TX|US|America/Chicago
+Irving|TX|US|America/Chicago
+Frisco|TX|US|America/Chicago
+Phoenix|AZ|US|America/Phoenix
+Scottsdale|AZ|US|America/Phoenix
+Tempe|AZ|US|America/Phoenix
+Chandler|AZ|US|America/Phoenix
+Tucson|AZ|US|America/Phoenix
+Philadelphia|PA|US|America/New_York
+Pittsburgh|PA|US|America/New_York
+Miami|FL|US|America/New_York
+Tampa|FL|US|America/New_York
+Orlando|FL|US|America/New_York
+Jacksonville|FL|US|America/New_York
+Fort Lauderdale|FL|US|America/New_York
+Pensacola|FL|US|America/Chicago
+Minneapolis|MN|US|America/Chicago
+St Paul|MN|US|America/Chicago
+Detroit|MI|US|America/Detroit
+Ann Arbor|MI|US|America/Detroit
+Grand Rapids|MI|US|America/Detroit
+Salt Lake City|UT|US|America/Denver
+Lehi|UT|US|America/Denver
+Provo|UT|US|America/Denver
+Raleigh|NC|US|America/New_York
+Durham|NC|US|America/New_York
+Charlotte|NC|US|America/New_York
+Research Triangle Park;RTP|NC|US|America/New_York
+Nashville|TN|US|America/Chicago
+Memphis|TN|US|America/Chicago
+Knoxville|TN|US|America/New_York
+Chattanooga|TN|US|America/New_York
+Columbus|OH|US|America/New_York
+Cleveland|OH|US|America/New_York
+Cincinnati|OH|US|America/New_York
+Indianapolis|IN|US|America/Indiana/Indianapolis
+St Louis|MO|US|America/Chicago
+Kansas City|MO|US|America/Chicago
+Las Vegas|NV|US|America/Los_Angeles
+Reno|NV|US|America/Los_Angeles
+Sacramento|CA|US|America/Los_Angeles
+Oakland|CA|US|America/Los_Angeles
+Berkeley|CA|US|America/Los_Angeles
+Palo Alto|CA|US|America/Los_Angeles
+Mountain View|CA|US|America/Los_Angeles
+Sunnyvale|CA|US|America/Los_Angeles
+Santa Clara|CA|US|America/Los_Angeles
+Menlo Park|CA|US|America/Los_Angeles
+Redwood City|CA|US|America/Los_Angeles
+Cupertino|CA|US|America/Los_Angeles
+San Mateo|CA|US|America/Los_Angeles
+Irvine|CA|US|America/Los_Angeles
+Santa Monica|CA|US|America/Los_Angeles
+Pasadena|CA|US|America/Los_Angeles
+Santa Barbara|CA|US|America/Los_Angeles
+Fremont|CA|US|America/Los_Angeles
+Bellevue|WA|US|America/Los_Angeles
+Redmond|WA|US|America/Los_Angeles
+Kirkland|WA|US|America/Los_Angeles
+Tacoma|WA|US|America/Los_Angeles
+Spokane|WA|US|America/Los_Angeles
+Vancouver|WA|US|America/Los_Angeles
+Beaverton|OR|US|America/Los_Angeles
+Hillsboro|OR|US|America/Los_Angeles
+Eugene|OR|US|America/Los_Angeles
+Boulder|CO|US|America/Denver
+Colorado Springs|CO|US|America/Denver
+Boise|ID|US|America/Boise
+Albuquerque|NM|US|America/Denver
+Omaha|NE|US|America/Chicago
+Milwaukee|WI|US|America/Chicago
+Madison|WI|US|America/Chicago
+Des Moines|IA|US|America/Chicago
+Oklahoma City|OK|US|America/Chicago
+Tulsa|OK|US|America/Chicago
+New Orleans|LA|US|America/Chicago
+Baltimore|MD|US|America/New_York
+Bethesda|MD|US|America/New_York
+Arlington|VA|US|America/New_York
+Reston|VA|US|America/New_York
+McLean|VA|US|America/New_York
+Richmond|VA|US|America/New_York
+Herndon|VA|US|America/New_York
+Cambridge|MA|US|America/New_York
+Somerville|MA|US|America/New_York
+Providence|RI|US|America/New_York
+Hartford|CT|US|America/New_York
+Stamford|CT|US|America/New_York
+New Haven|CT|US|America/New_York
+Jersey City|NJ|US|America/New_York
+Newark|NJ|US|America/New_York
+Hoboken|NJ|US|America/New_York
+Princeton|NJ|US|America/New_York
+Buffalo|NY|US|America/New_York
+Rochester|NY|US|America/New_York
+Albany|NY|US|America/New_York
+Louisville|KY|US|America/Kentucky/Louisville
+Lexington|KY|US|America/New_York
+Birmingham|AL|US|America/Chicago
+Huntsville|AL|US|America/Chicago
+Charleston|SC|US|America/New_York
+Greenville|SC|US|America/New_York
+Burlington|VT|US|America/New_York
+Anchorage|AK|US|America/Anchorage
+Honolulu|HI|US|Pacific/Honolulu
+San Juan|PR|US|America/Puerto_Rico
+Toronto|ON|CA|America/Toronto
+Ottawa|ON|CA|America/Toronto
+Waterloo|ON|CA|America/Toronto
+Kitchener|ON|CA|America/Toronto
+Mississauga|ON|CA|America/Toronto
+London|ON|CA|America/Toronto
+Hamilton|ON|CA|America/Toronto
+Montreal|QC|CA|America/Toronto
+Quebec City;Quebec|QC|CA|America/Toronto
+Vancouver|BC|CA|America/Vancouver
+Victoria|BC|CA|America/Vancouver
+Burnaby|BC|CA|America/Vancouver
+Calgary|AB|CA|America/Edmonton
+Edmonton|AB|CA|America/Edmonton
+Winnipeg|MB|CA|America/Winnipeg
+Saskatoon|SK|CA|America/Regina
+Regina|SK|CA|America/Regina
+Halifax|NS|CA|America/Halifax
+Fredericton|NB|CA|America/Moncton
+St Johns|NL|CA|America/St_Johns
+Sydney|NSW|AU|Australia/Sydney
+Melbourne|VIC|AU|Australia/Melbourne
+Brisbane|QLD|AU|Australia/Brisbane
+Perth|WA|AU|Australia/Perth
+Adelaide|SA|AU|Australia/Adelaide
+Canberra|ACT|AU|Australia/Sydney
+Hobart|TAS|AU|Australia/Hobart
+Darwin|NT|AU|Australia/Darwin
+Gold Coast|QLD|AU|Australia/Brisbane
+Manchester||GB|Europe/London
+Edinburgh||GB|Europe/London
+Glasgow||GB|Europe/London
+Bristol||GB|Europe/London
+Cambridge||GB|Europe/London
+Oxford||GB|Europe/London
+Leeds||GB|Europe/London
+Belfast||GB|Europe/London
+Cardiff||GB|Europe/London
+Reading||GB|Europe/London
+Cork||IE|Europe/Dublin
+Galway||IE|Europe/Dublin
+Munich;Muenchen;Munchen||DE|Europe/Berlin
+Hamburg||DE|Europe/Berlin
+Frankfurt;Frankfurt am Main||DE|Europe/Berlin
+Cologne;Koln;Koeln||DE|Europe/Berlin
+Stuttgart||DE|Europe/Berlin
+Dusseldorf;Duesseldorf||DE|Europe/Berlin
+Leipzig||DE|Europe/Berlin
+Dresden||DE|Europe/Berlin
+Karlsruhe||DE|Europe/Berlin
+Nuremberg;Nurnberg||DE|Europe/Berlin
+Hanover;Hannover||DE|Europe/Berlin
+Lyon||FR|Europe/Paris
+Marseille||FR|Europe/Paris
+Toulouse||FR|Europe/Paris
+Nice||FR|Europe/Paris
+Bordeaux||FR|Europe/Paris
+Lille||FR|Europe/Paris
+Nantes||FR|Europe/Paris
+Grenoble||FR|Europe/Paris
+Barcelona||ES|Europe/Madrid
+Valencia||ES|Europe/Madrid
+Seville;Sevilla||ES|Europe/Madrid
+Malaga||ES|Europe/Madrid
+Bilbao||ES|Europe/Madrid
+Porto||PT|Europe/Lisbon
+Milan;Milano||IT|Europe/Rome
+Turin;Torino||IT|Europe/Rome
+Florence;Firenze||IT|Europe/Rome
+Naples;Napoli||IT|Europe/Rome
+Bologna||IT|Europe/Rome
+Rotterdam||NL|Europe/Amsterdam
+The Hague;Den Haag||NL|Europe/Amsterdam
+Utrecht||NL|Europe/Amsterdam
+Eindhoven||NL|Europe/Amsterdam
+Antwerp;Antwerpen||BE|Europe/Brussels
+Ghent;Gent||BE|Europe/Brussels
+Geneva;Geneve||CH|Europe/Zurich
+Basel||CH|Europe/Zurich
+Bern||CH|Europe/Zurich
+Lausanne||CH|Europe/Zurich
+Graz||AT|Europe/Vienna
+Salzburg||AT|Europe/Vienna
+Gothenburg;Goteborg||SE|Europe/Stockholm
+Malmo||SE|Europe/Stockholm
+Aarhus||DK|Europe/Copenhagen
+Bergen||NO|Europe/Oslo
+Trondheim||NO|Europe/Oslo
+Espoo||FI|Europe/Helsinki
+Tampere||FI|Europe/Helsinki
+Krakow||PL|Europe/Warsaw
+Wroclaw||PL|Europe/Warsaw
+Gdansk||PL|Europe/Warsaw
+Poznan||PL|Europe/Warsaw
+Lodz||PL|Europe/Warsaw
+Brno||CZ|Europe/Prague
+Cluj-Napoca;Cluj||RO|Europe/Bucharest
+Iasi||RO|Europe/Bucharest
+Timisoara||RO|Europe/Bucharest
+Novi Sad||RS|Europe/Belgrade
+Thessaloniki||GR|Europe/Athens
+Lviv||UA|Europe/Kyiv
+Kharkiv||UA|Europe/Kyiv
+Kyiv;Kiev||UA|Europe/Kyiv
+Odesa;Odessa||UA|Europe/Kyiv
+St Petersburg;Saint Petersburg||RU|Europe/Moscow
+Ankara||TR|Europe/Istanbul
+Izmir||TR|Europe/Istanbul
+Tel Aviv;Tel Aviv-Yafo||IL|Asia/Jerusalem
+Haifa||IL|Asia/Jerusalem
+Abu Dhabi||AE|Asia/Dubai
+Riyadh||SA|Asia/Riyadh
+Bangalore;Bengaluru||IN|Asia/Kolkata
+Mumbai;Bombay||IN|Asia/Kolkata
+Pune||IN|Asia/Kolkata
+Hyderabad||IN|Asia/Kolkata
+Chennai;Madras||IN|Asia/Kolkata
+New Delhi;Delhi||IN|Asia/Kolkata
+Gurgaon;Gurugram||IN|Asia/Kolkata
+Noida||IN|Asia/Kolkata
+Kolkata;Calcutta||IN|Asia/Kolkata
+Ahmedabad||IN|Asia/Kolkata
+Kochi;Cochin||IN|Asia/Kolkata
+Jaipur||IN|Asia/Kolkata
+Chandigarh||IN|Asia/Kolkata
+Lahore||PK|Asia/Karachi
+Islamabad||PK|Asia/Karachi
+Beijing;Peking||CN|Asia/Shanghai
+Shenzhen||CN|Asia/Shanghai
+Guangzhou||CN|Asia/Shanghai
+Hangzhou||CN|Asia/Shanghai
+Chengdu||CN|Asia/Shanghai
+Osaka||JP|Asia/Tokyo
+Kyoto||JP|Asia/Tokyo
+Fukuoka||JP|Asia/Tokyo
+Busan||KR|Asia/Seoul
+Taipei||TW|Asia/Taipei
+Cebu||PH|Asia/Manila
+Hanoi||VN|Asia/Ho_Chi_Minh
+Ho Chi Minh City;Saigon||VN|Asia/Ho_Chi_Minh
+Penang||MY|Asia/Kuala_Lumpur
+Bandung||ID|Asia/Jakarta
+Bali;Denpasar||ID|Asia/Makassar
+Auckland||NZ|Pacific/Auckland
+Wellington||NZ|Pacific/Auckland
+Christchurch||NZ|Pacific/Auckland
+Rio de Janeiro||BR|America/Sao_Paulo
+Belo Horizonte||BR|America/Sao_Paulo
+Brasilia||BR|America/Sao_Paulo
+Curitiba||BR|America/Sao_Paulo
+Porto Alegre||BR|America/Sao_Paulo
+Florianopolis||BR|America/Sao_Paulo
+Recife||BR|America/Recife
+Guadalajara||MX|America/Mexico_City
+Monterrey||MX|America/Monterrey
+Tijuana||MX|America/Tijuana
+Medellin||CO|America/Bogota
+Cali||CO|America/Bogota
+Cordoba||AR|America/Argentina/Cordoba
+Valparaiso||CL|America/Santiago
+Quito||EC|America/Guayaquil
+Cape Town||ZA|Africa/Johannesburg
+Durban||ZA|Africa/Johannesburg
+Pretoria||ZA|Africa/Johannesburg
+Alexandria||EG|Africa/Cairo
+Kigali||RW|Africa/Kigali
+Andorra||AD|Europe/Andorra
+Dubai||AE|Asia/Dubai
+Kabul||AF|Asia/Kabul
+Antigua||AG|America/Antigua
+Anguilla||AI|America/Anguilla
+Tirane||AL|Europe/Tirane
+Yerevan||AM|Asia/Yerevan
+Luanda||AO|Africa/Luanda
+Buenos Aires||AR|America/Argentina/Buenos_Aires
+Cordoba||AR|America/Argentina/Cordoba
+Mendoza||AR|America/Argentina/Mendoza
+Pago Pago||AS|Pacific/Pago_Pago
+Vienna||AT|Europe/Vienna
+Hobart||AU|Australia/Hobart
+Melbourne||AU|Australia/Melbourne
+Sydney||AU|Australia/Sydney
+Brisbane||AU|Australia/Brisbane
+Lindeman||AU|Australia/Lindeman
+Adelaide||AU|Australia/Adelaide
+Darwin||AU|Australia/Darwin
+Perth||AU|Australia/Perth
+Eucla||AU|Australia/Eucla
+Aruba||AW|America/Aruba
+Mariehamn||AX|Europe/Mariehamn
+Baku||AZ|Asia/Baku
+Sarajevo||BA|Europe/Sarajevo
+Barbados||BB|America/Barbados
+Dhaka||BD|Asia/Dhaka
+Brussels||BE|Europe/Brussels
+Ouagadougou||BF|Africa/Ouagadougou
+Sofia||BG|Europe/Sofia
+Bahrain||BH|Asia/Bahrain
+Bujumbura||BI|Africa/Bujumbura
+Porto-Novo||BJ|Africa/Porto-Novo
+St Barthelemy||BL|America/St_Barthelemy
+Bermuda||BM|Atlantic/Bermuda
+Brunei||BN|Asia/Brunei
+La Paz||BO|America/La_Paz
+Kralendijk||BQ|America/Kralendijk
+Belem||BR|America/Belem
+Fortaleza||BR|America/Fortaleza
+Recife||BR|America/Recife
+Bahia||BR|America/Bahia
+Sao Paulo||BR|America/Sao_Paulo
+Manaus||BR|America/Manaus
+Nassau||BS|America/Nassau
+Thimphu||BT|Asia/Thimphu
+Gaborone||BW|Africa/Gaborone
+Minsk||BY|Europe/Minsk
+Belize||BZ|America/Belize
+St Johns||CA|America/St_Johns
+Halifax||CA|America/Halifax
+Moncton||CA|America/Moncton
+Blanc-Sablon||CA|America/Blanc-Sablon
+Toronto||CA|America/Toronto
+Iqaluit||CA|America/Iqaluit
+Winnipeg||CA|America/Winnipeg
+Regina||CA|America/Regina
+Edmonton||CA|America/Edmonton
+Whitehorse||CA|America/Whitehorse
+Vancouver||CA|America/Vancouver
+Cocos||CC|Indian/Cocos
+Kinshasa||CD|Africa/Kinshasa
+Bangui||CF|Africa/Bangui
+Brazzaville||CG|Africa/Brazzaville
+Zurich||CH|Europe/Zurich
+Abidjan||CI|Africa/Abidjan
+Rarotonga||CK|Pacific/Rarotonga
+Santiago||CL|America/Santiago
+Douala||CM|Africa/Douala
+Shanghai||CN|Asia/Shanghai
+Bogota||CO|America/Bogota
+Costa Rica||CR|America/Costa_Rica
+Havana||CU|America/Havana
+Cape Verde||CV|Atlantic/Cape_Verde
+Curacao||CW|America/Curacao
+Christmas||CX|Indian/Christmas
+Nicosia||CY|Asia/Nicosia
+Prague||CZ|Europe/Prague
+Berlin||DE|Europe/Berlin
+Djibouti||DJ|Africa/Djibouti
+Copenhagen||DK|Europe/Copenhagen
+Dominica||DM|America/Dominica
+Santo Domingo||DO|America/Santo_Domingo
+Algiers||DZ|Africa/Algiers
+Guayaquil||EC|America/Guayaquil
+Tallinn||EE|Europe/Tallinn
+Cairo||EG|Africa/Cairo
+El Aaiun||EH|Africa/El_Aaiun
+Asmara||ER|Africa/Asmara
+Madrid||ES|Europe/Madrid
+Addis Ababa||ET|Africa/Addis_Ababa
+Helsinki||FI|Europe/Helsinki
+Fiji||FJ|Pacific/Fiji
+Stanley||FK|Atlantic/Stanley
+Faroe||FO|Atlantic/Faroe
+Paris||FR|Europe/Paris
+Libreville||GA|Africa/Libreville
+London||GB|Europe/London
+Grenada||GD|America/Grenada
+Tbilisi||GE|Asia/Tbilisi
+Cayenne||GF|America/Cayenne
+Guernsey||GG|Europe/Guernsey
+Accra||GH|Africa/Accra
+Gibraltar||GI|Europe/Gibraltar
+Nuuk||GL|America/Nuuk
+Banjul||GM|Africa/Banjul
+Conakry||GN|Africa/Conakry
+Guadeloupe||GP|America/Guadeloupe
+Malabo||GQ|Africa/Malabo
+Athens||GR|Europe/Athens
+South Georgia||GS|Atlantic/South_Georgia
+Guatemala||GT|America/Guatemala
+Guam||GU|Pacific/Guam
+Bissau||GW|Africa/Bissau
+Guyana||GY|America/Guyana
+Hong Kong||HK|Asia/Hong_Kong
+Tegucigalpa||HN|America/Tegucigalpa
+Zagreb||HR|Europe/Zagreb
+Port-au-Prince||HT|America/Port-au-Prince
+Budapest||HU|Europe/Budapest
+Jakarta||ID|Asia/Jakarta
+Dublin||IE|Europe/Dublin
+Jerusalem||IL|Asia/Jerusalem
+Isle of Man||IM|Europe/Isle_of_Man
+Kolkata||IN|Asia/Kolkata
+Chagos||IO|Indian/Chagos
+Baghdad||IQ|Asia/Baghdad
+Tehran||IR|Asia/Tehran
+Reykjavik||IS|Atlantic/Reykjavik
+Rome||IT|Europe/Rome
+Jersey||JE|Europe/Jersey
+Jamaica||JM|America/Jamaica
+Amman||JO|Asia/Amman
+Tokyo||JP|Asia/Tokyo
+Nairobi||KE|Africa/Nairobi
+Bishkek||KG|Asia/Bishkek
+Phnom Penh||KH|Asia/Phnom_Penh
+Comoro||KM|Indian/Comoro
+St Kitts||KN|America/St_Kitts
+Pyongyang||KP|Asia/Pyongyang
+Seoul||KR|Asia/Seoul
+Kuwait||KW|Asia/Kuwait
+Cayman||KY|America/Cayman
+Almaty||KZ|Asia/Almaty
+Vientiane||LA|Asia/Vientiane
+Beirut||LB|Asia/Beirut
+St Lucia||LC|America/St_Lucia
+Vaduz||LI|Europe/Vaduz
+Colombo||LK|Asia/Colombo
+Monrovia||LR|Africa/Monrovia
+Maseru||LS|Africa/Maseru
+Vilnius||LT|Europe/Vilnius
+Luxembourg||LU|Europe/Luxembourg
+Riga||LV|Europe/Riga
+Tripoli||LY|Africa/Tripoli
+Casablanca||MA|Africa/Casablanca
+Monaco||MC|Europe/Monaco
+Chisinau||MD|Europe/Chisinau
+Podgorica||ME|Europe/Podgorica
+Marigot||MF|America/Marigot
+Antananarivo||MG|Indian/Antananarivo
+Skopje||MK|Europe/Skopje
+Bamako||ML|Africa/Bamako
+Yangon||MM|Asia/Yangon
+Ulaanbaatar||MN|Asia/Ulaanbaatar
+Macau||MO|Asia/Macau
+Saipan||MP|Pacific/Saipan
+Martinique||MQ|America/Martinique
+Nouakchott||MR|Africa/Nouakchott
+Montserrat||MS|America/Montserrat
+Malta||MT|Europe/Malta
+Mauritius||MU|Indian/Mauritius
+Maldives||MV|Indian/Maldives
+Blantyre||MW|Africa/Blantyre
+Mexico City||MX|America/Mexico_City
+Cancun||MX|America/Cancun
+Merida||MX|America/Merida
+Monterrey||MX|America/Monterrey
+Matamoros||MX|America/Matamoros
+Chihuahua||MX|America/Chihuahua
+Ciudad Juarez||MX|America/Ciudad_Juarez
+Mazatlan||MX|America/Mazatlan
+Hermosillo||MX|America/Hermosillo
+Tijuana||MX|America/Tijuana
+Kuala Lumpur||MY|Asia/Kuala_Lumpur
+Maputo||MZ|Africa/Maputo
+Windhoek||NA|Africa/Windhoek
+Noumea||NC|Pacific/Noumea
+Niamey||NE|Africa/Niamey
+Lagos||NG|Africa/Lagos
+Managua||NI|America/Managua
+Amsterdam||NL|Europe/Amsterdam
+Oslo||NO|Europe/Oslo
+Kathmandu||NP|Asia/Kathmandu
+Nauru||NR|Pacific/Nauru
+Niue||NU|Pacific/Niue
+Auckland||NZ|Pacific/Auckland
+Muscat||OM|Asia/Muscat
+Panama||PA|America/Panama
+Lima||PE|America/Lima
+Tahiti||PF|Pacific/Tahiti
+Port Moresby||PG|Pacific/Port_Moresby
+Manila||PH|Asia/Manila
+Karachi||PK|Asia/Karachi
+Warsaw||PL|Europe/Warsaw
+Miquelon||PM|America/Miquelon
+Puerto Rico||PR|America/Puerto_Rico
+Lisbon||PT|Europe/Lisbon
+Palau||PW|Pacific/Palau
+Asuncion||PY|America/Asuncion
+Qatar||QA|Asia/Qatar
+Reunion||RE|Indian/Reunion
+Bucharest||RO|Europe/Bucharest
+Belgrade||RS|Europe/Belgrade
+Kaliningrad||RU|Europe/Kaliningrad
+Moscow||RU|Europe/Moscow
+Volgograd||RU|Europe/Volgograd
+Samara||RU|Europe/Samara
+Yekaterinburg||RU|Asia/Yekaterinburg
+Omsk||RU|Asia/Omsk
+Novosibirsk||RU|Asia/Novosibirsk
+Krasnoyarsk||RU|Asia/Krasnoyarsk
+Irkutsk||RU|Asia/Irkutsk
+Vladivostok||RU|Asia/Vladivostok
+Kigali||RW|Africa/Kigali
+Riyadh||SA|Asia/Riyadh
+Guadalcanal||SB|Pacific/Guadalcanal
+Mahe||SC|Indian/Mahe
+Khartoum||SD|Africa/Khartoum
+Stockholm||SE|Europe/Stockholm
+Singapore||SG|Asia/Singapore
+St Helena||SH|Atlantic/St_Helena
+Ljubljana||SI|Europe/Ljubljana
+Longyearbyen||SJ|Arctic/Longyearbyen
+Bratislava||SK|Europe/Bratislava
+Freetown||SL|Africa/Freetown
+San Marino||SM|Europe/San_Marino
+Dakar||SN|Africa/Dakar
+Mogadishu||SO|Africa/Mogadishu
+Paramaribo||SR|America/Paramaribo
+Juba||SS|Africa/Juba
+Sao Tome||ST|Africa/Sao_Tome
+El Salvador||SV|America/El_Salvador
+Lower Princes||SX|America/Lower_Princes
+Damascus||SY|Asia/Damascus
+Mbabane||SZ|Africa/Mbabane
+Grand Turk||TC|America/Grand_Turk
+Ndjamena||TD|Africa/Ndjamena
+Kerguelen||TF|Indian/Kerguelen
+Lome||TG|Africa/Lome
+Bangkok||TH|Asia/Bangkok
+Dushanbe||TJ|Asia/Dushanbe
+Fakaofo||TK|Pacific/Fakaofo
+Dili||TL|Asia/Dili
+Ashgabat||TM|Asia/Ashgabat
+Tunis||TN|Africa/Tunis
+Tongatapu||TO|Pacific/Tongatapu
+Istanbul||TR|Europe/Istanbul
+Port of Spain||TT|America/Port_of_Spain
+Funafuti||TV|Pacific/Funafuti
+Taipei||TW|Asia/Taipei
+Dar es Salaam||TZ|Africa/Dar_es_Salaam
+Simferopol||UA|Europe/Simferopol
+Kyiv||UA|Europe/Kyiv
+Kampala||UG|Africa/Kampala
+New York||US|America/New_York
+Detroit||US|America/Detroit
+Louisville||US|America/Kentucky/Louisville
+Indianapolis||US|America/Indiana/Indianapolis
+Chicago||US|America/Chicago
+Denver||US|America/Denver
+Boise||US|America/Boise
+Phoenix||US|America/Phoenix
+Los Angeles||US|America/Los_Angeles
+Anchorage||US|America/Anchorage
+Juneau||US|America/Juneau
+Honolulu||US|Pacific/Honolulu
+Montevideo||UY|America/Montevideo
+Tashkent||UZ|Asia/Tashkent
+Vatican||VA|Europe/Vatican
+St Vincent||VC|America/St_Vincent
+Caracas||VE|America/Caracas
+Tortola||VG|America/Tortola
+St Thomas||VI|America/St_Thomas
+Ho Chi Minh||VN|Asia/Ho_Chi_Minh
+Efate||VU|Pacific/Efate
+Wallis||WF|Pacific/Wallis
+Apia||WS|Pacific/Apia
+Aden||YE|Asia/Aden
+Mayotte||YT|Indian/Mayotte
+Johannesburg||ZA|Africa/Johannesburg
+Lusaka||ZM|Africa/Lusaka
+Harare||ZW|Africa/Harare
+"""
+
+
+@dataclass(frozen=True)
+class GazetteerMatch:
+    """Gazetteer hit. ``timezone_name`` is None when the location is ambiguous."""
+
+    timezone_name: Optional[str]
+    level: str  # "city", "region" or "country"
+
+
+@dataclass(frozen=True)
+class _Place:
+    country: str
+    admin: Optional[str]
+    timezone_name: Optional[str]
+    level: str
+
+
+# Token rewrites applied after normalization ("St. Louis" == "Saint Louis").
+_TOKEN_ALIASES = {"saint": "st", "ft": "fort", "mt": "mount"}
+
+# Words that decorate a location without changing it ("Greater Boston Area").
+_NOISE_TOKENS = frozenset(
+    {
+        "greater",
+        "metro",
+        "metropolitan",
+        "area",
+        "region",
+        "downtown",
+        "remote",
+        "hybrid",
+        "onsite",
+        "office",
+        "hq",
+        "headquarters",
+        "based",
+        "only",
+    }
+)
+
+# Alternatives ("SF / NYC", "Berlin or Remote") and parts ("Austin, TX (Hybrid)").
+_ALTERNATIVE_SPLIT = re.compile(r"[/|;]|\s+or\s+")
+_PART_SPLIT = re.compile(r"[,()\[\]]|\s[-–—]\s")
+
+
+def normalize_location(text: str) -> str:
+    """Lowercase, strip accents/punctuation/postcodes and collapse whitespace."""
+    text = unicodedata.normalize("NFKD", text or "")
+    text = "".join(ch for ch in text if not unicodedata.combining(ch)).lower()
+    text = re.sub(r"[.'’`]", "", text.replace("&", " and "))
+    tokens = re.sub(r"[^a-z0-9]+", " ", text).split()
+    return " ".join(_TOKEN_ALIASES.get(t, t) for t in tokens if not any(c.isdigit() for c in t))
+
+
+def _strip_noise(name: str) -> str:
+    return " ".join(t for t in name.split() if t not in _NOISE_TOKENS)
+
+
+def _rows(data: str) -> List[List[str]]:
+    return [line.split("|") for line in data.strip().splitlines()]
+
+
+def _build_indexes():
+    regions: Dict[str, List[_Place]] = {}
+    cities: Dict[str, List[_Place]] = {}
+
+    def add(index: Dict[str, List[_Place]], key: str, place: _Place) -> None:
+        key = normalize_location(key)
+        if key and place not in index.setdefault(key, []):
+            index[key].append(place)
+
+    # States/provinces first so "CA"/"WA" prefer the admin reading over a country.
+    for country, admin, names, tz in _rows(_ADMIN_DATA):
+        place = _Place(country, admin, tz, "region")
+        add(regions, admin, place)
+        for name in names.split(";"):
+            add(regions, name, place)
+
+    for country, tz, names in _rows(_COUNTRY_DATA):
+        place = _Place(country, None, tz or None, "country")
+        add(regions, country, place)
+        for name in names.split(";"):
+            add(regions, name, place)
+
+    for names, admin, country, tz in _rows(_CITY_DATA):
+        place = _Place(country, admin or None, tz, "city")
+        for name in names.split(";"):
+            add(cities, name, place)
+
+    return regions, cities
+
+
+_REGION_INDEX, _CITY_INDEX = _build_indexes()
+
+
+def _city_candidates(name: str) -> List[_Place]:
+    return _CITY_INDEX.get(name) or _CITY_INDEX.get(_strip_noise(name)) or []
+
+
+def _region_options(name: str) -> List[_Place]:
+    return _REGION_INDEX.get(name) or _REGION_INDEX.get(_strip_noise(name)) or []
+
+
+def _within(place: _Place, region: _Place) -> bool:
+    return place.country == region.country and (
+        region.level == "country" or place.admin == region.admin
+    )
+
+
+def _pick_city(candidates: List[_Place], qualifiers: List[List[_Place]]) -> Optional[_Place]:
+    """First candidate consistent with every qualifier, else with any of them."""
+    if not qualifiers:
+        return candidates[0]
+    for required in (all, any):
+        for place in candidates:
+            if required(any(_within(place, r) for r in options) for options in qualifiers):
+                return place
+    return None
+
+
+def _resolve_parts(parts: List[str]) -> Optional[GazetteerMatch]:
+    head, rest = parts[0], parts[1:]
+    qualifiers = [opts for opts in (_region_options(p) for p in rest) if opts]
+    candidates = _city_candidates(head)
+
+    # "Austin TX" / "Berlin Germany": peel a trailing region off an unmatched head.
+    if not candidates and not rest:
+        words = head.split()
+        for size in (1, 2, 3):
+            if len(words) <= size:
+                break
+            suffix = _region_options(" ".join(words[-size:]))
+            prefix = _city_candidates(" ".join(words[:-size]))
+            if suffix and prefix:
+                candidates, qualifiers = prefix, [suffix]
+                break
+
+    if candidates:
+        place = _pick_city(candidates, qualifiers)
+        if place is not None:
+            return GazetteerMatch(place.timezone_name, place.level)
+
+    # Fall back to the most specific region: the head itself ("Poland"), then qualifiers.
+    ambiguous: Optional[GazetteerMatch] = None
+    for options in ([] if candidates else [_region_options(head)]) + qualifiers:
+        for place in options:
+            if place.timezone_name:
+                return GazetteerMatch(place.timezone_name, place.level)
+            ambiguous = ambiguous or GazetteerMatch(None, place.level)
+    return ambiguous
+
+
+def lookup_timezone(location: str) -> Optional[GazetteerMatch]:
+    """Resolve a free-text location against the bundled gazetteer.
+
+    Returns None when nothing matches (the caller may fall back to a geocoder),
+    or a match with ``timezone_name=None`` when the location is a known region
+    spanning several timezones (e.g. "Canada").
+    """
+    ambiguous: Optional[GazetteerMatch] = None
+    for alternative in _ALTERNATIVE_SPLIT.split(location or ""):
+        parts = [p for p in (normalize_location(s) for s in _PART_SPLIT.split(alternative)) if p]
+        if not parts:
+            continue
+        match = _resolve_parts(parts)
+        if match is not None and match.timezone_name:
+            return match
+        ambiguous = ambiguous or match
+    return ambiguous
@@ -1,40 +1,48 @@
 """Timezone utilities for converting city names to UTC offsets.
 
-Uses geopy for geocoding (city -> lat/lng) and timezonefinder for timezone lookup.
-Results are cached to minimize API calls to the geocoding service.
+Resolution order for a location string:
+
+1. In-process LRU of resolved timezone names.
+2. The bundled offline gazetteer (``timezone_gazetteer``) - covers the vast
+   majority of job locations with a dict lookup and no network.
+3. A persistent SQLite cache of earlier geocoder answers (enabled via
+   ``configure_persistent_cache``; shared with ``enrichment_cache``).
+4. Optional fallback: geopy Nominatim geocoding (city -> lat/lng) plus
+   timezonefinder. Disable with ``TIMEZONE_GEOCODER_FALLBACK=false``.
 
 IMPORTANT NOTES:
 
 Rate Limiting:
-    Uses OpenStreetMap's Nominatim service which has a usage policy of max 1 request/second.
-    The cache (maxsize=500) helps reduce requests, but under high load with many unique
-    cities, rate limits may be hit. Consider adding explicit rate limiting if processing
-    large batches of jobs with diverse locations.
-
-DST Cache Behavior:
-    The cache does not have a TTL, so cached timezone offsets may become stale across
-    DST transitions (e.g., a city cached in summer with PDT offset -7 will still return -7
-    in winter when PST offset -8 is active). The impact is minimal (max 1 hour difference)
-    and only affects cached entries during transition periods. Call clear_cache() if exact
-    offsets are required after DST changes.
+    Nominatim's usage policy allows max 1 request/second. Only locations the
+    gazetteer cannot place reach it, and each answer (including "not found")
+    is persisted, so a given string is geocoded at most once per cache TTL.
+
+DST:
+    Caches store IANA timezone names, not offsets; the UTC offset is computed
+    at lookup time so it is always correct for the current date.
 
 Ambiguous City Names:
-    Single city names without state/country (e.g., "Portland") may geocode to unexpected
-    locations. Portland exists in Oregon, Maine, and other places worldwide. For accurate
-    results, provide disambiguating information (e.g., "Portland, OR" or "Portland, Oregon").
+    Bare names resolve to the gazetteer's most prominent entry (e.g.
+    "Portland" -> Portland, OR). Country-spanning regions such as "Canada" or
+    "USA" are reported as ambiguous instead of being geocoded to a centroid.
 """
 
 import logging
+import os
 import threading
+from collections import OrderedDict
 from dataclasses import dataclass
 from datetime import datetime, timezone
-from typing import Dict, Optional
+from typing import Optional
 from zoneinfo import ZoneInfo, ZoneInfoNotFoundError
 
 from geopy.geocoders import Nominatim
 from geopy.exc import GeocoderTimedOut, GeocoderServiceError
 from timezonefinder import TimezoneFinder
 
+from job_finder.storage.enrichment_cache import MISSING, EnrichmentCache
+from job_finder.utils.timezone_gazetteer import lookup_timezone
+
 logger = logging.getLogger(__name__)
 
 # Singleton instances (created lazily with thread-safe initialization)
@@ -74,19 +82,49 @@ class TimezoneResult:
     error: Optional[str] = None
 
 
-# Manual cache that only caches successful results (no transient errors).
-# Keys are normalized (stripped) city names to avoid cache pollution.
-_timezone_cache: Dict[str, TimezoneResult] = {}
+# In-process LRU of successful resolutions, keyed by the stripped input.
+# Values are IANA names; offsets are computed per call so DST stays correct.
+_timezone_cache: "OrderedDict[str, str]" = OrderedDict()
 _timezone_cache_lock = threading.Lock()
-_TIMEZONE_CACHE_MAXSIZE = 500
+_TIMEZONE_CACHE_MAXSIZE = 10000
+
+# Persistent cache for geocoder answers (namespace in enrichment_cache).
+_GEOCODE_CACHE_NAMESPACE = "timezone"
+GEOCODE_TTL_SECONDS = 180 * 24 * 3600
+GEOCODE_NEGATIVE_TTL_SECONDS = 7 * 24 * 3600
+_persistent_cache: Optional[EnrichmentCache] = None
+
+
+def configure_persistent_cache(db_path: Optional[str]) -> None:
+    """Persist geocoder fallback results in *db_path* (None disables)."""
+    global _persistent_cache
+    _persistent_cache = EnrichmentCache(db_path) if db_path else None
+
+
+def _geocoder_fallback_enabled() -> bool:
+    return os.getenv("TIMEZONE_GEOCODER_FALLBACK", "true").strip().lower() not in (
+        "0",
+        "false",
+        "no",
+        "off",
+    )
+
+
+def _remember(key: str, tz_name: str) -> None:
+    with _timezone_cache_lock:
+        _timezone_cache[key] = tz_name
+        _timezone_cache.move_to_end(key)
+        while len(_timezone_cache) > _TIMEZONE_CACHE_MAXSIZE:
+            _timezone_cache.popitem(last=False)
 
 
 def get_timezone_for_city(city: str) -> TimezoneResult:
     """
     Get timezone information for a city name.
 
-    Uses OpenStreetMap's Nominatim for geocoding (free, no API key required).
-    Successful results are cached; transient errors (timeouts) are not cached.
+    Resolves offline via the bundled gazetteer; only unknown locations go to
+    the persistent geocode cache and then (if enabled) Nominatim. Transient
+    geocoder errors (timeouts) are never cached.
 
     Args:
         city: City name, optionally with state/country (e.g., "Portland, OR" or "Hyderabad, India")
@@ -101,24 +139,61 @@ def get_timezone_for_city(city: str) -> TimezoneResult:
 
     normalized = city.strip()
 
-    # Check cache with normalized key (lock-free read; dict.get is thread-safe in CPython)
-    cached = _timezone_cache.get(normalized)
+    with _timezone_cache_lock:
+        cached = _timezone_cache.get(normalized)
+        if cached is not None:
+            _timezone_cache.move_to_end(normalized)
     if cached is not None:
-        return cached
+        return _result_for_timezone(normalized, cached)
+
+    match = lookup_timezone(normalized)
+    if match is not None:
+        if match.timezone_name is None:
+            return TimezoneResult(
+                city=normalized,
+                timezone_name=None,
+                utc_offset_hours=None,
+                error="Ambiguous location",
+            )
+        _remember(normalized, match.timezone_name)
+        return _result_for_timezone(normalized, match.timezone_name)
+
+    cache = _persistent_cache
+    if cache is not None:
+        payload = cache.get(_GEOCODE_CACHE_NAMESPACE, normalized)
+        if payload is not MISSING:
+            tz_name = payload.get("timezone") if isinstance(payload, dict) else None
+            if tz_name:
+                _remember(normalized, tz_name)
+                return _result_for_timezone(normalized, tz_name)
+            return TimezoneResult(
+                city=normalized, timezone_name=None, utc_offset_hours=None, error="City not found"
+            )
+
+    if not _geocoder_fallback_enabled():
+        return TimezoneResult(
+            city=normalized, timezone_name=None, utc_offset_hours=None, error="City not found"
+        )
 
     result = _lookup_timezone(normalized)
 
-    # Only cache successful results (no transient errors like timeouts)
-    if result.error is None:
-        with _timezone_cache_lock:
-            if len(_timezone_cache) < _TIMEZONE_CACHE_MAXSIZE:
-                _timezone_cache[normalized] = result
+    if result.error is None and result.timezone_name:
+        _remember(normalized, result.timezone_name)
+        if cache is not None:
+            cache.set(
+                _GEOCODE_CACHE_NAMESPACE,
+                normalized,
+                {"timezone": result.timezone_name},
+                GEOCODE_TTL_SECONDS,
+            )
+    elif result.error == "City not found" and cache is not None:
+        cache.set(_GEOCODE_CACHE_NAMESPACE, normalized, None, GEOCODE_NEGATIVE_TTL_SECONDS)
 
     return result
 
 
 def _lookup_timezone(city: str) -> TimezoneResult:
-    """Internal timezone lookup (not cached)."""
+    """Geocoder lookup (not cached): Nominatim -> coordinates -> timezonefinder."""
     try:
         geolocator = _get_geolocator()
         location = geolocator.geocode(city)
@@ -145,33 +220,7 @@ def _lookup_timezone(city: str) -> TimezoneResult:
                 error="Timezone not found for coordinates",
             )
 
-        # Get current UTC offset for this timezone
-        try:
-            tz = ZoneInfo(tz_name)
-        except ZoneInfoNotFoundError:
-            logger.warning("Timezone '%s' not found in system database for city: %s", tz_name, city)
-            return TimezoneResult(
-                city=city,
-                timezone_name=tz_name,
-                utc_offset_hours=None,
-                error=f"Timezone {tz_name} not found in system database",
-            )
-
-        now = datetime.now(timezone.utc)
-        offset = now.astimezone(tz).utcoffset()
-
-        if offset is None:
-            return TimezoneResult(
-                city=city,
-                timezone_name=tz_name,
-                utc_offset_hours=None,
-                error="Could not determine UTC offset",
-            )
-
-        offset_hours = offset.total_seconds() / 3600
-
-        logger.debug("Timezone for '%s': %s (UTC%+.1f)", city, tz_name, offset_hours)
-        return TimezoneResult(city=city, timezone_name=tz_name, utc_offset_hours=offset_hours)
+        return _result_for_timezone(city, tz_name)
 
     except GeocoderTimedOut:
         logger.warning("Geocoding timeout for city: %s", city)
@@ -188,6 +237,33 @@ def _lookup_timezone(city: str) -> TimezoneResult:
         return TimezoneResult(city=city, timezone_name=None, utc_offset_hours=None, error=str(e))
 
 
+def _result_for_timezone(city: str, tz_name: str) -> TimezoneResult:
+    """Build a result with the current UTC offset of *tz_name*."""
+    try:
+        tz = ZoneInfo(tz_name)
+    except ZoneInfoNotFoundError:
+        logger.warning("Timezone '%s' not found in system database for city: %s", tz_name, city)
+        return TimezoneResult(
+            city=city,
+            timezone_name=tz_name,
+            utc_offset_hours=None,
+            error=f"Timezone {tz_name} not found in system database",
+        )
+
+    offset = datetime.now(timezone.utc).astimezone(tz).utcoffset()
+    if offset is None:
+        return TimezoneResult(
+            city=city,
+            timezone_name=tz_name,
+            utc_offset_hours=None,
+            error="Could not determine UTC offset",
+        )
+
+    offset_hours = offset.total_seconds() / 3600
+    logger.debug("Timezone for '%s': %s (UTC%+.1f)", city, tz_name, offset_hours)
+    return TimezoneResult(city=city, timezone_name=tz_name, utc_offset_hours=offset_hours)
+
+
 def get_timezone_diff_hours(city1: str, city2: str) -> Optional[float]:
     """
     Calculate the timezone difference in hours between two cities.
@@ -209,6 +285,6 @@ def get_timezone_diff_hours(city1: str, city2: str) -> Optional[float]:
 
 
 def clear_cache() -> None:
-    """Clear the timezone lookup cache. Useful for testing."""
+    """Clear the in-process timezone cache. Useful for testing."""
     with _timezone_cache_lock:
         _timezone_cache.clear()
@@ -0,0 +1,229 @@
+"""Compiled URL classification for job boards, ATS platforms and aggregators.
+
+Intake and discovery ask several questions about every URL: is the host a
+known job-board domain (``job_sources.aggregator_domain``), which
+``PLATFORM_PATTERNS`` entry matches it, is it an ATS application page, should
+search results on it be ignored. ``UrlClassifier`` answers all of them in one
+call instead of one linear scan per question:
+
+- domain lists are folded into a trie keyed on reversed host labels
+  (``jobs.lever.co`` walks ``co -> lever -> jobs``), so a host costs one walk
+  of its own labels however long the lists are
+- bare host substrings (``AGGREGATOR_HOST_SUBSTRINGS``) share one
+  ``KeywordMatcher``
+- platform patterns are combined into a single regex of ordered lookaheads,
+  so the first pattern in registry order still wins, exactly like looping
+  ``re.search`` over the list
+- results are memoized in a per-classifier LRU
+
+Domain entries match the host itself or any subdomain of it
+(``greenhouse.io`` matches ``boards.greenhouse.io`` but not
+``notgreenhouse.io``).
+"""
+
+import re
+import threading
+from collections import OrderedDict
+from dataclasses import dataclass
+from functools import lru_cache
+from typing import TYPE_CHECKING, Any, Dict, Iterable, List, Optional, Sequence, Tuple
+from urllib.parse import urlparse
+
+from job_finder.utils.keyword_matcher import KeywordMatcher
+from job_finder.utils.url_utils import ATS_DOMAINS, AGGREGATOR_HOST_SUBSTRINGS, EXCLUDED_DOMAINS
+
+if TYPE_CHECKING:  # pragma: no cover
+    from job_finder.scrapers.platform_patterns import PlatformPattern
+
+_CACHE_SIZE = 8192
+# Trie terminal key; a DNS label can never contain a dot.
+_END = "."
+_GROUP_NAME_RE = re.compile(r"\(\?P<(\w+)>")
+
+
+class _SuffixTrie:
+    """Domain set indexed by reversed labels.
+
+    Each node maps a child label to its node, plus ``_END`` to the listed
+    domain that ends there.
+    """
+
+    def __init__(self, domains: Iterable[str]):
+        self._root: Dict[str, Any] = {}
+        for domain in domains:
+            domain = (domain or "").strip().strip(".").lower()
+            if not domain:
+                continue
+            node: Dict[str, Any] = self._root
+            for label in reversed(domain.split(".")):
+                node = node.setdefault(label, {})
+            node.setdefault(_END, domain)
+
+    def match(self, host: str) -> Optional[str]:
+        """Return the most specific listed domain that is *host* or a parent of it."""
+        node: Dict[str, Any] = self._root
+        found: Optional[str] = None
+        for label in reversed(host.split(".")):
+            child: Optional[Dict[str, Any]] = node.get(label)
+            if child is None:
+                break
+            node = child
+            suffix = node.get(_END)
+            if isinstance(suffix, str):
+                found = suffix
+        return found
+
+
+def _combine_platform_patterns(
+    patterns: Sequence["PlatformPattern"],
+) -> Tuple[Optional[re.Pattern], List[List[Tuple[str, str]]]]:
+    """Fold ``url_pattern``s into one regex anchored at position 0.
+
+    Each pattern becomes ``(?=[\\s\\S]*?(?P<_i>...))`` with its named groups
+    renamed to ``_i_name`` (names repeat across patterns). Alternatives are
+    tried in order and each lookahead finds that pattern's leftmost match, so
+    the result equals the first pattern for which ``re.search`` succeeds.
+    """
+    branches = []
+    group_names: List[List[Tuple[str, str]]] = []
+    for index, pattern in enumerate(patterns):
+        names: List[Tuple[str, str]] = []
+
+        def rename(match: re.Match, index: int = index, names: list = names) -> str:
+            renamed = f"_{index}_{match.group(1)}"
+            names.append((match.group(1), renamed))
+            return f"(?P<{renamed}>"
+
+        body = _GROUP_NAME_RE.sub(rename, pattern.url_pattern)
+        branches.append(f"(?=[\\s\\S]*?(?P<_{index}>{body}))")
+        group_names.append(names)
+    if not branches:
+        return None, group_names
+    return re.compile("(?:" + "|".join(branches) + ")"), group_names
+
+
+@dataclass(frozen=True)
+class UrlClassification:
+    """Everything the pipeline needs to know about one URL."""
+
+    host: str
+    # Matching job_sources.aggregator_domain (most specific), if any
+    aggregator_domain: Optional[str] = None
+    platform: Optional["PlatformPattern"] = None
+    platform_groups: Tuple[Tuple[str, Optional[str]], ...] = ()
+    # Matching ATS_DOMAINS entry, if any
+    ats_domain: Optional[str] = None
+    # Host is in EXCLUDED_DOMAINS (generic boards / aggregators)
+    excluded: bool = False
+    # Host contains an AGGREGATOR_HOST_SUBSTRINGS entry
+    aggregator_host: bool = False
+
+    @property
+    def is_job_board(self) -> bool:
+        return self.aggregator_domain is not None
+
+    def platform_match(self) -> Optional[Tuple["PlatformPattern", Dict[str, Optional[str]]]]:
+        """``match_platform``-style ``(pattern, groups)`` tuple (fresh dict)."""
+        if self.platform is None:
+            return None
+        return self.platform, dict(self.platform_groups)
+
+
+class UrlClassifier:
+    """Immutable, thread-safe classifier for one set of aggregator domains."""
+
+    def __init__(
+        self,
+        aggregator_domains: Iterable[str] = (),
+        platform_patterns: Optional[Sequence["PlatformPattern"]] = None,
+        cache_size: int = _CACHE_SIZE,
+    ):
+        """
+        Args:
+            aggregator_domains: Job-board domains (``job_sources.aggregator_domain``)
+            platform_patterns: Platform registry; defaults to ``PLATFORM_PATTERNS``
+            cache_size: LRU size for ``classify``
+        """
+        if platform_patterns is None:
+            # Imported lazily: the scrapers package imports this module.
+            from job_finder.scrapers.platform_patterns import PLATFORM_PATTERNS
+
+            platform_patterns = PLATFORM_PATTERNS
+        self._patterns = tuple(platform_patterns)
+        self._platform_regex, self._platform_groups = _combine_platform_patterns(self._patterns)
+        self._aggregators = _SuffixTrie(aggregator_domains)
+        self._ats = _SuffixTrie(ATS_DOMAINS)
+        self._excluded = _SuffixTrie(d for d in EXCLUDED_DOMAINS if "." in d)
+        self._aggregator_hosts = KeywordMatcher(AGGREGATOR_HOST_SUBSTRINGS, word_boundary=False)
+        self._classify_cached = lru_cache(maxsize=cache_size)(self._classify)
+
+    def classify(self, url: Optional[str]) -> UrlClassification:
+        """Classify *url*; never raises (unparseable URLs get an empty host)."""
+        return self._classify_cached(url or "")
+
+    def cache_info(self):
+        return self._classify_cached.cache_info()
+
+    def _classify(self, url: str) -> UrlClassification:
+        try:
+            host = (urlparse(url).hostname or "").rstrip(".")
+        except ValueError:
+            host = ""
+
+        platform = None
+        groups: Tuple[Tuple[str, Optional[str]], ...] = ()
+        if url and self._platform_regex is not None:
+            match = self._platform_regex.match(url)
+            if match and match.lastgroup:
+                index = int(match.lastgroup[1:])
+                platform = self._patterns[index]
+                groups = tuple(
+                    (name, match.group(renamed)) for name, renamed in self._platform_groups[index]
+                )
+
+        if not host:
+            return UrlClassification(host="", platform=platform, platform_groups=groups)
+
+        aggregator_host = self._aggregator_hosts.contains_any(host)
+        return UrlClassification(
+            host=host,
+            aggregator_domain=self._aggregators.match(host),
+            platform=platform,
+            platform_groups=groups,
+            ats_domain=self._ats.match(host),
+            excluded=aggregator_host or self._excluded.match(host) is not None,
+            aggregator_host=aggregator_host,
+        )
+
+
+_classifiers: "OrderedDict[tuple, UrlClassifier]" = OrderedDict()
+_classifiers_lock = threading.Lock()
+_MAX_CLASSIFIERS = 8
+
+
+def get_url_classifier(aggregator_domains: Iterable[str] = ()) -> UrlClassifier:
+    """Shared classifier for *aggregator_domains* and the current platform registry.
+
+    Classifiers are rebuilt when the domain list or ``PLATFORM_PATTERNS``
+    changes (e.g. after ``JobSourcesManager`` refreshes its domain cache).
+    """
+    from job_finder.scrapers.platform_patterns import PLATFORM_PATTERNS
+
+    domains = tuple(aggregator_domains)
+    key = (domains, tuple(map(id, PLATFORM_PATTERNS)))
+    with _classifiers_lock:
+        classifier = _classifiers.get(key)
+        if classifier is not None:
+            _classifiers.move_to_end(key)
+            return classifier
+    classifier = UrlClassifier(domains, PLATFORM_PATTERNS)
+    with _classifiers_lock:
+        _classifiers[key] = classifier
+        while len(_classifiers) > _MAX_CLASSIFIERS:
+            _classifiers.popitem(last=False)
+    return classifier
+
+
+def classify_url(url: Optional[str]) -> UrlClassification:
+    """Classify *url* without job-board domains (static lists and platforms only)."""
+    return get_url_classifier().classify(url)
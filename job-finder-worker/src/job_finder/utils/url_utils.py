@@ -11,6 +11,36 @@ logger = logging.getLogger(__name__)
 # when extracting company URLs from descriptions and gating apply_url fallbacks.
 AGGREGATOR_HOST_SUBSTRINGS = ("weworkremotely", "remotive", "remoteok", "jobicy")
 
+# ATS domains that strongly indicate a real application page
+ATS_DOMAINS = (
+    "greenhouse.io",
+    "lever.co",
+    "ashbyhq.com",
+    "workable.com",
+    "myworkdayjobs.com",
+    "smartrecruiters.com",
+    "recruitee.com",
+    "breezy.hr",
+    "bamboohr.com",
+    "icims.com",
+    "jobvite.com",
+    "applytojob.com",
+    "dover.com",
+    "rippling.com",
+)
+
+# Domains to exclude from search results (aggregators / generic boards)
+EXCLUDED_DOMAINS = (
+    "linkedin.com",
+    "indeed.com",
+    "glassdoor.com",
+    "ziprecruiter.com",
+    "monster.com",
+    "dice.com",
+    "careerbuilder.com",
+    *AGGREGATOR_HOST_SUBSTRINGS,
+)
+
 # Optional import: more accurate public-suffix parsing if available
 try:  # pragma: no cover - optional dependency
     import tldextract
@@ -0,0 +1,165 @@
+"""Tests for token-budgeted description compaction."""
+
+import sqlite3
+
+import pytest
+
+from job_finder.ai import compaction
+from job_finder.ai.compaction import (
+    DescriptionCompactor,
+    classify_heading,
+    count_tokens,
+    fit_description,
+    segment_sections,
+)
+from job_finder.storage.boilerplate_storage import BoilerplateStore
+
+ABOUT = (
+    "Acme builds logistics software for thousands of warehouses worldwide. We are a "
+    "remote-first team of engineers, designers and operators who love shipping."
+)
+REQUIREMENTS = "5+ years of Python experience.\nStrong PostgreSQL and Kubernetes skills."
+EEO = (
+    "Acme is an equal opportunity employer and considers all applicants without regard "
+    "to race, sex, age, or any other protected characteristic."
+)
+
+
+def _description(role: str = "Build the routing engine in Python and Go.") -> str:
+    return "\n\n".join(
+        [
+            "About Acme",
+            ABOUT,
+            "Responsibilities:",
+            role,
+            "Requirements:",
+            REQUIREMENTS,
+            "Compensation",
+            "$150,000 - $180,000 per year",
+            EEO,
+        ]
+    )
+
+
+@pytest.fixture(autouse=True)
+def _reset_stats():
+    compaction.reset_compaction_stats()
+    yield
+    compaction.reset_compaction_stats()
+
+
+def test_classify_heading():
+    assert classify_heading("What you'll do") == "responsibilities"
+    assert classify_heading("Qualifications") == "requirements"
+    assert classify_heading("Benefits & Perks") == "benefits"
+    assert classify_heading("Equal Opportunity") == "legal"
+    assert classify_heading("Our stack") == "overview"
+
+
+def test_segment_sections_groups_paragraphs_under_headings():
+    kinds = [s.kind for s in segment_sections(_description())]
+    assert kinds == ["about", "responsibilities", "requirements", "salary", "legal"]
+
+
+def test_legal_text_dropped_and_salary_kept():
+    result = DescriptionCompactor().compact(_description())
+    assert "equal opportunity" not in result.text
+    assert "$150,000" in result.text
+    assert "legal" in result.dropped_sections
+    assert result.tokens < result.original_tokens
+
+
+def test_budget_keeps_requirements_over_company_blurb():
+    long_about = "\n\n".join([ABOUT] * 20)
+    description = _description().replace(ABOUT, long_about)
+    result = DescriptionCompactor(budget_tokens=120).compact(description)
+
+    assert "PostgreSQL" in result.text
+    assert "routing engine" in result.text
+    assert "Acme builds logistics" not in result.text
+    assert "about" in result.dropped_sections
+    assert result.tokens <= 120
+
+
+def test_html_description_is_sanitized():
+    html = "<p>About Acme</p><p>" + ABOUT + "</p><h3>Requirements</h3><ul><li>Python</li></ul>"
+    result = DescriptionCompactor().compact(html)
+    assert "<p>" not in result.text
+    assert "Python" in result.text
+
+
+def test_company_boilerplate_learned_after_min_postings(tmp_path):
+    db_path = str(tmp_path / "boilerplate.db")
+    sqlite3.connect(db_path).close()
+    compactor = DescriptionCompactor(BoilerplateStore(db_path, min_postings=3))
+
+    roles = ["Build the router.", "Own the billing API.", "Scale the data platform."]
+    for role in roles[:2]:
+        assert ABOUT in compactor.compact(_description(role), "Acme", observe=True).text
+
+    # Same posting again does not count twice
+    compactor.compact(_description(roles[1]), "Acme", observe=True)
+    assert ABOUT in compactor.compact(_description(roles[1]), "Acme").text
+
+    result = compactor.compact(_description(roles[2]), "Acme", observe=True)
+    assert ABOUT not in result.text
+    assert result.boilerplate_paragraphs == 1
+    assert "Scale the data platform." in result.text
+    # Other companies are unaffected
+    assert ABOUT in compactor.compact(_description(roles[2]), "Other Co").text
+
+
+def test_templated_boilerplate_matched_by_shingles(tmp_path):
+    db_path = str(tmp_path / "boilerplate.db")
+    sqlite3.connect(db_path).close()
+    compactor = DescriptionCompactor(BoilerplateStore(db_path, min_postings=3))
+    blurb = (
+        "Acme builds logistics software for thousands of warehouses worldwide, and the "
+        "{team} team is a remote-first group of engineers, designers and operators who love "
+        "shipping useful tools to the people who move freight every day."
+    )
+
+    for team in ["Routing", "Billing", "Platform"]:
+        compactor.compact(
+            _description().replace(ABOUT, blurb.format(team=team)), "Acme", observe=True
+        )
+
+    result = compactor.compact(_description().replace(ABOUT, blurb.format(team="Search")), "Acme")
+    assert "Search team" not in result.text
+    assert result.boilerplate_paragraphs == 1
+    # A different paragraph that shares a phrase is kept
+    other = "Acme builds logistics software, but this team writes firmware for scanners in Rust."
+    assert other in compactor.compact(_description().replace(ABOUT, other), "Acme").text
+
+
+def test_repeated_salary_paragraph_is_never_boilerplate(tmp_path):
+    db_path = str(tmp_path / "boilerplate.db")
+    sqlite3.connect(db_path).close()
+    compactor = DescriptionCompactor(BoilerplateStore(db_path, min_postings=2))
+    pay = (
+        "The base salary range for this role is $150,000 - $180,000 per year, plus equity "
+        "and an annual bonus."
+    )
+    for role in ["Role one.", "Role two.", "Role three."]:
+        text = compactor.compact(f"{role}\n\n{pay}", "Acme", observe=True).text
+    assert pay in text
+
+
+def test_fit_description_short_text_unchanged():
+    assert fit_description("Short description") == "Short description"
+    assert fit_description(None) == ""
+
+
+def test_count_tokens_falls_back_to_estimate(monkeypatch):
+    monkeypatch.setattr(compaction, "_encoder", None)
+    monkeypatch.setattr(compaction, "_encoder_loaded", True)
+    assert count_tokens("") == 0
+    assert count_tokens("a" * 40) == 10
+
+
+def test_stats_recorded():
+    DescriptionCompactor().compact(_description())
+    stats = compaction.get_compaction_stats()
+    assert stats["descriptions"] == 1
+    assert stats["compacted"] == 1
+    assert stats["tokens_out"] < stats["tokens_in"]
@@ -0,0 +1,108 @@
+"""Tests for the fused extraction + match analysis call."""
+
+import json
+from unittest.mock import MagicMock
+
+import pytest
+
+from job_finder.ai.extraction import (
+    JobExtractor,
+    get_fused_extraction_stats,
+    reset_fused_extraction_stats,
+)
+from job_finder.ai.matcher import AIJobMatcher
+from job_finder.ai.task_router import get_model_for_task, is_fused_task
+
+_DESCRIPTION = (
+    "Acme builds logistics software for freight carriers around the world. " * 3
+    + "You will own our Python and PostgreSQL services. This is a fully remote role, "
+    "full-time, and the base salary range is $150,000 - $180,000 per year."
+)
+_JOB = {
+    "title": "Senior Backend Engineer",
+    "company": "Acme",
+    "company_info": "Acme ships freight software.",
+    "description": _DESCRIPTION,
+    "location": "Remote - US",
+}
+_EXTRACTION = {
+    "seniority": "senior",
+    "workArrangement": "remote",
+    "timezone": -5,
+    "salaryMin": 150000,
+    "salaryMax": 180000,
+    "employmentType": "full-time",
+    "technologies": ["Python", "PostgreSQL"],
+    "includesEquity": True,
+}
+_ANALYSIS = {"matched_skills": ["Python"], "missing_skills": ["Go"], "experience_match": "Fits."}
+
+
+@pytest.fixture(autouse=True)
+def _reset_stats():
+    reset_fused_extraction_stats()
+    yield
+    reset_fused_extraction_stats()
+
+
+def _run(mock_profile, response: dict):
+    client = MagicMock()
+    client.execute.return_value = MagicMock(text=json.dumps(response), model="m")
+    matcher = AIJobMatcher(client, mock_profile)
+    return client, JobExtractor(client).extract_fused(dict(_JOB), matcher)
+
+
+def test_one_call_returns_both_guarded_parts(mock_profile):
+    client, fused = _run(mock_profile, {"extraction": _EXTRACTION, "analysis": _ANALYSIS})
+
+    assert client.execute.call_count == 1
+    call = client.execute.call_args[1]
+    assert call["task_type"] == "fused"
+    assert "# Task 1: extraction" in call["system_prompt"]
+    assert "# Task 2: analysis" in call["system_prompt"]
+    assert call["prompt"].count("freight carriers") == 3  # posting sent once
+    assert "Acme ships freight software." in call["prompt"]
+
+    assert fused.extraction.technologies == ["python", "postgresql"]
+    assert fused.extraction.salary_min == 150000
+    assert fused.extraction.includes_equity is False  # equity guard still applies
+    assert fused.analysis == _ANALYSIS
+    assert get_fused_extraction_stats() == {"fused": 1, "fallbacks": 0}
+
+
+@pytest.mark.parametrize(
+    "response",
+    [
+        {"extraction": _EXTRACTION, "analysis": {"matched_skills": ["Python"]}},
+        {"extraction": "n/a", "analysis": _ANALYSIS},
+        {"analysis": _ANALYSIS},
+        [_EXTRACTION, _ANALYSIS],
+    ],
+)
+def test_invalid_part_falls_back(mock_profile, response):
+    client, fused = _run(mock_profile, response)
+
+    assert fused is None
+    assert client.execute.call_count == 1
+    assert get_fused_extraction_stats() == {"fused": 0, "fallbacks": 1}
+
+
+def test_analyze_job_uses_fused_analysis(mock_profile):
+    client = MagicMock()
+    matcher = AIJobMatcher(client, mock_profile)
+
+    result = matcher.analyze_job({**_JOB, "deterministic_score": 80}, analysis=_ANALYSIS)
+
+    client.execute.assert_not_called()
+    assert result.match_score == 80
+    assert result.missing_skills == ["Go"]
+
+
+def test_fused_mode_is_opt_in_per_task(monkeypatch):
+    monkeypatch.delenv("LITELLM_FUSED_TASKS", raising=False)
+    assert not is_fused_task("extraction")
+
+    monkeypatch.setenv("LITELLM_FUSED_TASKS", "extraction, analysis")
+    assert is_fused_task("extraction")
+    assert not is_fused_task("analysis")  # only extraction can be fused
+    assert get_model_for_task("fused") == "local-extract"
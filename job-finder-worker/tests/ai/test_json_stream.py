@@ -0,0 +1,88 @@
+"""Tests for the incremental JSON stream scanner."""
+
+import json
+
+from job_finder.ai.json_stream import (
+    ABORT_NOT_OBJECT,
+    ABORT_OFF_SCHEMA,
+    ABORT_PROSE,
+    OUTCOME_COMPLETE,
+    OUTCOME_TRUNCATED,
+    JSONStreamScanner,
+)
+
+
+def _feed_chars(scanner, text):
+    """Feed one character at a time; return (outcome, chars consumed)."""
+    for i, char in enumerate(text):
+        if scanner.feed(char):
+            return scanner.outcome, i + 1
+    return scanner.finish(), len(text)
+
+
+class TestJSONStreamScanner:
+    def test_complete_object_stops_before_trailing_chatter(self):
+        body = '{"seniority": "senior", "technologies": ["go", "k8s"], "nested": {"a": "}"}}'
+        scanner = JSONStreamScanner()
+
+        outcome, consumed = _feed_chars(scanner, body + "\n\nHope this helps!")
+
+        assert outcome == OUTCOME_COMPLETE
+        assert consumed == len(body)
+        assert json.loads(scanner.salvage())["nested"] == {"a": "}"}
+
+    def test_fence_and_think_block_skipped(self):
+        scanner = JSONStreamScanner(expected_keys={"seniority"})
+        text = '<think>the answer is {maybe} [x]</think>\n```json\n{"seniority": "mid"}\n```'
+
+        outcome, _ = _feed_chars(scanner, text)
+
+        assert outcome == OUTCOME_COMPLETE
+        assert json.loads(scanner.salvage()) == {"seniority": "mid"}
+
+    def test_prose_aborts_after_preamble_budget(self):
+        scanner = JSONStreamScanner(max_preamble_chars=40)
+
+        outcome, consumed = _feed_chars(scanner, "I'm sorry, but I can't help with that. " * 10)
+
+        assert outcome == ABORT_PROSE
+        assert consumed < 60
+        assert scanner.salvage() == "{}"
+
+    def test_array_and_scalar_responses_abort(self):
+        assert _feed_chars(JSONStreamScanner(), '[{"a": 1}]')[0] == ABORT_NOT_OBJECT
+        assert _feed_chars(JSONStreamScanner(), '```json\n"just a string"')[0] == ABORT_NOT_OBJECT
+
+    def test_unexpected_first_key_aborts(self):
+        scanner = JSONStreamScanner(expected_keys={"seniority", "technologies"})
+
+        outcome, consumed = _feed_chars(scanner, '{"job": {"seniority": "senior"}}')
+
+        assert outcome == ABORT_OFF_SCHEMA
+        assert consumed == len('{"job"')
+
+    def test_only_top_level_keys_are_checked(self):
+        scanner = JSONStreamScanner(expected_keys={"results"})
+        outcome, _ = _feed_chars(scanner, '{"results": [{"anything": 1}]}')
+        assert outcome == OUTCOME_COMPLETE
+
+    def test_truncated_stream_salvages_complete_members(self):
+        scanner = JSONStreamScanner()
+        text = '{"seniority": "senior", "salaryMin": 150000, "technologies": ["go", "ru'
+
+        outcome, _ = _feed_chars(scanner, text)
+
+        assert outcome == OUTCOME_TRUNCATED
+        assert json.loads(scanner.salvage()) == {
+            "seniority": "senior",
+            "salaryMin": 150000,
+            "technologies": ["go"],
+        }
+
+    def test_salvage_is_valid_json_at_every_cut(self):
+        body = '{"a": "x,y", "b": [1, {"c": true}], "d": null, "e": -2.5e3}'
+        for cut in range(len(body)):
+            scanner = JSONStreamScanner()
+            scanner.feed(body[:cut])
+            scanner.finish()
+            assert isinstance(json.loads(scanner.salvage()), dict), body[:cut]
@@ -0,0 +1,201 @@
+"""Tests for deterministic pre-extraction and its use by JobExtractor."""
+
+import json
+from datetime import datetime, timedelta, timezone
+from unittest.mock import MagicMock
+
+from job_finder.ai.extraction import (
+    RULES_MODEL,
+    JobExtractor,
+    get_pre_extraction_stats,
+    reset_pre_extraction_stats,
+)
+from job_finder.ai.extraction_prompts import EXTRACTION_FIELD_KEYS
+from job_finder.ai.pre_extraction import (
+    PreExtraction,
+    PreExtractor,
+    parse_salary_range,
+    structured_fields,
+)
+
+_BENEFITS = "We offer health insurance, dental, and a 401(k) match. "
+_PLAIN = "Build Python services and own them in production. " * 6
+
+
+def _settled(title="Software Engineer", description=_PLAIN, **kwargs):
+    return PreExtractor().extract(title, description, **kwargs).settled
+
+
+class TestStructuredFields:
+    def test_ashby_fields(self):
+        settled = _settled(structured={"employment_type": "FullTime", "is_remote": True})
+        assert settled["employment_type"] == "full-time"
+        assert settled["is_contract"] is False
+        assert settled["work_arrangement"] == "remote"
+
+    def test_greenhouse_metadata_and_lever_commitment(self):
+        settled = _settled(
+            structured={"metadata": {"Location Type": "Hybrid"}, "commitment": "Contract"}
+        )
+        assert settled["work_arrangement"] == "hybrid"
+        assert settled["employment_type"] == "contract"
+        assert settled["is_contract"] is True
+
+    def test_workday_time_type_and_jobicy_level(self):
+        settled = _settled(structured={"time_type": "Part time", "job_level": "Midweight"})
+        assert settled["employment_type"] == "part-time"
+        assert settled["seniority"] == "mid"
+
+    def test_ats_salary_range_is_authoritative(self):
+        settled = _settled(salary_range="USD 165000-220000")
+        assert (settled["salary_min"], settled["salary_max"]) == (165000, 220000)
+        assert parse_salary_range("$150,000 - $170,000") == (150000, 170000)
+        assert parse_salary_range("competitive") is None
+
+    def test_structured_fields_keeps_only_known_keys(self):
+        job = {
+            "title": "Engineer",
+            "employment_type": "FullTime",
+            "is_remote": None,
+            "metadata": {"Location Type": "Remote", "Internal Notes": "x" * 500},
+        }
+        assert structured_fields(job) == {
+            "employment_type": "FullTime",
+            "metadata": {"Location Type": "Remote"},
+        }
+
+
+class TestTextRules:
+    def test_seniority_from_title(self):
+        assert _settled("Senior Backend Engineer")["seniority"] == "senior"
+        assert _settled("Sr. Staff Software Engineer")["seniority"] == "staff"
+        assert _settled("Software Engineer II")["seniority"] == "mid"
+        assert "seniority" not in _settled("Software Engineer")
+
+    def test_single_salary_range_in_text(self):
+        settled = _settled(description=_PLAIN + "The base salary range is $140,000 - $180,000.")
+        assert (settled["salary_min"], settled["salary_max"]) == (140000, 180000)
+
+    def test_tiered_or_hourly_salary_left_to_the_model(self):
+        tiers = "Salary: $140,000 - $180,000 (NYC); $120,000 - $160,000 (elsewhere)."
+        hourly = "Pay: $50.00 - $70.00 per hour. Salary: $60K - $80K per hour equivalent."
+        assert "salary_min" not in _settled(description=_PLAIN + tiers)
+        assert "salary_min" not in _settled(description=_PLAIN + hourly)
+
+    def test_no_salary_text_settles_empty_salary(self):
+        settled = _settled()
+        assert settled["salary_min"] is None and settled["salary_max"] is None
+
+    def test_location_resolves_city_and_standard_offset(self):
+        settled = _settled(location="Austin, TX")
+        assert settled["city"] == "Austin"
+        assert settled["timezone"] == -6.0
+        assert settled["timezone_flexible"] is False
+
+    def test_remote_location_never_sets_city(self):
+        settled = _settled(location="Remote - US")
+        assert settled["work_arrangement"] == "remote"
+        assert "city" not in settled
+        assert "timezone_flexible" not in settled
+
+    def test_benefits_imply_full_time_unless_contract_language(self):
+        assert _settled(description=_PLAIN + _BENEFITS)["employment_type"] == "full-time"
+        contract = _PLAIN + _BENEFITS + "This is a 6-month contract role, C2C welcome."
+        assert "employment_type" not in _settled(description=contract)
+
+    def test_benefits_do_not_override_part_time_text(self):
+        description = (
+            "This is a part-time position, about 20 hours per week. "
+            "Benefits include dental and vision."
+        )
+        settled = _settled(description=description, location="Austin, TX")
+        assert "employment_type" not in settled
+        assert "is_contract" not in settled
+
+    def test_bare_contract_overrides_full_time_hours(self):
+        description = "We are hiring for a 6-month contract. Full-time hours expected."
+        settled = _settled(description=description)
+        assert "employment_type" not in settled
+        assert "is_contract" not in settled
+
+    def test_single_experience_requirement(self):
+        settled = _settled(description=_PLAIN + "You have 5+ years of backend experience.")
+        assert (settled["experience_min"], settled["experience_max"]) == (5, None)
+        mixed = _PLAIN + "3+ years of Python and 5+ years overall."
+        assert "experience_min" not in _settled(description=mixed)
+
+    def test_days_old_from_posted_date(self):
+        posted = (datetime.now(timezone.utc) - timedelta(days=3)).isoformat()
+        assert _settled(posted_date=posted)["days_old"] == 3
+
+    def test_disabled_settles_nothing(self):
+        pre = PreExtractor(enabled=False).extract("Senior Engineer", _PLAIN, "Remote")
+        assert pre.settled == {}
+
+
+class TestJobExtractorPreExtraction:
+    def setup_method(self):
+        reset_pre_extraction_stats()
+
+    def _client(self, payload):
+        client = MagicMock()
+        client.execute.return_value = MagicMock(text=json.dumps(payload), model="local-extract")
+        return client
+
+    def test_llm_asked_only_for_unsettled_fields(self):
+        client = self._client({"technologies": ["Python"], "seniority": "junior"})
+        extractor = JobExtractor(client)
+
+        result = extractor.extract(
+            "Senior Backend Engineer",
+            _PLAIN + _BENEFITS,
+            location="Remote",
+            structured={"employment_type": "FullTime"},
+        )
+
+        user_prompt = client.execute.call_args[1]["prompt"]
+        requested = user_prompt.splitlines()[1]
+        assert requested.startswith("Return only these fields:")
+        assert "technologies" in requested and "roleTypes" in requested
+        assert "seniority" not in requested and "employmentType" not in requested
+        # Settled values win over what the model returned
+        assert result.seniority == "senior"
+        assert result.work_arrangement == "remote"
+        assert result.technologies == ["python"]
+        assert get_pre_extraction_stats()["targeted"] == 1
+
+    def test_llm_skipped_when_every_field_settled(self):
+        everything = {name: None for name in EXTRACTION_FIELD_KEYS}
+        everything.update(seniority="senior", technologies=["go"], role_types=["backend"])
+        pre_extractor = MagicMock()
+        pre_extractor.extract.return_value = PreExtraction(
+            values=everything, confidence={name: 1.0 for name in everything}
+        )
+        client = MagicMock()
+
+        result = JobExtractor(client, pre_extractor=pre_extractor).extract(
+            "Senior Go Engineer", _PLAIN
+        )
+
+        client.execute.assert_not_called()
+        assert result.extraction_model == RULES_MODEL
+        assert result.technologies == ["go"]
+        assert get_pre_extraction_stats()["skipped"] == 1
+
+    def test_repair_skipped_when_missing_fields_are_settled_empty(self):
+        # Model leaves salary and timezone empty; pre-extraction knows there is
+        # no salary text and the role is remote-only, so only timezone is open.
+        client = self._client(
+            {"seniority": "senior", "workArrangement": "remote", "technologies": ["go"]}
+        )
+        extractor = JobExtractor(client)
+
+        result = extractor.extract_with_repair(
+            "Senior Go Engineer",
+            _PLAIN + _BENEFITS,
+            location="Remote",
+        )
+
+        assert client.execute.call_count == 1
+        assert result.salary_min is None
+        assert get_pre_extraction_stats()["repairs_avoided"] == 1
@@ -7,8 +7,10 @@ the system/user split preserves the expected content.
 from unittest.mock import Mock
 
 from job_finder.ai.extraction_prompts import (
+    build_batch_extraction_prompt,
     build_extraction_prompt,
     build_repair_prompt,
+    build_taxonomy_enrich_prompt,
 )
 from job_finder.ai.prompts import JobMatchPrompts
 
@@ -36,11 +38,13 @@ class TestExtractionPromptPair:
         assert "Infer seniority" in system
         assert "Detect work arrangement" in system
 
-    def test_system_contains_todays_date(self):
+    def test_todays_date_in_user_not_system(self):
+        """The date changes daily, so it stays out of the cacheable prefix."""
         from datetime import date
 
-        system, _ = build_extraction_prompt("Engineer", "Build things")
-        assert date.today().isoformat() in system
+        system, user = build_extraction_prompt("Engineer", "Build things")
+        assert date.today().isoformat() not in system
+        assert user.startswith(f"Today's date: {date.today().isoformat()}")
 
     def test_user_contains_job_title(self):
         _, user = build_extraction_prompt("Senior Backend Engineer", "Build APIs")
@@ -78,6 +82,34 @@ class TestExtractionPromptPair:
         assert "Unique Location" not in system
 
 
+class TestStablePrefix:
+    """System prompts are byte-identical across requests (prefix-cache reuse)."""
+
+    def test_extraction_system_identical_across_jobs(self):
+        a, _ = build_extraction_prompt("Engineer", "desc one", location="Remote")
+        b, _ = build_extraction_prompt("Designer", "desc two", posted_date="2025-01-01")
+        assert a == b
+
+    def test_batch_system_independent_of_batch_size(self):
+        jobs = [{"title": f"Job {n}", "description": f"desc {n}"} for n in range(4)]
+        system_two, user_two = build_batch_extraction_prompt(jobs[:2])
+        system_four, _ = build_batch_extraction_prompt(jobs)
+        assert system_two == system_four
+        assert "2 job postings follow." in user_two
+
+    def test_repair_system_independent_of_missing_fields(self):
+        a, user = build_repair_prompt("Engineer", "desc", ["seniority"])
+        b, _ = build_repair_prompt("Engineer", "desc", ["timezone", "technologies"])
+        assert a == b
+        assert "Missing fields to fill: seniority" in user
+
+    def test_taxonomy_prompt_split(self):
+        system, user = build_taxonomy_enrich_prompt(["pgvector"], "ML Engineer", "Uses pgvector")
+        assert "pgvector" not in system
+        assert "- pgvector" in user
+        assert '"canonical"' in system
+
+
 class TestRepairPromptPair:
     """Test build_repair_prompt returns a valid PromptPair."""
 
@@ -161,6 +193,15 @@ class TestMatcherPromptPair:
         assert "Acme Corp" in user
         assert "Build scalable systems" in user
 
+    def test_system_starts_with_static_instructions(self):
+        system, _ = JobMatchPrompts.analyze_job_match(self._make_profile(), self._make_job())
+        other = self._make_profile()
+        other.name = "Someone Else"
+        system_other, _ = JobMatchPrompts.analyze_job_match(other, self._make_job())
+        profile_at = system.index("# Candidate Profile")
+        assert system[:profile_at] == system_other[:profile_at]
+        assert "matched_skills" in system[:profile_at]
+
     def test_system_does_not_contain_job_data(self):
         """System prompt should not contain job-specific data."""
         system, _ = JobMatchPrompts.analyze_job_match(self._make_profile(), self._make_job())
@@ -0,0 +1,156 @@
+"""Tests for field-scoped repair excerpts and their use by JobExtractor."""
+
+import json
+from unittest.mock import MagicMock
+
+from job_finder.ai.extraction import (
+    JobExtractionResult,
+    JobExtractor,
+    get_pre_extraction_stats,
+    reset_pre_extraction_stats,
+)
+from job_finder.ai.extraction_prompts import build_repair_prompt
+from job_finder.ai.repair import select_repair_excerpts, split_sentences
+
+_FILLER = "Acme builds logistics software for freight carriers around the world. " * 8
+_DESCRIPTION = (
+    "About Acme\n\n"
+    f"{_FILLER}\n\n"
+    "Requirements:\n"
+    "- 5+ years of experience with Go and PostgreSQL\n"
+    "- Kubernetes in production\n\n"
+    "This is a hybrid role, three days a week in our Denver office.\n\n"
+    "The base salary range is $150,000 - $180,000 per year."
+)
+
+
+class TestSelectRepairExcerpts:
+    def test_split_sentences_strips_bullets_and_keeps_section_kind(self):
+        units = split_sentences(_DESCRIPTION)
+
+        assert ("requirements", "Kubernetes in production") in units
+        assert all(not sentence.startswith("-") for _, sentence in units)
+
+    def test_excerpts_scoped_to_requested_fields(self):
+        plan = select_repair_excerpts(_DESCRIPTION, ["salary_min", "work_arrangement"])
+
+        assert plan.fields == ["salary_min", "work_arrangement"]
+        assert plan.excerpts == [
+            "This is a hybrid role, three days a week in our Denver office.",
+            "The base salary range is $150,000 - $180,000 per year.",
+        ]
+
+    def test_requirement_bullets_are_technology_evidence(self):
+        plan = select_repair_excerpts(_DESCRIPTION, ["technologies"])
+
+        assert "Kubernetes in production" in plan.excerpts
+        assert not any("freight" in excerpt for excerpt in plan.excerpts)
+
+    def test_known_technology_names_are_evidence_but_not_acronyms(self):
+        plan = select_repair_excerpts(
+            "We pay $150k-$200k. Remote in US. Python and Go required.", ["technologies"]
+        )
+
+        assert plan.excerpts == ["Python and Go required."]
+
+    def test_caller_technologies_extend_the_wordlist(self):
+        description = "You will maintain our Zig services. Generous PTO and a US team."
+
+        assert select_repair_excerpts(description, ["technologies"]).fields == []
+        plan = select_repair_excerpts(
+            description, ["technologies"], known_technologies=frozenset({"zig", "pto"})
+        )
+        assert plan.excerpts == ["You will maintain our Zig services."]
+
+    def test_timezone_matches_location_words(self):
+        plan = select_repair_excerpts(_DESCRIPTION, ["timezone"], location="Denver, CO")
+
+        assert plan.excerpts == ["This is a hybrid role, three days a week in our Denver office."]
+
+    def test_fields_without_evidence_are_dropped(self):
+        plan = select_repair_excerpts(_FILLER, ["salary_min", "employment_type", "seniority"])
+
+        assert plan.fields == ["seniority"]
+        assert plan.dropped == ["salary_min", "employment_type"]
+        assert plan.excerpts == []
+
+    def test_location_fields_kept_when_location_known(self):
+        assert select_repair_excerpts(_FILLER, ["timezone"]).fields == []
+        assert select_repair_excerpts(_FILLER, ["timezone"], location="Austin, TX").fields == [
+            "timezone"
+        ]
+
+    def test_budget_is_shared_round_robin(self):
+        salary_lines = "\n".join(f"Salary band {n}: ${n}00,000." for n in range(1, 9))
+        remote_lines = "\n".join(f"Remote option {n} available." for n in range(1, 9))
+        plan = select_repair_excerpts(
+            f"{salary_lines}\n{remote_lines}", ["salary_min", "work_arrangement"], budget_tokens=40
+        )
+
+        assert any("Salary" in excerpt for excerpt in plan.excerpts)
+        assert any("Remote" in excerpt for excerpt in plan.excerpts)
+        assert plan.tokens <= 40
+
+
+class TestRepairPrompt:
+    def test_excerpts_replace_description(self):
+        system, user = build_repair_prompt(
+            "Engineer", _DESCRIPTION, ["salary_min"], excerpts=["Pay is $150k - $180k."]
+        )
+
+        assert "Relevant excerpts:\n- Pay is $150k - $180k." in user
+        assert "freight" not in user
+        # Field guide stays in the shared system prompt
+        assert system == build_repair_prompt("Engineer", "desc", ["seniority"])[0]
+
+    def test_no_excerpts_still_renders(self):
+        _, user = build_repair_prompt("Senior Engineer", _DESCRIPTION, ["seniority"], excerpts=[])
+
+        assert "Relevant excerpts:\n(none)" in user
+
+
+class TestJobExtractorRepair:
+    def setup_method(self):
+        reset_pre_extraction_stats()
+
+    def test_repair_sends_only_excerpts(self):
+        client = MagicMock()
+        client.execute.side_effect = [
+            MagicMock(text=json.dumps({"seniority": "senior"}), model="m"),
+            MagicMock(
+                text=json.dumps(
+                    {"technologies": ["go", "postgresql"], "salaryMin": 150000, "salaryMax": 180000}
+                ),
+                model="m",
+            ),
+        ]
+
+        result = JobExtractor(client).extract_with_repair("Senior Engineer", _DESCRIPTION)
+
+        assert client.execute.call_count == 2
+        repair_prompt = client.execute.call_args_list[1][1]["prompt"]
+        assert "Relevant excerpts:" in repair_prompt
+        assert "5+ years of experience with Go and PostgreSQL" in repair_prompt
+        assert "freight" not in repair_prompt
+        assert result.technologies == ["go", "postgresql"]
+
+    def test_repair_skipped_without_evidence(self):
+        # Salary is settled empty (no salary text); technologies and
+        # employment type stay open, and nothing in the text mentions either.
+        client = MagicMock()
+        client.execute.return_value = MagicMock(
+            text=json.dumps({"seniority": "senior", "workArrangement": "remote", "timezone": -5}),
+            model="m",
+        )
+
+        JobExtractor(client).extract_with_repair("Senior Engineer", _FILLER, location="Remote")
+
+        assert client.execute.call_count == 1
+        assert get_pre_extraction_stats()["repairs_no_evidence"] == 1
+
+
+def test_merge_fills_salary_range_from_repair():
+    result = JobExtractionResult()
+    result.merge(JobExtractionResult(salary_min=150000, salary_max=180000))
+
+    assert (result.salary_min, result.salary_max) == (150000, 180000)
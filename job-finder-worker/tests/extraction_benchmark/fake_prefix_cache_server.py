@@ -0,0 +1,211 @@
+#!/usr/bin/env python3
+"""Local OpenAI-compatible server that simulates backend prefix caching.
+
+Stands in for a LiteLLM-fronted vLLM / llama.cpp backend when measuring how
+much prompt prefix the worker's prompts let the backend reuse. Like vLLM's
+automatic prefix caching, the serialized chat messages are split into fixed
+blocks chained by hash; a request reuses every leading block already in the
+cache and pays prefill only for the rest:
+
+    latency = uncached_prompt_tokens * prefill_ms + completion_tokens * decode_ms
+
+The server sleeps ``latency * time_scale`` and reports the cached tokens as
+``usage.prompt_tokens_details.cached_tokens`` (what ``InferenceClient``
+records). Tokens are estimated at 4 characters each; no model runs, every
+completion is an empty JSON object.
+
+Usage:
+    python fake_prefix_cache_server.py --port 4001
+    LITELLM_BASE_URL=http://localhost:4001 ...   # point the worker at it
+
+Or in-process (see ``measure_prefix_cache.py``):
+    server = FakePrefixCacheServer(port=0).start()
+    ...
+    server.stop()
+"""
+
+from __future__ import annotations
+
+import argparse
+import hashlib
+import json
+import threading
+import time
+from collections import OrderedDict
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Any, Dict, List, Tuple
+
+CHARS_PER_TOKEN = 4
+BLOCK_TOKENS = 16
+
+
+class PrefixCache:
+    """LRU of hash-chained prompt blocks (capacity in blocks)."""
+
+    def __init__(self, capacity_blocks: int = 20000, enabled: bool = True):
+        self.capacity_blocks = capacity_blocks
+        self.enabled = enabled
+        self._blocks: "OrderedDict[str, None]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def lookup_and_insert(self, text: str) -> Tuple[int, int]:
+        """Return (prompt_tokens, cached_tokens) for *text*, then cache its blocks."""
+        block_chars = BLOCK_TOKENS * CHARS_PER_TOKEN
+        prompt_tokens = max(1, (len(text) + CHARS_PER_TOKEN - 1) // CHARS_PER_TOKEN)
+        if not self.enabled:
+            return prompt_tokens, 0
+        chain = hashlib.sha256()
+        cached_blocks = 0
+        matching = True
+        with self._lock:
+            # Only full blocks are cacheable, as in vLLM
+            for start in range(0, len(text) - block_chars + 1, block_chars):
+                chain.update(text[start : start + block_chars].encode("utf-8"))
+                key = chain.hexdigest()
+                if matching and key in self._blocks:
+                    cached_blocks += 1
+                    self._blocks.move_to_end(key)
+                    continue
+                matching = False
+                self._blocks[key] = None
+            while len(self._blocks) > self.capacity_blocks:
+                self._blocks.popitem(last=False)
+        return prompt_tokens, min(prompt_tokens, cached_blocks * BLOCK_TOKENS)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._blocks.clear()
+
+
+class FakePrefixCacheServer:
+    """``/v1/chat/completions`` with simulated prefill/decode latency."""
+
+    def __init__(
+        self,
+        host: str = "127.0.0.1",
+        port: int = 4001,
+        prefill_ms_per_token: float = 0.25,
+        decode_ms_per_token: float = 20.0,
+        completion_tokens: int = 120,
+        time_scale: float = 1.0,
+        cache_enabled: bool = True,
+    ):
+        self.prefill_ms_per_token = prefill_ms_per_token
+        self.decode_ms_per_token = decode_ms_per_token
+        self.completion_tokens = completion_tokens
+        self.time_scale = time_scale
+        self.cache = PrefixCache(enabled=cache_enabled)
+        self.stats: Dict[str, float] = {}
+        self._stats_lock = threading.Lock()
+        self.reset_stats()
+        self._httpd = ThreadingHTTPServer((host, port), self._handler())
+        self._thread: threading.Thread | None = None
+
+    @property
+    def base_url(self) -> str:
+        host, port = self._httpd.server_address[:2]
+        return f"http://{host}:{port}"
+
+    def reset_stats(self) -> None:
+        with self._stats_lock:
+            self.stats = {
+                "requests": 0,
+                "prompt_tokens": 0,
+                "cached_tokens": 0,
+                "prefill_seconds": 0.0,
+                "simulated_seconds": 0.0,
+            }
+
+    def complete(self, body: Dict[str, Any]) -> Dict[str, Any]:
+        messages: List[Dict[str, str]] = body.get("messages") or []
+        # Serialize the way a chat template would: role markers, then content
+        text = "".join(f"<|{m.get('role')}|>{m.get('content') or ''}" for m in messages)
+        prompt_tokens, cached_tokens = self.cache.lookup_and_insert(text)
+        prefill = (prompt_tokens - cached_tokens) * self.prefill_ms_per_token / 1000
+        seconds = prefill + self.completion_tokens * self.decode_ms_per_token / 1000
+        with self._stats_lock:
+            self.stats["requests"] += 1
+            self.stats["prompt_tokens"] += prompt_tokens
+            self.stats["cached_tokens"] += cached_tokens
+            self.stats["prefill_seconds"] += prefill
+            self.stats["simulated_seconds"] += seconds
+        if self.time_scale > 0:
+            time.sleep(seconds * self.time_scale)
+        return {
+            "id": "chatcmpl-fake",
+            "object": "chat.completion",
+            "created": int(time.time()),
+            "model": body.get("model", "fake"),
+            "choices": [
+                {
+                    "index": 0,
+                    "message": {"role": "assistant", "content": "{}"},
+                    "finish_reason": "stop",
+                }
+            ],
+            "usage": {
+                "prompt_tokens": prompt_tokens,
+                "completion_tokens": self.completion_tokens,
+                "total_tokens": prompt_tokens + self.completion_tokens,
+                "prompt_tokens_details": {"cached_tokens": cached_tokens},
+            },
+        }
+
+    def _handler(self):
+        server = self
+
+        class Handler(BaseHTTPRequestHandler):
+            def do_POST(self):  # noqa: N802 (http.server API)
+                if not self.path.rstrip("/").endswith("/chat/completions"):
+                    self.send_error(404)
+                    return
+                length = int(self.headers.get("Content-Length") or 0)
+                payload = json.dumps(server.complete(json.loads(self.rfile.read(length))))
+                self.send_response(200)
+                self.send_header("Content-Type", "application/json")
+                self.send_header("Content-Length", str(len(payload)))
+                self.end_headers()
+                self.wfile.write(payload.encode("utf-8"))
+
+            def log_message(self, *args):
+                pass
+
+        return Handler
+
+    def start(self) -> "FakePrefixCacheServer":
+        self._thread = threading.Thread(target=self._httpd.serve_forever, daemon=True)
+        self._thread.start()
+        return self
+
+    def stop(self) -> None:
+        self._httpd.shutdown()
+        self._httpd.server_close()
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=4001)
+    parser.add_argument("--prefill-ms", type=float, default=0.25)
+    parser.add_argument("--decode-ms", type=float, default=20.0)
+    parser.add_argument("--time-scale", type=float, default=1.0)
+    parser.add_argument("--no-cache", action="store_true")
+    args = parser.parse_args()
+
+    server = FakePrefixCacheServer(
+        args.host,
+        args.port,
+        prefill_ms_per_token=args.prefill_ms,
+        decode_ms_per_token=args.decode_ms,
+        time_scale=args.time_scale,
+        cache_enabled=not args.no_cache,
+    )
+    print(f"Fake prefix-cache server on {server.base_url} (Ctrl-C to stop)")
+    try:
+        server._httpd.serve_forever()
+    except KeyboardInterrupt:
+        pass
+
+
+if __name__ == "__main__":
+    main()
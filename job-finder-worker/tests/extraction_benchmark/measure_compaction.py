@@ -0,0 +1,129 @@
+#!/usr/bin/env python3
+"""Measure description compaction on the benchmark listings (no model needed).
+
+Compares the prompt description the extractor used to send
+(``description[:8000]``) with ``DescriptionCompactor`` output:
+
+- tokens: per-listing description tokens, before and after
+- evidence retention: how many ground-truth values that appear in the
+  original description (technologies, city, salary figures, years of
+  experience) are still present in the text sent to the model
+
+Two compactor configurations are measured: store-less (token budget plus
+legal boilerplate) and with a warm per-company ``BoilerplateStore`` (every
+listing observed once first, as the worker would after a scrape).
+
+Usage:
+    python measure_compaction.py
+    python measure_compaction.py --budget 1500
+
+Extraction accuracy itself needs a model: run ``run_benchmark.py <model>``
+(the production prompt builders compact automatically) and compare with
+``results/report.txt``.
+"""
+
+import argparse
+import json
+import re
+import sqlite3
+import statistics
+import sys
+import tempfile
+from pathlib import Path
+
+BENCHMARK_DIR = Path(__file__).parent
+sys.path.insert(0, str(BENCHMARK_DIR.parent.parent / "src"))
+
+from job_finder.ai.compaction import (  # noqa: E402
+    DEFAULT_DESCRIPTION_TOKEN_BUDGET,
+    DescriptionCompactor,
+    count_tokens,
+)
+from job_finder.scrapers.text_sanitizer import sanitize_html_description  # noqa: E402
+from job_finder.storage.boilerplate_storage import BoilerplateStore  # noqa: E402
+
+
+def load_jsonl(path: Path) -> list[dict]:
+    with open(path) as f:
+        return [json.loads(line) for line in f if line.strip()]
+
+
+def evidence(truth: dict) -> list[str]:
+    """Ground-truth values a reader would look for in the description text."""
+    values = [t.lower() for t in truth.get("technologies") or [] if len(t) > 2]
+    if truth.get("city"):
+        values.append(truth["city"].lower())
+    for key in ("salaryMin", "salaryMax"):
+        amount = truth.get(key)
+        if isinstance(amount, int) and amount >= 1000:
+            values.append(f"{amount // 1000}")
+    if isinstance(truth.get("experienceMin"), int):
+        values.append(f"{truth['experienceMin']}+")
+    return values
+
+
+def present(value: str, text: str) -> bool:
+    return re.search(rf"(?<![a-z0-9]){re.escape(value)}", text) is not None
+
+
+def measure(name: str, listings: list[dict], truths: dict, compact) -> dict:
+    before, after, kept, total = [], [], 0, 0
+    for listing in listings:
+        original = listing["description"] or ""
+        old_prompt = original[:8000]
+        new_prompt = compact(listing)
+        before.append(count_tokens(old_prompt))
+        after.append(count_tokens(new_prompt))
+
+        readable = sanitize_html_description(original).lower()
+        new_lower = sanitize_html_description(new_prompt).lower()
+        for value in evidence(truths[listing["id"]].get("extraction") or {}):
+            if present(value, readable):
+                total += 1
+                kept += present(value, new_lower)
+
+    saved = 1 - sum(after) / max(1, sum(before))
+    print(
+        f"{name:<28} tokens {sum(before):>7} -> {sum(after):>7} ({saved:6.1%} saved)  "
+        f"median {statistics.median(before):>5.0f} -> {statistics.median(after):>5.0f}  "
+        f"evidence kept {kept}/{total} ({kept / max(1, total):.1%})"
+    )
+    return {"saved": saved, "evidence": kept / max(1, total)}
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--budget", type=int, default=DEFAULT_DESCRIPTION_TOKEN_BUDGET)
+    args = parser.parse_args()
+
+    truths = {t["id"]: t for t in load_jsonl(BENCHMARK_DIR / "ground_truth.jsonl")}
+    listings = [
+        item for item in load_jsonl(BENCHMARK_DIR / "sample_listings.jsonl") if item["id"] in truths
+    ]
+    print(f"{len(listings)} listings, budget {args.budget} tokens")
+
+    storeless = DescriptionCompactor(budget_tokens=args.budget)
+    measure(
+        "budget + legal",
+        listings,
+        truths,
+        lambda job: storeless.compact(job["description"], job.get("company_name")).text,
+    )
+
+    with tempfile.TemporaryDirectory() as tmp:
+        db_path = str(Path(tmp) / "boilerplate.db")
+        sqlite3.connect(db_path).close()
+        store = BoilerplateStore(db_path, min_postings=2)
+        warm = DescriptionCompactor(store, budget_tokens=args.budget)
+        for job in listings:
+            warm.compact(job["description"], job.get("company_name"), observe=True)
+        measure(
+            "budget + legal + company store",
+            listings,
+            truths,
+            lambda job: warm.compact(job["description"], job.get("company_name")).text,
+        )
+
+
+if __name__ == "__main__":
+    main()
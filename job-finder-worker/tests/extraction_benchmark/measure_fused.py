@@ -0,0 +1,120 @@
+#!/usr/bin/env python3
+"""Measure fused extraction + match analysis prompts on the benchmark listings (no model needed).
+
+For every listing the prompts the worker would send are built both ways,
+with pre-extraction and compaction applied as in production and
+``benchmark_profile.json`` as the candidate:
+
+- split: ``build_extraction_prompt`` + ``JobMatchPrompts.analyze_job_match``
+  (two calls, the posting sent twice)
+- fused: ``JobMatchPrompts.fused_extraction_match`` (one call)
+
+Reported:
+
+- calls: listings pre-extraction settles completely make no extraction
+  call, so fused mode leaves them on the analysis call alone
+- prompt tokens: total, and per-job (user message) tokens — the system
+  prompts are identical for every job of one profile and served from the
+  prefix cache after the first call
+
+Usage:
+    python measure_fused.py
+
+Fused accuracy needs a model: run ``run_benchmark.py <model> --mode fused``
+(the extraction part is scored like any other result file, next to the
+single-call run) and compare with ``results/report.txt``.
+"""
+
+import json
+import sys
+from pathlib import Path
+
+BENCHMARK_DIR = Path(__file__).parent
+sys.path.insert(0, str(BENCHMARK_DIR.parent.parent / "src"))
+
+from job_finder.ai.compaction import DescriptionCompactor, count_tokens  # noqa: E402
+from job_finder.ai.extraction_prompts import (  # noqa: E402
+    EXTRACTION_FIELD_KEYS,
+    build_extraction_prompt,
+)
+from job_finder.ai.pre_extraction import PreExtractor  # noqa: E402
+from job_finder.ai.prompts import JobMatchPrompts  # noqa: E402
+from job_finder.profile.schema import Profile  # noqa: E402
+
+
+def load_jsonl(path: Path) -> list[dict]:
+    with open(path) as f:
+        return [json.loads(line) for line in f if line.strip()]
+
+
+def main() -> None:
+    truths = {t["id"] for t in load_jsonl(BENCHMARK_DIR / "ground_truth.jsonl")}
+    listings = [
+        job for job in load_jsonl(BENCHMARK_DIR / "sample_listings.jsonl") if job["id"] in truths
+    ]
+    profile = Profile(**json.loads((BENCHMARK_DIR / "benchmark_profile.json").read_text()))
+    pre_extractor = PreExtractor()
+    compactor = DescriptionCompactor()
+
+    calls = {"split": 0, "fused": 0}
+    total = {"split": 0, "fused": 0}
+    per_job = {"split": 0, "fused": 0}
+    settled_only = 0
+
+    for job in listings:
+        title, location = job["title"], job.get("location")
+        pre = pre_extractor.extract(
+            title, job["description"], location, job.get("posted_date"), job.get("salary_range")
+        )
+        compacted = compactor.compact(job["description"], job.get("company_name")).text
+        match_job = {
+            "title": title,
+            "company": job.get("company_name"),
+            "location": location,
+            "description": compacted,
+        }
+        analysis = JobMatchPrompts.analyze_job_match(profile, match_job)
+
+        fields = pre.remaining(EXTRACTION_FIELD_KEYS) if pre.settled else None
+        if fields == []:
+            settled_only += 1
+            for mode in ("split", "fused"):
+                calls[mode] += 1
+                total[mode] += count_tokens(analysis[0]) + count_tokens(analysis[1])
+                per_job[mode] += count_tokens(analysis[1])
+            continue
+
+        extraction = build_extraction_prompt(
+            title,
+            compacted,
+            location,
+            job.get("posted_date"),
+            salary_range=job.get("salary_range"),
+            url=job.get("url"),
+            fields=fields,
+        )
+        fused = JobMatchPrompts.fused_extraction_match(profile, extraction, match_job)
+
+        calls["split"] += 2
+        calls["fused"] += 1
+        total["split"] += sum(count_tokens(part) for part in (*extraction, *analysis))
+        total["fused"] += count_tokens(fused[0]) + count_tokens(fused[1])
+        per_job["split"] += count_tokens(extraction[1]) + count_tokens(analysis[1])
+        per_job["fused"] += count_tokens(fused[1])
+
+    print(
+        f"{len(listings)} listings, {settled_only} settled by pre-extraction "
+        f"(analysis call only)\n"
+    )
+    print(f"{'':<22}{'split':>10}{'fused':>10}{'saved':>9}")
+    for label, counts in (
+        ("calls", calls),
+        ("prompt tokens", total),
+        ("per-job tokens", per_job),
+    ):
+        saved = 1 - counts["fused"] / max(1, counts["split"])
+        print(f"{label:<22}{counts['split']:>10}{counts['fused']:>10}{saved:>9.1%}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,125 @@
+#!/usr/bin/env python3
+"""Measure how much LLM extraction work deterministic pre-extraction removes.
+
+Runs ``PreExtractor`` over the benchmark listings (title, description,
+location, posted date and ATS salary range; the sample has no other
+structured ATS fields) and, treating the ground truth as what the model
+would answer, reports:
+
+- per field: how often it is settled, and how often the settled value
+  agrees with the ground truth
+- LLM calls: extraction calls skipped outright, plus repair passes no
+  longer needed (``extract_with_repair`` repairs below 0.7 confidence)
+- response size: the JSON the model returns for the requested fields
+  only, against the full 19-field object (~4 characters per token)
+
+``daysOld`` agreement is not meaningful: the ground truth was generated
+without the posted date.
+
+Usage:
+    python measure_pre_extraction.py
+"""
+
+import json
+import sys
+from collections import Counter
+from pathlib import Path
+from typing import List
+
+BENCHMARK_DIR = Path(__file__).parent
+sys.path.insert(0, str(BENCHMARK_DIR.parent.parent / "src"))
+
+from job_finder.ai.extraction import JobExtractionResult  # noqa: E402
+from job_finder.ai.extraction_prompts import EXTRACTION_FIELD_KEYS  # noqa: E402
+from job_finder.ai.pre_extraction import PreExtractor  # noqa: E402
+
+REPAIR_THRESHOLD = 0.7
+
+
+def load_jsonl(path: Path) -> List[dict]:
+    with open(path) as f:
+        return [json.loads(line) for line in f if line.strip()]
+
+
+def agrees(settled, truth) -> bool:
+    if isinstance(settled, (int, float)) and isinstance(truth, (int, float)):
+        return abs(settled - truth) < 0.01
+    return settled == truth
+
+
+def main() -> None:
+    truths = {t["id"]: t["extraction"] for t in load_jsonl(BENCHMARK_DIR / "ground_truth.jsonl")}
+    listings = [
+        job for job in load_jsonl(BENCHMARK_DIR / "sample_listings.jsonl") if job["id"] in truths
+    ]
+    pre_extractor = PreExtractor()
+    total_fields = len(EXTRACTION_FIELD_KEYS)
+    confidence_fields = JobExtractionResult.CONFIDENCE_FIELDS
+
+    coverage: Counter = Counter()
+    agreement: Counter = Counter()
+    plans: Counter = Counter()
+    repairs = {"before": 0, "after": 0}
+    response_chars = {"before": 0, "after": 0}
+    requested_fields = 0
+
+    for job in listings:
+        truth = truths[job["id"]]
+        pre = pre_extractor.extract(
+            job["title"],
+            job["description"],
+            job.get("location"),
+            job.get("posted_date"),
+            job.get("salary_range"),
+        )
+        settled = pre.settled
+        for name, value in settled.items():
+            coverage[name] += 1
+            agreement[name] += agrees(value, truth.get(EXTRACTION_FIELD_KEYS[name]))
+
+        remaining = pre.remaining(EXTRACTION_FIELD_KEYS)
+        plans["skipped" if not remaining else "targeted" if settled else "full"] += 1
+        requested_fields += len(remaining)
+        response_chars["before"] += len(json.dumps(truth))
+        response_chars["after"] += len(
+            json.dumps(
+                {EXTRACTION_FIELD_KEYS[n]: truth.get(EXTRACTION_FIELD_KEYS[n]) for n in remaining}
+            )
+            if remaining
+            else ""
+        )
+
+        # Repair gate, with the model answering like the ground truth
+        result = JobExtractionResult.from_dict(truth)
+        if result.confidence < REPAIR_THRESHOLD:
+            repairs["before"] += 1
+        for name, value in settled.items():
+            setattr(result, name, value)
+        result.confidence = result.compute_confidence()
+        open_fields = pre.remaining(result.missing_fields())
+        known = 1 - len(open_fields) / len(confidence_fields)
+        if result.confidence < REPAIR_THRESHOLD and known < REPAIR_THRESHOLD:
+            repairs["after"] += 1
+
+    n = len(listings)
+    print(f"{n} listings, {total_fields} extraction fields\n")
+    print(f"{'field':<22}{'settled':>9}{'agrees':>9}")
+    for name in EXTRACTION_FIELD_KEYS:
+        if coverage[name]:
+            print(f"{name:<22}{coverage[name]:>9}{agreement[name]:>9}")
+
+    calls_before = n + repairs["before"]
+    calls_after = (n - plans["skipped"]) + repairs["after"]
+    print(
+        f"\nplans: skipped {plans['skipped']}, targeted {plans['targeted']}, full {plans['full']}"
+        f"\nfields requested from the LLM: {requested_fields / n:.1f} of {total_fields} on average"
+        f"\nrepair passes: {repairs['before']} -> {repairs['after']}"
+        f"\nLLM calls: {calls_before} -> {calls_after} "
+        f"({1 - calls_after / max(1, calls_before):.1%} avoided)"
+        f"\nresponse tokens: {response_chars['before'] // 4} -> {response_chars['after'] // 4} "
+        f"({1 - response_chars['after'] / max(1, response_chars['before']):.1%} fewer)"
+    )
+
+
+if __name__ == "__main__":
+    main()
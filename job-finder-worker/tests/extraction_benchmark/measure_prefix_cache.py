@@ -0,0 +1,176 @@
+#!/usr/bin/env python3
+"""Measure prompt-prefix reuse against the fake prefix-cache backend.
+
+Sends the benchmark listings through ``InferenceClient`` to
+``fake_prefix_cache_server.py`` the way the worker does (extraction, a
+repair pass for the fields ground truth leaves empty, taxonomy enrichment
+for the technologies, batched extraction in groups of 4) and reports:
+
+- prefix repeats: calls whose system-prompt hash was already sent
+  (``get_prefix_stats``), i.e. the best-case hit rate
+- cached tokens: prompt tokens the simulated backend reused
+- simulated prefill time (time to first token) for the uncached tokens, and
+  total simulated latency including a fixed decode cost
+
+Two layouts are compared. "stable prefix" uses the production prompt
+builders. "legacy (emulated)" moves the per-request parts back where the
+old builders put them: the date at the top of the extraction system prompt,
+the missing-field list and batch size inside the system prompt, and
+taxonomy terms as a bare JSON blob with no system prompt.
+
+Usage:
+    python measure_prefix_cache.py
+    python measure_prefix_cache.py --limit 50 --time-scale 0
+"""
+
+import argparse
+import json
+import logging
+import sys
+from datetime import date
+from pathlib import Path
+from typing import Callable, Dict, List, Tuple
+
+BENCHMARK_DIR = Path(__file__).parent
+sys.path.insert(0, str(BENCHMARK_DIR.parent.parent / "src"))
+sys.path.insert(0, str(BENCHMARK_DIR))
+
+from fake_prefix_cache_server import FakePrefixCacheServer  # noqa: E402
+from job_finder.ai.extraction_prompts import (  # noqa: E402
+    build_batch_extraction_prompt,
+    build_extraction_prompt,
+    build_repair_prompt,
+    build_taxonomy_enrich_prompt,
+)
+from job_finder.ai.inference_client import (  # noqa: E402
+    InferenceClient,
+    get_prefix_stats,
+    reset_prefix_stats,
+)
+
+Call = Tuple[str, str, str]  # (task label, system prompt, user prompt)
+
+_FIELD_TRUTH_KEYS = {
+    "seniority": "seniority",
+    "work_arrangement": "workArrangement",
+    "timezone": "timezone",
+    "salary_min": "salaryMin",
+    "employment_type": "employmentType",
+}
+
+
+def load_jsonl(path: Path) -> List[dict]:
+    with open(path) as f:
+        return [json.loads(line) for line in f if line.strip()]
+
+
+def stable_calls(listings: List[dict], truths: Dict[str, dict]) -> List[Call]:
+    calls: List[Call] = []
+    for job in listings:
+        truth = truths[job["id"]].get("extraction") or {}
+        calls.append(("extraction", *build_extraction_prompt(job["title"], job["description"])))
+        missing = [k for k, t in _FIELD_TRUTH_KEYS.items() if truth.get(t) in (None, "unknown")]
+        if missing:
+            calls.append(
+                ("repair", *build_repair_prompt(job["title"], job["description"], missing))
+            )
+        terms = (truth.get("technologies") or [])[:3]
+        if terms:
+            calls.append(
+                (
+                    "taxonomy",
+                    *build_taxonomy_enrich_prompt(terms, job["title"], job["description"]),
+                )
+            )
+    for start in range(0, len(listings), 4):
+        calls.append(("batch", *build_batch_extraction_prompt(listings[start : start + 4])))
+    return calls
+
+
+def legacy_calls(listings: List[dict], truths: Dict[str, dict]) -> List[Call]:
+    """The same requests with per-request data back inside the system prompt."""
+    today = f"Today's date: {date.today().isoformat()}"
+    calls: List[Call] = []
+    for label, system, user in stable_calls(listings, truths):
+        if label == "taxonomy":
+            terms = [line[2:] for line in user.split("\n\n")[0].splitlines()[1:]]
+            # Old call: one JSON blob with the terms, title and description
+            blob = {"action": "taxonomy_enrich", "unknown_terms": terms, "job": user}
+            calls.append((label, "", json.dumps(blob)))
+            continue
+        head, _, rest = user.partition("\n")
+        per_request = head
+        if label in ("repair", "batch"):
+            detail, _, rest = rest.lstrip("\n").partition("\n")
+            per_request = f"{today}\n\n{detail}"
+        first, _, instructions = system.partition("\n")
+        calls.append((label, f"{first}\n\n{per_request}\n{instructions}", rest.lstrip("\n")))
+    return calls
+
+
+def run(name: str, calls: List[Call], args) -> None:
+    server = FakePrefixCacheServer(
+        port=0,
+        prefill_ms_per_token=args.prefill_ms,
+        decode_ms_per_token=args.decode_ms,
+        time_scale=args.time_scale,
+    ).start()
+    reset_prefix_stats()
+    client = InferenceClient(base_url=server.base_url, api_key="benchmark")
+    try:
+        for label, system, user in calls:
+            client.execute(
+                task_type=label,
+                prompt=user,
+                system_prompt=system or None,
+                model_override="local-extract",
+                temperature=0.1,
+                cache=False,
+            )
+    finally:
+        server.stop()
+
+    stats = server.stats
+    prefix = get_prefix_stats()
+    calls_with_prefix = sum(s["calls"] for s in prefix.values())
+    repeats = sum(s["repeats"] for s in prefix.values())
+    print(
+        f"{name:<20} requests {stats['requests']:>4}  "
+        f"prefix repeats {repeats:>4}/{calls_with_prefix:<4} "
+        f"cached tokens {stats['cached_tokens'] / max(1, stats['prompt_tokens']):6.1%}  "
+        f"prefill {stats['prefill_seconds']:6.1f}s  total {stats['simulated_seconds']:6.1f}s"
+    )
+    for label, s in sorted(prefix.items()):
+        print(
+            f"    {label:<12} calls {s['calls']:>4}  distinct prefixes {s['distinct']:>4}  "
+            f"cached {s['cached_tokens'] / max(1, s['prompt_tokens']):6.1%}"
+        )
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--limit", type=int, default=100)
+    parser.add_argument("--prefill-ms", type=float, default=0.25)
+    parser.add_argument("--decode-ms", type=float, default=20.0)
+    parser.add_argument("--time-scale", type=float, default=0.0)
+    args = parser.parse_args()
+    logging.basicConfig(level=logging.WARNING)
+
+    truths = {t["id"]: t for t in load_jsonl(BENCHMARK_DIR / "ground_truth.jsonl")}
+    listings = [
+        job for job in load_jsonl(BENCHMARK_DIR / "sample_listings.jsonl") if job["id"] in truths
+    ][: args.limit]
+    print(
+        f"{len(listings)} listings; prefill {args.prefill_ms}ms/token, "
+        f"decode {args.decode_ms}ms/token"
+    )
+    layouts: List[Tuple[str, Callable]] = [
+        ("legacy (emulated)", legacy_calls),
+        ("stable prefix", stable_calls),
+    ]
+    for name, build in layouts:
+        run(name, build(listings, truths), args)
+
+
+if __name__ == "__main__":
+    main()
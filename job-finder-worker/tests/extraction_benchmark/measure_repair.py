@@ -0,0 +1,160 @@
+#!/usr/bin/env python3
+"""Measure field-scoped repair prompts on the benchmark listings (no model needed).
+
+For every listing, the repair pass is simulated for each confidence field
+pre-extraction does not settle (as if the model had left them all empty,
+the worst case) and two repair prompts are built:
+
+- full: ``build_repair_prompt`` over the compacted description (previous
+  behaviour)
+- scoped: ``select_repair_excerpts`` sentences only (current behaviour)
+
+Reported:
+
+- tokens: repair user-prompt tokens, full against scoped (the system
+  prompt is identical and cached as a shared prefix)
+- evidence retention per field: how many ground-truth values the full
+  prompt contains (technologies, salary thousands, city for timezone,
+  years of experience for seniority, arrangement and employment-type
+  words) are still in the scoped prompt. A value the model cannot read
+  cannot be repaired, so this bounds repaired-field accuracy.
+- calls: repairs skipped because no sentence mentions any open field, and
+  ground-truth values lost by dropping a field
+
+Usage:
+    python measure_repair.py
+    python measure_repair.py --budget 300
+
+Repaired-field accuracy itself needs a model: run ``run_benchmark.py <model>``
+and compare with ``results/report.txt``.
+"""
+
+import argparse
+import json
+import re
+import sys
+from collections import Counter
+from pathlib import Path
+
+BENCHMARK_DIR = Path(__file__).parent
+sys.path.insert(0, str(BENCHMARK_DIR.parent.parent / "src"))
+
+from job_finder.ai.compaction import DescriptionCompactor, count_tokens  # noqa: E402
+from job_finder.ai.extraction import JobExtractionResult  # noqa: E402
+from job_finder.ai.extraction_prompts import build_repair_prompt  # noqa: E402
+from job_finder.ai.pre_extraction import PreExtractor  # noqa: E402
+from job_finder.ai.repair import (  # noqa: E402
+    DEFAULT_REPAIR_EXCERPT_TOKENS,
+    select_repair_excerpts,
+)
+
+_ARRANGEMENT = {"remote": r"remote", "hybrid": r"hybrid", "onsite": r"on-?site|office"}
+_EMPLOYMENT = {"full-time": r"full[- ]time", "part-time": r"part[- ]time", "contract": r"contract"}
+
+
+def load_jsonl(path: Path) -> list[dict]:
+    with open(path) as f:
+        return [json.loads(line) for line in f if line.strip()]
+
+
+def evidence(field_name: str, truth: dict) -> list[str]:
+    """Regexes for the ground-truth value of *field_name* in prompt text."""
+    if field_name == "technologies":
+        return [re.escape(t.lower()) for t in truth.get("technologies") or [] if len(t) > 2]
+    if field_name == "salary_min":
+        amounts = [truth.get("salaryMin"), truth.get("salaryMax")]
+        return [f"{a // 1000}" for a in amounts if isinstance(a, int) and a >= 1000]
+    if field_name == "timezone":
+        return [re.escape(truth["city"].lower())] if truth.get("city") else []
+    if field_name == "seniority":
+        years = truth.get("experienceMin")
+        return [rf"{years}\+? ?(years|yrs)"] if isinstance(years, int) else []
+    if field_name == "work_arrangement":
+        pattern = _ARRANGEMENT.get(truth.get("workArrangement") or "")
+        return [pattern] if pattern else []
+    if field_name == "employment_type":
+        pattern = _EMPLOYMENT.get(truth.get("employmentType") or "")
+        return [pattern] if pattern else []
+    return []
+
+
+def present(pattern: str, text: str) -> bool:
+    return re.search(rf"(?<![a-z0-9])(?:{pattern})", text) is not None
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--budget", type=int, default=DEFAULT_REPAIR_EXCERPT_TOKENS)
+    args = parser.parse_args()
+
+    truths = {t["id"]: t["extraction"] for t in load_jsonl(BENCHMARK_DIR / "ground_truth.jsonl")}
+    listings = [
+        job for job in load_jsonl(BENCHMARK_DIR / "sample_listings.jsonl") if job["id"] in truths
+    ]
+    pre_extractor = PreExtractor()
+    compactor = DescriptionCompactor()
+
+    tokens = {"full": 0, "scoped": 0}
+    found: Counter = Counter()
+    kept: Counter = Counter()
+    lost: Counter = Counter()
+    repairs = {"simulated": 0, "skipped": 0}
+
+    for job in listings:
+        truth = truths[job["id"]]
+        title, location = job["title"], job.get("location")
+        pre = pre_extractor.extract(
+            title, job["description"], location, job.get("posted_date"), job.get("salary_range")
+        )
+        open_fields = pre.remaining(JobExtractionResult.CONFIDENCE_FIELDS)
+        if not open_fields:
+            continue
+        repairs["simulated"] += 1
+        compacted = compactor.compact(job["description"], job.get("company_name")).text
+        plan = select_repair_excerpts(compacted, open_fields, location, args.budget)
+
+        _, full_user = build_repair_prompt(title, compacted, open_fields, location)
+        full_text = full_user.lower()
+        tokens["full"] += count_tokens(full_user)
+        if not plan.fields:
+            repairs["skipped"] += 1
+            scoped_text = ""
+        else:
+            _, scoped_user = build_repair_prompt(
+                title, compacted, plan.fields, location, excerpts=plan.excerpts
+            )
+            scoped_text = scoped_user.lower()
+            tokens["scoped"] += count_tokens(scoped_user)
+
+        for name in open_fields:
+            for pattern in evidence(name, truth):
+                if not present(pattern, full_text):
+                    continue
+                found[name] += 1
+                if name in plan.fields and present(pattern, scoped_text):
+                    kept[name] += 1
+                elif name in plan.dropped:
+                    lost[name] += 1
+
+    print(
+        f"{len(listings)} listings, {repairs['simulated']} with open fields, "
+        f"excerpt budget {args.budget} tokens\n"
+    )
+    print(f"{'field':<18}{'evidence':>9}{'kept':>7}{'dropped':>9}")
+    for name in JobExtractionResult.CONFIDENCE_FIELDS:
+        if found[name]:
+            print(
+                f"{name:<18}{found[name]:>9}{kept[name]:>7}{lost[name]:>9}"
+                f"  ({kept[name] / found[name]:.1%})"
+            )
+    total_found, total_kept = sum(found.values()), sum(kept.values())
+    saved = 1 - tokens["scoped"] / max(1, tokens["full"])
+    print(
+        f"\nevidence kept {total_kept}/{total_found} ({total_kept / max(1, total_found):.1%})"
+        f"\nrepair calls skipped (no evidence): {repairs['skipped']}/{repairs['simulated']}"
+        f"\nrepair prompt tokens: {tokens['full']} -> {tokens['scoped']} ({saved:.1%} saved)"
+    )
+
+
+if __name__ == "__main__":
+    main()
@@ -11,13 +11,19 @@ Usage:
     python run_benchmark.py                    # Run all models
     python run_benchmark.py qwen3:8b           # Run specific model
     python run_benchmark.py --report-only      # Just regenerate report from saved results
+    python run_benchmark.py qwen3:8b --mode compare --batch-size 4
+                                               # Single vs micro-batched extraction
+    python run_benchmark.py qwen3:8b --mode fused
+                                               # Extraction + match analysis in one call
 
 Models are run one at a time.  Each model is loaded, benchmarked, then unloaded
 before the next one starts.
 
 Output:
-    results/<model_name>.jsonl  — per-job extraction results
-    results/report.txt          — comparison table
+    results/<model_name>.jsonl          — per-job extraction results (single mode)
+    results/<model_name>__batch<N>.jsonl — per-job results from batched requests
+    results/<model_name>__fused.jsonl   — extraction part of fused extraction + analysis
+    results/report.txt                  — comparison table (accuracy + tokens/sec)
 """
 
 import argparse
@@ -40,11 +46,18 @@ BENCHMARK_DIR = Path(__file__).parent
 SAMPLE_FILE = BENCHMARK_DIR / "sample_listings.jsonl"
 GROUND_TRUTH_FILE = BENCHMARK_DIR / "ground_truth.jsonl"
 RESULTS_DIR = BENCHMARK_DIR / "results"
+PROFILE_FILE = BENCHMARK_DIR / "benchmark_profile.json"
 
 # Import the production prompt builder to stay in sync.
 sys.path.insert(0, str(BENCHMARK_DIR.parent.parent / "src"))
 
-from job_finder.ai.extraction_prompts import build_extraction_prompt  # noqa: E402
+from job_finder.ai.extraction_prompts import (  # noqa: E402
+    build_batch_extraction_prompt,
+    build_extraction_prompt,
+)
+from job_finder.ai.matcher import AIJobMatcher  # noqa: E402
+from job_finder.ai.prompts import JobMatchPrompts  # noqa: E402
+from job_finder.profile.schema import Profile  # noqa: E402
 
 # Ollama endpoint — defaults to localhost but production Ollama is only
 # accessible inside the Docker network.  Use --ollama-url or set OLLAMA_URL.
@@ -307,6 +320,219 @@ def score_extraction(predicted: dict, truth: dict) -> dict:
 # ── Benchmark execution ───────────────────────────────────────────────────
 
 
+def _usage_fields(response: Any, share: float = 1.0) -> dict:
+    """Token counts from a completion response, scaled by this job's share."""
+    usage = getattr(response, "usage", None)
+    prompt_tokens = getattr(usage, "prompt_tokens", None) or 0
+    completion_tokens = getattr(usage, "completion_tokens", None) or 0
+    return {
+        "prompt_tokens": round(prompt_tokens * share, 1),
+        "completion_tokens": round(completion_tokens * share, 1),
+    }
+
+
+def _normalize_extraction(extraction: dict) -> dict:
+    if "technologies" in extraction and isinstance(extraction["technologies"], list):
+        extraction["technologies"] = [
+            str(t).lower().strip() for t in extraction["technologies"] if t
+        ]
+    return extraction
+
+
+def run_model_batch_benchmark(
+    model: str,
+    listings: list[dict],
+    ground_truth: dict[str, dict],
+    batch_size: int,
+):
+    """Run listings through micro-batched requests (production batch prompt).
+
+    Jobs are packed ``batch_size`` per request; elapsed time and token usage
+    are split evenly across the jobs of a batch. Sub-results that are missing
+    from the response are recorded as errors (no single-call fallback here,
+    so the report measures batch accuracy on its own).
+    """
+    RESULTS_DIR.mkdir(parents=True, exist_ok=True)
+    safe_name = model.replace(":", "_").replace("/", "_")
+    result_file = RESULTS_DIR / f"{safe_name}__batch{batch_size}.jsonl"
+
+    done_ids: set[str] = set()
+    if result_file.exists():
+        with open(result_file) as f:
+            for line in f:
+                done_ids.add(json.loads(line)["id"])
+
+    remaining = [item for item in listings if item["id"] not in done_ids]
+    if not remaining:
+        print(f"  All {len(listings)} jobs already processed for {model} (batch {batch_size})")
+        return
+
+    print(f"  Processing {len(remaining)} jobs with {model} in batches of {batch_size}...")
+    client = OpenAI(base_url=f"{OLLAMA_URL}/v1", api_key="none")
+    errors = 0
+
+    with open(result_file, "a") as out:
+        for start in range(0, len(remaining), batch_size):
+            group = remaining[start : start + batch_size]
+            system_prompt, user_prompt = build_batch_extraction_prompt(
+                [
+                    {
+                        "title": job["title"],
+                        "description": job["description"] or "",
+                        "location": job.get("location"),
+                        "posted_date": job.get("posted_date"),
+                        "salary_range": job.get("salary_range"),
+                        "url": job.get("url"),
+                    }
+                    for job in group
+                ]
+            )
+            t0 = time.time()
+            response = None
+            entries: dict[int, dict] = {}
+            error = None
+            try:
+                response = client.chat.completions.create(
+                    model=model,
+                    messages=[
+                        {"role": "system", "content": system_prompt},
+                        {"role": "user", "content": user_prompt},
+                    ],
+                    max_tokens=1024 * len(group),
+                    temperature=0.1,
+                    response_format={"type": "json_object"},
+                )
+                parsed = extract_json_from_response(response.choices[0].message.content or "")
+                results = parsed.get("results") if isinstance(parsed, dict) else None
+                if not isinstance(results, list):
+                    error = "batch response has no results array"
+                else:
+                    for position, entry in enumerate(results, start=1):
+                        if isinstance(entry, dict):
+                            entries.setdefault(int(entry.pop("index", position)), entry)
+            except Exception as e:
+                error = str(e)
+            elapsed = time.time() - t0
+            share = 1.0 / len(group)
+
+            for position, job in enumerate(group, start=1):
+                entry = entries.get(position)
+                if entry is None:
+                    errors += 1
+                    extraction = {"_error": error or "missing from batch response"}
+                else:
+                    extraction = _normalize_extraction(entry)
+                record = {
+                    "id": job["id"],
+                    "title": job["title"],
+                    "company_name": job["company_name"],
+                    "extraction": extraction,
+                    "elapsed_s": round(elapsed * share, 2),
+                    **(_usage_fields(response, share) if response is not None else {}),
+                }
+                out.write(json.dumps(record) + "\n")
+            out.flush()
+            print(
+                f"    [{min(start + batch_size, len(remaining))}/{len(remaining)}] "
+                f"{len(entries)}/{len(group)} OK {elapsed:.1f}s"
+            )
+
+    print(f"  Done: {len(remaining) - errors} OK, {errors} errors")
+
+
+def run_model_fused_benchmark(model: str, listings: list[dict], ground_truth: dict[str, dict]):
+    """Run listings through the fused extraction + match analysis prompt.
+
+    The extraction part is scored like a single-call result, so the report
+    compares fused accuracy with ``<model>.jsonl`` directly. A response whose
+    analysis part fails the matcher's validation is kept (``analysis_ok``
+    false): production would fall back to separate calls for that job.
+    """
+    RESULTS_DIR.mkdir(parents=True, exist_ok=True)
+    safe_name = model.replace(":", "_").replace("/", "_")
+    result_file = RESULTS_DIR / f"{safe_name}__fused.jsonl"
+
+    done_ids: set[str] = set()
+    if result_file.exists():
+        with open(result_file) as f:
+            for line in f:
+                done_ids.add(json.loads(line)["id"])
+
+    remaining = [item for item in listings if item["id"] not in done_ids]
+    if not remaining:
+        print(f"  All {len(listings)} jobs already processed for {model} (fused)")
+        return
+
+    print(f"  Processing {len(remaining)} jobs with {model} (fused)...")
+    client = OpenAI(base_url=f"{OLLAMA_URL}/v1", api_key="none")
+    profile = Profile(**json.loads(PROFILE_FILE.read_text()))
+    is_valid_analysis = AIJobMatcher(None, profile).is_valid_analysis
+    errors = 0
+    analysis_ok = 0
+
+    with open(result_file, "a") as out:
+        for i, job in enumerate(remaining):
+            extraction_prompt = build_extraction_prompt(
+                title=job["title"],
+                description=job["description"] or "",
+                location=job.get("location"),
+                posted_date=job.get("posted_date"),
+                salary_range=job.get("salary_range"),
+                url=job.get("url"),
+            )
+            system_prompt, user_prompt = JobMatchPrompts.fused_extraction_match(
+                profile, extraction_prompt, {"company": job["company_name"]}
+            )
+            t0 = time.time()
+            response = None
+            try:
+                response = client.chat.completions.create(
+                    model=model,
+                    messages=[
+                        {"role": "system", "content": system_prompt},
+                        {"role": "user", "content": user_prompt},
+                    ],
+                    max_tokens=2048 + 1400,
+                    temperature=0.1,
+                    response_format={"type": "json_object"},
+                )
+                text = response.choices[0].message.content or ""
+                parsed = extract_json_from_response(text)
+                extraction = parsed.get("extraction") if isinstance(parsed, dict) else None
+                valid = isinstance(parsed, dict) and is_valid_analysis(parsed.get("analysis"))
+                if not isinstance(extraction, dict):
+                    extraction = {"_error": "no extraction part", "_raw": text[:500]}
+                else:
+                    extraction = _normalize_extraction(extraction)
+            except Exception as e:
+                extraction, valid = {"_error": str(e)}, False
+            elapsed = time.time() - t0
+
+            errors += "_error" in extraction
+            analysis_ok += valid
+            record = {
+                "id": job["id"],
+                "title": job["title"],
+                "company_name": job["company_name"],
+                "extraction": extraction,
+                "analysis_ok": valid,
+                "elapsed_s": round(elapsed, 2),
+                **(_usage_fields(response) if response is not None else {}),
+            }
+            out.write(json.dumps(record) + "\n")
+            out.flush()
+            status = "OK" if "_error" not in extraction and valid else "FAIL"
+            print(
+                f"    [{i+1}/{len(remaining)}] {status} {elapsed:.1f}s "
+                f"— {job['company_name']}: {job['title'][:40]}"
+            )
+
+    print(
+        f"  Done: {len(remaining) - errors} extractions OK, "
+        f"{analysis_ok}/{len(remaining)} analysis parts valid"
+    )
+
+
 def run_model_benchmark(model: str, listings: list[dict], ground_truth: dict[str, dict]):
     """Run all listings through a single model and save results."""
     RESULTS_DIR.mkdir(parents=True, exist_ok=True)
@@ -366,11 +592,7 @@ def run_model_benchmark(model: str, listings: list[dict], ground_truth: dict[str
                     errors += 1
                     extraction = {"_error": "JSON parse failed", "_raw": text[:500]}
                 else:
-                    # Normalize technologies
-                    if "technologies" in extraction:
-                        extraction["technologies"] = [
-                            str(t).lower().strip() for t in extraction["technologies"] if t
-                        ]
+                    extraction = _normalize_extraction(extraction)
 
                 record = {
                     "id": job["id"],
@@ -378,6 +600,7 @@ def run_model_benchmark(model: str, listings: list[dict], ground_truth: dict[str
                     "company_name": job["company_name"],
                     "extraction": extraction,
                     "elapsed_s": round(elapsed, 2),
+                    **_usage_fields(response),
                 }
                 out.write(json.dumps(record) + "\n")
                 out.flush()
@@ -424,12 +647,14 @@ def generate_report(ground_truth: dict[str, dict]):
         total = 0
         errors = 0
         total_time = 0.0
+        completion_tokens = 0.0
 
         with open(rf) as f:
             for line in f:
                 record = json.loads(line)
                 total += 1
                 total_time += record.get("elapsed_s", 0)
+                completion_tokens += record.get("completion_tokens", 0) or 0
 
                 extraction = record.get("extraction", {})
                 if "_error" in extraction:
@@ -455,6 +680,7 @@ def generate_report(ground_truth: dict[str, dict]):
         avg_scores["_errors"] = errors
         avg_scores["_total"] = total
         avg_scores["_avg_time"] = total_time / max(total, 1)
+        avg_scores["_tok_per_s"] = completion_tokens / total_time if total_time else 0.0
         model_scores[model_name] = avg_scores
 
     # Generate report
@@ -470,18 +696,19 @@ def generate_report(ground_truth: dict[str, dict]):
     ranked = sorted(model_scores.items(), key=lambda x: x[1]["_overall"], reverse=True)
 
     report_lines.append("OVERALL RANKING")
-    report_lines.append("-" * 80)
+    report_lines.append("-" * 90)
     report_lines.append(
-        f"{'Model':<25} {'Overall':>8} {'Errors':>7} {'Avg Time':>9} "
+        f"{'Model':<25} {'Overall':>8} {'Errors':>7} {'Avg Time':>9} {'Tok/s':>7} "
         f"{'Seniority':>10} {'WorkArr':>8} {'Techs':>8} {'Roles':>8} {'Salary':>8}"
     )
-    report_lines.append("-" * 80)
+    report_lines.append("-" * 90)
 
     for model_name, scores in ranked:
         sal_score = (scores.get("salaryMin", 0) + scores.get("salaryMax", 0)) / 2
         report_lines.append(
             f"{model_name:<25} {scores['_overall']:>7.1%} "
             f"{scores['_errors']:>6}  {scores['_avg_time']:>7.1f}s "
+            f"{scores['_tok_per_s']:>7.1f} "
             f"{scores.get('seniority', 0):>9.1%} "
             f"{scores.get('workArrangement', 0):>7.1%} "
             f"{scores.get('technologies', 0):>7.1%} "
@@ -534,6 +761,16 @@ def main():
     parser.add_argument("models", nargs="*", help="Specific models to test (default: all)")
     parser.add_argument("--report-only", action="store_true", help="Only regenerate report")
     parser.add_argument("--ollama-url", default=DEFAULT_OLLAMA_URL, help="Ollama API URL")
+    parser.add_argument(
+        "--mode",
+        choices=["single", "batch", "compare", "fused"],
+        default="single",
+        help=(
+            "single: one request per job; batch: micro-batched; compare: both; "
+            "fused: single plus fused extraction + match analysis"
+        ),
+    )
+    parser.add_argument("--batch-size", type=int, default=4, help="Jobs per request in batch mode")
     parser.add_argument(
         "--docker",
         action="store_true",
@@ -586,7 +823,12 @@ def main():
             continue
 
         # Run benchmark
-        run_model_benchmark(model, listings, ground_truth)
+        if args.mode in ("single", "compare", "fused"):
+            run_model_benchmark(model, listings, ground_truth)
+        if args.mode in ("batch", "compare"):
+            run_model_batch_benchmark(model, listings, ground_truth, args.batch_size)
+        if args.mode == "fused":
+            run_model_fused_benchmark(model, listings, ground_truth)
 
         # Unload model to free VRAM for next one
         print(f"  Unloading {model}...")
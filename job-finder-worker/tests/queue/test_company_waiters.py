@@ -0,0 +1,144 @@
+"""Tests for parking jobs on an in-flight company enrichment task.
+
+Jobs whose company is still a stub park on the active COMPANY item instead of
+requeue-polling. The COMPANY item's terminal status wakes every waiter exactly
+once, and parked jobs are invisible to get_pending_items() until then.
+"""
+
+import sqlite3
+from datetime import datetime, timedelta, timezone
+
+import pytest
+
+from job_finder.job_queue.manager import COMPANY_WAIT_TIMEOUT_MINUTES, QueueManager
+from job_finder.job_queue.models import JobQueueItem, QueueItemType, QueueStatus
+
+
+def _init_db(db_path) -> None:
+    conn = sqlite3.connect(db_path)
+    conn.execute("""
+        CREATE TABLE job_queue (
+            id TEXT PRIMARY KEY,
+            type TEXT NOT NULL,
+            status TEXT NOT NULL,
+            url TEXT,
+            tracking_id TEXT,
+            parent_item_id TEXT,
+            dedupe_key TEXT,
+            input TEXT,
+            output TEXT,
+            result_message TEXT,
+            error_details TEXT,
+            retry_count INTEGER NOT NULL DEFAULT 0,
+            max_retries INTEGER NOT NULL DEFAULT 3,
+            last_error_category TEXT,
+            created_at TEXT,
+            updated_at TEXT,
+            processed_at TEXT,
+            completed_at TEXT
+        );
+        """)
+    conn.commit()
+    conn.close()
+
+
+@pytest.fixture()
+def queue_mgr(tmp_path):
+    db_path = tmp_path / "queue.db"
+    _init_db(db_path)
+    return QueueManager(db_path=str(db_path))
+
+
+def _add_company(qm: QueueManager, company_id="c1", company_name="Acme") -> str:
+    return qm.add_item(
+        JobQueueItem(
+            type=QueueItemType.COMPANY,
+            url=f"https://{company_name.lower()}.example",
+            company_name=company_name,
+            company_id=company_id,
+        )
+    )
+
+
+def _add_job(qm: QueueManager, n: int) -> str:
+    return qm.add_item(
+        JobQueueItem(
+            type=QueueItemType.JOB,
+            url=f"https://jobs.example/{n}",
+            company_name="Acme",
+        )
+    )
+
+
+def _pending_ids(qm: QueueManager):
+    return {item.id for item in qm.get_pending_items(limit=100)}
+
+
+def test_parked_jobs_are_hidden_until_company_completes(queue_mgr):
+    company_item = _add_company(queue_mgr)
+    jobs = [_add_job(queue_mgr, n) for n in range(5)]
+
+    for job_id in jobs:
+        assert queue_mgr.park_for_company(job_id, "c1", "Acme", {"waiting_for_company_id": "c1"})
+
+    assert _pending_ids(queue_mgr) == {company_item}
+    assert queue_mgr.get_company_waiter_counts()[0]["count"] == 5
+
+    queue_mgr.update_status(company_item, QueueStatus.PROCESSING)
+    queue_mgr.update_status(company_item, QueueStatus.SUCCESS)
+
+    assert _pending_ids(queue_mgr) == set(jobs)
+    assert queue_mgr.get_company_waiter_counts() == []
+    parked = queue_mgr.get_item(jobs[0])
+    assert parked.pipeline_state == {"waiting_for_company_id": "c1"}
+
+
+def test_release_wakes_each_waiter_once(queue_mgr):
+    _add_company(queue_mgr)
+    job_id = _add_job(queue_mgr, 1)
+    queue_mgr.park_for_company(job_id, "c1", "Acme", {})
+
+    assert queue_mgr.release_company_waiters("c1", "Acme") == 1
+    assert queue_mgr.release_company_waiters("c1", "Acme") == 0
+
+
+def test_release_matches_by_name_when_id_differs(queue_mgr):
+    company_item = _add_company(queue_mgr, company_id=None, company_name="Acme")
+    job_id = _add_job(queue_mgr, 1)
+    assert queue_mgr.park_for_company(job_id, "c-new", "Acme", {})
+
+    queue_mgr.update_status(company_item, QueueStatus.FAILED, "boom")
+
+    assert job_id in _pending_ids(queue_mgr)
+
+
+def test_park_refuses_without_active_company_task(queue_mgr):
+    company_item = _add_company(queue_mgr)
+    queue_mgr.update_status(company_item, QueueStatus.SUCCESS)
+    job_id = _add_job(queue_mgr, 1)
+
+    assert queue_mgr.park_for_company(job_id, "c1", "Acme", {}) is False
+    assert job_id in _pending_ids(queue_mgr)
+    assert queue_mgr.get_company_waiter_counts() == []
+
+
+def test_stale_waiters_become_claimable(queue_mgr):
+    _add_company(queue_mgr)
+    job_id = _add_job(queue_mgr, 1)
+    queue_mgr.park_for_company(job_id, "c1", "Acme", {})
+
+    stale = datetime.now(timezone.utc) - timedelta(minutes=COMPANY_WAIT_TIMEOUT_MINUTES + 1)
+    with sqlite3.connect(queue_mgr.db_path) as conn:
+        conn.execute("UPDATE company_waiters SET parked_at = ?", (stale.isoformat(),))
+
+    assert job_id in _pending_ids(queue_mgr)
+
+
+def test_deleting_company_item_releases_waiters(queue_mgr):
+    company_item = _add_company(queue_mgr)
+    job_id = _add_job(queue_mgr, 1)
+    queue_mgr.park_for_company(job_id, "c1", "Acme", {})
+
+    assert queue_mgr.delete_item(company_item)
+
+    assert job_id in _pending_ids(queue_mgr)
@@ -115,24 +115,31 @@ def test_skip_company_enrichment_when_active_task_exists():
     qm.spawn_item_safely.assert_not_called()
 
 
-def test_check_company_dependency_requeues_and_waits():
+def test_check_company_dependency_parks_on_company_task():
     jp, qm, comp = _make_job_processor()
     ctx, state = _ctx(wait_count=0)
 
     comp.has_good_company_data.return_value = False
     qm.has_company_task.return_value = False
+    qm.park_for_company.return_value = True
 
     proceed = jp._check_company_dependency(ctx, state)
 
     assert proceed is False
-    qm.requeue_with_state.assert_called_once()
+    qm.park_for_company.assert_called_once()
+    item_id, company_id, company_name, parked_state = qm.park_for_company.call_args[0]
+    assert (item_id, company_id, company_name) == ("job-1", "c1", "Acme")
+    assert parked_state["waiting_for_company_id"] == "c1"
+    qm.requeue_with_state.assert_not_called()
 
 
-def test_check_company_dependency_proceeds_after_max_waits():
+def test_check_company_dependency_proceeds_when_nothing_to_wait_on():
+    """If no active company task exists (spawn failed), don't park."""
     jp, qm, comp = _make_job_processor()
-    ctx, state = _ctx(wait_count=3)
+    ctx, state = _ctx(wait_count=0)
 
     comp.has_good_company_data.return_value = False
+    qm.park_for_company.return_value = False
 
     proceed = jp._check_company_dependency(ctx, state)
 
@@ -140,6 +147,20 @@ def test_check_company_dependency_proceeds_after_max_waits():
     qm.requeue_with_state.assert_not_called()
 
 
+def test_check_company_dependency_proceeds_after_wake():
+    """A woken job proceeds even if enrichment left the company sparse."""
+    jp, qm, comp = _make_job_processor()
+    ctx, state = _ctx(wait_count=1)
+
+    comp.has_good_company_data.return_value = False
+
+    proceed = jp._check_company_dependency(ctx, state)
+
+    assert proceed is True
+    qm.park_for_company.assert_not_called()
+    qm.spawn_item_safely.assert_not_called()
+
+
 # ============================================================================
 # REGRESSION TESTS: Verify has_company_task is called with correct parameters
 # ============================================================================
@@ -104,6 +104,11 @@ def processor(mock_managers):
                 return self.extract(title, description, location, posted_date, **kwargs)
 
         class MockScoringEngine:
+            min_score = 60
+
+            def upper_bound(self, known, company_data=None):
+                return 100
+
             def score(self, extraction, job_title, job_description, company_data=None):
                 from job_finder.scoring.engine import ScoreAdjustment
 
@@ -249,11 +254,12 @@ def test_single_task_pipeline_spawns_company_enrichment(processor, mock_managers
 
     processor.job_processor.process_job(sample_job_item)
 
-    # Should spawn enrichment and requeue while waiting for richer data
+    # Should spawn enrichment and park on it while waiting for richer data
     assert mock_managers["queue_manager"].spawn_item_safely.called
-    mock_managers["queue_manager"].requeue_with_state.assert_called_once()
-    requeue_call = mock_managers["queue_manager"].requeue_with_state.call_args
-    assert "waiting_for_company_id" in requeue_call[0][1]
+    mock_managers["queue_manager"].park_for_company.assert_called_once()
+    park_call = mock_managers["queue_manager"].park_for_company.call_args
+    assert "waiting_for_company_id" in park_call[0][3]
+    mock_managers["queue_manager"].requeue_with_state.assert_not_called()
 
 
 def test_single_task_pipeline_completes_to_match(processor, mock_managers, sample_job_item):
@@ -309,6 +315,122 @@ def test_single_task_pipeline_completes_to_match(processor, mock_managers, sampl
     assert "match-456" in success_calls[0][0][2] or "95" in success_calls[0][0][2]
 
 
+def test_pipeline_prunes_job_whose_score_bound_is_below_threshold(
+    processor, mock_managers, sample_job_item
+):
+    """A job that cannot reach minScore is skipped before any extraction call."""
+    mock_managers["sources_manager"].resolve_company_from_source.return_value = None
+    mock_managers["companies_manager"].get_company.return_value = {"id": "comp-1", "name": "Co"}
+    mock_managers["companies_manager"].has_good_company_data.return_value = True
+    mock_managers["job_listing_storage"].get_or_create_listing.return_value = ("listing-9", True)
+    job_processor = processor.job_processor
+    job_processor.extractor = MagicMock()
+    job_processor.scoring_engine.upper_bound = MagicMock(return_value=40)
+    job_processor.ai_matcher.analyze_job = MagicMock()
+    sample_job_item.scraped_data = {
+        "title": "Junior Engineer",
+        "company": "Co",
+        "description": "A" * 200,
+        "location": "Remote",
+        "url": "https://co.example/job/9",
+    }
+
+    job_processor.process_job(sample_job_item)
+
+    known = job_processor.scoring_engine.upper_bound.call_args[0][0]
+    assert known["seniority"] == "junior" and known["work_arrangement"] == "remote"
+    job_processor.extractor.extract_with_repair.assert_not_called()
+    job_processor.ai_matcher.analyze_job.assert_not_called()
+    filter_result = mock_managers["job_listing_storage"].update_status.call_args[0][2]
+    assert filter_result["pruned"]["upperBound"] == 40
+    skipped = [
+        call
+        for call in mock_managers["queue_manager"].update_status.call_args_list
+        if call[0][1] == QueueStatus.SKIPPED
+    ]
+    assert "upper bound 40 below threshold 60" in skipped[0][0][2]
+
+
+def test_pipeline_reuses_cached_extraction_for_same_content(
+    processor, mock_managers, sample_job_item, tmp_path
+):
+    """A repost of the same job under a new URL is not extracted again."""
+    from job_finder.ai.extraction import JobExtractionResult
+    from job_finder.storage.job_extraction_cache import JobExtractionCache
+
+    db_path = tmp_path / "cache.db"
+    db_path.touch()
+    mock_managers["sources_manager"].resolve_company_from_source.return_value = None
+    mock_managers["companies_manager"].get_company.return_value = {"id": "comp-1", "name": "Co"}
+    mock_managers["companies_manager"].has_good_company_data.return_value = True
+    mock_managers["job_listing_storage"].get_or_create_listing.return_value = ("listing-1", True)
+    job_processor = processor.job_processor
+    job_processor.extraction_cache = JobExtractionCache(str(db_path))
+    job_processor.extractor = MagicMock()
+    job_processor.extractor.extract_with_repair.return_value = JobExtractionResult(
+        seniority="senior", work_arrangement="remote", technologies=["python"]
+    )
+    job_processor.ai_matcher.analyze_job = MagicMock(return_value=None)
+
+    extractions = []
+    for url in ("https://co.example/job/1", "https://aggregator.example/co/1"):
+        sample_job_item.scraped_data = {
+            "title": "Senior Engineer",
+            "company": "Co",
+            "description": "Build Python services. " * 20,
+            "location": "Remote",
+            "url": url,
+        }
+        sample_job_item.url = url
+        job_processor.process_job(sample_job_item)
+        extractions.append(
+            mock_managers["job_listing_storage"].update_status.call_args_list[-1][0][2]
+        )
+
+    assert job_processor.extractor.extract_with_repair.call_count == 1
+    assert extractions[1]["extraction"]["technologies"] == ["python"]
+    assert extractions[1]["extraction"]["seniority"] == "senior"
+
+
+@pytest.mark.parametrize("fused_ok", [True, False])
+def test_pipeline_fused_extraction_feeds_analysis(
+    processor, mock_managers, sample_job_item, fused_ok
+):
+    """Fused mode reuses the fused analysis; a failed fused call runs both calls."""
+    from job_finder.ai.extraction import FusedExtraction, JobExtractionResult
+
+    mock_managers["sources_manager"].resolve_company_from_source.return_value = None
+    mock_managers["companies_manager"].get_company.return_value = {"id": "comp-1", "name": "Co"}
+    mock_managers["companies_manager"].has_good_company_data.return_value = True
+    mock_managers["job_listing_storage"].get_or_create_listing.return_value = ("listing-1", True)
+    sample_job_item.scraped_data = {
+        "title": "Senior Engineer",
+        "company": "Co",
+        "description": "Build Python services. " * 20,
+        "location": "Remote",
+        "url": "https://co.example/job/1",
+    }
+    extraction = JobExtractionResult(
+        seniority="senior", work_arrangement="remote", technologies=["python"]
+    )
+    analysis = {"matched_skills": ["python"], "missing_skills": []}
+    job_processor = processor.job_processor
+    job_processor.fused_extraction = True
+    job_processor.extractor = MagicMock()
+    job_processor.extractor.extract_fused.return_value = (
+        FusedExtraction(extraction=extraction, analysis=analysis) if fused_ok else None
+    )
+    job_processor.extractor.extract_with_repair.return_value = extraction
+    job_processor.ai_matcher.analyze_job = MagicMock(return_value=None)
+
+    job_processor.process_job(sample_job_item)
+
+    assert job_processor.extractor.extract_fused.call_count == 1
+    assert job_processor.extractor.extract_with_repair.call_count == (0 if fused_ok else 1)
+    kwargs = job_processor.ai_matcher.analyze_job.call_args[1]
+    assert kwargs.get("analysis") == (analysis if fused_ok else None)
+
+
 def test_single_task_pipeline_handles_aggregator_source_name(
     processor, mock_managers, sample_job_item
 ):
@@ -397,9 +519,9 @@ def test_single_task_pipeline_spawns_company_for_real_company_from_aggregator(
     stub_call_args = mock_managers["companies_manager"].create_company_stub.call_args
     assert "Speechify" in stub_call_args[0][0]  # First positional arg is company name
 
-    # Should spawn COMPANY task for enrichment and requeue to wait
+    # Should spawn COMPANY task for enrichment and park to wait
     assert mock_managers["queue_manager"].spawn_item_safely.called
-    mock_managers["queue_manager"].requeue_with_state.assert_called_once()
+    mock_managers["queue_manager"].park_for_company.assert_called_once()
 
 
 def test_build_company_info_string(processor):
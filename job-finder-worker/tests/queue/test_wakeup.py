@@ -0,0 +1,149 @@
+"""Tests for waking the idle worker loop on queue changes."""
+
+import sqlite3
+import threading
+import time
+
+import pytest
+
+from job_finder.job_queue.manager import QueueManager
+from job_finder.job_queue.models import JobQueueItem, QueueItemType, QueueStatus
+from job_finder.job_queue.wakeup import QueueWakeup
+
+
+def _init_db(db_path) -> None:
+    conn = sqlite3.connect(db_path)
+    conn.execute("""
+        CREATE TABLE job_queue (
+            id TEXT PRIMARY KEY,
+            type TEXT NOT NULL,
+            status TEXT NOT NULL,
+            url TEXT,
+            tracking_id TEXT,
+            parent_item_id TEXT,
+            dedupe_key TEXT,
+            input TEXT,
+            output TEXT,
+            result_message TEXT,
+            error_details TEXT,
+            retry_count INTEGER NOT NULL DEFAULT 0,
+            max_retries INTEGER NOT NULL DEFAULT 3,
+            last_error_category TEXT,
+            created_at TEXT,
+            updated_at TEXT,
+            processed_at TEXT,
+            completed_at TEXT
+        );
+        """)
+    conn.commit()
+    conn.close()
+
+
+@pytest.fixture()
+def queue_mgr(tmp_path):
+    db_path = tmp_path / "queue.db"
+    _init_db(db_path)
+    return QueueManager(db_path=str(db_path))
+
+
+def test_wake_ends_wait_with_reason():
+    wakeup = QueueWakeup()
+    timer = threading.Timer(0.05, wakeup.wake, args=("http",))
+    timer.start()
+    started = time.monotonic()
+    assert wakeup.wait(5) == "http"
+    assert time.monotonic() - started < 1
+    # The event is consumed: the next wait times out
+    assert wakeup.wait(0.01) is None
+
+
+def test_wake_before_wait_is_not_lost():
+    wakeup = QueueWakeup()
+    wakeup.wake("command")
+    assert wakeup.wait(5) == "command"
+
+
+def test_version_change_after_checkpoint_wakes():
+    versions = iter([1, 1, 2])
+    wakeup = QueueWakeup(lambda: next(versions), check_interval=0.01)
+    wakeup.checkpoint()
+    assert wakeup.wait(5) == "queue_change"
+
+
+def test_wait_times_out_without_changes():
+    wakeup = QueueWakeup(lambda: 7, check_interval=0.01)
+    wakeup.checkpoint()
+    started = time.monotonic()
+    assert wakeup.wait(0.05) is None
+    assert 0.04 <= time.monotonic() - started < 1
+
+
+def test_unavailable_version_falls_back_to_plain_wait():
+    def broken():
+        raise sqlite3.OperationalError("no such table")
+
+    wakeup = QueueWakeup(broken, check_interval=0.01)
+    wakeup.checkpoint()
+    assert wakeup.wait(0.03) is None
+
+
+def test_pending_version_moves_on_claimable_changes(queue_mgr):
+    start = queue_mgr.get_pending_version()
+    assert start == 0
+
+    item_id = queue_mgr.add_item(
+        JobQueueItem(type=QueueItemType.JOB, url="https://example.com/job/1")
+    )
+    after_insert = queue_mgr.get_pending_version()
+    assert after_insert == start + 1
+
+    queue_mgr.update_status(item_id, QueueStatus.PROCESSING)
+    assert queue_mgr.get_pending_version() == after_insert
+
+    queue_mgr.update_status(item_id, QueueStatus.PENDING)
+    assert queue_mgr.get_pending_version() == after_insert + 1
+
+
+def test_worker_wakes_on_add_item(queue_mgr):
+    wakeup = QueueWakeup(queue_mgr.get_pending_version, check_interval=0.01)
+    wakeup.checkpoint()
+    assert queue_mgr.get_pending_items() == []
+
+    # Submitted after the (empty) fetch but before the wait starts
+    queue_mgr.add_item(JobQueueItem(type=QueueItemType.JOB, url="https://example.com/job/2"))
+    assert wakeup.wait(5) == "queue_change"
+    assert len(queue_mgr.get_pending_items()) == 1
+
+
+def test_submission_while_paused_wakes_only_once(queue_mgr):
+    # Paused loop: waits without fetching, so nothing re-checkpoints
+    wakeup = QueueWakeup(queue_mgr.get_pending_version, check_interval=0.01)
+    wakeup.checkpoint()
+    queue_mgr.add_item(JobQueueItem(type=QueueItemType.JOB, url="https://example.com/job/3"))
+    assert wakeup.wait(5) == "queue_change"
+
+    started = time.monotonic()
+    assert wakeup.wait(0.05) is None
+    assert time.monotonic() - started >= 0.04
+
+
+def test_pending_reports_work_without_consuming_it(queue_mgr):
+    wakeup = QueueWakeup(queue_mgr.get_pending_version, check_interval=0.01)
+    wakeup.checkpoint()
+    assert not wakeup.pending()
+
+    queue_mgr.add_item(JobQueueItem(type=QueueItemType.JOB, url="https://example.com/job/4"))
+    assert wakeup.pending()
+    assert wakeup.wait(5) == "queue_change"
+    assert not wakeup.pending()
+
+    wakeup.wake("http")
+    assert wakeup.pending()
+    assert wakeup.wait(5) == "http"
+
+
+def test_wake_command_calls_on_wake(queue_mgr):
+    reasons = []
+    queue_mgr.on_wake = reasons.append
+    queue_mgr.handle_command({"event": "command.wake"})
+    assert reasons == ["command"]
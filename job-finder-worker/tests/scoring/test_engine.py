@@ -878,3 +878,83 @@ class TestScoringEngine:
             remote_adj is not None
         ), f"Expected Remote-first adjustment, got: {company_adjustments}"
         assert remote_adj.points == default_config["company"]["remoteFirstScore"]
+
+
+class TestUpperBound:
+    """Tests for ScoringEngine.upper_bound (pre-extraction pruning)."""
+
+    def _random_extraction(self, rng):
+        skills = ["typescript", "react", "python", "aws", "gcp", "java", "rust", "cobol"]
+        roles = ["backend", "frontend", "fullstack", "devops", "data", "consulting"]
+        return JobExtractionResult(
+            seniority=rng.choice(["junior", "mid", "senior", "staff", "lead", "unknown"]),
+            work_arrangement=rng.choice(["remote", "hybrid", "onsite", "unknown"]),
+            timezone=rng.choice([None, -10, -8, -7, -5, 0, 1]),
+            city=rng.choice([None, "Portland", "Austin"]),
+            salary_min=rng.choice([None, 120000, 160000, 210000]),
+            salary_max=rng.choice([None, 180000, 250000]),
+            technologies=rng.sample(skills, rng.randint(0, len(skills))),
+            days_old=rng.choice([None, 0, 1, 5, 30]),
+            is_repost=rng.random() < 0.3,
+            relocation_required=rng.random() < 0.2,
+            includes_equity=rng.random() < 0.5,
+            is_contract=rng.random() < 0.2,
+            role_types=rng.sample(roles, rng.randint(0, 3)),
+            timezone_flexible=rng.random() < 0.3,
+        )
+
+    def test_bound_never_below_actual_score(self, engine_factory, default_config):
+        """Any extraction agreeing with the known fields scores at most the bound."""
+        import random
+
+        default_config["location"]["userCity"] = "Portland"
+        default_config["location"]["relocationAllowed"] = True
+        engine = engine_factory()
+        rng = random.Random(7)
+        company = {"employeeCount": 50000, "isRemoteFirst": True}
+        names = [
+            "seniority",
+            "work_arrangement",
+            "timezone",
+            "city",
+            "salary_min",
+            "salary_max",
+            "days_old",
+            "is_repost",
+            "includes_equity",
+            "role_types",
+        ]
+
+        for _ in range(500):
+            extraction = self._random_extraction(rng)
+            known = {n: getattr(extraction, n) for n in rng.sample(names, rng.randint(0, 6))}
+            result = engine.score(extraction, "Engineer", "", company_data=company)
+            assert result.final_score <= engine.upper_bound(known, company), known
+
+    def test_unknown_everything_is_not_pruned(self, engine_factory):
+        engine = engine_factory()
+        assert engine.upper_bound({}) >= engine.min_score
+
+    def test_settled_hard_reject_bounds_at_zero(self, engine_factory):
+        """Onsite is disallowed by config, so a settled onsite job cannot pass."""
+        engine = engine_factory()
+        # Relocation could still route around the arrangement check until settled
+        assert engine.upper_bound({"work_arrangement": "onsite"}) > 0
+        assert engine.upper_bound({"work_arrangement": "onsite", "relocation_required": False}) == 0
+        assert engine.upper_bound({"seniority": "junior"}) == 0
+
+    def test_settled_penalties_accumulate_below_threshold(self, engine_factory):
+        engine = engine_factory()
+        known = {
+            "seniority": "mid",
+            "work_arrangement": "hybrid",
+            "timezone": -5.0,
+            "city": None,
+            "salary_min": 150000,
+            "salary_max": 160000,
+            "includes_equity": False,
+            "days_old": 30,
+            "is_repost": True,
+        }
+        assert engine.upper_bound(known) < engine.min_score
+        assert engine.upper_bound({"seniority": "mid"}) >= engine.min_score
@@ -0,0 +1,73 @@
+"""Tests for the fingerprint-keyed job extraction cache."""
+
+import pytest
+
+from job_finder.storage.job_extraction_cache import (
+    JobExtractionCache,
+    extraction_fingerprint,
+    get_extraction_cache_stats,
+    reset_extraction_cache_stats,
+)
+
+_EXTRACTION = {"seniority": "senior", "technologies": ["python"], "extractionModel": "m"}
+
+
+@pytest.fixture
+def cache(tmp_path):
+    db_path = tmp_path / "cache.db"
+    db_path.touch()
+    reset_extraction_cache_stats()
+    yield JobExtractionCache(str(db_path))
+    reset_extraction_cache_stats()
+
+
+def test_fingerprint_normalizes_names_but_keeps_location():
+    base = extraction_fingerprint("Senior Engineer", "Acme", "Build things.", "Denver, CO")
+
+    assert base == extraction_fingerprint(
+        "senior engineer", "Acme Inc.", "Build things.", "denver co"
+    )
+    assert base != extraction_fingerprint("Senior Engineer", "Acme", "Build things.", "Austin, TX")
+
+
+def test_round_trip_counts_hits_and_misses(cache):
+    assert cache.get("fp", "v1", "local-extract") is None
+    cache.set("fp", "v1", "local-extract", _EXTRACTION, "gemma")
+
+    assert cache.get("fp", "v1", "local-extract") == _EXTRACTION
+    assert cache.get("fp", "v2", "local-extract") is None
+    assert cache.get("fp", "v1", "gemini-general") is None
+    assert get_extraction_cache_stats() == {"hits": 1, "misses": 3, "writes": 1, "evicted": 0}
+
+
+def test_prune_evicts_least_recently_used(tmp_path):
+    db_path = tmp_path / "cache.db"
+    db_path.touch()
+    cache = JobExtractionCache(str(db_path), max_entries=2)
+    for fingerprint in ("a", "b", "c"):
+        cache.set(fingerprint, "v1", "m", _EXTRACTION)
+    cache.get("a", "v1", "m")  # "b" is now the least recently used
+
+    assert cache.prune() == 1
+    assert cache.get("a", "v1", "m") is not None
+    assert cache.get("b", "v1", "m") is None
+    assert cache.get("c", "v1", "m") is not None
+
+
+def test_invalidate_by_prompt_version(cache):
+    for version in ("v1", "v2", "v3"):
+        cache.set("fp", version, "m", _EXTRACTION)
+    cache.get("fp", "v3", "m")
+
+    assert cache.invalidate(prompt_versions=["v1"]) == 1
+    assert sorted(cache.versions()) == [("v2", 1, 0), ("v3", 1, 1)]
+    assert cache.invalidate(keep_version="v3") == 1
+    assert cache.versions() == [("v3", 1, 1)]
+    assert cache.invalidate() == 1
+
+
+def test_unreadable_database_is_a_miss(tmp_path):
+    cache = JobExtractionCache(str(tmp_path / "missing" / "cache.db"))
+
+    cache.set("fp", "v1", "m", _EXTRACTION)
+    assert cache.get("fp", "v1", "m") is None
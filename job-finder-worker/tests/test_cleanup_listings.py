@@ -0,0 +1,109 @@
+"""Tests for the streaming cleanup_listings maintenance command."""
+
+import sqlite3
+from types import SimpleNamespace
+from unittest.mock import MagicMock
+
+import pytest
+
+from job_finder import cleanup_listings
+from job_finder.cleanup_listings import delete_listings, iter_listing_chunks, load_sources
+
+
+class _FakePreFilter:
+    """Rejects titles containing "Intern"; remote sources pass everything."""
+
+    def __init__(self, config):
+        self.config = config
+        for attr in ("required_keywords", "excluded_keywords", "max_age_days", "min_salary"):
+            setattr(self, attr, None)
+        self.allow_remote = self.allow_hybrid = self.allow_onsite = True
+
+    def filter(self, job_data, is_remote_source=False):
+        passed = is_remote_source or "Intern" not in job_data["title"]
+        return SimpleNamespace(passed=passed, reason=None if passed else "title")
+
+
+@pytest.fixture
+def db_path(tmp_path):
+    path = tmp_path / "cleanup.db"
+    with sqlite3.connect(path) as conn:
+        conn.executescript("""
+            CREATE TABLE job_sources (id TEXT PRIMARY KEY, name TEXT, source_type TEXT);
+            CREATE TABLE job_listings (
+              id TEXT PRIMARY KEY, url TEXT, title TEXT, company_name TEXT, location TEXT,
+              description TEXT, posted_date TEXT, salary_range TEXT, source_id TEXT,
+              status TEXT, created_at TEXT
+            );
+            INSERT INTO job_sources VALUES ('s-remote', 'Remotive', 'remotive');
+            INSERT INTO job_sources VALUES ('s-acme', 'Acme Careers', 'greenhouse');
+            """)
+        for i in range(50):
+            title = "Intern" if i % 5 == 0 else "Engineer"
+            source = "s-remote" if i % 10 == 0 else "s-acme"
+            conn.execute(
+                "INSERT INTO job_listings (id, title, company_name, description, source_id)"
+                " VALUES (?, ?, 'Acme', 'desc', ?)",
+                (f"l-{i:02d}", title, source),
+            )
+    return str(path)
+
+
+@pytest.fixture
+def fake_prefilter(monkeypatch):
+    loader = MagicMock()
+    loader.return_value.get_prefilter_policy.return_value = {}
+    monkeypatch.setattr(cleanup_listings, "ConfigLoader", loader)
+    monkeypatch.setattr(cleanup_listings, "PreFilter", _FakePreFilter)
+
+
+def _listing_ids(db_path):
+    with sqlite3.connect(db_path) as conn:
+        return {row[0] for row in conn.execute("SELECT id FROM job_listings")}
+
+
+def test_iter_listing_chunks_keyset_pages(db_path):
+    chunks = list(iter_listing_chunks(db_path, chunk_size=12))
+    assert [len(c) for c in chunks] == [12, 12, 12, 12, 2]
+    assert [row["id"] for chunk in chunks for row in chunk] == [f"l-{i:02d}" for i in range(50)]
+
+
+def test_iter_listing_chunks_tolerates_deletes_behind_cursor(db_path):
+    seen = []
+    for chunk in iter_listing_chunks(db_path, chunk_size=10):
+        seen.extend(row["id"] for row in chunk)
+        delete_listings(db_path, [row["id"] for row in chunk])
+    assert len(seen) == 50
+    assert _listing_ids(db_path) == set()
+
+
+def test_load_sources_single_query(db_path):
+    sources = load_sources(db_path)
+    assert set(sources) == {"s-remote", "s-acme"}
+    assert sources["s-remote"]["source_type"] == "remotive"
+
+
+def test_delete_listings_reports_rows_deleted(db_path, monkeypatch):
+    monkeypatch.setattr(cleanup_listings, "_DELETE_STATEMENT_SIZE", 7)
+    ids = [f"l-{i:02d}" for i in range(20)] + ["missing"]
+    assert delete_listings(db_path, ids) == 20
+    assert delete_listings(db_path, ids) == 0
+
+
+@pytest.mark.parametrize("workers", [1, 2])
+def test_run_cleanup_deletes_failures(db_path, fake_prefilter, workers):
+    total, passed, failed = cleanup_listings.run_cleanup(
+        db_path, batch_size=3, chunk_size=7, workers=workers
+    )
+
+    # Interns on remote sources (i % 10 == 0) are kept
+    assert (total, passed, failed) == (50, 45, 5)
+    remaining = _listing_ids(db_path)
+    assert len(remaining) == 45
+    assert "l-05" not in remaining
+    assert "l-10" in remaining
+
+
+def test_run_cleanup_dry_run_keeps_rows(db_path, fake_prefilter):
+    assert cleanup_listings.run_cleanup(db_path, dry_run=True, chunk_size=9) == (50, 45, 5)
+    assert len(_listing_ids(db_path)) == 50
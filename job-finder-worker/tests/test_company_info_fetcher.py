@@ -133,3 +133,90 @@ def test_choose_best_website_uses_candidate_when_wiki_invalid(monkeypatch):
         company_name="Acme",
     )
     assert result == "https://acme.com"
+
+
+def _cached_fetcher(tmp_path, monkeypatch, search_client=None, wiki_client=None):
+    db_path = tmp_path / "cache.db"
+    db_path.touch()
+    monkeypatch.setattr("job_finder.company_info_fetcher.get_search_client", lambda: search_client)
+    fetcher = CompanyInfoFetcher(db_path=str(db_path))
+    if wiki_client is not None:
+        fetcher.wikipedia_client = wiki_client
+    return fetcher
+
+
+def test_search_results_persist_across_fetchers(tmp_path, monkeypatch):
+    """A second fetcher instance serves repeated queries from the SQLite cache."""
+    from unittest.mock import Mock
+
+    from job_finder.ai.search_client import SearchResult
+
+    inner = Mock()
+    inner.search.return_value = [SearchResult("Acme", "https://acme.com", "About Acme")]
+
+    first = _cached_fetcher(tmp_path, monkeypatch, search_client=inner)
+    assert first._search("Acme company official website")[0].url == "https://acme.com"
+
+    second = _cached_fetcher(tmp_path, monkeypatch, search_client=inner)
+    results = second._search("  acme COMPANY official website ")
+
+    assert inner.search.call_count == 1
+    assert results[0].url == "https://acme.com"
+    assert second.search_client.hits == 1
+
+
+def test_focused_pass_reuses_fast_pass_searches(tmp_path, monkeypatch):
+    """Queries shared by the fast and focused passes hit the network once."""
+    from unittest.mock import Mock
+
+    inner = Mock()
+    inner.search.return_value = []
+    wiki = Mock()
+    wiki.search_company.return_value = None
+
+    fetcher = _cached_fetcher(tmp_path, monkeypatch, search_client=inner, wiki_client=wiki)
+    monkeypatch.setattr(fetcher, "_needs_enrichment", lambda info: False)
+    monkeypatch.setattr(fetcher, "_homepage_mentions_brand", lambda *_a, **_k: False)
+
+    fetcher.fetch_company_info("Acme")
+
+    queried = [c.args[0] for c in inner.search.call_args_list]
+    assert len(queried) == len(set(queried))
+    assert set(fetcher._build_search_queries("Acme", mode="fast")) <= set(queried)
+    # Negative Wikipedia lookup is reused by the focused pass
+    assert wiki.search_company.call_count == 1
+
+
+def test_wikipedia_negative_result_cached(tmp_path, monkeypatch):
+    from unittest.mock import Mock
+
+    wiki = Mock()
+    wiki.search_company.return_value = None
+
+    _cached_fetcher(tmp_path, monkeypatch, wiki_client=wiki)._try_wikipedia("Nobody Inc")
+    result = _cached_fetcher(tmp_path, monkeypatch, wiki_client=wiki)._try_wikipedia("Nobody Inc")
+
+    assert result is None
+    assert wiki.search_company.call_count == 1
+
+
+def test_page_content_cached_only_on_success(tmp_path, monkeypatch):
+    fetcher = _cached_fetcher(tmp_path, monkeypatch)
+    calls = []
+
+    def fake_download(url, timeout=10):
+        calls.append(url)
+        return None if "missing" in url else "About Acme text"
+
+    monkeypatch.setattr(fetcher, "_download_page_content", fake_download)
+
+    assert fetcher._fetch_page_content("acme.com/about") == "About Acme text"
+    assert fetcher._fetch_page_content("https://acme.com/about") == "About Acme text"
+    assert fetcher._fetch_page_content("https://acme.com/missing") is None
+    assert fetcher._fetch_page_content("https://acme.com/missing") is None
+
+    assert calls == [
+        "https://acme.com/about",
+        "https://acme.com/missing",
+        "https://acme.com/missing",
+    ]
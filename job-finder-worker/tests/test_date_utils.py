@@ -1,11 +1,20 @@
 """Tests for date parsing and scoring utilities."""
 
-from datetime import timezone
+import json
+from datetime import datetime, timezone
+from pathlib import Path
 
+import pytest
+
+from job_finder.utils import date_utils
 from job_finder.utils.date_utils import (
+    get_date_parse_stats,
     parse_job_date,
+    reset_date_parse_stats,
 )
 
+_GOLDEN = json.loads((Path(__file__).parent / "fixtures" / "date_parsing_golden.json").read_text())
+
 
 class TestParseJobDate:
     """Test job date parsing."""
@@ -74,3 +83,68 @@ class TestParseJobDate:
         result = parse_job_date("2000-01-01T00:00:00Z")
         assert result is not None
         assert result.year == 2000
+
+
+class TestParseJobDateFastPaths:
+    """Tiered parsing, memo and histogram."""
+
+    @pytest.fixture(autouse=True)
+    def _reset(self):
+        reset_date_parse_stats()
+        yield
+        reset_date_parse_stats()
+
+    @pytest.mark.parametrize("entry", _GOLDEN, ids=lambda e: e["input"][:40])
+    def test_matches_golden_corpus(self, entry):
+        """Output matches what the dateutil-only parser produced."""
+        result = parse_job_date(entry["input"])
+        if "relative_seconds" in entry:
+            assert result is not None
+            age = (datetime.now(timezone.utc) - result).total_seconds()
+            assert abs(age - entry["relative_seconds"]) < 5
+        elif "expected_month" in entry:
+            # Year-month only: dateutil takes the day from today
+            assert result is not None
+            assert result.strftime("%Y-%m") == entry["expected_month"]
+        else:
+            assert (result.isoformat() if result else None) == entry["expected"]
+
+    def test_iso_fast_path_skips_dateutil(self, monkeypatch):
+        monkeypatch.setattr(date_utils.dateutil.parser, "parse", pytest.fail)
+        result = parse_job_date("2024-01-15T10:30:00.123456789+0530")
+        assert result.isoformat() == "2024-01-15T10:30:00.123456+05:30"
+        assert get_date_parse_stats() == {"iso": 1}
+
+    def test_epoch_seconds_and_milliseconds(self):
+        expected = datetime(2024, 1, 15, 10, 30, tzinfo=timezone.utc)
+        assert parse_job_date("1705314600") == expected
+        assert parse_job_date("1705314600000") == expected
+        assert get_date_parse_stats() == {"epoch": 2}
+
+    def test_rfc2822_not_mistaken_for_relative_date(self):
+        """ "02 Dec" used to match the relative "2 d" pattern."""
+        result = parse_job_date("Mon, 02 Dec 2024 10:30:00 +0000")
+        assert result == datetime(2024, 12, 2, 10, 30, tzinfo=timezone.utc)
+        assert get_date_parse_stats() == {"rfc2822": 1}
+
+    def test_absolute_results_memoized(self, monkeypatch):
+        parse_job_date("January 15, 2024")
+        parse_job_date("not a valid date")
+        monkeypatch.setattr(date_utils.dateutil.parser, "parse", pytest.fail)
+        assert parse_job_date("January 15, 2024").day == 15
+        assert parse_job_date("not a valid date") is None
+        stats = get_date_parse_stats()
+        assert stats["dateutil"] == 1
+        assert stats["unparsed"] == 1
+        assert stats["memo_hits"] == 2
+
+    def test_relative_results_not_memoized(self):
+        parse_job_date("2 days ago")
+        parse_job_date("2 days ago")
+        assert get_date_parse_stats() == {"relative": 2}
+
+    def test_memo_bounded(self, monkeypatch):
+        monkeypatch.setattr(date_utils, "_MEMO_MAXSIZE", 3)
+        for day in range(1, 6):
+            parse_job_date(f"2024-01-0{day}")
+        assert len(date_utils._memo) == 3
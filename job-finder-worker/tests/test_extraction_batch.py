@@ -0,0 +1,116 @@
+"""Tests for micro-batched extraction (JobExtractor.extract_batch)."""
+
+import json
+from unittest.mock import MagicMock
+
+from job_finder.ai.extraction import (
+    BATCH_MAX_DESCRIPTION_LENGTH,
+    JobExtractor,
+)
+from job_finder.ai.extraction_prompts import build_batch_extraction_prompt
+
+
+def _job(n, description=None):
+    return {
+        "title": f"Engineer {n}",
+        "description": description or f"Build Python services for team {n}. " + "x" * 250,
+        "location": "Remote",
+    }
+
+
+def _entry(index, **fields):
+    return {
+        "index": index,
+        "seniority": "senior",
+        "workArrangement": "remote",
+        "technologies": ["Python"],
+        **fields,
+    }
+
+
+def _response(payload, model="local-extract"):
+    return MagicMock(text=json.dumps(payload), model=model)
+
+
+def test_batch_prompt_numbers_each_job():
+    system, user = build_batch_extraction_prompt([_job(1), _job(2)])
+
+    assert '"results"' in system
+    assert "=== JOB 1 ===" in user and "=== JOB 2 ===" in user
+    assert "Engineer 2" in user
+
+
+def test_short_listings_share_one_request():
+    client = MagicMock()
+    client.execute.return_value = _response({"results": [_entry(1), _entry(2), _entry(3)]})
+    extractor = JobExtractor(client)
+
+    outcomes = extractor.extract_batch([_job(1), _job(2), _job(3)], batch_size=4)
+
+    assert client.execute.call_count == 1
+    assert all(o.batched and o.result for o in outcomes)
+    assert outcomes[0].result.technologies == ["python"]
+    assert outcomes[0].result.extraction_model == "local-extract"
+
+
+def test_missing_or_invalid_sub_results_fall_back_to_single():
+    client = MagicMock()
+    client.execute.side_effect = [
+        _response({"results": [_entry(1), "garbage"]}),
+        _response(_entry(2, seniority="mid")),
+    ]
+    extractor = JobExtractor(client)
+
+    outcomes = extractor.extract_batch([_job(1), _job(2)])
+
+    assert client.execute.call_count == 2
+    assert outcomes[0].batched is True
+    assert outcomes[1].batched is False
+    assert outcomes[1].result.seniority == "mid"
+
+
+def test_unparseable_batch_response_falls_back_for_every_item():
+    client = MagicMock()
+    client.execute.side_effect = [
+        MagicMock(text="not json", model="m"),
+        _response(_entry(1)),
+        _response(_entry(2)),
+    ]
+    extractor = JobExtractor(client)
+
+    outcomes = extractor.extract_batch([_job(1), _job(2)])
+
+    assert client.execute.call_count == 3
+    assert [o.batched for o in outcomes] == [False, False]
+    assert all(o.result for o in outcomes)
+
+
+def test_guards_apply_to_batched_results():
+    client = MagicMock()
+    client.execute.return_value = _response(
+        {"results": [_entry(1, salaryMin=200000, salaryMax=250000), _entry(2)]}
+    )
+    extractor = JobExtractor(client)
+
+    outcomes = extractor.extract_batch([_job(1), _job(2)])
+
+    # Description has no salary text, so the salary guard nulls hallucinations
+    assert outcomes[0].result.salary_min is None
+    assert outcomes[0].result.salary_max is None
+
+
+def test_long_and_short_descriptions_routed_correctly():
+    client = MagicMock()
+    client.execute.side_effect = [
+        _response({"results": [_entry(1), _entry(2)]}),
+        _response(_entry(1)),
+    ]
+    extractor = JobExtractor(client)
+    long_job = _job(3, description="y" * (BATCH_MAX_DESCRIPTION_LENGTH + 1))
+    too_short = _job(4, description="short")
+
+    outcomes = extractor.extract_batch([_job(1), _job(2), long_job, too_short])
+
+    assert client.execute.call_count == 2
+    assert outcomes[2].batched is False and outcomes[2].result is not None
+    assert outcomes[3].result is None and "too short" in outcomes[3].error
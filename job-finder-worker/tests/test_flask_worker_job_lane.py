@@ -0,0 +1,104 @@
+"""Tests for the concurrent JOB lane in flask_worker._process_batch."""
+
+import concurrent.futures
+import threading
+import time
+from types import SimpleNamespace
+from unittest.mock import MagicMock
+
+import pytest
+
+from job_finder.exceptions import NoAgentsAvailableError
+from job_finder.job_queue.models import QueueItemType
+
+
+@pytest.fixture
+def worker(monkeypatch):
+    try:
+        import job_finder.flask_worker as fw
+    except ModuleNotFoundError as exc:  # flask not installed in lightweight envs
+        pytest.skip(f"flask not available: {exc}")
+
+    cfg = MagicMock()
+    cfg.get_task_delay.return_value = 0
+    cfg.is_processing_enabled.return_value = True
+    cfg.get_max_concurrent_jobs.return_value = 3
+    monkeypatch.setattr(fw, "config_loader", cfg)
+    monkeypatch.setattr(fw, "queue_manager", MagicMock())
+    monkeypatch.setattr(fw, "processor", MagicMock())
+    monkeypatch.setitem(fw.worker_state, "shutdown_requested", False)
+    monkeypatch.setitem(fw.worker_state, "items_in_flight", 0)
+    return fw
+
+
+def _items(*types):
+    return [SimpleNamespace(id=f"item-{i}", type=t) for i, t in enumerate(types)]
+
+
+def _run(fw, items):
+    with concurrent.futures.ThreadPoolExecutor(max_workers=8) as executor:
+        return fw._process_batch(executor, items, processing_timeout=5)
+
+
+def test_job_items_overlap_up_to_configured_concurrency(worker):
+    active = 0
+    peak = 0
+    lock = threading.Lock()
+
+    def process(item):
+        nonlocal active, peak
+        with lock:
+            active += 1
+            peak = max(peak, active)
+        time.sleep(0.05)
+        with lock:
+            active -= 1
+
+    worker.processor.process_item.side_effect = process
+
+    paused = _run(worker, _items(*[QueueItemType.JOB] * 6))
+
+    assert paused is False
+    assert worker.processor.process_item.call_count == 6
+    assert peak == 3
+    assert worker.worker_state["items_in_flight"] == 0
+
+
+def test_non_job_items_stay_sequential_and_ordered(worker):
+    order = []
+    worker.processor.process_item.side_effect = lambda item: order.append(item.id)
+
+    items = _items(
+        QueueItemType.COMPANY, QueueItemType.JOB, QueueItemType.JOB, QueueItemType.SCRAPE
+    )
+    _run(worker, items)
+
+    assert order[0] == "item-0"
+    assert set(order[1:3]) == {"item-1", "item-2"}
+    assert order[3] == "item-3"
+
+
+def test_no_agents_available_pauses_lane(worker):
+    def process(item):
+        if item.id == "item-0":
+            raise NoAgentsAvailableError("down", task_type="extraction", tried_agents=["m"])
+        time.sleep(0.05)
+
+    worker.processor.process_item.side_effect = process
+    worker.config_loader.get_max_concurrent_jobs.return_value = 2
+
+    paused = _run(worker, _items(*[QueueItemType.JOB] * 6))
+
+    assert paused is True
+    assert worker.processor.process_item.call_count < 6
+    worker.config_loader.set_processing_disabled_with_reason.assert_called_once()
+
+
+def test_concurrency_one_keeps_sequential_path(worker):
+    worker.config_loader.get_max_concurrent_jobs.return_value = 1
+    order = []
+    worker.processor.process_item.side_effect = lambda item: order.append(item.id)
+
+    _run(worker, _items(*[QueueItemType.JOB] * 3))
+
+    assert order == ["item-0", "item-1", "item-2"]
@@ -887,19 +887,26 @@ class TestEnrichStaleListings:
         self, monkeypatch, scraper, status_code
     ):
         """Job should be returned unmodified when detail page returns 403, 404, or 410."""
-        sleep_calls = []
+        acquired = []
 
         def fake_get(url, headers=None, timeout=None):
             return SimpleNamespace(status_code=status_code, text="Not Found")
 
-        def fake_sleep(seconds):
-            sleep_calls.append(seconds)
+        class FakeLimiter:
+            def acquire(self, key, rate=None, burst=None):
+                acquired.append((key, rate))
+                return 0.0
+
+            def record_response(self, key, status_code, retry_after=None):
+                pass
 
         monkeypatch.setattr("job_finder.scrapers.generic_scraper.requests.get", fake_get)
         monkeypatch.setattr(
             "job_finder.scrapers.generic_scraper.get_fetch_delay_seconds", lambda: 0.5
         )
-        monkeypatch.setattr("job_finder.scrapers.generic_scraper.time.sleep", fake_sleep)
+        monkeypatch.setattr(
+            "job_finder.scrapers.generic_scraper.get_rate_limiter", lambda: FakeLimiter()
+        )
 
         original_job = {
             "title": "Software Engineer",
@@ -912,8 +919,8 @@ class TestEnrichStaleListings:
 
         # Job should be returned unmodified
         assert result == original_job
-        # Rate limit delay should still be applied
-        assert sleep_calls == [0.5]
+        # The fetch is still paced by the per-host limiter (0.5s delay -> 2 req/s)
+        assert acquired == [("example.com", 2.0)]
 
     def test_enrich_gracefully_handles_server_errors(self, monkeypatch, scraper):
         """Other HTTP errors (e.g., 500) should be handled gracefully, returning job unmodified."""
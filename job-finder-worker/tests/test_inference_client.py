@@ -7,7 +7,15 @@ LiteLLM handles provider selection, fallbacks, retries, and budget tracking.
 import pytest
 from unittest.mock import patch, MagicMock
 
-from job_finder.ai.inference_client import InferenceClient, AgentResult
+from job_finder.ai.inference_client import (
+    InferenceClient,
+    AgentResult,
+    get_prefix_stats,
+    get_response_cache_stats,
+    prefix_hash,
+    reset_prefix_stats,
+    reset_response_cache_stats,
+)
 from job_finder.ai.task_router import get_model_for_task, TASK_MODEL_MAP, DEFAULT_MODEL
 from job_finder.exceptions import (
     AIProviderError,
@@ -37,7 +45,7 @@ class TestTaskRouter:
 
     def test_all_task_types_have_mappings(self):
         """All expected task types should have explicit mappings."""
-        expected = {"extraction", "analysis", "document", "chat"}
+        expected = {"extraction", "analysis", "document", "chat", "fused"}
         assert expected == set(TASK_MODEL_MAP.keys())
 
     def test_use_local_false_reroutes_local_models(self):
@@ -237,6 +245,248 @@ class TestInferenceClientExecute:
         assert "response_format" not in call_kwargs
 
 
+class TestInferenceClientResponseCache:
+    """Test the prompt-level response cache."""
+
+    def _make_mock_response(self, text='{"seniority": "senior"}', model="local-extract"):
+        message = MagicMock()
+        message.content = text
+        choice = MagicMock()
+        choice.message = message
+        response = MagicMock()
+        response.choices = [choice]
+        response.model = model
+        response.usage = MagicMock(total_tokens=100)
+        return response
+
+    @pytest.fixture
+    def cached_client(self, tmp_path):
+        db_path = tmp_path / "cache.db"
+        db_path.touch()
+        reset_response_cache_stats()
+        with patch("job_finder.ai.inference_client.OpenAI") as mock_openai_cls:
+            mock_api = MagicMock()
+            mock_api.chat.completions.create.return_value = self._make_mock_response()
+            mock_openai_cls.return_value = mock_api
+            client = InferenceClient(api_key="test-key", db_path=str(db_path))
+            yield client, mock_api
+        reset_response_cache_stats()
+
+    def test_extraction_cached_by_default(self, cached_client):
+        client, mock_api = cached_client
+
+        first = client.execute("extraction", "job text", temperature=0.1, response_format="json")
+        second = client.execute("extraction", "job text  ", temperature=0.1, response_format="json")
+
+        assert mock_api.chat.completions.create.call_count == 1
+        assert first.cached is False
+        assert second.cached is True
+        assert second.text == first.text
+        assert get_response_cache_stats()["extraction"] == {"hits": 1, "misses": 1}
+
+    def test_cache_shared_across_clients_on_same_db(self, cached_client):
+        client, mock_api = cached_client
+        client.execute("extraction", "job text", temperature=0.1)
+
+        other = InferenceClient(api_key="test-key", response_cache=client.response_cache)
+        other._client = mock_api
+        assert other.execute("extraction", "job text", temperature=0.1).cached is True
+        assert mock_api.chat.completions.create.call_count == 1
+
+    def test_other_task_types_are_opt_in(self, cached_client):
+        client, mock_api = cached_client
+
+        client.execute("analysis", "match me", temperature=0.0)
+        client.execute("analysis", "match me", temperature=0.0)
+        assert mock_api.chat.completions.create.call_count == 2
+
+        client.execute("analysis", "match me", temperature=0.0, cache=True)
+        assert client.execute("analysis", "match me", temperature=0.0, cache=True).cached
+        assert mock_api.chat.completions.create.call_count == 3
+
+    def test_high_temperature_and_bypass_not_cached(self, cached_client):
+        client, mock_api = cached_client
+
+        client.execute("extraction", "job text", temperature=0.7)
+        client.execute("extraction", "job text", temperature=0.7)
+        client.execute("extraction", "job text", temperature=0.1, cache=False)
+        client.execute("extraction", "job text", temperature=0.1, cache=False)
+
+        assert mock_api.chat.completions.create.call_count == 4
+        assert "extraction" not in get_response_cache_stats()
+
+    def test_request_parameters_are_part_of_key(self, cached_client):
+        client, mock_api = cached_client
+
+        client.execute("extraction", "job text", temperature=0.1)
+        client.execute("extraction", "job text", temperature=0.1, system_prompt="v2")
+        client.execute("extraction", "job text", temperature=0.1, max_tokens=50)
+        client.use_local_models = False
+        client.execute("extraction", "job text", temperature=0.1)
+
+        assert mock_api.chat.completions.create.call_count == 4
+
+    def test_unparseable_json_not_cached(self, cached_client):
+        client, mock_api = cached_client
+        mock_api.chat.completions.create.return_value = self._make_mock_response(
+            text='{"truncated": '
+        )
+
+        client.execute("extraction", "job text", temperature=0.1, response_format="json")
+        client.execute("extraction", "job text", temperature=0.1, response_format="json")
+
+        assert mock_api.chat.completions.create.call_count == 2
+
+    def test_size_cap_evicts_oldest(self, cached_client):
+        client, _ = cached_client
+        cache = client.response_cache
+        cache.max_entries = 3
+        for i in range(5):
+            cache.set(f"key-{i}", "extraction", "m", f"text-{i}", "m", 3600)
+
+        assert cache.prune() == 2
+        assert cache.get("key-0") is None
+        assert cache.get("key-4") == ("text-4", "m")
+
+
+class TestPromptPrefix:
+    """Test per-call prompt-prefix hashing and reuse counters."""
+
+    @pytest.fixture
+    def client(self):
+        reset_prefix_stats()
+        with patch("job_finder.ai.inference_client.OpenAI") as mock_openai_cls:
+            mock_api = MagicMock()
+            message = MagicMock(content="{}")
+            usage = MagicMock(prompt_tokens=120, completion_tokens=10)
+            usage.prompt_tokens_details.cached_tokens = 100
+            mock_api.chat.completions.create.return_value = MagicMock(
+                choices=[MagicMock(message=message)], model="local-extract", usage=usage
+            )
+            mock_openai_cls.return_value = mock_api
+            yield InferenceClient(api_key="test-key")
+        reset_prefix_stats()
+
+    def test_prefix_hash_is_byte_exact(self):
+        assert prefix_hash("rules") == prefix_hash("rules")
+        assert prefix_hash("rules") != prefix_hash("rules ")
+        assert prefix_hash(None) is None
+        assert prefix_hash("") is None
+
+    def test_repeats_and_cached_tokens_counted(self, client):
+        first = client.execute("extraction", "job 1", system_prompt="rules")
+        client.execute("extraction", "job 2", system_prompt="rules")
+        client.execute("extraction", "job 3", system_prompt="other rules")
+
+        assert first.prefix_hash == prefix_hash("rules")
+        assert get_prefix_stats()["extraction"] == {
+            "calls": 3,
+            "repeats": 1,
+            "distinct": 2,
+            "prompt_tokens": 360,
+            "cached_tokens": 300,
+        }
+
+    def test_calls_without_system_prompt_not_counted(self, client):
+        result = client.execute("analysis", "just a prompt")
+        assert result.prefix_hash is None
+        assert get_prefix_stats() == {}
+
+
+class TestStreaming:
+    """Test streamed JSON-mode calls with early abort."""
+
+    class _FakeStream:
+        def __init__(self, deltas, model="local-extract", usage=None):
+            self.deltas = deltas
+            self.model = model
+            self.usage = usage
+            self.sent = 0
+            self.closed = False
+
+        def __iter__(self):
+            for delta in self.deltas:
+                self.sent += 1
+                yield MagicMock(
+                    choices=[MagicMock(delta=MagicMock(content=delta))],
+                    model=self.model,
+                    usage=None,
+                )
+            if self.usage is not None:
+                yield MagicMock(choices=[], model=self.model, usage=self.usage)
+
+        def close(self):
+            self.closed = True
+
+    @pytest.fixture
+    def client(self, tmp_path):
+        db_path = tmp_path / "cache.db"
+        db_path.touch()
+        with patch("job_finder.ai.inference_client.OpenAI") as mock_openai_cls:
+            mock_api = MagicMock()
+            mock_openai_cls.return_value = mock_api
+            yield InferenceClient(api_key="test-key", db_path=str(db_path)), mock_api
+
+    def test_stops_reading_once_object_closes(self, client):
+        client, mock_api = client
+        stream = self._FakeStream(['{"seniority":', ' "senior"}', "\n\nLet me know", " more"])
+        mock_api.chat.completions.create.return_value = stream
+
+        result = client.execute("extraction", "job", response_format="json", stream=True)
+
+        kwargs = mock_api.chat.completions.create.call_args[1]
+        assert kwargs["stream"] is True
+        assert kwargs["stream_options"] == {"include_usage": True}
+        assert stream.sent == 2 and stream.closed
+        assert result.text == '{"seniority": "senior"}'
+        assert result.stream_outcome == "complete"
+
+    def test_off_schema_abort_returns_partial_and_skips_cache(self, client):
+        client, mock_api = client
+        stream = self._FakeStream(['{"job', '": {"seniority": "senior"}', "}"])
+        mock_api.chat.completions.create.return_value = stream
+
+        for _ in range(2):
+            result = client.execute(
+                "extraction",
+                "job",
+                temperature=0.1,
+                response_format="json",
+                stream=True,
+                expected_keys={"seniority"},
+            )
+
+        assert stream.closed
+        assert result.stream_outcome == "off_schema"
+        assert result.text == "{}"
+        assert mock_api.chat.completions.create.call_count == 2
+
+    def test_truncated_stream_keeps_complete_members(self, client):
+        client, mock_api = client
+        mock_api.chat.completions.create.return_value = self._FakeStream(
+            ['{"seniority": "senior", ', '"technologies": ["go", "ru'],
+            usage=MagicMock(prompt_tokens=50, completion_tokens=30),
+        )
+
+        result = client.execute("extraction", "job", response_format="json", stream=True)
+
+        assert result.stream_outcome == "truncated"
+        assert result.text == '{"seniority": "senior", "technologies": ["go"]}'
+
+    def test_stream_tasks_opt_in_and_json_only(self, client):
+        client, mock_api = client
+        mock_api.chat.completions.create.return_value = MagicMock(
+            choices=[MagicMock(message=MagicMock(content="plain"))], model="local-extract"
+        )
+
+        client.stream_tasks = {"extraction"}
+        client.execute("extraction", "job", cache=False)
+        client.execute("analysis", "job", response_format="json")
+
+        for call in mock_api.chat.completions.create.call_args_list:
+            assert "stream" not in call[1]
+
+
 class TestInferenceClientErrors:
     """Test error handling and mapping."""
 
@@ -58,3 +58,109 @@ def test_get_source_by_company_and_aggregator_no_match(tmp_path):
     mgr = JobSourcesManager(str(db))
 
     assert mgr.get_source_by_company_and_aggregator("co-2", "greenhouse.io") is None
+
+
+def _insert(db, source_id, name, config_json):
+    with sqlite3.connect(db) as conn:
+        conn.execute(
+            """
+            INSERT INTO job_sources (
+              id, name, source_type, status, config_json, tags,
+              company_id, aggregator_domain, created_at, updated_at
+            ) VALUES (?, ?, 'api', 'active', ?, '[]', NULL, 'x.com', datetime('now'), datetime('now'))
+            """,
+            (source_id, name, config_json),
+        )
+
+
+def _legacy_url_match(rows, url):
+    normalized_url = url.lower()
+    for source_id, _, config in rows:
+        board_token = config.get("board_token") or ""
+        base_url = config.get("url") or ""
+        if board_token and board_token.lower() in normalized_url:
+            return source_id
+        if base_url and base_url.lower() in normalized_url:
+            return source_id
+    return None
+
+
+def _legacy_name_match(rows, company_name):
+    from job_finder.utils.company_name_utils import normalize_company_name
+
+    normalized = normalize_company_name(company_name)
+    if not normalized:
+        return None
+    best, best_score = None, 0
+    for source_id, name, _ in rows:
+        target = normalize_company_name(name)
+        if normalized == target:
+            return source_id
+        score = JobSourcesManager._compute_partial_match_score(normalized, target)
+        if score > best_score:
+            best, best_score = source_id, score
+    return best if best and best_score >= 4 else None
+
+
+def test_source_index_matches_full_scan(tmp_path):
+    import json
+    import random
+
+    db = tmp_path / "sources_lookup.db"
+    _bootstrap_db(db)
+    rng = random.Random(7)
+    stems = ["stripe", "coinbase", "coin", "acme", "acmecorp", "data", "datadog", "lever", "ab"]
+    rows = [("src-gh", "GH Jobs", {})]
+    for i in range(120):
+        stem = rng.choice(stems) + rng.choice(["", "", "x", "labs"])
+        name = f"{stem.title()} {rng.choice(['Jobs', 'Careers', 'Greenhouse', ''])} {i}"
+        name = name if rng.random() < 0.5 else f"{stem.title()} Jobs"
+        config = rng.choice(
+            [{}, {"board_token": stem}, {"url": f"https://jobs.lever.co/{stem}"}, {"url": ""}]
+        )
+        source_id = f"src-{i}"
+        try:
+            _insert(db, source_id, name, json.dumps(config))
+        except sqlite3.IntegrityError:
+            continue
+        rows.append((source_id, name, config))
+
+    mgr = JobSourcesManager(str(db))
+    for stem in stems + ["stripelabs", "Coinbase Careers", "Acme Corp Inc", "zzz"]:
+        url = f"https://boards.greenhouse.io/{stem}/jobs/1"
+        found = mgr.get_source_for_url(url)
+        assert (found["id"] if found else None) == _legacy_url_match(rows, url)
+        found = mgr._match_source_by_company_name(stem)
+        assert (found["id"] if found else None) == _legacy_name_match(rows, stem)
+
+
+def test_source_index_rebuilt_after_external_write(tmp_path):
+    db = tmp_path / "sources_lookup.db"
+    _bootstrap_db(db)
+    mgr = JobSourcesManager(str(db))
+    assert mgr.get_source_for_url("https://boards.greenhouse.io/stripe") is None
+    index = mgr._source_index
+
+    # Unrelated column changes keep the index; rows are re-read on every hit
+    with sqlite3.connect(db) as conn:
+        conn.execute("UPDATE job_sources SET status = 'disabled' WHERE id = 'src-gh'")
+    mgr.get_source_for_url("https://boards.greenhouse.io/stripe")
+    assert mgr._source_index is index
+
+    # Writes from another process bump table_versions via triggers
+    _insert(db, "src-stripe", "Stripe Jobs", '{"board_token": "stripe"}')
+    assert mgr.get_source_for_url("https://boards.greenhouse.io/stripe")["id"] == "src-stripe"
+    with sqlite3.connect(db) as conn:
+        conn.execute("UPDATE job_sources SET config_json = '{}' WHERE id = 'src-stripe'")
+    assert mgr.get_source_for_url("https://boards.greenhouse.io/stripe") is None
+
+
+def test_source_index_invalidated_by_update_config(tmp_path):
+    db = tmp_path / "sources_lookup.db"
+    _bootstrap_db(db)
+    mgr = JobSourcesManager(str(db))
+    assert mgr.get_source_for_url("https://jobs.lever.co/gh") is None
+    mgr.update_config("src-gh", {"url": "https://jobs.lever.co/gh"})
+    found = mgr.get_source_for_url("https://jobs.lever.co/gh/123")
+    assert found["id"] == "src-gh"
+    assert found["status"] == "active"
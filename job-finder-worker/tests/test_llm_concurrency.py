@@ -0,0 +1,164 @@
+"""Tests for adaptive per-model LLM concurrency control."""
+
+import threading
+import time
+from unittest.mock import MagicMock, patch
+
+import pytest
+from openai import APIStatusError, APITimeoutError
+
+from job_finder.ai.concurrency import AdaptiveConcurrencyLimiter
+from job_finder.ai.inference_client import InferenceClient
+from job_finder.exceptions import NoAgentsAvailableError, QuotaExhaustedError, TransientError
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+
+def _run_call(limiter, clock, model, latency, overloaded=False):
+    with limiter.slot(model) as slot:
+        clock.now += latency
+        if overloaded:
+            slot.mark_overloaded()
+
+
+class TestAdaptiveConcurrencyLimiter:
+    def test_additive_increase_on_healthy_latency(self):
+        clock = FakeClock()
+        limiter = AdaptiveConcurrencyLimiter(initial_limit=2, max_limit=4, clock=clock)
+
+        for _ in range(10):
+            _run_call(limiter, clock, "local-extract", 1.0)
+
+        assert limiter.snapshot()["local-extract"]["limit"] == 4
+
+    def test_multiplicative_decrease_on_overload(self):
+        clock = FakeClock()
+        limiter = AdaptiveConcurrencyLimiter(initial_limit=8, max_limit=8, clock=clock)
+
+        _run_call(limiter, clock, "local-extract", 1.0, overloaded=True)
+        assert limiter.snapshot()["local-extract"]["limit"] == 4
+        _run_call(limiter, clock, "local-extract", 1.0, overloaded=True)
+        _run_call(limiter, clock, "local-extract", 1.0, overloaded=True)
+        _run_call(limiter, clock, "local-extract", 1.0, overloaded=True)
+        assert limiter.snapshot()["local-extract"]["limit"] == 1
+
+    def test_latency_spike_shrinks_limit(self):
+        clock = FakeClock()
+        limiter = AdaptiveConcurrencyLimiter(
+            initial_limit=4, max_limit=4, latency_tolerance=3.0, clock=clock
+        )
+        _run_call(limiter, clock, "m", 1.0)
+        _run_call(limiter, clock, "m", 10.0)
+
+        snap = limiter.snapshot()["m"]
+        assert snap["limit"] == 2
+        assert snap["overloads"] == 1
+
+    def test_limits_are_per_model(self):
+        clock = FakeClock()
+        limiter = AdaptiveConcurrencyLimiter(initial_limit=4, clock=clock)
+
+        _run_call(limiter, clock, "local-extract", 1.0, overloaded=True)
+        _run_call(limiter, clock, "gemini-general", 1.0)
+
+        snap = limiter.snapshot()
+        assert snap["local-extract"]["limit"] == 2
+        assert snap["gemini-general"]["limit"] == 4
+
+    def test_plain_errors_release_without_moving_limit(self):
+        clock = FakeClock()
+        limiter = AdaptiveConcurrencyLimiter(initial_limit=2, clock=clock)
+
+        with pytest.raises(ValueError):
+            with limiter.slot("m"):
+                raise ValueError("bad prompt")
+
+        snap = limiter.snapshot()["m"]
+        assert snap["in_flight"] == 0
+        assert snap["limit"] == 2
+
+    def test_acquire_blocks_at_limit(self):
+        limiter = AdaptiveConcurrencyLimiter(initial_limit=2, max_limit=2)
+        assert limiter.acquire("m")
+        assert limiter.acquire("m")
+        assert limiter.acquire("m", timeout=0.01) is False
+
+        limiter.release("m", latency=0.1)
+        assert limiter.acquire("m", timeout=0.01) is True
+
+    def test_threads_never_exceed_limit(self):
+        limiter = AdaptiveConcurrencyLimiter(initial_limit=3, max_limit=3)
+        active = 0
+        peak = 0
+        lock = threading.Lock()
+
+        def work():
+            nonlocal active, peak
+            with limiter.slot("m"):
+                with lock:
+                    active += 1
+                    peak = max(peak, active)
+                time.sleep(0.01)
+                with lock:
+                    active -= 1
+
+        threads = [threading.Thread(target=work) for _ in range(12)]
+        for t in threads:
+            t.start()
+        for t in threads:
+            t.join()
+
+        assert peak == 3
+
+
+def _status_error(status):
+    response = MagicMock()
+    response.status_code = status
+    response.headers = {}
+    return APIStatusError(f"HTTP {status}", response=response, body=None)
+
+
+class TestInferenceClientConcurrency:
+    @pytest.mark.parametrize(
+        "error, expected",
+        [
+            (_status_error(429), QuotaExhaustedError),
+            (_status_error(503), NoAgentsAvailableError),
+            (APITimeoutError(request=MagicMock()), TransientError),
+        ],
+    )
+    @patch("job_finder.ai.inference_client.OpenAI")
+    def test_overload_errors_shrink_limit_and_keep_semantics(
+        self, mock_openai_cls, error, expected
+    ):
+        mock_api = MagicMock()
+        mock_api.chat.completions.create.side_effect = error
+        mock_openai_cls.return_value = mock_api
+        limiter = AdaptiveConcurrencyLimiter(initial_limit=4)
+        client = InferenceClient(api_key="test-key", concurrency_limiter=limiter)
+
+        with pytest.raises(expected):
+            client.execute("extraction", "prompt")
+
+        snap = limiter.snapshot()["local-extract"]
+        assert snap["limit"] == 2
+        assert snap["in_flight"] == 0
+
+    @patch("job_finder.ai.inference_client.OpenAI")
+    def test_other_status_errors_do_not_shrink_limit(self, mock_openai_cls):
+        mock_api = MagicMock()
+        mock_api.chat.completions.create.side_effect = _status_error(400)
+        mock_openai_cls.return_value = mock_api
+        limiter = AdaptiveConcurrencyLimiter(initial_limit=4)
+        client = InferenceClient(api_key="test-key", concurrency_limiter=limiter)
+
+        with pytest.raises(Exception):
+            client.execute("extraction", "prompt")
+
+        assert limiter.snapshot()["local-extract"]["limit"] == 4
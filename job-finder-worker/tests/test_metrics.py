@@ -0,0 +1,109 @@
+"""Tests for the striped counters/histograms behind /metrics."""
+
+import sqlite3
+import threading
+
+import pytest
+
+from job_finder import metrics
+from job_finder.metrics import Counter, Histogram, render_gauge, render_metrics, timed
+from job_finder.storage.sqlite_client import sqlite_connection, statement_family
+
+
+@pytest.fixture(autouse=True)
+def _isolated_registry(monkeypatch):
+    monkeypatch.setattr(metrics, "_registry", {})
+    yield
+
+
+def test_counter_merges_stripes_across_threads():
+    counter = Counter("test_events_total", "Events.", ("kind",))
+
+    def work():
+        for _ in range(1000):
+            counter.inc(kind="a")
+
+    threads = [threading.Thread(target=work) for _ in range(8)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert counter.value(kind="a") == 8000
+    assert counter.value(kind="b") == 0
+
+
+def test_histogram_buckets_are_cumulative():
+    histogram = Histogram("test_seconds", "Latency.", ("stage",), buckets=(0.1, 1))
+    for value in (0.05, 0.1, 0.5, 2):
+        histogram.observe(value, stage="x")
+
+    assert histogram.snapshot(stage="x") == (4, pytest.approx(2.65))
+    lines = histogram.render()
+    assert 'test_seconds_bucket{stage="x",le="0.1"} 2' in lines
+    assert 'test_seconds_bucket{stage="x",le="1"} 3' in lines
+    assert 'test_seconds_bucket{stage="x",le="+Inf"} 4' in lines
+    assert 'test_seconds_count{stage="x"} 4' in lines
+
+
+def test_timed_records_when_function_raises():
+    histogram = Histogram("test_stage_seconds", "Stage.", ("stage",))
+
+    @timed(histogram, stage="boom")
+    def fail():
+        raise RuntimeError("x")
+
+    with pytest.raises(RuntimeError):
+        fail()
+    assert histogram.snapshot(stage="boom")[0] == 1
+
+
+def test_render_metrics_text_format():
+    Counter("test_items_total", "Items.", ("type",)).inc(3, type='a"b')
+    gauge = render_gauge("test_depth", "Depth.", ("status",), [({"status": "pending"}, 5)])
+    text = render_metrics([gauge])
+
+    assert "# TYPE test_items_total counter" in text
+    assert 'test_items_total{type="a\\"b"} 3' in text
+    assert "# TYPE test_depth gauge" in text
+    assert 'test_depth{status="pending"} 5' in text
+
+
+def test_duplicate_metric_name_rejected():
+    Counter("test_dup_total", "Dup.")
+    with pytest.raises(ValueError):
+        Counter("test_dup_total", "Dup.")
+
+
+@pytest.mark.parametrize(
+    "sql,family",
+    [
+        ("SELECT * FROM job_queue WHERE id = ?", "select job_queue"),
+        ("\n  UPDATE job_matches SET status = ?", "update job_matches"),
+        ("INSERT OR REPLACE INTO seen_urls (url) VALUES (?)", "insert seen_urls"),
+        ("DELETE FROM job_listings WHERE id IN (?, ?)", "delete job_listings"),
+        ("CREATE TABLE IF NOT EXISTS rescore_runs (id TEXT)", "create rescore_runs"),
+        ("PRAGMA foreign_keys = ON;", "pragma"),
+        ("SELECT 1", "select"),
+    ],
+)
+def test_statement_family(sql, family):
+    assert statement_family(sql) == family
+
+
+def test_sqlite_connection_records_statement_latency(tmp_path, monkeypatch):
+    histogram = Histogram("test_sqlite_seconds", "SQLite.", ("family",))
+    monkeypatch.setattr("job_finder.storage.sqlite_client.SQLITE_QUERY_SECONDS", histogram)
+    db_path = tmp_path / "metrics.db"
+    sqlite3.connect(db_path).close()
+
+    with sqlite_connection(str(db_path)) as conn:
+        conn.execute("CREATE TABLE t (id INTEGER)")
+        conn.executemany("INSERT INTO t VALUES (?)", [(1,), (2,)])
+        cursor = conn.cursor()
+        cursor.execute("SELECT id FROM t")
+        assert [row["id"] for row in cursor.fetchall()] == [1, 2]
+
+    assert histogram.snapshot(family="insert t")[0] == 1
+    assert histogram.snapshot(family="select t")[0] == 1
+    assert histogram.snapshot(family="pragma")[0] == 2
@@ -0,0 +1,170 @@
+"""Tests for the score upper-bound pruning backtest."""
+
+import json
+import sqlite3
+from unittest.mock import MagicMock
+
+import pytest
+
+from job_finder.prune_backtest import backtest_records, iter_listings
+from job_finder.rescore_matches import RescoreContext
+from job_finder.scoring.engine import ScoringEngine
+from job_finder.scoring.taxonomy import SkillTaxonomyRepository
+
+_POLICY = {
+    "minScore": 60,
+    "seniority": {
+        "preferred": ["senior", "staff"],
+        "acceptable": ["mid"],
+        "rejected": ["junior"],
+        "preferredScore": 15,
+        "acceptableScore": 0,
+        "rejectedScore": -100,
+    },
+    "location": {
+        "allowRemote": True,
+        "allowHybrid": True,
+        "allowOnsite": False,
+        "userTimezone": -8,
+        "maxTimezoneDiffHours": 4,
+        "perHourScore": -3,
+        "hybridSameCityScore": 10,
+        "remoteScore": 5,
+        "relocationScore": -50,
+        "unknownTimezoneScore": -5,
+        "relocationAllowed": False,
+    },
+    "skillMatch": {
+        "baseMatchScore": 1,
+        "yearsMultiplier": 0.5,
+        "maxYearsBonus": 5,
+        "missingScore": -1,
+        "missingIgnore": [],
+        "analogScore": 0,
+        "maxBonus": 25,
+        "maxPenalty": -15,
+    },
+    "salary": {
+        "minimum": 150000,
+        "target": 200000,
+        "belowTargetScore": -2,
+        "belowTargetMaxPenalty": -20,
+        "missingSalaryScore": 0,
+        "meetsTargetScore": 5,
+        "equityScore": 5,
+        "contractScore": -15,
+    },
+    "freshness": {
+        "freshDays": 2,
+        "freshScore": 10,
+        "staleDays": 3,
+        "staleScore": -10,
+        "veryStaleDays": 12,
+        "veryStaleScore": -20,
+        "repostScore": -5,
+    },
+    "roleFit": {
+        "preferred": ["backend"],
+        "acceptable": ["fullstack"],
+        "penalized": ["frontend"],
+        "rejected": ["management"],
+        "preferredScore": 5,
+        "penalizedScore": -5,
+    },
+    "company": {
+        "preferredCityScore": 0,
+        "preferredCity": "",
+        "remoteFirstScore": 0,
+        "aiMlFocusScore": 0,
+        "largeCompanyScore": 0,
+        "smallCompanyScore": 0,
+        "largeCompanyThreshold": 10000,
+        "smallCompanyThreshold": 100,
+        "startupScore": 0,
+    },
+}
+
+_LISTINGS = [
+    # (id, title, description, location, salary_range, stored extraction, matched)
+    (
+        "l-match",
+        "Senior Backend Engineer",
+        "Build Python services. The base salary range is $210,000 - $240,000.",
+        "Remote - US",
+        None,
+        {"seniority": "senior", "workArrangement": "remote", "technologies": ["python"]},
+        True,
+    ),
+    (
+        "l-junior",
+        "Junior Developer",
+        "Learn to build web apps with a friendly team.",
+        "Remote",
+        None,
+        {"seniority": "junior", "workArrangement": "remote"},
+        False,
+    ),
+    (
+        "l-lowpay",
+        "Software Engineer II",
+        "Hybrid role. Salary: $145,000 - $150,000.",
+        "Denver, CO (Hybrid)",
+        "$145,000 - $150,000",
+        {"seniority": "mid", "workArrangement": "hybrid", "timezone": -7},
+        False,
+    ),
+    ("l-failed", "Engineer", "Extraction failed for this one.", None, None, None, False),
+]
+
+
+@pytest.fixture
+def db_path(tmp_path):
+    path = tmp_path / "backtest.db"
+    with sqlite3.connect(path) as conn:
+        conn.executescript("""
+            CREATE TABLE job_listings (
+              id TEXT PRIMARY KEY, title TEXT, description TEXT, location TEXT,
+              salary_range TEXT, filter_result TEXT, company_id TEXT
+            );
+            CREATE TABLE job_matches (id TEXT PRIMARY KEY, job_listing_id TEXT);
+            """)
+        for listing_id, title, desc, location, salary, extraction, matched in _LISTINGS:
+            filter_result = json.dumps({"extraction": extraction} if extraction else {"error": "x"})
+            conn.execute(
+                "INSERT INTO job_listings VALUES (?, ?, ?, ?, ?, ?, NULL)",
+                (listing_id, title, desc, location, salary, filter_result),
+            )
+            if matched:
+                conn.execute(
+                    "INSERT INTO job_matches VALUES (?, ?)", (f"m-{listing_id}", listing_id)
+                )
+    return str(path)
+
+
+def _context(db_path):
+    engine = ScoringEngine(
+        _POLICY,
+        skill_years={"python": 6},
+        taxonomy_repo=SkillTaxonomyRepository(db_path),
+    )
+    return RescoreContext(
+        engine=engine, min_score=60, title_filter=None, companies_manager=MagicMock()
+    )
+
+
+def test_backtest_prunes_hopeless_listings_without_false_prunes(db_path):
+    counts = {}
+    results = {
+        r["listing_id"]: r
+        for r in backtest_records(_context(db_path), iter_listings(db_path, None, 2), counts)
+    }
+
+    assert set(results) == {"l-match", "l-junior", "l-lowpay"}
+    assert results["l-junior"]["pruned"] and results["l-junior"]["bound"] == 0
+    assert results["l-lowpay"]["pruned"]
+    assert not results["l-match"]["pruned"]
+    assert results["l-match"]["score"] >= 60
+    assert counts["pruned"] == 2
+    assert counts["false_prunes"] == 0
+    assert counts["violations"] == 0
+    assert counts["pruned_matches"] == 0
@@ -0,0 +1,137 @@
+"""Tests for the rescore_matches maintenance command."""
+
+import json
+import sqlite3
+from types import SimpleNamespace
+from unittest.mock import MagicMock
+
+import pytest
+
+from job_finder import rescore_matches
+from job_finder.rescore_matches import (
+    RescoreContext,
+    apply_changes,
+    iter_candidates,
+    iter_parallel_diffs,
+    plan_shards,
+    rescore_records,
+)
+
+
+class _FakeEngine:
+    """Scores a listing by the number at the end of its title."""
+
+    def score(self, extraction, title, description, company_data=None):
+        score = int(title.rsplit(" ", 1)[-1])
+        if company_data:
+            score += company_data["bonus"]
+        return SimpleNamespace(
+            final_score=score, static_score=score, to_dict=lambda: {"final": score}
+        )
+
+
+def _context():
+    companies = MagicMock()
+    companies.batch_get_companies.side_effect = lambda ids: {
+        cid: {"id": cid, "bonus": 5} for cid in ids if cid == "co-bonus"
+    }
+    return RescoreContext(
+        engine=_FakeEngine(), min_score=50, title_filter=None, companies_manager=companies
+    )
+
+
+@pytest.fixture
+def db_path(tmp_path):
+    path = tmp_path / "rescore.db"
+    with sqlite3.connect(path) as conn:
+        conn.executescript("""
+            CREATE TABLE job_listings (
+              id TEXT PRIMARY KEY, title TEXT, description TEXT, filter_result TEXT,
+              company_id TEXT, match_score INTEGER, updated_at TEXT
+            );
+            CREATE TABLE job_matches (
+              id TEXT PRIMARY KEY, job_listing_id TEXT, status TEXT, match_score INTEGER,
+              static_score INTEGER, is_ghost INTEGER DEFAULT 0, analyzed_at TEXT,
+              updated_at TEXT, status_note TEXT, status_updated_by TEXT, ignored_at TEXT
+            );
+            CREATE TABLE application_status_history (
+              id TEXT PRIMARY KEY, job_match_id TEXT, from_status TEXT, to_status TEXT,
+              changed_by TEXT, application_email_id TEXT, note TEXT, created_at TEXT
+            );
+            """)
+        extraction = json.dumps({"extraction": {"seniority": "senior"}})
+        for i in range(60):
+            filter_result = extraction if i % 7 else "{}"
+            company_id = "co-bonus" if i % 5 == 0 else None
+            conn.execute(
+                "INSERT INTO job_listings VALUES (?, ?, '', ?, ?, ?, '')",
+                (f"l-{i}", f"Engineer {40 + i % 30}", filter_result, company_id, 60),
+            )
+            conn.execute(
+                "INSERT INTO job_matches (id, job_listing_id, status, match_score, static_score,"
+                " analyzed_at) VALUES (?, ?, ?, 60, 60, ?)",
+                (f"m-{i:02d}", f"l-{i}", "ignored" if i % 4 == 0 else "active", f"2024-01-{i:02d}"),
+            )
+    return str(path)
+
+
+def _serial(db_path):
+    counts = {}
+    records = iter_candidates(db_path, {"active", "ignored"}, None, batch_size=8)
+    diffs = list(rescore_records(_context(), records, counts, prefetch_size=8))
+    return counts, diffs
+
+
+def test_rescore_records_prefetches_companies_in_bulk(db_path):
+    context = _context()
+    counts = {}
+    records = iter_candidates(db_path, {"active", "ignored"}, None, batch_size=100)
+    diffs = list(rescore_records(context, records, counts, prefetch_size=100))
+
+    context.companies_manager.batch_get_companies.assert_called_once()
+    context.companies_manager.get_company_by_id.assert_not_called()
+    assert counts == {"seen": 60, "skipped_no_extraction": 9}
+    bonus = next(d for d in diffs if d["listing_id"] == "l-5")
+    assert bonus["new_match_score"] == 40 + 5 + 5
+
+
+def test_plan_shards_cover_rowid_span(db_path):
+    shards = plan_shards(db_path, {"active", "ignored"}, 7)
+    assert shards[0][0] == 1
+    assert shards[-1][1] == 60
+    assert all(a[1] + 1 == b[0] for a, b in zip(shards, shards[1:]))
+
+
+def test_parallel_matches_serial(db_path, monkeypatch):
+    monkeypatch.setattr(rescore_matches, "load_context", lambda _db: _context())
+    serial_counts, serial = _serial(db_path)
+    parallel_counts = {}
+    parallel = list(iter_parallel_diffs(db_path, {"active", "ignored"}, 2, 8, parallel_counts))
+
+    for diff in serial:
+        diff.pop("breakdown")
+    assert parallel_counts == serial_counts
+    assert sorted(parallel, key=lambda d: d["match_id"]) == sorted(
+        serial, key=lambda d: d["match_id"]
+    )
+
+
+def test_apply_changes_bulk_writes(db_path):
+    _, diffs = _serial(db_path)
+    apply_changes(db_path, diffs)
+
+    flips = [d for d in diffs if d["next_status"] != d["status"]]
+    assert flips
+    with sqlite3.connect(db_path) as conn:
+        conn.row_factory = sqlite3.Row
+        row = conn.execute("SELECT * FROM job_matches WHERE id = ?", (flips[0]["match_id"],))
+        row = row.fetchone()
+        assert row["status"] == "ignored"
+        assert row["status_updated_by"] == "reconciliation-script"
+        assert row["match_score"] == flips[0]["new_match_score"]
+        history = conn.execute("SELECT COUNT(*) FROM application_status_history").fetchone()[0]
+        assert history == len(flips)
+        listing = conn.execute(
+            "SELECT match_score FROM job_listings WHERE id = ?", (diffs[0]["listing_id"],)
+        ).fetchone()
+        assert listing["match_score"] == diffs[0]["new_match_score"]
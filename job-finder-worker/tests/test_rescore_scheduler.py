@@ -0,0 +1,199 @@
+"""Tests for background rescoring after scoring-config changes."""
+
+import json
+import sqlite3
+from itertools import count
+from types import SimpleNamespace
+from unittest.mock import MagicMock
+
+import pytest
+
+from job_finder import rescore_scheduler
+from job_finder.rescore_matches import RescoreContext
+from job_finder.rescore_scheduler import RescoreScheduler
+
+
+class _TitleScoreEngine:
+    """Scores a listing by the number at the end of its title, minus a penalty."""
+
+    penalty = 0
+
+    def score(self, extraction, title, description, company_data=None):
+        score = int(title.rsplit(" ", 1)[-1]) - self.penalty
+        return SimpleNamespace(final_score=score, static_score=score, to_dict=lambda: {})
+
+
+@pytest.fixture
+def engine(monkeypatch):
+    engine = _TitleScoreEngine()
+    monkeypatch.setattr(
+        rescore_scheduler,
+        "load_context",
+        lambda _db: RescoreContext(
+            engine=engine, min_score=50, title_filter=None, companies_manager=MagicMock()
+        ),
+    )
+    return engine
+
+
+@pytest.fixture
+def db_path(tmp_path):
+    path = tmp_path / "rescore.db"
+    with sqlite3.connect(path) as conn:
+        conn.executescript("""
+            CREATE TABLE job_finder_config (id TEXT PRIMARY KEY, payload_json TEXT NOT NULL);
+            CREATE TABLE content_items (id TEXT PRIMARY KEY, updated_at TEXT NOT NULL);
+            CREATE TABLE job_listings (
+              id TEXT PRIMARY KEY, title TEXT, description TEXT, filter_result TEXT,
+              company_id TEXT, match_score INTEGER, updated_at TEXT
+            );
+            CREATE TABLE job_matches (
+              id TEXT PRIMARY KEY, job_listing_id TEXT, status TEXT, match_score INTEGER,
+              static_score INTEGER, is_ghost INTEGER DEFAULT 0, analyzed_at TEXT,
+              updated_at TEXT, status_note TEXT, status_updated_by TEXT, ignored_at TEXT
+            );
+            CREATE TABLE application_status_history (
+              id TEXT PRIMARY KEY, job_match_id TEXT, from_status TEXT, to_status TEXT,
+              changed_by TEXT, application_email_id TEXT, note TEXT, created_at TEXT
+            );
+            INSERT INTO job_finder_config VALUES ('match-policy', '{"minScore": 50}');
+            INSERT INTO content_items VALUES ('c-1', '2024-01-01');
+            """)
+        extraction = json.dumps({"extraction": {"seniority": "senior"}})
+        for i in range(40):
+            score = 45 + i % 20
+            conn.execute(
+                "INSERT INTO job_listings VALUES (?, ?, '', ?, NULL, ?, '')",
+                (f"l-{i}", f"Engineer {score}", extraction, score),
+            )
+            conn.execute(
+                "INSERT INTO job_matches (id, job_listing_id, status, match_score, static_score,"
+                " analyzed_at) VALUES (?, ?, 'active', ?, ?, '2024-01-01')",
+                (f"m-{i:02d}", f"l-{i}", score, score),
+            )
+    return str(path)
+
+
+def _scheduler(db_path, slice_seconds=100.0):
+    ticks = count()
+    return RescoreScheduler(
+        db_path, slice_seconds=slice_seconds, window_rows=10, clock=lambda: next(ticks)
+    )
+
+
+def _set_policy(db_path, payload):
+    with sqlite3.connect(db_path) as conn:
+        conn.execute(
+            "UPDATE job_finder_config SET payload_json = ? WHERE id = 'match-policy'",
+            (json.dumps(payload),),
+        )
+
+
+def _scores(db_path):
+    with sqlite3.connect(db_path) as conn:
+        return dict(conn.execute("SELECT id, match_score FROM job_matches").fetchall())
+
+
+def test_first_run_records_baseline_without_rescoring(db_path, engine):
+    engine.penalty = 10
+    before = _scores(db_path)
+    status = _scheduler(db_path).run_idle_slice()
+    assert status["state"] == "completed"
+    assert status["total"] == 0
+    assert _scores(db_path) == before
+
+
+def test_config_change_rescores_all_matches(db_path, engine):
+    scheduler = _scheduler(db_path)
+    scheduler.run_idle_slice()
+
+    engine.penalty = 10
+    _set_policy(db_path, {"minScore": 50, "skills": {"weight": 2}})
+    status = scheduler.run_idle_slice()
+
+    assert status["state"] == "completed"
+    assert status["changed_inputs"] == ["match-policy"]
+    assert status["processed"] == status["total"] == 40
+    assert status["updated"] == 40
+    assert status["flipped"] > 0
+    assert all(score < 55 for score in _scores(db_path).values())
+
+
+def test_rescore_is_throttled_and_resumes_after_restart(db_path, engine):
+    _scheduler(db_path).run_idle_slice()
+    engine.penalty = 10
+    _set_policy(db_path, {"minScore": 60})
+
+    # Clock advances one tick per check: two windows of 10 rows per slice
+    status = _scheduler(db_path, slice_seconds=2.5).run_idle_slice()
+    assert status["state"] == "running"
+    assert status["processed"] == 20
+    assert 0 < status["progress"] < 1
+
+    # A fresh scheduler (worker restart) continues from the checkpoint
+    status = _scheduler(db_path).run_idle_slice()
+    assert status["state"] == "completed"
+    assert status["processed"] == 40
+
+
+def test_slice_stops_between_windows_when_work_is_pending(db_path, engine):
+    _scheduler(db_path).run_idle_slice()
+    engine.penalty = 10
+    _set_policy(db_path, {"minScore": 60})
+
+    checks = count()
+    status = _scheduler(db_path).run_idle_slice(should_stop=lambda: next(checks) >= 1)
+    assert status["state"] == "running"
+    assert status["processed"] == 10
+
+    status = _scheduler(db_path).run_idle_slice(should_stop=lambda: True)
+    assert status["processed"] == 10
+
+
+def test_config_change_mid_run_supersedes(db_path, engine):
+    _scheduler(db_path).run_idle_slice()
+    _set_policy(db_path, {"minScore": 60})
+    first = _scheduler(db_path, slice_seconds=1.5).run_idle_slice()
+    assert first["state"] == "running"
+
+    with sqlite3.connect(db_path) as conn:
+        conn.execute("UPDATE content_items SET updated_at = '2024-02-01'")
+    second = _scheduler(db_path).run_idle_slice()
+
+    assert second["run_id"] != first["run_id"]
+    assert second["changed_inputs"] == ["content_items"]
+    assert second["processed"] == 40
+    with sqlite3.connect(db_path) as conn:
+        state = conn.execute(
+            "SELECT status FROM rescore_runs WHERE id = ?", (first["run_id"],)
+        ).fetchone()[0]
+    assert state == "superseded"
+
+
+def test_unchanged_config_is_idle(db_path, engine):
+    scheduler = _scheduler(db_path)
+    scheduler.run_idle_slice()
+    engine.penalty = 10
+    before = _scores(db_path)
+    assert scheduler.run_idle_slice()["state"] == "completed"
+    assert _scores(db_path) == before
+
+
+def test_learned_taxonomy_terms_do_not_invalidate_version(db_path):
+    from job_finder.scoring.taxonomy import SkillTaxonomyRepository
+
+    repo = SkillTaxonomyRepository(db_path)
+
+    def version():
+        with sqlite3.connect(db_path) as conn:
+            return rescore_scheduler.scoring_input_versions(conn)
+
+    before = version()
+    # What the scoring stage does for unknown terms: new rows and new
+    # synonyms for a curated canonical
+    repo.learn(canonical="bazel", synonyms_csv="bazel", category="tooling")
+    repo.learn(canonical="react", synonyms_csv="react,react.js,reactjs,react js")
+    assert version() == before
+
+    repo.upsert(canonical="bazel", synonyms_csv="bazel", parallels_csv="buck")
+    assert version()["skill_taxonomy"] != before["skill_taxonomy"]
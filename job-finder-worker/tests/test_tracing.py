@@ -0,0 +1,107 @@
+"""Tests for per-queue-item span tracing."""
+
+import sqlite3
+import threading
+
+import pytest
+
+from job_finder import tracing
+from job_finder.storage.sqlite_client import sqlite_connection
+from job_finder.storage.trace_storage import TraceStorage
+from job_finder.tracing import Tracer, is_sampled, record, render_trace_text, span, traced
+
+
+@pytest.fixture
+def db_path(tmp_path):
+    path = tmp_path / "traces.db"
+    sqlite3.connect(path).close()
+    return str(path)
+
+
+def _names(node):
+    return [node["name"]] + [n for child in node.get("children", []) for n in _names(child)]
+
+
+def test_spans_are_noops_outside_a_trace():
+    with span("orphan") as current:
+        assert current is None
+    record("sqlite", "select x", 0.1)
+    assert tracing.current_span() is None
+
+
+def test_trace_item_builds_span_tree_and_stores_it(db_path):
+    storage = TraceStorage(db_path)
+    tracer = Tracer(storage, sample_rate=1.0)
+
+    @traced("stage:scoring")
+    def score():
+        with span("llm", model="m") as llm:
+            llm.set(prompt_tokens=12)
+        with sqlite_connection(db_path) as conn:
+            conn.execute("SELECT 1")
+
+    with tracer.trace_item("item-1", "job") as root:
+        assert root is not None
+        score()
+        with pytest.raises(ValueError):
+            with span("emit_event", event="job:saved"):
+                raise ValueError("boom")
+
+    [stored] = storage.get_traces("item-1")
+    trace = stored["trace"]
+    assert stored["item_type"] == "job"
+    assert _names(trace) == ["item:job", "stage:scoring", "llm", "emit_event"]
+    stage = trace["children"][0]
+    assert stage["children"][0]["attrs"] == {"model": "m", "prompt_tokens": 12}
+    assert stage["totals"]["sqlite:select"]["count"] == 1
+    assert trace["children"][1]["error"] == "ValueError: boom"
+    assert trace["span_count"] == 4
+
+    text = render_trace_text(trace)
+    assert text.splitlines()[0].startswith("item:job ")
+    assert "    llm " in text
+    assert "[sqlite:pragma]" in text
+
+
+def test_unsampled_items_store_nothing(db_path):
+    storage = TraceStorage(db_path)
+    with Tracer(storage, sample_rate=0.0).trace_item("item-2", "job") as root:
+        assert root is None
+        with span("llm") as child:
+            assert child is None
+    assert storage.get_traces("item-2") == []
+
+
+def test_sampling_is_deterministic_per_item():
+    ids = [f"item-{i}" for i in range(2000)]
+    sampled = [i for i in ids if is_sampled(i, 0.25)]
+    assert 400 < len(sampled) < 600
+    assert sampled == [i for i in ids if is_sampled(i, 0.25)]
+
+
+def test_span_cap_counts_dropped(monkeypatch):
+    monkeypatch.setattr(tracing, "MAX_SPANS", 3)
+    finished = {}
+    tracer = Tracer(sample_rate=1.0)
+    monkeypatch.setattr(
+        tracer, "_finish", lambda item_id, item_type, started, root: finished.update(root=root)
+    )
+    with tracer.trace_item("item-3", "scrape"):
+        for _ in range(5):
+            with span("http"):
+                pass
+    root = finished["root"]
+    assert len(root.children) == 2
+    assert root._trace.dropped == 3
+
+
+def test_spans_do_not_leak_across_threads(db_path):
+    tracer = Tracer(TraceStorage(db_path), sample_rate=1.0)
+    seen = []
+
+    with tracer.trace_item("item-4", "job"):
+        thread = threading.Thread(target=lambda: seen.append(tracing.current_span()))
+        thread.start()
+        thread.join()
+
+    assert seen == [None]
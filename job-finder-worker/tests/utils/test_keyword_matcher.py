@@ -0,0 +1,62 @@
+"""Tests for the combined multi-keyword matcher."""
+
+import random
+import re
+
+from job_finder.utils.keyword_matcher import KeywordMatcher, get_keyword_matcher
+
+
+def _first_by_loop(keywords, text):
+    """Reference behaviour: one \\bkw\\b regex per keyword, in list order."""
+    for kw in keywords:
+        if re.search(rf"\b{re.escape(kw)}\b", text, re.IGNORECASE):
+            return kw
+    return None
+
+
+class TestKeywordMatcher:
+    def test_word_boundaries(self):
+        matcher = KeywordMatcher(["llm", "ai"])
+        assert not matcher.contains_any("small domain")
+        assert matcher.contains_any("Building LLM agents")
+        assert matcher.first("maintain the ai stack") == "ai"
+
+    def test_first_reports_earliest_listed_keyword(self):
+        """Rejection reasons name the first configured keyword, not the leftmost hit."""
+        matcher = KeywordMatcher(["manager", "senior manager", "senior"])
+        assert matcher.first("senior manager, platform") == "manager"
+        assert KeywordMatcher(["senior", "manager"]).first("manager (senior)") == "senior"
+
+    def test_shared_prefixes(self):
+        matcher = KeywordMatcher(["data", "data engineer", "devops"])
+        assert matcher.first("data engineer") == "data"
+        assert matcher.contains_any("DevOps lead")
+        assert not matcher.contains_any("database admin")
+
+    def test_substring_mode(self):
+        matcher = KeywordMatcher(["$", "usd ", "per year"], word_boundary=False)
+        assert matcher.contains_any("pays $120k")
+        assert matcher.contains_any("100k usd base")
+        assert not matcher.contains_any("usda grant")
+
+    def test_empty(self):
+        matcher = KeywordMatcher(["", "  "])
+        assert not matcher
+        assert not matcher.contains_any("anything")
+        assert matcher.first("anything") is None
+
+    def test_shared_instance_per_keyword_tuple(self):
+        assert get_keyword_matcher(("a", "b")) is get_keyword_matcher(("a", "b"))
+
+    def test_matches_per_keyword_regex_loop(self):
+        """Randomized equivalence with the per-keyword loop, incl. non-word edges."""
+        rng = random.Random(7)
+        vocab = ["sr", "senior", "c++", ".net", "node.js", "ml", "mlops", "lead", "ai", "a"]
+        vocab += ["engineer", "manager", "data", "data engineer", "sales", "vp of sales"]
+        for _ in range(300):
+            keywords = rng.sample(vocab, rng.randint(1, len(vocab)))
+            text = " ".join(rng.choice(vocab + ["x", "-", "/", "(", ")"]) for _ in range(6))
+            matcher = KeywordMatcher(keywords)
+            expected = _first_by_loop(keywords, text)
+            assert matcher.first(text) == expected, (keywords, text)
+            assert matcher.contains_any(text) == (expected is not None)
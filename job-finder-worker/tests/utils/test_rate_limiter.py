@@ -0,0 +1,111 @@
+"""Tests for the per-host token-bucket rate limiter."""
+
+import threading
+from datetime import datetime, timedelta, timezone
+from email.utils import format_datetime
+
+import pytest
+
+from job_finder.utils.rate_limiter import RateLimiter, parse_retry_after
+
+
+class FakeClock:
+    """Monotonic clock whose sleep just advances time."""
+
+    def __init__(self):
+        self.now = 1000.0
+        self.sleeps = []
+
+    def __call__(self):
+        return self.now
+
+    def sleep(self, seconds):
+        self.sleeps.append(round(seconds, 6))
+        self.now += seconds
+
+
+@pytest.fixture
+def clock():
+    return FakeClock()
+
+
+@pytest.fixture
+def limiter(clock):
+    return RateLimiter(rate=1.0, burst=3, clock=clock, sleep=clock.sleep)
+
+
+def test_burst_then_paced_at_rate(limiter, clock):
+    waits = [limiter.acquire("a.example", rate=2.0, burst=3) for _ in range(5)]
+    assert waits == [0.0, 0.0, 0.0, 0.5, 0.5]
+    assert clock.now == pytest.approx(1001.0)
+
+
+def test_idle_time_refills_up_to_burst(limiter, clock):
+    for _ in range(3):
+        limiter.acquire("a.example")
+    clock.now += 60
+    waits = [limiter.acquire("a.example") for _ in range(4)]
+    assert waits == [0.0, 0.0, 0.0, 1.0]
+
+
+def test_hosts_do_not_pace_each_other(limiter):
+    for _ in range(3):
+        limiter.acquire("slow.example", rate=0.1, burst=3)
+    assert limiter.reserve("slow.example", rate=0.1, burst=3) == pytest.approx(10.0)
+    assert limiter.acquire("fast.example", rate=0.1, burst=3) == 0.0
+
+
+def test_zero_rate_disables_limiting(limiter, clock):
+    assert [limiter.acquire("x", rate=0) for _ in range(10)] == [0.0] * 10
+    assert clock.sleeps == []
+
+
+def test_concurrent_reservations_queue_in_order(clock):
+    limiter = RateLimiter(rate=4.0, burst=1, clock=clock, sleep=clock.sleep)
+    waits = []
+    lock = threading.Lock()
+
+    def reserve():
+        wait = limiter.reserve("a.example")
+        with lock:
+            waits.append(wait)
+
+    threads = [threading.Thread(target=reserve) for _ in range(8)]
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+    assert sorted(waits) == [0.0, 0.25, 0.5, 0.75, 1.0, 1.25, 1.5, 1.75]
+
+
+def test_429_with_retry_after_blocks_and_slows_host(limiter, clock):
+    limiter.acquire("a.example", rate=2.0, burst=2)
+    limiter.record_response("a.example", 429, "30")
+    # First request after the block waits it out; later ones come at half rate
+    assert limiter.acquire("a.example", rate=2.0, burst=2) == pytest.approx(30.0)
+    assert limiter.acquire("a.example", rate=2.0, burst=2) == pytest.approx(1.0)
+    assert limiter.acquire("other.example", rate=2.0, burst=2) == 0.0
+
+    # Successes restore the configured rate step by step
+    for _ in range(10):
+        limiter.record_response("a.example", 200)
+    clock.now += 100
+    waits = [limiter.acquire("a.example", rate=2.0, burst=2) for _ in range(3)]
+    assert waits == [0.0, 0.0, 0.5]
+
+
+def test_429_without_retry_after_backs_off_exponentially(limiter):
+    limiter.acquire("a.example")
+    limiter.record_response("a.example", 429)
+    assert limiter.acquire("a.example") == pytest.approx(2.0)
+    limiter.record_response("a.example", 429)
+    assert limiter.acquire("a.example") == pytest.approx(4.0)
+
+
+def test_parse_retry_after():
+    now = datetime(2025, 1, 1, 12, 0, tzinfo=timezone.utc)
+    assert parse_retry_after("120") == 120.0
+    assert parse_retry_after(5) == 5.0
+    assert parse_retry_after(format_datetime(now + timedelta(seconds=45), usegmt=True), now) == 45.0
+    assert parse_retry_after("soon") is None
+    assert parse_retry_after(None) is None
@@ -0,0 +1,69 @@
+"""Tests for the offline location -> timezone gazetteer."""
+
+import pytest
+
+from job_finder.utils.timezone_gazetteer import lookup_timezone, normalize_location
+
+
+class TestNormalizeLocation:
+    def test_strips_accents_punctuation_and_postcodes(self):
+        assert normalize_location("São Paulo") == "sao paulo"
+        assert normalize_location("St. Louis 63101") == "st louis"
+        assert normalize_location("Saint-Étienne") == "st etienne"
+
+
+class TestLookupTimezone:
+    @pytest.mark.parametrize(
+        "location,expected",
+        [
+            ("Portland, OR", "America/Los_Angeles"),
+            ("Portland, ME", "America/New_York"),
+            ("Austin TX", "America/Chicago"),
+            ("New York, NY 10001", "America/New_York"),
+            ("Toronto, ON, Canada", "America/Toronto"),
+            ("London, ON", "America/Toronto"),
+            ("London", "Europe/London"),
+            ("Perth, WA", "Australia/Perth"),
+            ("Seattle, WA", "America/Los_Angeles"),
+            ("Greater Seattle Area", "America/Los_Angeles"),
+            ("San Francisco Bay Area", "America/Los_Angeles"),
+            ("Bengaluru, Karnataka, India", "Asia/Kolkata"),
+            ("Kraków", "Europe/Warsaw"),
+            ("Berlin (Hybrid)", "Europe/Berlin"),
+            ("Tbilisi, Georgia", "Asia/Tbilisi"),
+        ],
+    )
+    def test_city_forms(self, location, expected):
+        match = lookup_timezone(location)
+        assert match is not None
+        assert match.timezone_name == expected
+        assert match.level == "city"
+
+    def test_unknown_city_falls_back_to_region(self):
+        """A city missing from the table still resolves via its state/country."""
+        match = lookup_timezone("Smallville, Kansas")
+        assert match.timezone_name == "America/Chicago"
+        assert match.level == "region"
+        assert lookup_timezone("Paris, TX").timezone_name == "America/Chicago"
+
+    def test_country(self):
+        match = lookup_timezone("Poland")
+        assert match.timezone_name == "Europe/Warsaw"
+        assert match.level == "country"
+
+    @pytest.mark.parametrize("location", ["Canada", "USA", "Australia"])
+    def test_multi_zone_country_is_ambiguous(self, location):
+        match = lookup_timezone(location)
+        assert match is not None
+        assert match.timezone_name is None
+
+    def test_first_resolvable_alternative_wins(self):
+        assert lookup_timezone("Canada / Berlin").timezone_name == "Europe/Berlin"
+        assert lookup_timezone("Canada or Berlin").timezone_name == "Europe/Berlin"
+
+    def test_oregon_abbreviation_is_not_an_alternative(self):
+        assert lookup_timezone("Lakeside, OR").timezone_name == "America/Los_Angeles"
+
+    @pytest.mark.parametrize("location", ["Nonexistent City, Nowhere", "", "Remote"])
+    def test_unknown(self, location):
+        assert lookup_timezone(location) is None
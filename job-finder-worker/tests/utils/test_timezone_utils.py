@@ -2,8 +2,12 @@
 
 from unittest.mock import MagicMock, patch
 
+import pytest
+
+from job_finder.utils import timezone_utils
 from job_finder.utils.timezone_utils import (
     TimezoneResult,
+    configure_persistent_cache,
     get_timezone_for_city,
     get_timezone_diff_hours,
     clear_cache,
@@ -56,8 +60,8 @@ class TestGetTimezoneForCity:
         mock_tf.timezone_at.return_value = "America/Los_Angeles"
         mock_get_tf.return_value = mock_tf
 
-        result = get_timezone_for_city("Portland, OR")
-        assert result.city == "Portland, OR"
+        result = get_timezone_for_city("Hood River")
+        assert result.city == "Hood River"
         assert result.timezone_name == "America/Los_Angeles"
         assert result.utc_offset_hours is not None  # Will be -8 or -7 depending on DST
         assert result.error is None
@@ -104,9 +108,9 @@ class TestGetTimezoneForCity:
         mock_get_tf.return_value = mock_tf
 
         # First call
-        result1 = get_timezone_for_city("Portland, OR")
+        result1 = get_timezone_for_city("Hood River")
         # Second call (should be cached)
-        result2 = get_timezone_for_city("Portland, OR")
+        result2 = get_timezone_for_city("Hood River")
 
         assert result1 == result2
         # Geocoder should only be called once due to caching
@@ -215,12 +219,109 @@ class TestClearCache:
         mock_get_tf.return_value = mock_tf
 
         # First call
-        get_timezone_for_city("Portland, OR")
+        get_timezone_for_city("Hood River")
         assert mock_geolocator.geocode.call_count == 1
 
         # Clear cache
         clear_cache()
 
         # Call again - should hit geocoder again
-        get_timezone_for_city("Portland, OR")
+        get_timezone_for_city("Hood River")
+        assert mock_geolocator.geocode.call_count == 2
+
+
+class TestOfflineResolution:
+    """Gazetteer-first resolution and the optional geocoder fallback."""
+
+    def setup_method(self):
+        clear_cache()
+
+    @patch("job_finder.utils.timezone_utils._get_geolocator")
+    def test_known_locations_skip_geocoder(self, mock_get_geolocator):
+        """Gazetteer hits never touch the network."""
+        assert get_timezone_for_city("Portland, OR").timezone_name == "America/Los_Angeles"
+        assert get_timezone_for_city("Hyderabad, India").timezone_name == "Asia/Kolkata"
+        assert get_timezone_for_city("Toronto, ON, Canada").timezone_name == "America/Toronto"
+        mock_get_geolocator.assert_not_called()
+
+    @patch("job_finder.utils.timezone_utils._get_geolocator")
+    def test_country_spanning_zones_is_ambiguous(self, mock_get_geolocator):
+        """'Canada' is reported as ambiguous rather than geocoded to a centroid."""
+        result = get_timezone_for_city("Canada")
+        assert result.timezone_name is None
+        assert result.error == "Ambiguous location"
+        mock_get_geolocator.assert_not_called()
+
+    @patch("job_finder.utils.timezone_utils._get_geolocator")
+    def test_fallback_can_be_disabled(self, mock_get_geolocator, monkeypatch):
+        """With the fallback off, unknown locations fail fast."""
+        monkeypatch.setenv("TIMEZONE_GEOCODER_FALLBACK", "false")
+        result = get_timezone_for_city("Hood River")
+        assert result.error == "City not found"
+        mock_get_geolocator.assert_not_called()
+
+    def test_memory_cache_is_bounded(self, monkeypatch):
+        """The in-process cache evicts least-recently-used entries."""
+        monkeypatch.setattr(timezone_utils, "_TIMEZONE_CACHE_MAXSIZE", 2)
+        for city in ("Berlin", "Paris", "Madrid"):
+            get_timezone_for_city(city)
+        assert list(timezone_utils._timezone_cache) == ["Paris", "Madrid"]
+
+
+class TestPersistentGeocodeCache:
+    """Geocoder answers survive process restarts via SQLite."""
+
+    def setup_method(self):
+        clear_cache()
+
+    def teardown_method(self):
+        configure_persistent_cache(None)
+        clear_cache()
+
+    @pytest.fixture
+    def geocode_db(self, tmp_path):
+        db_path = tmp_path / "tz.db"
+        db_path.touch()
+        configure_persistent_cache(str(db_path))
+        return db_path
+
+    @patch("job_finder.utils.timezone_utils._get_timezone_finder")
+    @patch("job_finder.utils.timezone_utils._get_geolocator")
+    def test_fallback_result_is_persisted(self, mock_get_geolocator, mock_get_tf, geocode_db):
+        mock_location = MagicMock(latitude=45.7, longitude=-121.5)
+        mock_geolocator = MagicMock()
+        mock_geolocator.geocode.return_value = mock_location
+        mock_get_geolocator.return_value = mock_geolocator
+        mock_get_tf.return_value = MagicMock(
+            timezone_at=MagicMock(return_value="America/Los_Angeles")
+        )
+
+        get_timezone_for_city("Hood River")
+        clear_cache()  # simulate a restart: only SQLite remains
+        result = get_timezone_for_city("Hood River")
+
+        assert result.timezone_name == "America/Los_Angeles"
+        assert result.utc_offset_hours is not None
+        assert mock_geolocator.geocode.call_count == 1
+
+    @patch("job_finder.utils.timezone_utils._get_geolocator")
+    def test_not_found_is_persisted(self, mock_get_geolocator, geocode_db):
+        mock_geolocator = MagicMock()
+        mock_geolocator.geocode.return_value = None
+        mock_get_geolocator.return_value = mock_geolocator
+
+        assert get_timezone_for_city("Nonexistent City, Nowhere").error == "City not found"
+        assert get_timezone_for_city("Nonexistent City, Nowhere").error == "City not found"
+        assert mock_geolocator.geocode.call_count == 1
+
+    @patch("job_finder.utils.timezone_utils._get_geolocator")
+    def test_transient_errors_are_not_persisted(self, mock_get_geolocator, geocode_db):
+        from geopy.exc import GeocoderTimedOut
+
+        mock_geolocator = MagicMock()
+        mock_geolocator.geocode.side_effect = GeocoderTimedOut("Timeout")
+        mock_get_geolocator.return_value = mock_geolocator
+
+        get_timezone_for_city("Some City")
+        get_timezone_for_city("Some City")
         assert mock_geolocator.geocode.call_count == 2
@@ -0,0 +1,122 @@
+"""Tests for the compiled URL classifier."""
+
+import re
+
+import pytest
+
+from job_finder.scrapers.platform_patterns import PLATFORM_PATTERNS, PlatformPattern, match_platform
+from job_finder.utils.url_classifier import UrlClassifier, classify_url, get_url_classifier
+
+_URLS = [
+    "https://boards.greenhouse.io/discord",
+    "https://job-boards.eu.greenhouse.io/acme/jobs/123",
+    "https://boards-api.greenhouse.io/v1/boards/stripe/jobs",
+    "https://jobs.ashbyhq.com/notion",
+    "https://api.ashbyhq.com/posting-api/job-board/notion",
+    "https://acme.wd5.myworkdayjobs.com/en-US/External",
+    "https://acme.wd1.myworkdayjobs.com/wday/cxs/acme/External/jobs",
+    "https://jobs.lever.co/netflix",
+    "https://remotive.com/api/remote-jobs?category=software-dev",
+    "https://remoteok.com/api",
+    "https://weworkremotely.com/categories/remote-programming-jobs.rss",
+    "https://jobs.smartrecruiters.com/Visa",
+    "https://acme.breezy.hr/p/123",
+    "https://apply.workable.com/acme/",
+    "https://acme.recruitee.com/o/engineer",
+    "https://acme.teamtailor.com/jobs",
+    "https://acme.jobs.personio.de/xml",
+    "https://builtin.com/jobs/remote",
+    "https://www.linkedin.com/jobs/view/123",
+    "https://acme.com/careers",
+    "https://example.com/?next=https://jobs.lever.co/netflix",
+    "not a url",
+    "",
+]
+
+
+def _legacy_match_platform(url):
+    for pattern in PLATFORM_PATTERNS:
+        match = re.search(pattern.url_pattern, url)
+        if match:
+            return pattern, match.groupdict()
+    return None
+
+
+class TestPlatformMatching:
+    @pytest.mark.parametrize("url", _URLS)
+    def test_matches_sequential_search(self, url):
+        assert match_platform(url) == _legacy_match_platform(url)
+
+    def test_registry_order_wins_over_match_position(self):
+        first = PlatformPattern(name="late", url_pattern=r"/needle", api_url_template="")
+        second = PlatformPattern(name="early", url_pattern=r"https?://", api_url_template="")
+        classifier = UrlClassifier(platform_patterns=[first, second])
+        assert classifier.classify("https://x.com/needle").platform.name == "late"
+
+    def test_groups_are_per_pattern(self):
+        pattern, groups = match_platform("https://jobs.lever.co/netflix")
+        assert pattern.name == "lever"
+        assert groups == {"company": "netflix"}
+
+    def test_groups_dict_is_a_copy(self):
+        _, groups = match_platform("https://jobs.lever.co/netflix")
+        groups["company"] = "changed"
+        assert match_platform("https://jobs.lever.co/netflix")[1] == {"company": "netflix"}
+
+    def test_registry_changes_rebuild_classifier(self, monkeypatch):
+        extra = PlatformPattern(
+            name="example", url_pattern=r"jobs\.example\.org", api_url_template=""
+        )
+        monkeypatch.setattr(
+            "job_finder.scrapers.platform_patterns.PLATFORM_PATTERNS", PLATFORM_PATTERNS + [extra]
+        )
+        assert match_platform("https://jobs.example.org/")[0].name == "example"
+
+
+class TestDomainClassification:
+    def test_aggregator_domain_requires_label_boundary(self):
+        classifier = UrlClassifier(["greenhouse.io", "lever.co"])
+        assert classifier.classify("https://boards.greenhouse.io/x").aggregator_domain == (
+            "greenhouse.io"
+        )
+        assert classifier.classify("https://GREENHOUSE.IO/x").is_job_board
+        assert not classifier.classify("https://notgreenhouse.io/x").is_job_board
+        assert not classifier.classify("https://greenhouse.io.evil.com/x").is_job_board
+
+    def test_most_specific_domain_wins(self):
+        classifier = UrlClassifier(["greenhouse.io", "boards.greenhouse.io"])
+        result = classifier.classify("https://eu.boards.greenhouse.io/x")
+        assert result.aggregator_domain == "boards.greenhouse.io"
+
+    def test_port_and_trailing_dot_ignored(self):
+        classifier = UrlClassifier(["lever.co"])
+        assert classifier.classify("https://jobs.lever.co:443/x").is_job_board
+        assert classifier.classify("https://jobs.lever.co./x").is_job_board
+
+    def test_ats_excluded_and_aggregator_flags(self):
+        ats = classify_url("https://boards.greenhouse.io/acme/jobs/1")
+        assert ats.ats_domain == "greenhouse.io"
+        assert not ats.excluded
+
+        board = classify_url("https://www.linkedin.com/jobs/view/1")
+        assert board.excluded
+        assert board.ats_domain is None
+
+        aggregator = classify_url("https://remotive.com/remote-jobs/1")
+        assert aggregator.aggregator_host
+        assert aggregator.excluded
+
+    def test_unparseable_url(self):
+        result = classify_url("http://[invalid")
+        assert result.host == ""
+        assert not result.is_job_board
+
+    def test_shared_classifier_per_domain_set(self):
+        assert get_url_classifier(["a.com"]) is get_url_classifier(("a.com",))
+        assert get_url_classifier(["a.com"]) is not get_url_classifier(["b.com"])
+
+    def test_results_cached(self):
+        classifier = UrlClassifier(["lever.co"])
+        classifier.classify("https://jobs.lever.co/x")
+        classifier.classify("https://jobs.lever.co/x")
+        assert classifier.cache_info().hits == 1
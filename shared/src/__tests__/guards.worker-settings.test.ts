@@ -0,0 +1,37 @@
+import { describe, expect, it } from "vitest"
+import { isWorkerSettings } from "../guards"
+import type { WorkerSettings } from "../config.types"
+
+const valid: WorkerSettings = {
+  scraping: { requestTimeoutSeconds: 30, maxHtmlSampleLength: 20000 },
+  textLimits: {
+    minCompanyPageLength: 200,
+    minSparseCompanyInfoLength: 100,
+    maxIntakeTextLength: 500,
+    maxIntakeDescriptionLength: 2000,
+    maxIntakeFieldLength: 400,
+    maxDescriptionPreviewLength: 500,
+    maxCompanyInfoTextLength: 1000,
+  },
+  runtime: {
+    processingTimeoutSeconds: 1800,
+    isProcessingEnabled: true,
+    taskDelaySeconds: 1,
+    pollIntervalSeconds: 60,
+  },
+}
+
+describe("isWorkerSettings", () => {
+  it("accepts runtime without maxConcurrentJobs", () => {
+    expect(isWorkerSettings(valid)).toBe(true)
+  })
+
+  it("accepts a numeric maxConcurrentJobs", () => {
+    expect(isWorkerSettings({ ...valid, runtime: { ...valid.runtime, maxConcurrentJobs: 4 } })).toBe(true)
+  })
+
+  it("rejects a non-numeric maxConcurrentJobs", () => {
+    const bad = { ...valid, runtime: { ...valid.runtime, maxConcurrentJobs: "4" } } as any
+    expect(isWorkerSettings(bad)).toBe(false)
+  })
+})
@@ -499,7 +499,10 @@ export interface WorkerSettings {
   scraping: {
     requestTimeoutSeconds: number // HTTP request timeout (default: 30)
     maxHtmlSampleLength: number // Max HTML length for AI selector discovery (default: 20000)
-    fetchDelaySeconds?: number // Delay between detail page fetches to avoid rate limiting (default: 1)
+    fetchDelaySeconds?: number // Average delay between fetches to one host (default: 1)
+    fetchBurst?: number // Back-to-back fetches a host may take before pacing kicks in (default: 3)
+    /** Per-host overrides; a key also covers its subdomains */
+    hostRateLimits?: Record<string, { requestsPerSecond: number; burst?: number }>
   }
   /** Source health tracking (optional) */
   health?: {
@@ -541,6 +544,11 @@ export interface WorkerSettings {
      * Defaults to true when absent.
      */
     useLocalModels?: boolean
+    /**
+     * How many JOB queue items the worker processes concurrently so their
+     * LLM calls overlap (1-8). Defaults to 3 when absent.
+     */
+    maxConcurrentJobs?: number
   }
 }
 
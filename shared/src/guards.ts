@@ -327,6 +327,14 @@ export function isWorkerSettings(value: unknown): value is WorkerSettings {
   if (typeof scraping.requestTimeoutSeconds !== "number") return false
   if (typeof scraping.maxHtmlSampleLength !== "number") return false
   if (scraping.fetchDelaySeconds !== undefined && typeof scraping.fetchDelaySeconds !== "number") return false
+  if (scraping.fetchBurst !== undefined && typeof scraping.fetchBurst !== "number") return false
+  if (scraping.hostRateLimits !== undefined) {
+    if (!isObject(scraping.hostRateLimits)) return false
+    for (const limit of Object.values(scraping.hostRateLimits as Record<string, unknown>)) {
+      if (!isObject(limit) || typeof (limit as any).requestsPerSecond !== "number") return false
+      if ((limit as any).burst !== undefined && typeof (limit as any).burst !== "number") return false
+    }
+  }
 
   // text limits
   const textLimits = (v as any).textLimits
@@ -355,6 +363,7 @@ export function isWorkerSettings(value: unknown): value is WorkerSettings {
   ) {
     return false
   }
+  if (rt.maxConcurrentJobs !== undefined && typeof rt.maxConcurrentJobs !== "number") return false
   if (rt.scrapeConfig !== undefined) {
     if (!isObject(rt.scrapeConfig)) return false
     const sc = rt.scrapeConfig as any
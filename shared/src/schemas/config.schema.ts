@@ -182,6 +182,10 @@ export const workerSettingsSchema = z.object({
     requestTimeoutSeconds: z.number(),
     maxHtmlSampleLength: z.number(),
     fetchDelaySeconds: z.number().optional(),
+    fetchBurst: z.number().optional(),
+    hostRateLimits: z
+      .record(z.string(), z.object({ requestsPerSecond: z.number(), burst: z.number().optional() }))
+      .optional(),
   }),
   health: z
     .object({
@@ -209,6 +213,7 @@ export const workerSettingsSchema = z.object({
     isProcessingEnabled: z.boolean(),
     taskDelaySeconds: z.number(),
     pollIntervalSeconds: z.number(),
+    maxConcurrentJobs: z.number().int().min(1).max(8).optional(),
     scrapeConfig: scrapeConfigSchema,
   }),
 })